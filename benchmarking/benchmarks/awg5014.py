@@ -0,0 +1,100 @@
+"""
+This module contains code used for benchmarking the packing of waveforms and
+sequences into the binary .awg files of the Tektronix AWG5014, and the
+parsing of such files.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from qcodes.instrument_drivers.tektronix.AWG5014 import (
+    _pack_waveform_array, _pack_records)
+from qcodes.instrument_drivers.tektronix.AWGFileParser import (
+    _unpacker, parse_awg_file)
+
+
+def _sequence_records(n_elements, n_points):
+    """
+    The records of an .awg file of a sequence of n_elements elements, each
+    playing a waveform of n_points points on channel 1, like
+    ``Tektronix_AWG5014._generate_awg_file`` makes them.
+    """
+    records = [('MAGIC', 5000, 'h'), ('VERSION', 1, 'h'),
+               ('SAMPLING_RATE', 1e9, 'd'), ('RUN_MODE', 4, 'h')]
+    timestamp = (2019, 1, 1, 1, 12, 0, 0, 0)
+    for element in range(n_elements):
+        packed = _pack_waveform_array(np.random.uniform(-1, 1, n_points),
+                                      np.random.randint(0, 2, n_points),
+                                      np.random.randint(0, 2, n_points))
+        name = 'wfm_{:05d}_ch1\x00'.format(element)
+        number = element + 21
+        records += [
+            ('WAVEFORM_NAME_{}'.format(number), name,
+             '{}s'.format(len(name))),
+            ('WAVEFORM_TYPE_{}'.format(number), 1, 'h'),
+            ('WAVEFORM_LENGTH_{}'.format(number), n_points, 'l'),
+            ('WAVEFORM_TIMESTAMP_{}'.format(number), timestamp, '8H'),
+            ('WAVEFORM_DATA_{}'.format(number), packed,
+             '{}H'.format(n_points))]
+    for element in range(n_elements):
+        name = 'wfm_{:05d}_ch1\x00'.format(element)
+        number = element + 1
+        records += [
+            ('SEQUENCE_WAIT_{}'.format(number), 0, 'h'),
+            ('SEQUENCE_LOOP_{}'.format(number), 1, 'l'),
+            ('SEQUENCE_JUMP_{}'.format(number), 0, 'h'),
+            ('SEQUENCE_GOTO_{}'.format(number), 0, 'h'),
+            ('SEQUENCE_WAVEFORM_NAME_CH_1_{}'.format(number), name,
+             '{}s'.format(len(name)))]
+    return records
+
+
+class PackWaveform:
+    """
+    This benchmark measures how much time it takes to pack a waveform and
+    its markers into the 16 bit integers of an .awg file, and to unpack
+    them again. Parametrization is used to alter the number of points.
+    """
+
+    params = [1000, 100000]
+    param_names = ['n_points']
+
+    def setup(self, n_points):
+        self.wf = np.random.uniform(-1, 1, n_points)
+        self.m1 = np.random.randint(0, 2, n_points)
+        self.m2 = np.random.randint(0, 2, n_points)
+        self.packed = _pack_waveform_array(self.wf, self.m1, self.m2)
+
+    def time_pack(self, n_points):
+        _pack_waveform_array(self.wf, self.m1, self.m2)
+
+    def time_unpack(self, n_points):
+        _unpacker(self.packed)
+
+
+class AWGFile:
+    """
+    This benchmark measures how much time it takes to assemble the .awg file
+    of a long sequence, and to parse it back. Parametrization is used to
+    alter the number of elements of the sequence.
+    """
+
+    params = [100, 2000]
+    param_names = ['n_elements']
+    n_points = 2000
+
+    def setup(self, n_elements):
+        self.records = _sequence_records(n_elements, self.n_points)
+        handle, self.path = tempfile.mkstemp(suffix='.awg')
+        with os.fdopen(handle, 'wb') as awg_file:
+            awg_file.write(_pack_records(self.records))
+
+    def teardown(self, n_elements):
+        os.remove(self.path)
+
+    def time_pack_records(self, n_elements):
+        _pack_records(self.records)
+
+    def time_parse_awg_file(self, n_elements):
+        parse_awg_file(self.path)
@@ -0,0 +1,43 @@
+"""
+This module contains code used for benchmarking the detection of the
+structure of setpoints done by ``qcodes.dataset.data_export`` when deciding
+how to plot a dataset.
+"""
+import numpy as np
+
+from qcodes.dataset.data_export import (detect_grid,
+                                        datatype_from_setpoints_2d,
+                                        reshape_2D_data)
+
+
+class DetectGrid:
+    """
+    This benchmark measures how much time it takes to find the grid structure
+    of 2D setpoints, and to determine the plot type and reshape the data
+    accordingly. Parametrization is used to alter the kind of setpoints: a
+    complete sweep, a sweep interrupted in the middle of a row, and
+    scattered points.
+    """
+
+    params = (['regular', 'interrupted', 'scatter'], [100, 1000])
+    param_names = ['kind', 'n']
+
+    def setup(self, kind, n):
+        if kind == 'scatter':
+            self.x, self.y = np.random.rand(2, n * n)
+        else:
+            x, y = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n))
+            npoints = n * n if kind == 'regular' else n * n // 2 + n // 2
+            self.x = x.ravel()[:npoints]
+            self.y = y.ravel()[:npoints]
+        self.z = np.random.rand(len(self.x))
+
+    def time_detect_grid(self, kind, n):
+        detect_grid(self.x, self.y)
+
+    def time_datatype_from_setpoints_2d(self, kind, n):
+        datatype_from_setpoints_2d(self.x, self.y)
+
+    def time_reshape_2D_data(self, kind, n):
+        if kind != 'scatter':
+            reshape_2D_data(self.x, self.y, self.z)
@@ -0,0 +1,27 @@
+"""
+This module contains code used for benchmarking the time it takes to import
+QCoDeS, each time in a fresh interpreter.
+"""
+
+
+def timeraw_import_qcodes():
+    return """
+    import qcodes
+    """
+
+
+def timeraw_import_qcodes_dataset():
+    return """
+    from qcodes.dataset.measurements import Measurement
+    from qcodes.dataset.data_set import load_by_id
+    """
+
+
+def timeraw_import_qcodes_all():
+    # accessing every name of the namespace imports everything, as an
+    # import of qcodes did before the namespace was loaded lazily
+    return """
+    import qcodes
+    for name in qcodes.__all__:
+        getattr(qcodes, name, None)
+    """
@@ -2,6 +2,13 @@
 
 # flake8: noqa (we don't need the "<...> imported but unused" error)
 
+import atexit
+import importlib
+import importlib.util
+import pkgutil
+import sys
+from typing import TYPE_CHECKING
+
 # config
 
 from qcodes.config import Config
@@ -15,73 +22,194 @@ config = Config() # type: Config
 from qcodes.version import __version__
 
 plotlib = config.gui.plotlib
-if plotlib in {'QT', 'all'}:
-    try:
-        from qcodes.plots.pyqtgraph import QtPlot
-    except Exception:
-        print('pyqtgraph plotting not supported, '
-              'try "from qcodes.plots.pyqtgraph import QtPlot" '
-              'to see the full error')
-
-if plotlib in {'matplotlib', 'all'}:
-    try:
-        from qcodes.plots.qcmatplotlib import MatPlot
-    except Exception:
-        print('matplotlib plotting not supported, '
-              'try "from qcodes.plots.qcmatplotlib import MatPlot" '
-              'to see the full error')
 
+# The rest of the namespace is imported lazily, on first access of a name
+# (see __getattr__), so that e.g. opening a database does not import the
+# plotting libraries, the legacy data formats or the instrument drivers.
+# The name of every attribute, and the module it is imported from
+_lazy_attributes = {
+    'Station': 'qcodes.station',
+    'Loop': 'qcodes.loops',
+    'active_loop': 'qcodes.loops',
+    'active_data_set': 'qcodes.loops',
+    'Measure': 'qcodes.measure',
+    'Task': 'qcodes.actions',
+    'Wait': 'qcodes.actions',
+    'BreakIf': 'qcodes.actions',
+    'Monitor': 'qcodes.monitor.monitor',
+
+    'DataSet': 'qcodes.data.data_set',
+    'new_data': 'qcodes.data.data_set',
+    'load_data': 'qcodes.data.data_set',
+    'FormatLocation': 'qcodes.data.location',
+    'DataArray': 'qcodes.data.data_array',
+    'Formatter': 'qcodes.data.format',
+    'GNUPlotFormat': 'qcodes.data.gnuplot_format',
+    'HDF5Format': 'qcodes.data.hdf5_format',
+    'DiskIO': 'qcodes.data.io',
+
+    'Instrument': 'qcodes.instrument.base',
+    'find_or_create_instrument': 'qcodes.instrument.base',
+    'IPInstrument': 'qcodes.instrument.ip',
+    'VisaInstrument': 'qcodes.instrument.visa',
+    'InstrumentChannel': 'qcodes.instrument.channel',
+    'ChannelList': 'qcodes.instrument.channel',
+
+    'Function': 'qcodes.instrument.function',
+    'Parameter': 'qcodes.instrument.parameter',
+    'ArrayParameter': 'qcodes.instrument.parameter',
+    'MultiParameter': 'qcodes.instrument.parameter',
+    'ParameterWithSetpoints': 'qcodes.instrument.parameter',
+    'StandardParameter': 'qcodes.instrument.parameter',
+    'ManualParameter': 'qcodes.instrument.parameter',
+    'ScaledParameter': 'qcodes.instrument.parameter',
+    'combine': 'qcodes.instrument.parameter',
+    'CombinedParameter': 'qcodes.instrument.parameter',
+    'SweepFixedValues': 'qcodes.instrument.sweep_values',
+    'SweepValues': 'qcodes.instrument.sweep_values',
+    'AdaptiveSweep': 'qcodes.instrument.sweep_values',
+
+    'validators': 'qcodes.utils.validators',
+    'Publisher': 'qcodes.utils.zmq_helpers',
+    'test_instruments': 'qcodes.instrument_drivers.test',
+    'test_instrument': 'qcodes.instrument_drivers.test',
+
+    'Measurement': 'qcodes.dataset.measurements',
+    'new_data_set': 'qcodes.dataset.data_set',
+    'load_by_counter': 'qcodes.dataset.data_set',
+    'load_by_id': 'qcodes.dataset.data_set',
+    'new_experiment': 'qcodes.dataset.experiment_container',
+    'load_experiment': 'qcodes.dataset.experiment_container',
+    'load_experiment_by_name': 'qcodes.dataset.experiment_container',
+    'load_last_experiment': 'qcodes.dataset.experiment_container',
+    'experiments': 'qcodes.dataset.experiment_container',
+    'load_or_create_experiment': 'qcodes.dataset.experiment_container',
+    'SQLiteSettings': 'qcodes.dataset.sqlite_settings',
+    'ParamSpec': 'qcodes.dataset.param_spec',
+    'initialise_database': 'qcodes.dataset.database',
+    'initialise_or_create_database_at': 'qcodes.dataset.database',
+}
 
-from qcodes.station import Station
-from qcodes.loops import Loop, active_loop, active_data_set
-from qcodes.measure import Measure
-from qcodes.actions import Task, Wait, BreakIf
-haswebsockets = True
-try:
-    import websockets
-except ImportError:
-    haswebsockets = False
-if haswebsockets:
+if plotlib in {'QT', 'all'}:
+    _lazy_attributes['QtPlot'] = 'qcodes.plots.pyqtgraph'
+if plotlib in {'matplotlib', 'all'}:
+    _lazy_attributes['MatPlot'] = 'qcodes.plots.qcmatplotlib'
+
+haswebsockets = importlib.util.find_spec('websockets') is not None
+if not haswebsockets:
+    del _lazy_attributes['Monitor']
+
+if TYPE_CHECKING:
+    # the lazily imported names, for type checkers and IDEs
+    from qcodes.station import Station
+    from qcodes.loops import Loop, active_loop, active_data_set
+    from qcodes.measure import Measure
+    from qcodes.actions import Task, Wait, BreakIf
     from qcodes.monitor.monitor import Monitor
 
-from qcodes.data.data_set import DataSet, new_data, load_data
-from qcodes.data.location import FormatLocation
-from qcodes.data.data_array import DataArray
-from qcodes.data.format import Formatter
-from qcodes.data.gnuplot_format import GNUPlotFormat
-from qcodes.data.hdf5_format import HDF5Format
-from qcodes.data.io import DiskIO
-
-from qcodes.instrument.base import Instrument, find_or_create_instrument
-from qcodes.instrument.ip import IPInstrument
-from qcodes.instrument.visa import VisaInstrument
-from qcodes.instrument.channel import InstrumentChannel, ChannelList
-
-from qcodes.instrument.function import Function
-from qcodes.instrument.parameter import (
-    Parameter,
-    ArrayParameter,
-    MultiParameter,
-    ParameterWithSetpoints,
-    StandardParameter,
-    ManualParameter,
-    ScaledParameter,
-    combine,
-    CombinedParameter)
-from qcodes.instrument.sweep_values import SweepFixedValues, SweepValues
-
-from qcodes.utils import validators
-from qcodes.utils.zmq_helpers import Publisher
-from qcodes.instrument_drivers.test import test_instruments, test_instrument
-
-from qcodes.dataset.measurements import Measurement
-from qcodes.dataset.data_set import new_data_set, load_by_counter, load_by_id
-from qcodes.dataset.experiment_container import new_experiment, load_experiment, load_experiment_by_name, \
-    load_last_experiment, experiments, load_or_create_experiment
-from qcodes.dataset.sqlite_settings import SQLiteSettings
-from qcodes.dataset.param_spec import ParamSpec
-from qcodes.dataset.database import initialise_database, \
-    initialise_or_create_database_at
+    from qcodes.data.data_set import DataSet, new_data, load_data
+    from qcodes.data.location import FormatLocation
+    from qcodes.data.data_array import DataArray
+    from qcodes.data.format import Formatter
+    from qcodes.data.gnuplot_format import GNUPlotFormat
+    from qcodes.data.hdf5_format import HDF5Format
+    from qcodes.data.io import DiskIO
+
+    from qcodes.instrument.base import Instrument, find_or_create_instrument
+    from qcodes.instrument.ip import IPInstrument
+    from qcodes.instrument.visa import VisaInstrument
+    from qcodes.instrument.channel import InstrumentChannel, ChannelList
+
+    from qcodes.instrument.function import Function
+    from qcodes.instrument.parameter import (
+        Parameter,
+        ArrayParameter,
+        MultiParameter,
+        ParameterWithSetpoints,
+        StandardParameter,
+        ManualParameter,
+        ScaledParameter,
+        combine,
+        CombinedParameter)
+    from qcodes.instrument.sweep_values import (SweepFixedValues,
+                                                SweepValues, AdaptiveSweep)
+
+    from qcodes.utils import validators
+    from qcodes.utils.zmq_helpers import Publisher
+    from qcodes.instrument_drivers.test import (test_instruments,
+                                                test_instrument)
+
+    from qcodes.dataset.measurements import Measurement
+    from qcodes.dataset.data_set import (new_data_set, load_by_counter,
+                                         load_by_id)
+    from qcodes.dataset.experiment_container import (
+        new_experiment, load_experiment, load_experiment_by_name,
+        load_last_experiment, experiments, load_or_create_experiment)
+    from qcodes.dataset.sqlite_settings import SQLiteSettings
+    from qcodes.dataset.param_spec import ParamSpec
+    from qcodes.dataset.database import (initialise_database,
+                                         initialise_or_create_database_at)
+
+    from qcodes.plots.pyqtgraph import QtPlot
+    from qcodes.plots.qcmatplotlib import MatPlot
+
+
+def _import_submodule(name: str):
+    """
+    Import a submodule of qcodes that is not imported yet, e.g. for
+    ``qcodes.loops``. Raises AttributeError if there is no such submodule.
+    """
+    module_name = f'{__name__}.{name}'
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            # the submodule exists, but fails to import
+            raise
+        raise AttributeError(
+            f"module 'qcodes' has no attribute '{name}'") from None
+
+
+def __getattr__(name: str):
+    if name not in _lazy_attributes:
+        if name.startswith('__'):
+            raise AttributeError(f"module 'qcodes' has no attribute '{name}'")
+        return _import_submodule(name)
+    module_name = _lazy_attributes[name]
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        if name not in ('QtPlot', 'MatPlot'):
+            raise
+        print(f'{module_name.split(".")[-1]} plotting not supported, '
+              f'try "from {module_name} import {name}" '
+              f'to see the full error')
+        raise AttributeError(f"module 'qcodes' has no attribute '{name}'")
+    if module_name.endswith('.' + name):
+        # the attribute is the module itself
+        value = module
+    else:
+        value = getattr(module, name)
+    # cache it, so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    submodules = {module.name for module in pkgutil.iter_modules(__path__)}
+    return sorted(set(globals()) | set(_lazy_attributes) | submodules)
+
+
+__all__ = ['config', 'Config', '__version__', 'plotlib', 'haswebsockets',
+           'test'] + list(_lazy_attributes)
+
+if sys.version_info < (3, 7):
+    # module __getattr__ needs python 3.7 (PEP 562), import everything now
+    for _name in list(_lazy_attributes):
+        try:
+            globals()[_name] = __getattr__(_name)
+        except AttributeError:
+            pass
 
 try:
     get_ipython() # type: ignore # Check if we are in iPython
@@ -95,8 +223,16 @@ except RuntimeError as e:
     print(e)
 
 # ensure to close all instruments when interpreter is closed
-import atexit
-atexit.register(Instrument.close_all)
+
+
+def _close_all_instruments():
+    # if the instruments were never imported, there are none to close
+    base = sys.modules.get('qcodes.instrument.base')
+    if base is not None:
+        base.Instrument.close_all()
+
+
+atexit.register(_close_all_instruments)
 
 def test(**kwargs):
     """
@@ -2,14 +2,15 @@
 import time
 
 from qcodes.utils.helpers import is_function
-from qcodes.utils.threading import thread_map
 
 
 _NO_SNAPSHOT = {'type': None, 'description': 'Action without snapshot'}
 
 
 # exception when threading is attempted used to simultaneously
-# query the same instrument for several values
+# query the same instrument for several values. No longer raised, since
+# parameters of the same instrument are now read sequentially by one worker,
+# but kept for backwards compatibility.
 class UnsafeThreadingException(Exception):
     pass
 
@@ -109,8 +110,11 @@ class _Measure:
 
     This should not be constructed manually, only by an ActiveLoop.
     """
-    def __init__(self, params_indices, data_set, use_threads):
-        self.use_threads = use_threads and len(params_indices) > 1
+    def __init__(self, params_indices, data_set, use_threads,
+                 thread_pool=None):
+        self.use_threads = (use_threads and len(params_indices) > 1 and
+                            thread_pool is not None)
+        self.thread_pool = thread_pool
         # the applicable DataSet.store function
         self.store = data_set.store
 
@@ -119,12 +123,12 @@ class _Measure:
         self.getters = []
         self.param_ids = []
         self.composite = []
-        paramcheck = []  # list to check if parameters are unique
+        # the instrument each getter talks to: getters of the same
+        # instrument are never executed concurrently
+        self.thread_groups = []
         for param, action_indices in params_indices:
             self.getters.append(param.get)
-
-            if param._instrument:
-                paramcheck.append((param, param._instrument))
+            self.thread_groups.append(_thread_group(param))
 
             if hasattr(param, 'names'):
                 part_ids = []
@@ -138,21 +142,10 @@ class _Measure:
                 self.param_ids.append(param_id)
                 self.composite.append(False)
 
-        if self.use_threads:
-            insts = [p[1] for p in paramcheck]
-            if (len(set(insts)) != len(insts)):
-                duplicates = [p for p in paramcheck if insts.count(p[1]) > 1]
-                raise UnsafeThreadingException('Can not use threading to '
-                                               'read '
-                                               'several things from the same '
-                                               'instrument. Specifically, you '
-                                               'asked for'
-                                               ' {}.'.format(duplicates))
-
     def __call__(self, loop_indices, **ignore_kwargs):
         out_dict = {}
         if self.use_threads:
-            out = thread_map(self.getters)
+            out = self.thread_pool.map(self.getters, self.thread_groups)
         else:
             out = [g() for g in self.getters]
 
@@ -167,6 +160,17 @@ class _Measure:
         self.store(loop_indices, out_dict)
 
 
+def _thread_group(param):
+    """
+    The key under which a parameter is serialized when measuring in threads:
+    its root instrument, or the parameter itself if it has no instrument.
+    """
+    instrument = getattr(param, '_instrument', None)
+    if instrument is None:
+        return id(param)
+    return id(getattr(instrument, 'root_instrument', instrument))
+
+
 class _Nest:
 
     """
@@ -3,13 +3,13 @@ import copy
 import json
 import logging
 import os
-import pkg_resources as pkgr
 
 from os.path import expanduser
 from pathlib import Path
+from types import MappingProxyType
 
 import jsonschema
-from typing import Dict, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,27 @@ BASE_SCHEMA = {
 }
 
 
+# compiled validators, by the JSON of their schema
+_validators: Dict[str, Any] = {}
+
+
+def _validate(json_config, schema) -> None:
+    """
+    Validate a config against a schema, like ``jsonschema.validate``, but
+    with a validator that is compiled (and the schema checked) only once per
+    schema.
+    """
+    key = json.dumps(schema, sort_keys=True)
+    validator = _validators.get(key)
+    if validator is None:
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = _validators[key] = cls(schema)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(json_config))
+    if error is not None:
+        raise error
+
+
 class Config:
     """
     QCoDeS config system
@@ -60,14 +81,15 @@ class Config:
     config_file_name = "qcodesrc.json"
     schema_file_name = "qcodesrc_schema.json"
 
-    # get abs path of packge config file
-    default_file_name = pkgr.resource_filename(__name__, config_file_name)
+    # get abs path of packge config file (without pkg_resources, which is
+    # slow to import)
+    _package_dir = os.path.dirname(os.path.abspath(__file__))
+    default_file_name = os.path.join(_package_dir, config_file_name)
     current_config_path = default_file_name
     _loaded_config_files = [default_file_name]
 
     # get abs path of schema  file
-    schema_default_file_name = pkgr.resource_filename(__name__,
-                                                      schema_file_name)
+    schema_default_file_name = os.path.join(_package_dir, schema_file_name)
 
     # home dir, os independent
     home_file_name = expanduser(os.path.join("~", config_file_name))
@@ -92,6 +114,12 @@ class Config:
     _diff_config: Dict[str, dict] = {}
     _diff_schema: Dict[str, dict] = {}
 
+    # the flattened config for fast lookups, and the config and DotDict
+    # version it was built from
+    _flat: Optional[Dict[str, Any]] = None
+    _flat_config: Any = None
+    _flat_version = -1
+
     def __init__(self, path: str=None) -> None:
         """
         Args:
@@ -161,6 +189,7 @@ class Config:
                                "expected locations.")
         self.current_config = config
         self.current_config_path = self._loaded_config_files[-1]
+        self._flat = None
 
         return config
 
@@ -204,14 +233,14 @@ class Config:
                     new_user = json.load(f)["properties"]["user"]
                     user = schema["properties"]['user']
                     user["properties"].update(new_user["properties"])
-                jsonschema.validate(json_config, schema)
+                _validate(json_config, schema)
             else:
                 logger.warning(EMPTY_USER_SCHEMA.format(extra_schema_path))
         else:
             if json_config is None and schema is None:
-                jsonschema.validate(self.current_config, self.current_schema)
+                _validate(self.current_config, self.current_schema)
             else:
-                jsonschema.validate(json_config, schema)
+                _validate(json_config, schema)
 
     def add(self, key, value, value_type=None, description=None, default=None):
         """ Add custom config value in place.
@@ -260,6 +289,7 @@ class Config:
             - finish _diffing
         """
         self.current_config["user"].update({key: value})
+        self._flat = None
 
         if self._diff_config.get("user", True):
             self._diff_config["user"] = {}
@@ -391,7 +421,38 @@ class Config:
 
         return doc
 
+    @property
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        A read-only mapping of every key of the current config, in 'dotdict'
+        notation (e.g. ``'core.db_location'``), to its value.
+
+        The snapshot is built on first use, and built again only after
+        ``add``, ``update_config``, or a change of any value of the config.
+        All dicts in the config are ``DotDict``'s, which count their changes,
+        but changes made inside other mutable values (e.g. appending to a
+        list in the config) go unnoticed: set the value again instead.
+        """
+        return MappingProxyType(self._flattened())
+
+    def _flattened(self) -> Dict[str, Any]:
+        flat = self._flat
+        if (flat is None or self._flat_version != DotDict.version
+                or self._flat_config is not self.current_config):
+            flat = {}
+            if self.current_config is not None:
+                _flatten(self.current_config, '', flat)
+            self._flat = flat
+            self._flat_config = self.current_config
+            self._flat_version = DotDict.version
+        return flat
+
     def __getitem__(self, name):
+        try:
+            return self._flattened()[name]
+        except (KeyError, TypeError):
+            pass
+        # raise the same error as a lookup in the config itself
         val = self.current_config
         for key in name.split('.'):
             val = val[key]
@@ -408,10 +469,21 @@ class Config:
         return output
 
 
+def _flatten(config: Mapping[str, Any], prefix: str,
+             flat: Dict[str, Any]) -> None:
+    for key, value in config.items():
+        flat[prefix + key] = value
+        if isinstance(value, Mapping):
+            _flatten(value, prefix + key + '.', flat)
+
+
 class DotDict(dict):
     """
     Wrapper dict that allows to get dotted attributes
     """
+    # the number of changes made to any DotDict, so that copies of their
+    # content (like Config.snapshot) can tell when they are outdated
+    version = 0
 
     def __init__(self, value=None):
         if value is None:
@@ -429,6 +501,30 @@ class DotDict(dict):
             if isinstance(value, dict) and not isinstance(value, DotDict):
                 value = DotDict(value)
             dict.__setitem__(self, key, value)
+            DotDict.version += 1
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        DotDict.version += 1
+
+    def update(self, *args, **kwargs):
+        # set every item through __setitem__, so that nested dicts become
+        # DotDict's as well and their changes are counted
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, *args):
+        DotDict.version += 1
+        return dict.pop(self, *args)
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def clear(self):
+        dict.clear(self)
+        DotDict.version += 1
 
     def __getitem__(self, key):
         if '.' not in key:
@@ -5,7 +5,7 @@ import logging
 from traceback import format_exc
 from copy import deepcopy
 from collections import OrderedDict
-from typing import Dict, Callable
+from typing import Dict, Callable, Optional
 
 from .gnuplot_format import GNUPlotFormat
 from .io import DiskIO
@@ -189,6 +189,12 @@ class DataSet(DelegateAttributes):
 
         self.metadata = {}
 
+        # the id of the run this DataSet is written to by a DatabaseFormat
+        self.run_id: Optional[int] = None
+
+        # LivePlots to push the stored data to, see qcodes.plots.live_plot
+        self.live_plots = []
+
         self.arrays = _PrettyPrintDict()
         if arrays:
             self.action_id_map = self._clean_array_ids(arrays)
@@ -404,6 +410,8 @@ class DataSet(DelegateAttributes):
          """
         for array_id, value in ids_values.items():
             self.arrays[array_id][loop_indices] = value
+        for live_plot in self.live_plots:
+            live_plot.store(self, loop_indices, ids_values)
         self.last_store = time.time()
         if (self.write_period is not None and
                 time.time() > self.last_write + self.write_period):
@@ -1,22 +1,24 @@
-from typing import List, Any, Sequence, Tuple, Dict, Union
+from typing import List, Any, Sequence, Tuple, Dict, Union, NamedTuple
 import logging
+from collections import OrderedDict
 
 import numpy as np
 
-from qcodes.dataset.sqlite_base import (get_dependencies, get_dependents,
-                                        get_layout)
+from qcodes.dataset.sqlite_base import get_data, get_dependent_layouts
 from qcodes.dataset.data_set import load_by_id
 
 log = logging.getLogger(__name__)
 
 
-def flatten_1D_data_for_plot(rawdata: Sequence[Sequence[Any]]) -> np.ndarray:
+def flatten_1D_data_for_plot(rawdata: Union[Sequence[Sequence[Any]],
+                                             Sequence[Any]]) -> np.ndarray:
     """
     Cast the return value of the database query to
     a numpy array
 
     Args:
-        rawdata: The return of the get_values function
+        rawdata: The return of the get_values function, or a column of
+            values
 
     Returns:
         A one-dimensional numpy array
@@ -66,39 +68,37 @@ def get_data_by_id(run_id: int) -> List:
     """
 
     data = load_by_id(run_id)
-
-    conn = data.conn
-    deps = get_dependents(conn, run_id)
+    layouts = get_dependent_layouts(data.conn, run_id)
+
+    # read all columns that are needed in a single scan of the results table
+    names = list(OrderedDict.fromkeys(layout['name']
+                                      for axes in layouts
+                                      for layout in axes))
+    if names:
+        rows = get_data(data.conn, data.table_name, names)
+    else:
+        rows = []
+    columns: Dict[str, List[Any]] = dict(zip(names,
+                                             map(list, zip(*rows))))
 
     output = []
-    for dep in deps:
-
-        dependencies = get_dependencies(conn, dep)
-
-        data_axis: Dict[str, Union[str, np.ndarray]] = get_layout(conn, dep)
-
-        rawdata = data.get_values(data_axis['name'])
-        data_axis['data'] = flatten_1D_data_for_plot(rawdata)
-
-        raw_setpoint_data = data.get_setpoints(data_axis['name'])
-
-        output_axes = []
-
-        max_size = 0
-        for dependency in dependencies:
-            axis: Dict[str, Union[str, np.ndarray]] = get_layout(conn,
-                                                                 dependency[0])
-
-            mydata = flatten_1D_data_for_plot(raw_setpoint_data[axis['name']])
-            axis['data'] = mydata
-
-            size = mydata.size
-            if size > max_size:
-                max_size = size
-
+    for axes in layouts:
+        dependent = columns.get(axes[-1]['name'], [])
+        # the rows in which the dependent parameter has been measured
+        measured = [i for i, value in enumerate(dependent)
+                    if value is not None]
+
+        output_axes: List[Dict[str, Union[str, np.ndarray]]] = []
+        for layout in axes:
+            column = columns.get(layout['name'], [])
+            axis: Dict[str, Union[str, np.ndarray]] = dict(layout)
+            axis['data'] = flatten_1D_data_for_plot(
+                [column[i] for i in measured])
             output_axes.append(axis)
 
-        for axis in output_axes:
+        max_size = max([axis['data'].size  # type: ignore
+                        for axis in output_axes[:-1]])
+        for axis in output_axes[:-1]:
             size = axis['data'].size  # type: ignore
             if size < max_size:
                 if max_size % size != 0:
@@ -107,119 +107,148 @@ def get_data_by_id(run_id: int) -> List:
                                        f"of {max_size}")
                 axis['data'] = np.repeat(axis['data'], max_size//size)
 
-        output_axes.append(data_axis)
-
         output.append(output_axes)
     return output
 
 
-def _all_steps_multiples_of_min_step(rows: Sequence[np.ndarray]) -> bool:
+class Grid(NamedTuple):
     """
-    Are all steps integer multiples of the smallest step?
-    This is used in determining whether the setpoints correspond
-    to a regular grid
+    The grid structure of a set of setpoints, as returned by `detect_grid`.
+
+    Attributes:
+        shape: the number of unique values along each axis
+        axes: the sorted unique values along each axis
+        indices: for each axis, the index into ``axes`` of each setpoint, so
+            that ``axes[i][indices[i]]`` gives back the setpoints of axis
+            ``i``
+        is_grid: whether the setpoints form a rectangular sweep, possibly
+            interrupted, over the grid spanned by ``axes``
+    """
+    shape: Tuple[int, ...]
+    axes: Tuple[np.ndarray, ...]
+    indices: Tuple[np.ndarray, ...]
+    is_grid: bool
 
-    Args:
-        rows: the output of _rows_from_datapoints
 
-    Returns:
-        The answer to the question
+def detect_grid(*setpoints: np.ndarray) -> Grid:
     """
+    Find the grid spanned by the unique values of one or more setpoint
+    arrays, the position of every point on that grid, and whether the points
+    form a rectangular sweep over it.
 
-    steps: List[np.ndarray] = []
-    for row in rows:
-        # TODO: What is an appropriate precision?
-        steps += list(np.unique(np.diff(row).round(decimals=15)))
+    The setpoints are considered a rectangular sweep if every value of each
+    axis is measured as often as the sweep over the other axes requires,
+    except for the values of one incomplete sweep at the end. That allows
+    for an interrupted sweep. Note that the axes need NOT be equidistantly
+    spaced. Since only the number of occurrences of each value is checked,
+    some other incomplete grids pass as well; their points are still sorted
+    onto the grid correctly by the index maps.
 
-    steps = np.unique((steps))
-    remainders = np.mod(steps[1:]/steps[0], 1)
+    This takes a single sort per axis, so it scales as O(n log n) with the
+    number of points.
 
-    # TODO: What are reasonable tolerances for allclose?
-    asmoms = bool(np.allclose(remainders, np.zeros_like(remainders)))
-
-    return asmoms
+    Args:
+        *setpoints: one 1D array per axis, all of the same length
 
+    Returns:
+        A `Grid` with the shape, axes and index maps of the grid
 
-def _rows_from_datapoints(inputsetpoints: np.ndarray) -> np.ndarray:
+    Example:
+        >>> grid = detect_grid(x, y)
+        >>> z_on_grid = np.full(grid.shape, np.nan)
+        >>> z_on_grid[grid.indices] = z
     """
-    Cast the (potentially) unordered setpoints into rows
-    of sorted, unique setpoint values. Because of the way they are ordered,
-    these rows do not necessarily correspond to actual rows of the scan,
-    but they can nonetheless be used to identify certain scan types
+    if len(setpoints) == 0:
+        raise ValueError('detect_grid needs at least one setpoint array')
+    lengths = {len(points) for points in setpoints}
+    if len(lengths) != 1:
+        raise ValueError('All setpoint arrays must have the same length, '
+                         f'got lengths {sorted(lengths)}')
+
+    axes = []
+    indices = []
+    counts = []
+    for points in setpoints:
+        values, inverse, count = np.unique(points, return_inverse=True,
+                                           return_counts=True)
+        axes.append(values)
+        indices.append(inverse)
+        counts.append(count)
+    shape = tuple(len(values) for values in axes)
+
+    is_grid = all(_is_rectangular_sweep_axis(count, int(np.prod(shape))
+                                             // n_unique)
+                  for count, n_unique in zip(counts, shape))
+
+    return Grid(shape=shape, axes=tuple(axes), indices=tuple(indices),
+                is_grid=is_grid)
+
+
+def _is_rectangular_sweep_axis(counts: np.ndarray,
+                               expected_count: int) -> bool:
+    """
+    Could the setpoints of an axis, with the given number of occurrences of
+    each unique value, be part of a (possibly interrupted) rectangular
+    sweep, where each value occurs ``expected_count`` times?
+
+    In such a sweep the values occur either the full number of times, or,
+    for the values of the interrupted sweep, a smaller but equal number of
+    times.
 
     Args:
-        setpoints: The raw setpoints as a one-dimensional array
+        counts: the number of times each unique setpoint value occurs
+        expected_count: the number of times each value occurs in a
+            complete sweep, i.e. the number of points on the grid of the
+            other axes
 
     Returns:
-        A ndarray of the rows
+        The answer to the question
     """
+    return (len(np.unique(counts)) <= 2
+            and int(counts.max()) == expected_count)
 
-    rows = []
-    setpoints = inputsetpoints.copy()
 
-    # first check if there is only one unique array in which case we can avoid the
-    # potentially slow loop below
-    temp, inds, count = np.unique(setpoints, return_index=True,
-                                  return_counts=True)
-    num_repeats_array = np.unique(count)
-    if len(num_repeats_array) == 1 and count.sum() == len(inputsetpoints):
-        return np.tile(temp, (num_repeats_array[0], 1))
-    else:
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
+def _distinct_rows(values: np.ndarray, counts: np.ndarray
+                   ) -> List[np.ndarray]:
+    """
+    Cast the (potentially) unordered setpoints into rows of sorted, unique
+    setpoint values, where row ``k`` holds the values that occur more than
+    ``k`` times. Because of the way they are ordered, these rows do not
+    necessarily correspond to actual rows of the scan, but they can
+    nonetheless be used to identify certain scan types. Only the distinct
+    rows are returned, since consecutive rows are often identical.
 
-    while len(setpoints) > 0:
-        temp, inds = np.unique(setpoints, return_index=True)
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
+    Args:
+        values: the sorted unique setpoint values
+        counts: the number of times each value occurs
 
-    return np.array(rows)
+    Returns:
+        A list of the distinct rows
+    """
+    return [values[counts >= count] for count in np.unique(counts)]
 
 
-def _all_in_group_or_subgroup(rows: np.ndarray) -> bool:
+def _all_steps_multiples_of_min_step(rows: Sequence[np.ndarray]) -> bool:
     """
-    Detects whether the setpoints correspond to two groups of
-    of identical rows, one being contained in the other.
-
-    This is the test for whether the setpoints correspond to a
-    rectangular sweep. It allows for a single rectangular hole
-    in the setpoint grid, thus allowing for an interrupted sweep.
-    Note that each axis needs NOT be equidistantly spaced.
+    Are all steps integer multiples of the smallest step?
+    This is used in determining whether the setpoints correspond
+    to a regular grid
 
     Args:
-        rows: The output from _rows_from_datapoints
+        rows: the output of _distinct_rows
 
     Returns:
-        A boolean indicating whether the setpoints meet the
-            criterion
+        The answer to the question
     """
+    # TODO: What is an appropriate precision?
+    steps = np.unique(np.concatenate([np.diff(row).round(decimals=15)
+                                      for row in rows]))
+    remainders = np.mod(steps[1:]/steps[0], 1)
 
-    groups = 1
-    comp_to = rows[0]
-
-    aigos = True
-    switchindex = 0
-
-    for rowind, row in enumerate(rows[1:]):
-        if np.array_equal(row, comp_to):
-            continue
-        else:
-            groups += 1
-            comp_to = row
-            switchindex = rowind
-            if groups > 2:
-                aigos = False
-                break
-
-    # if there are two groups, check that the rows of one group
-    # are all contained in the rows of the other
-    if aigos and switchindex > 0:
-        for row in rows[1+switchindex:]:
-            if sum([r in rows[0] for r in row]) != len(row):
-                aigos = False
-                break
+    # TODO: What are reasonable tolerances for allclose?
+    asmoms = bool(np.allclose(remainders, np.zeros_like(remainders)))
 
-    return aigos
+    return asmoms
 
 
 def _strings_as_ints(inputarray: np.ndarray) -> np.ndarray:
@@ -231,10 +260,8 @@ def _strings_as_ints(inputarray: np.ndarray) -> np.ndarray:
     Args:
         inputarray: A 1D array of strings
     """
-    newdata = np.zeros(len(inputarray))
-    for n, word in enumerate(np.unique(inputarray)):
-        newdata += ((inputarray == word).astype(int)*n)
-    return newdata
+    _, inverse = np.unique(inputarray, return_inverse=True)
+    return inverse.astype(float)
 
 
 def get_1D_plottype(xpoints: np.ndarray, ypoints: np.ndarray) -> str:
@@ -350,22 +377,18 @@ def datatype_from_setpoints_2d(xpoints: np.ndarray,
 
     # Now check if this is a simple rectangular sweep,
     # possibly interrupted in the middle of one row
-
-    xrows = _rows_from_datapoints(xpoints)
-    yrows = _rows_from_datapoints(ypoints)
-
-    x_check = _all_in_group_or_subgroup(xrows)
-    y_check = _all_in_group_or_subgroup(yrows)
-
-    x_check = x_check and (len(xrows[0]) == len(yrows))
-    y_check = y_check and (len(yrows[0]) == len(xrows))
+    grid = detect_grid(xpoints, ypoints)
 
     # this is the check that we are on a "simple" grid
-    if y_check and x_check:
+    if grid.is_grid:
         return '2D_grid'
 
-    x_check = _all_steps_multiples_of_min_step(xrows)
-    y_check = _all_steps_multiples_of_min_step(yrows)
+    xvalues, xcounts = np.unique(xpoints, return_counts=True)
+    yvalues, ycounts = np.unique(ypoints, return_counts=True)
+    x_check = _all_steps_multiples_of_min_step(_distinct_rows(xvalues,
+                                                              xcounts))
+    y_check = _all_steps_multiples_of_min_step(_distinct_rows(yvalues,
+                                                              ycounts))
 
     # this is the check that we are on an equidistant grid
     if y_check and x_check:
@@ -376,30 +399,121 @@ def datatype_from_setpoints_2d(xpoints: np.ndarray,
 
 def reshape_2D_data(x: np.ndarray, y: np.ndarray, z: np.ndarray
                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    xrow = np.array(_rows_from_datapoints(x)[0])
-    yrow = np.array(_rows_from_datapoints(y)[0])
-    nx = len(xrow)
-    ny = len(yrow)
+    """
+    Sort 2D data onto the grid spanned by the unique values of its
+    setpoints. Points of the grid that have not been measured are NaN (or
+    empty strings for string-valued data).
 
-    # potentially slow method of filling in the data, should be optimised
+    Args:
+        x: The x-axis values
+        y: The y-axis values
+        z: The z-axis values
+
+    Returns:
+        The unique x values, the unique y values and the z values on the
+        grid, with shape ``(len(y values), len(x values))``
+    """
     log.debug('Sorting 2D data onto grid')
+    grid = detect_grid(x, y)
+    xrow, yrow = grid.axes
+    nx, ny = grid.shape
 
     if isinstance(z[0], str):
         z_to_plot = np.full((ny, nx), '', dtype=z.dtype)
     else:
         z_to_plot = np.full((ny, nx), np.nan)
-    x_index = np.zeros_like(x, dtype=np.int)
-    y_index = np.zeros_like(y, dtype=np.int)
-    for i, xval in enumerate(xrow):
-        x_index[np.where(x == xval)[0]] = i
-    for i, yval in enumerate(yrow):
-        y_index[np.where(y == yval)[0]] = i
 
+    x_index, y_index = grid.indices
     z_to_plot[y_index, x_index] = z
 
     return xrow, yrow, z_to_plot
 
 
+def decimate_1D_data(x: np.ndarray, y: np.ndarray, n_buckets: int
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decimate line data for plotting, keeping at most four points per bucket
+    of the x range: the first, the last, the lowest and the highest point.
+    With one bucket per pixel, a line through the decimated points looks the
+    same as a line through all points, but takes a fraction of the time to
+    draw. This takes a single pass over the data.
+
+    Args:
+        x: The x values, sorted in ascending order and without NaNs
+        y: The y values
+        n_buckets: The number of buckets to divide the x range in, usually
+            the width of the plot in pixels
+
+    Returns:
+        The decimated x and y values, which are the input arrays themselves
+        if there are not more than four points per bucket
+    """
+    if len(x) <= 4 * n_buckets:
+        return x, y
+
+    inner_edges = np.linspace(x[0], x[-1], n_buckets + 1)[1:-1]
+    # the first point of each non-empty bucket
+    starts = np.unique(np.concatenate(
+        ([0], np.searchsorted(x, inner_edges, side='left'))))
+    counts = np.diff(np.append(starts, len(x)))
+
+    keep = [starts, starts + counts - 1]
+    for reduce in (np.fmin, np.fmax):
+        extremes = np.repeat(reduce.reduceat(y, starts), counts)
+        hits = np.flatnonzero(y == extremes)
+        buckets = np.searchsorted(starts, hits, side='right')
+        first_hits = np.concatenate(([True], np.diff(buckets) != 0))
+        keep.append(hits[first_hits])
+
+    indices = np.unique(np.concatenate(keep))
+    return x[indices], y[indices]
+
+
+def downsample_2D_data(xrow: np.ndarray, yrow: np.ndarray,
+                       z_on_grid: np.ndarray, shape: Tuple[int, int]
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Downsample gridded data for plotting by averaging blocks of
+    neighbouring points, ignoring NaNs, so that the result has at most the
+    given number of points along each axis.
+
+    Args:
+        xrow: The x values of the grid, as returned by `reshape_2D_data`
+        yrow: The y values of the grid
+        z_on_grid: The z values on the grid, with shape
+            ``(len(yrow), len(xrow))``
+        shape: The maximal number of x and y values of the result, usually
+            the width and height of the plot in pixels
+
+    Returns:
+        The block averaged x values, y values and z values, which are the
+        input arrays themselves if no downsampling is needed
+    """
+    ny, nx = z_on_grid.shape
+    fx = max(int(np.ceil(nx / shape[0])), 1)
+    fy = max(int(np.ceil(ny / shape[1])), 1)
+    if fx == 1 and fy == 1:
+        return xrow, yrow, z_on_grid
+
+    def block_mean(values: np.ndarray, factors: Tuple[int, ...]
+                   ) -> np.ndarray:
+        padding = [(0, -n % f) for n, f in zip(values.shape, factors)]
+        if any(pad for _, pad in padding):
+            values = np.pad(values.astype(float), padding, mode='constant',
+                            constant_values=np.nan)
+        blocks = values.reshape(sum(((n // f, f) for n, f
+                                     in zip(values.shape, factors)), ()))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            counts = np.sum(~np.isnan(blocks), axis=tuple(
+                range(1, 2 * len(factors), 2)))
+            sums = np.nansum(blocks, axis=tuple(
+                range(1, 2 * len(factors), 2)))
+            return sums / counts
+
+    return (block_mean(xrow, (fx,)), block_mean(yrow, (fy,)),
+            block_mean(z_on_grid, (fy, fx)))
+
+
 def get_shaped_data_by_runid(run_id: int) -> List:
     """
     Get data for a given run ID, but shaped according to its nature
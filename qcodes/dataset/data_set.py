@@ -1,6 +1,7 @@
 import functools
 import json
-from typing import Any, Dict, List, Optional, Union, Sized, Callable
+from typing import (Any, Dict, List, Optional, Union, Sized, Callable,
+                    TYPE_CHECKING)
 from threading import Thread
 import time
 import importlib
@@ -8,7 +9,6 @@ import logging
 import uuid
 from queue import Queue, Empty
 import numpy
-import pandas as pd
 
 from qcodes.dataset.param_spec import ParamSpec
 from qcodes.instrument.parameter import _BaseParameter
@@ -51,6 +51,10 @@ from qcodes.dataset.guids import generate_guid
 from qcodes.utils.deprecate import deprecate
 import qcodes.config
 
+if TYPE_CHECKING:
+    # pandas is slow to import, it is only imported when it is used
+    import pandas as pd
+
 log = logging.getLogger(__name__)
 
 
@@ -204,7 +208,7 @@ class DataSet(Sized):
                          'completed', 'snapshot', 'run_timestamp_raw',
                          'description', 'completed_timestamp_raw', 'metadata')
 
-    def __init__(self, path_to_db: str=None,
+    def __init__(self, path_to_db: Optional[str]=None,
                  run_id: Optional[int]=None,
                  conn: Optional[ConnectionPlus]=None,
                  exp_id=None,
@@ -827,7 +831,7 @@ class DataSet(Sized):
                                                     _BaseParameter],
                                      start: Optional[int] = None,
                                      end: Optional[int] = None) -> \
-            Dict[str, pd.DataFrame]:
+            Dict[str, 'pd.DataFrame']:
         """
         Returns the values stored in the DataSet for the specified parameters
         and their dependencies as a dict of :py:class:`pandas.DataFrame` s
@@ -864,6 +868,8 @@ class DataSet(Sized):
             a column and a indexed by a :py:class:`pandas.MultiIndex` formed
             by the dependencies.
         """
+        import pandas as pd
+
         dfs = {}
         datadict = self.get_parameter_data(*params,
                                            start=start,
@@ -0,0 +1,167 @@
+"""
+A formatter that writes legacy ``qcodes.data`` DataSets, e.g. as produced by
+a ``Loop``, directly into a run of the SQLite ``qcodes.dataset``.
+
+Example:
+
+    >>> from qcodes.dataset.database_format import DatabaseFormat
+    >>> data = loop.run(formatter=DatabaseFormat())
+    >>> run = load_by_id(data.run_id)
+"""
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from qcodes.data.format import Formatter
+from qcodes.dataset.data_set import DataSet
+from qcodes.dataset.legacy_import import (paramspecs_from_legacy,
+                                          group_to_results)
+from qcodes.utils.helpers import NumpyJSONEncoder
+
+if TYPE_CHECKING:
+    from qcodes.data.data_set import DataSet as OldDataSet
+
+
+log = logging.getLogger(__name__)
+
+# a run and the last index saved of every group of arrays written to it
+_RunState = Tuple[DataSet, Dict[str, int]]
+
+
+class DatabaseFormat(Formatter):
+    """
+    Formatter streaming a legacy DataSet into a new run of the current
+    database.
+
+    The run is created, with one parameter per ``DataArray`` and measured
+    arrays depending on their setpoint arrays, the first time the legacy
+    DataSet is written. Every subsequent ``write`` appends the points stored
+    since the last one with a single ``DataSet.add_results`` call per group
+    of arrays sharing the same setpoints. The snapshot of the legacy DataSet
+    is stored as the ``snapshot`` metadata of the run, and the run is marked
+    completed when the legacy DataSet is finalized.
+
+    The run id is available as ``run_id`` on the legacy DataSet once it has
+    been written. Nothing is written to the legacy ``io`` and ``location``,
+    so this formatter can not read data back; use ``load_by_id`` instead.
+
+    Args:
+        exp_id: the id of the experiment to create the runs in. Default the
+            last experiment of the database.
+        path_to_db: the database to write to. Default the database of the
+            current config.
+        name: the name of the runs. Default ``'results'``, like runs
+            created by a ``Measurement``. The location of the legacy DataSet
+            is stored as ``legacy_location`` metadata of the run.
+    """
+
+    def __init__(self, exp_id: Optional[int] = None,
+                 path_to_db: Optional[str] = None,
+                 name: Optional[str] = None) -> None:
+        self.exp_id = exp_id
+        self.path_to_db = path_to_db
+        self.name = name
+        # the run of every legacy DataSet written, and the last index saved
+        # of every group of arrays of it
+        self._runs: 'WeakKeyDictionary[OldDataSet, _RunState]' = \
+            WeakKeyDictionary()
+
+    def _get_run(self, data_set: 'OldDataSet'
+                 ) -> '_RunState':
+        """
+        Get the run belonging to a legacy DataSet, creating and starting it
+        if it does not exist yet, and the last index saved of every group of
+        arrays.
+        """
+        if data_set not in self._runs:
+            run = DataSet(path_to_db=self.path_to_db, exp_id=self.exp_id,
+                          name=self.name or 'results',
+                          specs=paramspecs_from_legacy(data_set))
+            run.mark_started()
+            if data_set.location:
+                run.add_metadata('legacy_location', data_set.location)
+            self._runs[data_set] = (run, {})
+            data_set.run_id = run.run_id
+            log.info(f'Writing {data_set.location} to run {run.run_id} '
+                     f'in {run.path_to_db}')
+        return self._runs[data_set]
+
+    def write(self, data_set: 'OldDataSet', io_manager, location,
+              write_metadata=True, force_write=False, only_complete=True):
+        """
+        Append all new data in this DataSet to its run in the database.
+
+        Rows are only ever appended: data that has already been written is
+        never written again, even if ``force_write`` is set.
+
+        Args:
+            data_set: the data we're storing
+            io_manager (io_manager): unused
+            location (str): unused
+            write_metadata (bool): if True, then the snapshot is written too
+            force_write (bool): unused, the database is append-only
+            only_complete (bool): passed to match_save_range, whether to
+                write only points for which all arrays of a group have data
+        """
+        run, last_saved = self._get_run(data_set)
+
+        for group in self.group_arrays(data_set.arrays):
+            if not group.data:
+                continue
+            save_range = self.match_save_range(group, file_exists=True,
+                                               only_complete=only_complete)
+            if save_range is None:
+                continue
+
+            start = max(save_range[0], last_saved.get(group.name, -1) + 1)
+            stop = save_range[1]
+            if stop >= start:
+                run.add_results(group_to_results(group, start, stop))
+                last_saved[group.name] = stop
+                log.debug(f'Wrote points {start} to {stop} of '
+                          f'{group.name} to run {run.run_id}')
+
+            for array in group.data + (group.set_arrays[-1],):
+                array.mark_saved(stop)
+
+        if write_metadata:
+            self.write_metadata(data_set, io_manager, location)
+
+    def write_metadata(self, data_set: 'OldDataSet', io_manager, location,
+                       read_first=True):
+        """
+        Write the snapshot of this DataSet as metadata of its run.
+
+        Args:
+            data_set: the data we're storing
+            io_manager (io_manager): unused
+            location (str): unused
+            read_first (bool): unused, the database holds no other metadata
+                than what is written here
+        """
+        run, _ = self._get_run(data_set)
+        run.add_metadata('snapshot', json.dumps(data_set.metadata,
+                                                cls=NumpyJSONEncoder))
+
+    def close_file(self, data_set: 'OldDataSet'):
+        """
+        Mark the run of this DataSet completed.
+
+        Args:
+            data_set: DataSet object
+        """
+        run, _ = self._runs.get(data_set, (None, None))
+        if run is not None and not run.completed:
+            run.mark_completed()
+
+    def read(self, data_set: 'OldDataSet'):
+        raise NotImplementedError('DatabaseFormat can not read data back '
+                                  'into a legacy DataSet, use '
+                                  'qcodes.dataset.data_set.load_by_id '
+                                  'with the run_id of the DataSet instead.')
+
+    def read_metadata(self, data_set: 'OldDataSet'):
+        run, _ = self._runs.get(data_set, (None, None))
+        if run is not None and run.snapshot is not None:
+            data_set.metadata.update(run.snapshot)
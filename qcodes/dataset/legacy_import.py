@@ -1,11 +1,26 @@
-from typing import List
+from collections import OrderedDict
+from traceback import format_exc
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 import json
+import logging
+import multiprocessing
+import os
+
+from tqdm import tqdm
 
 from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.data_set import DataSet, new_data_set
+from qcodes.dataset.experiment_container import Experiment
+from qcodes.dataset.param_spec import ParamSpec
+from qcodes.dataset.sqlite_base import ConnectionPlus
 from qcodes.data.data_set import load_data
 from qcodes.data.data_set import DataSet as OldDataSet
+from qcodes.data.format import Formatter
+from qcodes.utils.helpers import NumpyJSONEncoder
 import numpy as np
 
+log = logging.getLogger(__name__)
+
 
 def setup_measurement(dataset: OldDataSet) -> Measurement:
     """
@@ -28,6 +43,111 @@ def setup_measurement(dataset: OldDataSet) -> Measurement:
     return meas
 
 
+def paramspecs_from_legacy(dataset: OldDataSet) -> List[ParamSpec]:
+    """
+    Make ParamSpecs for all DataArrays in a given QCoDeS legacy dataset
+
+    The setpoint arrays come first, so the specs can be added to a new
+    DataSet in the order returned. Measured arrays depend on their
+    setpoint arrays.
+    """
+    setpoints = [array for array in dataset.arrays.values()
+                 if array.is_setpoint]
+    measured = [array for array in dataset.arrays.values()
+                if not array.is_setpoint]
+    specs = [ParamSpec(name=array.array_id, paramtype='numeric',
+                       label=array.label, unit=array.unit)
+             for array in setpoints]
+    specs += [ParamSpec(name=array.array_id, paramtype='numeric',
+                        label=array.label, unit=array.unit,
+                        depends_on=[setarray.array_id
+                                    for setarray in array.set_arrays])
+              for array in measured]
+    return specs
+
+
+def group_to_columns(group: Formatter.ArrayGroup,
+                     start: int = 0,
+                     stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Flatten a group of legacy DataArrays sharing the same setpoints into
+    1D columns of equal length, one per setpoint and measured array.
+
+    Each column holds the values of its array at the (raveled) points of the
+    innermost setpoint array. Outer setpoint arrays are broadcast to the
+    full shape of the group.
+
+    Args:
+        group: the arrays, as returned by ``Formatter.group_arrays``
+        start: the first raveled index to include
+        stop: the last raveled index to include, default the last point
+
+    Returns:
+        ``{array_id: column}``, setpoint arrays first
+    """
+    shape = group.set_arrays[-1].shape
+    if stop is None:
+        stop = int(np.prod(shape)) - 1
+    indices = np.unravel_index(np.arange(start, stop + 1), shape)
+
+    columns: Dict[str, np.ndarray] = OrderedDict()
+    for set_array in group.set_arrays:
+        ndim = len(set_array.shape)
+        columns[set_array.array_id] = set_array.ndarray[indices[:ndim]]
+    for array in group.data:
+        columns[array.array_id] = array.ndarray[indices]
+    return columns
+
+
+def columns_to_results(columns: Dict[str, np.ndarray],
+                       start: int = 0,
+                       stop: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Turn (a slice of) columns of equal length into results that can be
+    passed to ``DataSet.add_results``: one dict of ``{name: value}`` per row.
+    """
+    names = list(columns.keys())
+    rows = zip(*(column[start:stop].tolist()
+                 for column in columns.values()))
+    return [dict(zip(names, row)) for row in rows]
+
+
+def group_to_results(group: Formatter.ArrayGroup,
+                     start: int = 0,
+                     stop: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Flatten a group of legacy DataArrays sharing the same setpoints into
+    results that can be passed to ``DataSet.add_results``.
+
+    See ``group_to_columns`` for the meaning of the arguments.
+    """
+    return columns_to_results(group_to_columns(group, start, stop))
+
+
+def dataset_to_columns(dataset: OldDataSet) -> List[Dict[str, np.ndarray]]:
+    """
+    Flatten all arrays of a legacy dataset into columns, one dict of columns
+    per group of arrays sharing the same setpoints.
+    """
+    return [group_to_columns(group)
+            for group in dataset.formatter.group_arrays(dataset.arrays)
+            if group.data]
+
+
+def store_columns_to_database(dataset: DataSet,
+                              column_groups: Sequence[Dict[str, np.ndarray]],
+                              chunk_size: int = 10000) -> None:
+    """
+    Insert groups of columns, as made by ``dataset_to_columns``, into a
+    started DataSet with one ``add_results`` call per ``chunk_size`` rows.
+    """
+    for columns in column_groups:
+        n_rows = len(next(iter(columns.values())))
+        for start in range(0, n_rows, chunk_size):
+            dataset.add_results(
+                columns_to_results(columns, start, start + chunk_size))
+
+
 def store_array_to_database(datasaver, array):
     dims = len(array.shape)
     if dims == 2:
@@ -65,19 +185,142 @@ def store_array_to_database_alt(meas, array):
     return datasaver.run_id
 
 
-def import_dat_file(location: str) -> List[int]:
+def _new_run_from_legacy(specs: Sequence[ParamSpec],
+                         column_groups: Sequence[Dict[str, np.ndarray]],
+                         snapshot: str,
+                         exp_id: Optional[int] = None,
+                         conn: Optional[ConnectionPlus] = None,
+                         chunk_size: int = 10000) -> int:
     """
-    This imports a QCoDeS legacy DataSet
+    Create a completed run holding the flattened content of a legacy dataset
+    """
+    dataset = new_data_set('results', exp_id=exp_id, specs=list(specs),
+                           conn=conn)
+    dataset.mark_started()
+    dataset.add_metadata('snapshot', snapshot)
+    store_columns_to_database(dataset, column_groups, chunk_size=chunk_size)
+    dataset.mark_completed()
+    return dataset.run_id
+
+
+def import_dat_file(location: str,
+                    exp: Optional[Experiment] = None,
+                    chunk_size: int = 10000) -> List[int]:
     """
+    This imports a QCoDeS legacy DataSet
+
+    All arrays are flattened into columns and inserted into one new run in
+    chunks of ``chunk_size`` rows. Points measured at the same setpoints are
+    stored in the same row.
 
+    Args:
+        location: the location of the legacy DataSet
+        exp: the experiment to create the run in, default the last one
+        chunk_size: the number of rows inserted per ``add_results`` call
 
+    Returns:
+        the run id of the new run, once for every measured array of the
+        legacy DataSet
+    """
     loaded_data = load_data(location)
-    meas = setup_measurement(loaded_data)
-    run_ids = []
-    with meas.run() as datasaver:
-        datasaver.dataset.add_metadata('snapshot', json.dumps(loaded_data.snapshot()))
-        for arrayname, array in loaded_data.arrays.items():
-            if not array.is_setpoint:
-                run_id = store_array_to_database(datasaver, array)
-                run_ids.append(run_id)
+    specs = paramspecs_from_legacy(loaded_data)
+    run_id = _new_run_from_legacy(
+        specs, dataset_to_columns(loaded_data),
+        json.dumps(loaded_data.snapshot(), cls=NumpyJSONEncoder),
+        exp_id=None if exp is None else exp.exp_id,
+        conn=None if exp is None else exp.conn,
+        chunk_size=chunk_size)
+    return [run_id for spec in specs if spec.depends_on]
+
+
+def find_dat_files(root: str, extension: str = '.dat') -> List[str]:
+    """
+    Find all legacy GNUPlot DataSets in a directory tree, i.e. all
+    directories containing at least one file with the given extension.
+
+    Returns:
+        the sorted locations of the DataSets
+    """
+    locations = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if any(fn.endswith(extension) for fn in filenames):
+            locations.append(dirpath)
+    return sorted(locations)
+
+
+def _load_legacy_columns(location: str) -> Tuple[str, Any, Optional[str]]:
+    """
+    Load and flatten a legacy DataSet. Runs in the worker processes of
+    ``import_dat_files``, so everything returned must be picklable.
+
+    Returns:
+        the location, the tuple of ``(specs, column groups, snapshot)`` or
+        None if loading failed, and the formatted error if it failed.
+    """
+    try:
+        loaded_data = load_data(location)
+        if not loaded_data.arrays:
+            raise ValueError(f'No data arrays found at {location}')
+        content = (paramspecs_from_legacy(loaded_data),
+                   dataset_to_columns(loaded_data),
+                   json.dumps(loaded_data.snapshot(), cls=NumpyJSONEncoder))
+        return location, content, None
+    except Exception:
+        return location, None, format_exc()
+
+
+def import_dat_files(root: str,
+                     exp: Optional[Experiment] = None,
+                     processes: Optional[int] = None,
+                     chunk_size: int = 10000,
+                     progress: bool = True) -> Dict[str, int]:
+    """
+    Import all QCoDeS legacy DataSets found in a directory tree into one
+    database, one run per legacy DataSet.
+
+    Reading and flattening the legacy files is done in a pool of worker
+    processes, while all inserts happen from this process, so there is only
+    ever one writer to the database. The runs are created in the sorted order
+    of the locations. Legacy DataSets that can not be read are logged and
+    skipped.
+
+    Args:
+        root: the directory to search for legacy DataSets, see
+            ``find_dat_files``
+        exp: the experiment to create the runs in, default the last one
+        processes: the number of worker processes, default the number of
+            CPUs. With 1, everything is done in this process.
+        chunk_size: the number of rows inserted per ``add_results`` call
+        progress: show a progress bar
+
+    Returns:
+        the run id of each imported legacy DataSet, by location
+    """
+    locations = find_dat_files(root)
+    exp_id = None if exp is None else exp.exp_id
+    conn = None if exp is None else exp.conn
+
+    loaded: Iterable[Tuple[str, Any, Optional[str]]]
+    if processes == 1:
+        pool = None
+        loaded = map(_load_legacy_columns, locations)
+    else:
+        pool = multiprocessing.Pool(processes)
+        loaded = pool.imap(_load_legacy_columns, locations)
+
+    run_ids = {}
+    try:
+        for location, content, error in tqdm(loaded, total=len(locations),
+                                             disable=not progress):
+            if content is None:
+                log.warning(f'Could not import {location}:\n{error}')
+                continue
+            specs, column_groups, snapshot = content
+            run_ids[location] = _new_run_from_legacy(
+                specs=specs, column_groups=column_groups, snapshot=snapshot,
+                exp_id=exp_id, conn=conn, chunk_size=chunk_size)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
     return run_ids
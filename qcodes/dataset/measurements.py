@@ -63,7 +63,8 @@ class DataSaver:
     default_callback: Optional[dict] = None
 
     def __init__(self, dataset: DataSet, write_period: numeric_types,
-                 parameters: Dict[str, ParamSpec]) -> None:
+                 parameters: Dict[str, ParamSpec],
+                 live_plots: Sequence[Any] = ()) -> None:
         self._dataset = dataset
         if DataSaver.default_callback is not None \
                 and 'run_tables_subscription_callback' \
@@ -90,6 +91,7 @@ class DataSaver:
         self.parameters = parameters
         self._known_parameters = list(parameters.keys())
         self._results: List[dict] = []  # will be filled by addResult
+        self._live_plots = live_plots
         self._last_save_time = monotonic()
         self._known_dependencies: Dict[str, List[str]] = {}
         for param, parspec in parameters.items():
@@ -236,7 +238,10 @@ class DataSaver:
         elif inserting_as_arrays:
             input_size = 1
 
+        n_results = len(self._results)
         self._append_results(res, input_size)
+        for live_plot in self._live_plots:
+            live_plot.add_results(self._results[n_results:])
 
         if monotonic() - self._last_save_time > self.write_period:
             self.flush_data_to_database()
@@ -439,7 +444,8 @@ class Runner:
             name: str = '',
             subscribers: Sequence[Tuple[Callable,
                                         Union[MutableSequence,
-                                              MutableMapping]]] = None) -> None:
+                                              MutableMapping]]] = None,
+            live_plots: Sequence[Any] = ()) -> None:
 
         self.enteractions = enteractions
         self.exitactions = exitactions
@@ -450,6 +456,7 @@ class Runner:
             self.subscribers = []
         else:
             self.subscribers = subscribers
+        self.live_plots = live_plots
         self.experiment = experiment
         self.station = station
         self.parameters = parameters
@@ -503,7 +510,8 @@ class Runner:
 
         self.datasaver = DataSaver(dataset=self.ds,
                                    write_period=self.write_period,
-                                   parameters=self.parameters)
+                                   parameters=self.parameters,
+                                   live_plots=self.live_plots)
 
         return self.datasaver
 
@@ -541,6 +549,7 @@ class Measurement:
         self.enteractions: List[Tuple[Callable, Sequence]] = []
         self.subscribers: List[Tuple[Callable, Union[MutableSequence,
                                                      MutableMapping]]] = []
+        self.live_plots: List[Any] = []
         self.experiment = exp
         self.station = station
         self.parameters: Dict[str, ParamSpec] = OrderedDict()
@@ -942,6 +951,19 @@ class Measurement:
 
         return self
 
+    def add_live_plot(self: T, live_plot: Any) -> T:
+        """
+        Push the results of the measurement to a live plot as they are
+        added, instead of when they are written to the database.
+
+        Args:
+            live_plot: A ``qcodes.plots.live_plot.LivePlot`` whose traces
+                refer to parameters of this measurement.
+        """
+        self.live_plots.append(live_plot)
+
+        return self
+
     def run(self) -> Runner:
         """
         Returns the context manager for the experimental run
@@ -951,4 +973,5 @@ class Measurement:
                       write_period=self._write_period,
                       parameters=self.parameters,
                       name=self.name,
-                      subscribers=self.subscribers)
+                      subscribers=self.subscribers,
+                      live_plots=self.live_plots)
@@ -2,7 +2,7 @@ import logging
 from collections import OrderedDict
 from functools import partial
 from typing import (Optional, List, Sequence, Union, Tuple, Dict,
-                    Any, Set)
+                    Any, Set, Callable)
 import inspect
 import numpy as np
 import matplotlib
@@ -16,6 +16,7 @@ from qcodes.utils.plotting import auto_color_scale_from_config
 
 from .data_export import (get_data_by_id, flatten_1D_data_for_plot,
                           get_1D_plottype, get_2D_plottype, reshape_2D_data,
+                          decimate_1D_data, downsample_2D_data,
                           _strings_as_ints)
 
 log = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ def plot_by_id(run_id: int,
                rescale_axes: bool=True,
                auto_color_scale: Optional[bool]=None,
                cutoff_percentile: Optional[Union[Tuple[Number, Number], Number]]=None,
+               decimate: bool=False,
                **kwargs) -> AxesTupleList:
     """
     Construct all plots for a given run
@@ -130,6 +132,13 @@ def plot_by_id(run_id: int,
             on both sides of the distribution.
             If given a tuple (a,b) the percentile limits will be a and 100-b.
             See also the plotting tuorial notebook.
+        decimate: if True, only plot as much detail as the axes can show:
+            line plots are decimated to the lowest and highest point per
+            pixel, and heatmaps on a grid are downsampled to the pixel size
+            of the axes by averaging blocks of points. Whenever the limits
+            of the axes change, e.g. by zooming in, the visible part is
+            plotted again, at full resolution once there are fewer points
+            than pixels. Useful for plotting runs with millions of points.
 
     Returns:
         a list of axes and a list of colorbars of the same length. The
@@ -195,7 +204,10 @@ def plot_by_id(run_id: int,
 
                 with _appropriate_kwargs(plottype,
                                          colorbar is not None, **kwargs) as k:
-                    ax.plot(xpoints, ypoints, **k)
+                    if decimate:
+                        _DecimatedLine(ax, xpoints, ypoints, **k)
+                    else:
+                        ax.plot(xpoints, ypoints, **k)
             elif plottype == '1D_point':
                 with _appropriate_kwargs(plottype,
                                          colorbar is not None, **kwargs) as k:
@@ -231,11 +243,14 @@ def plot_by_id(run_id: int,
 
             log.debug(f'Determined plottype: {plottype}')
 
-            how_to_plot = {'2D_grid': plot_on_a_plain_grid,
-                           '2D_equidistant': plot_on_a_plain_grid,
-                           '2D_point': plot_2d_scatterplot,
-                           '2D_unknown': plot_2d_scatterplot}
+            how_to_plot: Dict[str, Callable[..., AxesTuple]] = {
+                '2D_grid': plot_on_a_plain_grid,
+                '2D_equidistant': plot_on_a_plain_grid,
+                '2D_point': plot_2d_scatterplot,
+                '2D_unknown': plot_2d_scatterplot}
             plot_func = how_to_plot[plottype]
+            if decimate and plot_func is plot_on_a_plain_grid:
+                plot_func = partial(plot_on_a_plain_grid, decimate=True)
 
             with _appropriate_kwargs(plottype,
                                      colorbar is not None, **kwargs) as k:
@@ -356,6 +371,7 @@ def plot_on_a_plain_grid(x: np.ndarray,
                          z: np.ndarray,
                          ax: matplotlib.axes.Axes,
                          colorbar: matplotlib.colorbar.Colorbar=None,
+                         decimate: bool=False,
                          **kwargs
                          ) -> AxesTuple:
     """
@@ -376,6 +392,9 @@ def plot_on_a_plain_grid(x: np.ndarray,
         z: The z values
         ax: The axis to plot onto
         colorbar: a colorbar to reuse the axis for
+        decimate: if True, downsample numeric data to the pixel size of the
+            axes, and plot the visible part again whenever the limits of the
+            axes change (see `plot_by_id`)
 
     Returns:
         The matplotlib axes handle for plot and colorbar
@@ -401,34 +420,18 @@ def plot_on_a_plain_grid(x: np.ndarray,
 
     xrow, yrow, z_to_plot = reshape_2D_data(x, y, z)
 
-    # we use a general edge calculator,
-    # in the case of non-equidistantly spaced data
-    # TODO: is this appropriate for a log ax?
-    dxs = np.diff(xrow)/2
-    dys = np.diff(yrow)/2
-    x_edges = np.concatenate((np.array([xrow[0] - dxs[0]]),
-                              xrow[:-1] + dxs,
-                              np.array([xrow[-1] + dxs[-1]])))
-    y_edges = np.concatenate((np.array([yrow[0] - dys[0]]),
-                              yrow[:-1] + dys,
-                              np.array([yrow[-1] + dys[-1]])))
-    if 'rasterized' in kwargs.keys():
-        rasterized = kwargs.pop('rasterized')
-    else:
-        rasterized = len(x_edges) * len(y_edges) \
-                      > qc.config.plotting.rasterize_threshold
-
     cmap = kwargs.pop('cmap') if 'cmap' in kwargs else None
 
     if z_is_stringy:
         name = cmap.name if hasattr(cmap, 'name') else 'viridis'
         cmap = matplotlib.cm.get_cmap(name, len(z_strings))
 
-    colormesh = ax.pcolormesh(x_edges, y_edges,
-                              np.ma.masked_invalid(z_to_plot),
-                              rasterized=rasterized,
-                              cmap=cmap,
-                              **kwargs)
+    if decimate and not z_is_stringy:
+        colormesh = _DecimatedMesh(ax, xrow, yrow, z_to_plot,
+                                   cmap=cmap, **kwargs).mesh
+    else:
+        colormesh = _plot_mesh(ax, xrow, yrow, z_to_plot,
+                               cmap=cmap, **kwargs)
 
     if x_is_stringy:
         ax.set_xticks(np.arange(len(np.unique(x_strings))))
@@ -452,6 +455,154 @@ def plot_on_a_plain_grid(x: np.ndarray,
     return ax, colorbar
 
 
+def _cell_edges(row: np.ndarray) -> np.ndarray:
+    """
+    The edges of the cells around the given (sorted) grid values, halfway
+    between neighbouring values
+    """
+    # we use a general edge calculator,
+    # in the case of non-equidistantly spaced data
+    # TODO: is this appropriate for a log ax?
+    ds = np.diff(row)/2
+    return np.concatenate((np.array([row[0] - ds[0]]),
+                           row[:-1] + ds,
+                           np.array([row[-1] + ds[-1]])))
+
+
+def _plot_mesh(ax: matplotlib.axes.Axes, xrow: np.ndarray, yrow: np.ndarray,
+               z_to_plot: np.ndarray, **kwargs
+               ) -> matplotlib.collections.QuadMesh:
+    """
+    Plot gridded data as returned by `reshape_2D_data` with pcolormesh.
+    ``**kwargs`` are passed to pcolormesh.
+    """
+    x_edges = _cell_edges(xrow)
+    y_edges = _cell_edges(yrow)
+    if 'rasterized' not in kwargs.keys():
+        kwargs['rasterized'] = len(x_edges) * len(y_edges) \
+                               > qc.config.plotting.rasterize_threshold
+
+    return ax.pcolormesh(x_edges, y_edges,
+                         np.ma.masked_invalid(z_to_plot),
+                         **kwargs)
+
+
+class _Decimated:
+    """
+    Base class of plots that only show as much detail as their axes can
+    show, and are plotted again whenever the limits of the axes change.
+
+    Subclasses make the initial plot in their ``__init__`` and then call
+    ``_connect``. The instance is kept alive by the axes, since matplotlib
+    only keeps weak references to callbacks.
+    """
+    limits: Tuple[str, ...] = ('xlim_changed', 'ylim_changed')
+
+    def __init__(self, ax: matplotlib.axes.Axes) -> None:
+        self.ax = ax
+        self._replotting = False
+
+    def _connect(self) -> None:
+        if not hasattr(self.ax, '_qcodes_decimated'):
+            self.ax._qcodes_decimated = []
+        self.ax._qcodes_decimated.append(self)
+        for limit in self.limits:
+            self.ax.callbacks.connect(limit, self._on_limits_changed)
+
+    @property
+    def pixels(self) -> Tuple[int, int]:
+        """The width and height of the axes in pixels"""
+        return (max(int(self.ax.bbox.width), 1),
+                max(int(self.ax.bbox.height), 1))
+
+    @staticmethod
+    def _visible(row: np.ndarray, limits: Tuple[float, float]) -> slice:
+        """
+        The slice of the sorted ``row`` that is within the limits, plus one
+        point on each side so that the plot extends to the edges of the axes
+        """
+        low, high = sorted(limits)
+        start = max(int(np.searchsorted(row, low, side='left')) - 1, 0)
+        stop = int(np.searchsorted(row, high, side='right')) + 1
+        if stop - start < 2:
+            return slice(0, len(row))
+        return slice(start, stop)
+
+    def _on_limits_changed(self, ax: matplotlib.axes.Axes) -> None:
+        # plotting may update the limits of the axes itself
+        if self._replotting:
+            return
+        self._replotting = True
+        try:
+            self.replot()
+        finally:
+            self._replotting = False
+
+    def replot(self) -> None:
+        raise NotImplementedError
+
+
+class _DecimatedLine(_Decimated):
+    """
+    A line plot of sorted data, decimated to the lowest and highest point
+    per pixel of the visible part, see `decimate_1D_data`. ``**kwargs`` are
+    passed to matplotlib's plot.
+    """
+    limits = ('xlim_changed',)
+
+    def __init__(self, ax: matplotlib.axes.Axes,
+                 x: np.ndarray, y: np.ndarray, **kwargs) -> None:
+        super().__init__(ax)
+        finite = ~np.isnan(x)
+        self.x = x[finite]
+        self.y = y[finite]
+        self.line, = ax.plot(*decimate_1D_data(self.x, self.y,
+                                               self.pixels[0]), **kwargs)
+        self._connect()
+
+    def replot(self) -> None:
+        visible = self._visible(self.x, self.ax.get_xlim())
+        self.line.set_data(*decimate_1D_data(self.x[visible],
+                                             self.y[visible],
+                                             self.pixels[0]))
+
+
+class _DecimatedMesh(_Decimated):
+    """
+    A heatmap of gridded data, downsampled to the pixel size of the visible
+    part by block averaging, see `downsample_2D_data`. ``**kwargs`` are
+    passed to matplotlib's pcolormesh. Since the number of cells of a
+    pcolormesh can not be changed, it is replaced by a new one, sharing the
+    colormap and normalization, whenever the limits change.
+    """
+    def __init__(self, ax: matplotlib.axes.Axes, xrow: np.ndarray,
+                 yrow: np.ndarray, z_to_plot: np.ndarray, **kwargs) -> None:
+        self.xrow = xrow
+        self.yrow = yrow
+        self.z_to_plot = z_to_plot
+        self.kwargs = kwargs
+        super().__init__(ax)
+        self.mesh = _plot_mesh(ax, *downsample_2D_data(xrow, yrow, z_to_plot,
+                                                       self.pixels),
+                               **kwargs)
+        self._connect()
+
+    def replot(self) -> None:
+        xs = self._visible(self.xrow, self.ax.get_xlim())
+        ys = self._visible(self.yrow, self.ax.get_ylim())
+        kwargs = dict(self.kwargs, cmap=self.mesh.get_cmap(),
+                      norm=self.mesh.norm)
+        mesh = _plot_mesh(self.ax, *downsample_2D_data(
+            self.xrow[xs], self.yrow[ys], self.z_to_plot[ys, xs],
+            self.pixels), **kwargs)
+        colorbar = self.mesh.colorbar
+        self.mesh.remove()
+        self.mesh = mesh
+        if colorbar is not None:
+            colorbar.mappable = mesh
+            mesh.colorbar = colorbar
+
+
 _UNITS_FOR_RESCALING: Set[str] = {
     # SI units (without some irrelevant ones like candela)
     # 'kg' is not included because it is 'kilo' and rarely used
@@ -1683,6 +1683,50 @@ def get_dependencies(conn: ConnectionPlus,
     return res
 
 
+def get_dependent_layouts(conn: ConnectionPlus,
+                          run_id: int) -> List[List[Dict[str, str]]]:
+    """
+    Get the layouts of all dependent variables of a run together with the
+    layouts of their dependencies, in two queries, as needed for plotting
+
+    Args:
+        conn: connection to the database
+        run_id: the run_id of the run
+
+    Returns:
+        A list with an element per dependent variable, in the order of their
+        layout_ids. Each element is a list of the layouts of the
+        dependencies, in the order of their axis_num, followed by the layout
+        of the dependent variable itself. The layouts are dicts with name,
+        label, and unit, like those returned by `get_layout`.
+    """
+    sql = """
+    SELECT layout_id, parameter, label, unit FROM layouts
+    WHERE run_id=?
+    ORDER BY layout_id
+    """
+    c = atomic_transaction(conn, sql, run_id)
+    layouts = {layout_id: dict(zip(['name', 'label', 'unit'], rest))
+               for layout_id, *rest
+               in many_many(c, 'layout_id', 'parameter', 'label', 'unit')}
+
+    sql = """
+    SELECT dependent, independent, axis_num FROM dependencies
+    WHERE dependent IN (SELECT layout_id FROM layouts WHERE run_id=?)
+    """
+    c = atomic_transaction(conn, sql, run_id)
+    dependencies: Dict[int, List[Tuple[int, int]]] = {}
+    for dependent, independent, axis_num in many_many(c, 'dependent',
+                                                      'independent',
+                                                      'axis_num'):
+        dependencies.setdefault(dependent, []).append((axis_num, independent))
+
+    return [[layouts[independent]
+             for _, independent in sorted(dependencies[layout_id])]
+            + [layouts[layout_id]]
+            for layout_id in layouts if layout_id in dependencies]
+
+
 def get_non_dependencies(conn: ConnectionPlus,
                          run_id: int) -> List[str]:
     """
@@ -145,12 +145,12 @@ class IPInstrument(Instrument):
 
     def _send(self, cmd):
         data = cmd + self._terminator
-        log.debug(f"Writing {data} to instrument {self.name}")
+        log.debug("Writing %s to instrument %s", data, self.name)
         self._socket.sendall(data.encode())
 
     def _recv(self):
         result = self._socket.recv(self._buffer_size)
-        log.debug(f"Got {result} from instrument {self.name}")
+        log.debug("Got %s from instrument %s", result, self.name)
         if result == b'':
             log.warning("Got empty response from Socket recv() "
                         "Connection broken.")
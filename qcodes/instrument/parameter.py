@@ -71,6 +71,7 @@ import os
 import collections
 import warnings
 import enum
+import weakref
 from typing import Optional, Sequence, TYPE_CHECKING, Union, Callable, List, \
     Dict, Any, Sized, Iterable, cast, Type, Tuple
 from functools import partial, wraps
@@ -262,6 +263,9 @@ class _BaseParameter(Metadatable):
         self._latest: Dict[str, Optional[Union[ParamDataType, datetime]]] = \
             {'value': None, 'ts': None, 'raw_value': None}
         self.get_latest = GetLatest(self, max_val_age=max_val_age)
+        # objects (e.g. a Monitor) whose ``parameter_updated`` method is
+        # called with this parameter whenever its latest value changes
+        self._update_listeners: 'weakref.WeakSet' = weakref.WeakSet()
 
         if hasattr(self, 'get_raw') and not getattr(self.get_raw, '__qcodes_is_abstract_method__', False):
             self.get = self._wrap_get(self.get_raw)
@@ -409,6 +413,9 @@ class _BaseParameter(Metadatable):
             self.raw_value = value
         self._latest = {'value': value, 'ts': datetime.now(),
                         'raw_value': self.raw_value}
+        if self._update_listeners:
+            for listener in self._update_listeners:
+                listener.parameter_updated(self)
 
     def _wrap_get(self, get_function: Callable[..., ParamDataType]) ->\
             Callable[..., ParamDataType]:
@@ -928,7 +935,8 @@ class Parameter(_BaseParameter):
                  vals: Optional[Validator]=None,
                  docstring: Optional[str]=None,
                  **kwargs) -> None:
-        super().__init__(name=name, instrument=instrument, vals=vals, **kwargs)
+        super().__init__(name=name, instrument=instrument, vals=vals,
+                         max_val_age=max_val_age, **kwargs)
 
         # Enable set/get methods if get_cmd/set_cmd is given
         # Called first so super().__init__ can wrap get/set methods
@@ -3,6 +3,7 @@ from copy import deepcopy
 from qcodes.utils.helpers import (is_sequence, permissive_range, make_sweep,
                                   named_repr)
 from qcodes.utils.metadata import Metadatable
+from qcodes.utils.adaptive import Learner1D
 
 
 class SweepValues(Metadatable):
@@ -20,9 +21,6 @@ class SweepValues(Metadatable):
 
     >>> .feedback(set_values, measured_values)
 
-    Todo:
-        - Link to adawptive sweep
-
     Args:
         parameter (Parameter): the target of the sweep, an object with
          set, and optionally validate methods
@@ -284,3 +282,91 @@ class SweepFixedValues(SweepValues):
         new_sv = self.copy()
         new_sv.reverse()
         return new_sv
+
+
+class AdaptiveSweep(SweepValues):
+    """
+    Adaptively chosen values of a parameter to sweep, concentrated where a
+    measured parameter changes fastest.
+
+    The values are chosen by bisection (see
+    ``qcodes.utils.adaptive.Learner1D``): first the start and stop values,
+    then always the midpoint of the interval between neighbouring values
+    across which the measured value changes most. After each value is set,
+    the sweep waits for the value measured there, either given to
+    ``feedback`` or, if not, read from ``measured_parameter.get_latest()``.
+    In a ``Loop`` the latter means that ``measured_parameter`` must be
+    measured at every point:
+
+    >>> sv = AdaptiveSweep(gate, dmm.current, start=-1, stop=1, num=200)
+    >>> Loop(sv).each(dmm.current).run()
+
+    The setpoints are not monotonic, so plot the data as scatter data.
+
+    Args:
+        parameter (Parameter): the target of the sweep
+        measured_parameter (Parameter): the parameter whose value decides
+            where to measure next
+        start (float): the first bound of the sweep
+        stop (float): the second bound of the sweep
+        num (int): the number of values to sweep
+        min_step (Optional[float]): the smallest distance between two values.
+            Default ``1e-6`` of the range of the sweep.
+    """
+    def __init__(self, parameter, measured_parameter, start, stop, num,
+                 min_step=None):
+        super().__init__(parameter)
+        if num < 2:
+            raise ValueError('An adaptive sweep needs at least 2 points')
+        self.validate((start, stop))
+        self.measured_parameter = measured_parameter
+        self.start = start
+        self.stop = stop
+        self.num = num
+        self.min_step = min_step
+        self._feedback = None
+
+    def feedback(self, set_values, measured_values):
+        """
+        Give the value measured at the last value of the sweep.
+
+        Args:
+            set_values: the loop indices of the point, unused
+            measured_values (float): the value of the measured parameter
+        """
+        self._feedback = measured_values
+
+    def __iter__(self):
+        learner = Learner1D((self.start, self.stop), min_step=self.min_step)
+        self._values = []
+        for _ in range(self.num):
+            value = learner.ask()
+            self._values.append(value)
+            self._feedback = None
+            yield value
+            measured = self._feedback
+            if measured is None:
+                measured = self.measured_parameter.get_latest()
+            learner.tell(value, measured)
+
+    def __len__(self):
+        return self.num
+
+    def snapshot_base(self, update=False):
+        """
+        Snapshot state of AdaptiveSweep.
+
+        Args:
+            update (bool): Place holder for API compatibility.
+
+        Returns:
+            dict: base snapshot
+        """
+        return {
+            'parameter': self.parameter.snapshot(),
+            'measured_parameter': self.measured_parameter.full_name,
+            'values': [{'first': self.start,
+                        'last': self.stop,
+                        'num': self.num,
+                        'type': 'adaptive'}]
+        }
@@ -1,8 +1,9 @@
 """Visa instrument driver based on pyvisa."""
-from typing import Sequence
+from typing import Optional, Sequence
 import warnings
 import logging
 
+import numpy as np
 import visa
 import pyvisa.constants as vi_const
 import pyvisa.resources
@@ -210,7 +211,7 @@ class VisaInstrument(Instrument):
         Args:
             cmd (str): The command to send to the instrument.
         """
-        self.visa_log.debug(f"Writing: {cmd}")
+        self.visa_log.debug("Writing: %s", cmd)
 
         nr_bytes_written, ret_code = self.visa_handle.write(cmd)
         self.check_error(ret_code)
@@ -225,11 +226,87 @@ class VisaInstrument(Instrument):
         Returns:
             str: The instrument's response.
         """
-        self.visa_log.debug(f"Querying: {cmd}")
+        self.visa_log.debug("Querying: %s", cmd)
         response = self.visa_handle.query(cmd)
-        self.visa_log.debug(f"Response: {response}")
+        self.visa_log.debug("Response: %s", response)
         return response
 
+    def ask_binary_block(self, cmd: str, datatype: str = 'f',
+                         is_big_endian: bool = False,
+                         expect_termination: bool = True,
+                         data_format_cmd: Optional[str] = 'FORM:DATA',
+                         byte_order_cmd: Optional[str] = 'FORM:BORD'
+                         ) -> np.ndarray:
+        """
+        Query the instrument for numbers transferred as an IEEE 488.2
+        definite length binary block, e.g. a trace, and read them into a
+        numpy array without parsing any text.
+
+        If ``data_format_cmd`` is given, the instrument is switched to the
+        ``REAL,32`` (for datatype ``'f'``) or ``REAL,64`` (for ``'d'``) data
+        format with it, and to the byte order given by ``is_big_endian`` with
+        ``byte_order_cmd``. The format and byte order the instrument was in
+        are restored afterwards. Only the settings that differ are changed.
+
+        Args:
+            cmd: The query returning the block.
+            datatype: The type of the numbers, as a ``struct`` format
+                character, e.g. ``'f'`` for 32 bit floats or ``'h'`` for 16 bit
+                integers.
+            is_big_endian: The byte order of the numbers.
+            expect_termination: Whether the instrument terminates the block
+                with its termination character(s), to be read and dropped.
+            data_format_cmd: The SCPI command setting (and, with ``?``,
+                querying) the data format, or None to leave the data format
+                as it is, e.g. if the driver sets it.
+            byte_order_cmd: The SCPI command setting (and querying) the byte
+                order, or None to leave it as it is.
+
+        Returns:
+            The numbers, in native byte order.
+        """
+        dtype = np.dtype(datatype).newbyteorder('>' if is_big_endian
+                                                else '<')
+        settings = []
+        if data_format_cmd is not None:
+            if datatype not in 'fd':
+                raise ValueError(f'Can only switch to a REAL data format for '
+                                 f'datatype f or d, not {datatype}')
+            settings.append((data_format_cmd, f'REAL,{8 * dtype.itemsize}'))
+        if byte_order_cmd is not None:
+            settings.append((byte_order_cmd,
+                             'NORM' if is_big_endian else 'SWAP'))
+
+        restore = []
+        for setting_cmd, value in settings:
+            old_value = self.ask(f'{setting_cmd}?').strip()
+            normalized = old_value.upper().replace('+', '').replace(' ', '')
+            if not normalized.startswith(value):
+                self.write(f'{setting_cmd} {value}')
+                restore.append((setting_cmd, old_value))
+        try:
+            self.write(cmd)
+            header = self.visa_handle.read_bytes(2)
+            if header[:1] != b'#' or not header[1:2].isdigit():
+                raise ValueError(f'Expected an IEEE 488.2 binary block in '
+                                 f'response to {cmd}, got {header!r}')
+            n_digits = int(header[1:2])
+            if n_digits == 0:
+                raise ValueError(f'Got an indefinite length binary block in '
+                                 f'response to {cmd}, only definite length '
+                                 f'blocks are supported')
+            n_bytes = int(self.visa_handle.read_bytes(n_digits))
+            data = self.visa_handle.read_bytes(n_bytes)
+            if expect_termination:
+                self.visa_handle.read_raw()
+            self.visa_log.debug("Read a binary block of %d bytes in "
+                                "response to: %s", n_bytes, cmd)
+        finally:
+            for setting_cmd, old_value in reversed(restore):
+                self.write(f'{setting_cmd} {old_value}')
+        return np.frombuffer(data, dtype=dtype).astype(
+            dtype.newbyteorder('='))
+
     def snapshot_base(self, update: bool=False,
                       params_to_skip_update: Sequence[str] = None):
         """
@@ -3,7 +3,7 @@ import logging
 import time
 import os
 import warnings
-from typing import List, Dict, Union, Sequence
+from typing import List, Dict, Optional, Union, Sequence
 from contextlib import contextmanager
 
 import numpy as np
@@ -12,7 +12,7 @@ from qcodes.instrument.base import Instrument
 from qcodes.instrument.parameter import Parameter
 from .ats_api import AlazarATSAPI
 from .utils import TraceParameter
-from .helpers import CapabilityHelper
+from .helpers import BufferPipeline, CapabilityHelper
 from .constants import NUMBER_OF_CHANNELS_FROM_BYTE_REPR
 
 
@@ -384,7 +384,8 @@ class AlazarTech_ATS(Instrument):
                 alloc_buffers=None, fifo_only_streaming=None,
                 interleave_samples=None, get_processed_data=None,
                 allocated_buffers=None, buffer_timeout=None,
-                acquisition_controller=None):
+                acquisition_controller=None, processing_workers: int = 0,
+                max_buffers_in_flight: Optional[int] = None):
         """
         perform a single acquisition with the Alazar board, and set certain
         parameters to the appropriate values
@@ -407,6 +408,18 @@ class AlazarTech_ATS(Instrument):
             buffer_timeout:
             acquisition_controller: An instance of an acquisition controller
                 that handles the dataflow of an acquisition
+            processing_workers: If 0 (the default), every buffer is
+                processed and handled by the acquisition controller before it
+                is reposted to the board. Otherwise, buffers are copied and
+                reposted right away, and processed in parallel with the
+                acquisition: by ``acquisition_controller.process_buffer`` in
+                this many threads, then by ``handle_buffer`` in the order of
+                the buffers, see :class:`.BufferPipeline`.
+            max_buffers_in_flight: If ``processing_workers`` is used, the
+                maximum number of buffers that are copied but not handled
+                yet. Defaults to ``allocated_buffers``. When that many
+                buffers are in flight, the board is not given back a buffer
+                until one of them has been handled.
 
         Returns:
             Whatever is given by acquisition_controller.post_acquire method
@@ -528,6 +541,13 @@ class AlazarTech_ATS(Instrument):
         allocated_buffers = self.allocated_buffers.raw_value
         buffer_recycling = buffers_per_acquisition > allocated_buffers
 
+        pipeline = None
+        if processing_workers:
+            pipeline = BufferPipeline(
+                acquisition_controller, processing_workers,
+                max_buffers_in_flight or allocated_buffers)
+        wait_time = 0.
+
         # post buffers to Alazar
         try:
             for _ in range(allocated_buffers):
@@ -553,19 +573,26 @@ class AlazarTech_ATS(Instrument):
                 # Wait for the buffer at the head of the list of available
                 # buffers to be filled by the board.
                 buf = self.buffer_list[buffers_completed % allocated_buffers]
+                start_wait = time.perf_counter()
                 self.api.wait_async_buffer_complete(
                     self._handle,
                     ctypes.cast(buf.addr, ctypes.c_void_p),
                     buffer_timeout
                 )
+                wait_time += time.perf_counter() - start_wait
 
                 acquisition_controller.buffer_done_callback(buffers_completed)
 
                 # if buffers must be recycled, extract data and repost them
                 # otherwise continue to next buffer
                 if buffer_recycling:
-                    acquisition_controller.handle_buffer(
-                        buf.buffer, buffers_completed)
+                    if pipeline is not None:
+                        pipeline.submit(buf.buffer, buffers_completed)
+                    else:
+                        acquisition_controller.handle_buffer(
+                            acquisition_controller.process_buffer(
+                                buf.buffer, buffers_completed),
+                            buffers_completed)
                     self.api.post_async_buffer(
                         self._handle,
                         ctypes.cast(buf.addr, ctypes.c_void_p),
@@ -573,6 +600,10 @@ class AlazarTech_ATS(Instrument):
                     )
                 buffers_completed += 1
                 bytes_transferred += buf.size_bytes
+        except BaseException:
+            if pipeline is not None:
+                pipeline.close()
+            raise
         finally:
             # stop measurement here
             done_capture = time.perf_counter()
@@ -582,9 +613,20 @@ class AlazarTech_ATS(Instrument):
 
         # -----cleanup here-----
         # extract data if not yet done
-        if not buffer_recycling:
-            for i, buf in enumerate(self.buffer_list):
-                acquisition_controller.handle_buffer(buf.buffer, i)
+        try:
+            if not buffer_recycling:
+                for i, buf in enumerate(self.buffer_list):
+                    if pipeline is not None:
+                        pipeline.submit(buf.buffer, i, copy=False)
+                    else:
+                        acquisition_controller.handle_buffer(
+                            acquisition_controller.process_buffer(
+                                buf.buffer, i), i)
+            if pipeline is not None:
+                pipeline.join()
+        finally:
+            if pipeline is not None:
+                pipeline.close()
         time_done_handling = time.perf_counter()
         # free up memory
         self.clear_buffers()
@@ -629,6 +671,19 @@ class AlazarTech_ATS(Instrument):
             self.log.debug("Pre setup took {}".format(presetup_time))
             self.log.debug("Pre capture setup took {}".format(setup_time))
             self.log.debug("Capture took {}".format(capture_time))
+            self.log.debug("waiting for buffers took {}".format(wait_time))
+            if pipeline is not None:
+                timings = pipeline.timings
+                self.log.debug("waiting for a buffer in flight to be "
+                               "handled took {}".format(
+                                   timings['wait_for_slot']))
+                self.log.debug("copying buffers took {}".format(
+                    timings['copy']))
+                self.log.debug("processing buffers took {} in {} "
+                               "workers".format(timings['process'],
+                                                processing_workers))
+                self.log.debug("handling buffers took {}".format(
+                    timings['handle']))
             self.log.debug("abort took {}".format(abort_time))
             self.log.debug("handling took {}".format(handling_time))
             self.log.debug("free mem took {}".format(free_mem_time))
@@ -861,6 +916,12 @@ class AcquisitionController(Instrument):
           alazar internals
         - Return acquisitioncontroller.post_acquire
 
+    Every buffer is first passed to acquisitioncontroller.process_buffer, and
+    the result of that is passed to acquisitioncontroller.handle_buffer. If
+    the acquisition is pipelined (see the ``processing_workers`` argument of
+    ``AlazarTech_ATS.acquire``), process_buffer is called in worker threads
+    while the acquisition goes on.
+
     Attributes:
         _alazar: a reference to the alazar instrument driver
     """
@@ -913,6 +974,28 @@ class AcquisitionController(Instrument):
         raise NotImplementedError(
             'This method should be implemented in a subclass')
 
+    def process_buffer(self, buffer, buffer_number=None):
+        """
+        This method can do the part of the processing of a buffer that does
+        not depend on other buffers, e.g. demodulation. If the acquisition
+        is pipelined, it is called in one of several worker threads, so
+        possibly for several buffers at the same time and out of order. It
+        must therefore not change the state of the controller. Its result is
+        passed to handle_buffer, which is called in the order of the
+        buffers.
+
+        The buffer is only valid until handle_buffer has returned, its
+        memory is then reused for other buffers.
+
+        Args:
+            buffer: np.array with the data from the Alazar card
+            buffer_number: counter for which buffer we are processing
+
+        Returns:
+            the data to pass to handle_buffer, by default the buffer itself
+        """
+        return buffer
+
     def post_acquire(self):
         """
         This method should return any information you want to save from this
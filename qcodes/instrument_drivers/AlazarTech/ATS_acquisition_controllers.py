@@ -1,5 +1,6 @@
 from .ATS import AcquisitionController
 import math
+from typing import Any, Dict, Optional, Sequence
 import numpy as np
 
 
@@ -76,7 +77,7 @@ class Demodulation_AcquisitionController(AcquisitionController):
         self.sin_list = np.sin(angle_list)
         self.buffer = np.zeros(self.samples_per_record *
                                self.records_per_buffer *
-                               self.number_of_channels)
+                               self.number_of_channels, dtype=np.int64)
 
     def pre_acquire(self):
         """
@@ -104,17 +105,10 @@ class Demodulation_AcquisitionController(AcquisitionController):
         # average all records in a buffer
         records_per_acquisition = (1. * self.buffers_per_acquisition *
                                    self.records_per_buffer)
-        recordA = np.zeros(self.samples_per_record)
-        for i in range(self.records_per_buffer):
-            i0 = i * self.samples_per_record
-            i1 = i0 + self.samples_per_record
-            recordA += self.buffer[i0:i1] / records_per_acquisition
-
-        recordB = np.zeros(self.samples_per_record)
-        for i in range(self.records_per_buffer):
-            i0 = i * self.samples_per_record + len(self.buffer) // 2
-            i1 = i0 + self.samples_per_record
-            recordB += self.buffer[i0:i1] / records_per_acquisition
+        records = self.buffer.reshape(self.number_of_channels,
+                                      self.records_per_buffer,
+                                      self.samples_per_record)
+        recordA, recordB = records.sum(axis=1) / records_per_acquisition
 
         if self.number_of_channels == 2:
             # fit channel A and channel B
@@ -144,3 +138,233 @@ class Demodulation_AcquisitionController(AcquisitionController):
 
         # see manual page 52!!! (using unsigned data)
         return [ampl, math.atan2(ImPart, RePart) * 360 / (2 * math.pi)]
+
+
+class Vectorized_AcquisitionController(AcquisitionController):
+    """
+    Base class of acquisition controllers that treat every buffer as a
+    whole, as an array of shape ``(channels, records, samples)``, rather
+    than record by record. This is how the Alazar card fills a buffer in
+    NPT mode, with ``interleave_samples`` disabled.
+
+    The reduction of a buffer that does not depend on other buffers is done
+    in ``process_buffer``, so that it runs in parallel with the acquisition
+    if that is pipelined (see ``AlazarTech_ATS.acquire``); ``handle_buffer``
+    only adds the result to accumulators that are allocated once per
+    acquisition. Sums of samples are accumulated as (64 bit) integers,
+    without converting the samples to floats.
+
+    The results are in volts, with the channels along the last axis.
+
+    Args:
+        name: name for this acquisition_conroller as an instrument
+
+        alazar_name: the name of the alazar instrument such that this
+            controller can communicate with the Alazar
+
+        **kwargs: kwargs are forwarded to the Instrument base class
+    """
+    def __init__(self, name: str, alazar_name: str, **kwargs) -> None:
+        self.acquisitionkwargs: Dict[str, Any] = {}
+        self.samples_per_record = 0
+        self.records_per_buffer = 0
+        self.buffers_per_acquisition = 0
+        self.number_of_channels = 0
+        # the value of the sample code halfway the range of the channels,
+        # and the volts per sample code of every channel
+        self.zero_code = 0.
+        self.volts_per_code = np.ones(0)
+        super().__init__(name, alazar_name, **kwargs)
+        self.add_parameter("acquisition", get_cmd=self.do_acquisition)
+
+    def update_acquisitionkwargs(self, **kwargs) -> None:
+        """
+        Update the kwargs used for the acquisition with
+        ``AlazarTech_ATS.acquire``
+        """
+        self.acquisitionkwargs.update(**kwargs)
+
+    def do_acquisition(self) -> Any:
+        """
+        Perform an acquisition, the get_cmd of the acquisition parameter of
+        this instrument
+        """
+        return self._get_alazar().acquire(acquisition_controller=self,
+                                          **self.acquisitionkwargs)
+
+    def pre_start_capture(self) -> None:
+        """
+        Get the shape of the acquisition and the conversion of sample codes
+        to volts from the Alazar. Subclasses allocate their accumulators
+        here.
+        """
+        alazar = self._get_alazar()
+        self.samples_per_record = alazar.samples_per_record.get()
+        self.records_per_buffer = alazar.records_per_buffer.get()
+        self.buffers_per_acquisition = alazar.buffers_per_acquisition.get()
+        channel_selection = alazar.channel_selection.raw_value
+        self.number_of_channels = alazar.get_num_channels(channel_selection)
+
+        # the sample codes are stored in the most significant bits of the
+        # sample words
+        _, bits_per_sample = alazar.api.get_channel_info_(alazar._handle)
+        bits_per_word = 8 * ((bits_per_sample + 7) // 8)
+        code_step = 2 ** (bits_per_word - bits_per_sample)
+        self.zero_code = (2 ** bits_per_sample - 1) / 2 * code_step
+        channels = [channel for channel in range(1, alazar.channels + 1)
+                    if channel_selection & 2 ** (channel - 1)]
+        self.volts_per_code = np.array(
+            [alazar.parameters['channel_range' + str(channel)].get()
+             for channel in channels]) / self.zero_code
+
+    def pre_acquire(self) -> None:
+        pass
+
+    def records(self, buffer: np.ndarray) -> np.ndarray:
+        """A view of a buffer as an array of shape (channels, records,
+        samples)"""
+        return buffer.reshape(self.number_of_channels,
+                              self.records_per_buffer,
+                              self.samples_per_record)
+
+    def to_volts(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Convert (averages of) sample codes, with the channels along the
+        first axis, to volts, with the channels along the last axis.
+        """
+        codes = np.moveaxis(codes, 0, -1)
+        return (codes - self.zero_code) * self.volts_per_code
+
+
+class RecordAveraging_AcquisitionController(Vectorized_AcquisitionController):
+    """
+    Averages all records of all buffers of an acquisition.
+
+    The acquisition returns the average record of every channel, an array
+    of shape ``(samples, channels)``.
+    """
+    def pre_start_capture(self) -> None:
+        super().pre_start_capture()
+        self.sum = np.zeros((self.number_of_channels,
+                             self.samples_per_record), dtype=np.int64)
+
+    def process_buffer(self, buffer, buffer_number=None):
+        return self.records(buffer).sum(axis=1, dtype=np.int64)
+
+    def handle_buffer(self, buffer, buffer_number=None):
+        self.sum += buffer
+
+    def post_acquire(self):
+        n_records = self.records_per_buffer * self.buffers_per_acquisition
+        return self.to_volts(self.sum / n_records)
+
+
+class BufferAveraging_AcquisitionController(Vectorized_AcquisitionController):
+    """
+    Averages the buffers of an acquisition, keeping the records of a buffer
+    apart.
+
+    The acquisition returns the average of every record of a buffer, an
+    array of shape ``(records, samples, channels)``.
+    """
+    def pre_start_capture(self) -> None:
+        super().pre_start_capture()
+        self.sum = np.zeros((self.number_of_channels,
+                             self.records_per_buffer,
+                             self.samples_per_record), dtype=np.int64)
+
+    def handle_buffer(self, buffer, buffer_number=None):
+        self.sum += self.records(buffer)
+
+    def post_acquire(self):
+        return self.to_volts(self.sum / self.buffers_per_acquisition)
+
+
+class IQDemodulation_AcquisitionController(Vectorized_AcquisitionController):
+    """
+    Digital IQ demodulation of every record at a single frequency.
+
+    Every record :math:`v(t)` (in volts) is reduced to the complex amplitude
+
+    .. math::
+
+        A = 2 \\frac{\\sum_t w(t) v(t) e^{-2 \\pi i f t}}{\\sum_t w(t)}
+
+    with integration weights :math:`w(t)`, so that a record
+    :math:`a \\cos(2 \\pi f t + \\phi)` gives :math:`a e^{i \\phi}` if it
+    has a whole number of periods. The weighted references are computed once
+    per acquisition, and all records of a buffer are demodulated with a
+    single matrix product of the sample codes with the references.
+
+    Args:
+        name: name for this acquisition_conroller as an instrument
+
+        alazar_name: the name of the alazar instrument such that this
+            controller can communicate with the Alazar
+
+        demodulation_frequency: the frequency f to demodulate at, in Hz
+
+        integration_weights: the weights w of the samples of a record,
+            default all ones
+
+        average_records: if True, the acquisition returns the average
+            amplitude of all records, an array of shape ``(channels,)``.
+            Otherwise it returns the amplitude of every record, an array of
+            shape ``(buffers, records, channels)``.
+
+        **kwargs: kwargs are forwarded to the Instrument base class
+    """
+    def __init__(self, name: str, alazar_name: str,
+                 demodulation_frequency: float,
+                 integration_weights: Optional[Sequence[float]] = None,
+                 average_records: bool = True, **kwargs) -> None:
+        self.demodulation_frequency = demodulation_frequency
+        self.integration_weights = integration_weights
+        self.average_records = average_records
+        super().__init__(name, alazar_name, **kwargs)
+
+    def pre_start_capture(self) -> None:
+        super().pre_start_capture()
+        if self.integration_weights is None:
+            weights = np.ones(self.samples_per_record)
+        else:
+            weights = np.asarray(self.integration_weights, dtype=float)
+            if weights.shape != (self.samples_per_record,):
+                raise ValueError(f'Got {len(weights)} integration weights '
+                                 f'for {self.samples_per_record} samples '
+                                 f'per record')
+        sample_rate = self._get_alazar().get_sample_rate()
+        times = np.arange(self.samples_per_record) / sample_rate
+        phases = 2 * np.pi * self.demodulation_frequency * times
+        # the real and imaginary part of the weighted reference, as the two
+        # columns of a matrix, normalized as in the docstring
+        self.reference = (2 / weights.sum() * weights[:, np.newaxis] *
+                          np.column_stack([np.cos(phases), -np.sin(phases)]))
+        # the contribution of the zero level of the sample codes
+        self.reference_offset = self.zero_code * self.reference.sum(axis=0)
+
+        if self.average_records:
+            self.result = np.zeros((self.number_of_channels, 2))
+        else:
+            self.result = np.zeros((self.number_of_channels,
+                                    self.buffers_per_acquisition,
+                                    self.records_per_buffer, 2))
+
+    def process_buffer(self, buffer, buffer_number=None):
+        # (channels, records, 2), in sample codes
+        return np.dot(self.records(buffer), self.reference)
+
+    def handle_buffer(self, buffer, buffer_number=None):
+        if self.average_records:
+            self.result += buffer.sum(axis=1)
+        else:
+            self.result[:, buffer_number] = buffer
+
+    def post_acquire(self):
+        result = self.result
+        if self.average_records:
+            result = result / (self.records_per_buffer *
+                               self.buffers_per_acquisition)
+        result = result - self.reference_offset
+        amplitude = result[..., 0] + 1j * result[..., 1]
+        return np.moveaxis(amplitude, 0, -1) * self.volts_per_code
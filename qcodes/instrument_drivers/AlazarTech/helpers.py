@@ -5,6 +5,13 @@ to hide realted pieces of logic into a form of "submodule" (analogious to
 class in some way.
 """
 
+import collections
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
 
 from .ats_api import AlazarATSAPI
 from .constants import Capability
@@ -89,3 +96,131 @@ class CapabilityHelper():
         # but the minor version is always 2 digits.
         firmware_version = f'{firmware_major}.{firmware_minor:02d}'
         return firmware_version
+
+
+class BufferPipeline:
+    """
+    A helper that processes the buffers of an acquisition in parallel with
+    the acquisition itself, see the ``processing_workers`` argument of
+    :meth:`.AlazarTech_ATS.acquire`.
+
+    The thread waiting for the DMA buffers only ``submit``'s every completed
+    buffer: if the buffer is to be reposted to the board, it is copied into
+    a spare array first. The buffer (or its copy) is then processed in two
+    stages:
+
+        - ``acquisition_controller.process_buffer``, in a pool of
+          ``workers`` threads, so possibly several buffers at once and out
+          of order
+        - ``acquisition_controller.handle_buffer`` with the result of
+          ``process_buffer``, in a single thread, one buffer at a time and
+          in the order of the buffers
+
+    At most ``max_in_flight`` buffers are submitted but not handled yet;
+    ``submit`` blocks when that many are. The arrays the buffers are copied
+    into are reused once a buffer has been handled.
+
+    The time spent in each stage is summed up in ``timings``.
+
+    Args:
+        acquisition_controller: the acquisition controller of the
+            acquisition
+        workers: the number of threads to process buffers in
+        max_in_flight: the maximum number of buffers that are being
+            processed or handled at any time
+    """
+    def __init__(self, acquisition_controller: Any, workers: int,
+                 max_in_flight: int) -> None:
+        if workers < 1 or max_in_flight < 1:
+            raise ValueError('A BufferPipeline needs at least one worker '
+                             'and one buffer in flight')
+        self._controller = acquisition_controller
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._copies: List[np.ndarray] = []
+        self._processors = ThreadPoolExecutor(
+            workers, thread_name_prefix='alazar_process')
+        self._handler = ThreadPoolExecutor(
+            1, thread_name_prefix='alazar_handle')
+        self._futures: Deque[Future] = collections.deque()
+        self._timings_lock = threading.Lock()
+        self.timings: Dict[str, float] = {
+            'wait_for_slot': 0., 'copy': 0., 'process': 0., 'handle': 0.}
+        self._closed = False
+
+    def _add_time(self, stage: str, start: float) -> None:
+        with self._timings_lock:
+            self.timings[stage] += time.perf_counter() - start
+
+    def submit(self, buffer: np.ndarray, buffer_number: int,
+               copy: bool = True) -> None:
+        """
+        Submit a completed buffer. If ``copy`` is True, the buffer is copied
+        before this returns, and can be reposted to the board right away.
+        Raises the error of any buffer that failed to be processed or
+        handled.
+        """
+        self.check()
+        start = time.perf_counter()
+        self._in_flight.acquire()
+        self._add_time('wait_for_slot', start)
+
+        data: Optional[np.ndarray] = None
+        if copy:
+            start = time.perf_counter()
+            try:
+                data = self._copies.pop()
+            except IndexError:
+                data = np.empty_like(buffer)
+            np.copyto(data, buffer)
+            self._add_time('copy', start)
+            buffer = data
+
+        processed = self._processors.submit(self._process, buffer,
+                                            buffer_number)
+        self._futures.append(self._handler.submit(
+            self._handle, processed, data, buffer_number))
+
+    def _process(self, buffer: np.ndarray, buffer_number: int) -> Any:
+        start = time.perf_counter()
+        result = self._controller.process_buffer(buffer, buffer_number)
+        self._add_time('process', start)
+        return result
+
+    def _handle(self, processed: Future, copy: Optional[np.ndarray],
+                buffer_number: int) -> None:
+        try:
+            result = processed.result()
+            start = time.perf_counter()
+            self._controller.handle_buffer(result, buffer_number)
+            self._add_time('handle', start)
+        finally:
+            if copy is not None:
+                self._copies.append(copy)
+            self._in_flight.release()
+
+    def check(self) -> None:
+        """Raise the error of any buffer that failed so far"""
+        # buffers are handled in order, so only the oldest ones can be done
+        while self._futures and self._futures[0].done():
+            self._futures.popleft().result()
+
+    def join(self) -> None:
+        """
+        Wait for all buffers to be handled. Raises the error of any buffer
+        that failed.
+        """
+        while self._futures:
+            self._futures.popleft().result()
+
+    def close(self) -> None:
+        """
+        Stop the threads, after the buffers that are being processed or
+        handled. Buffers that were not started on yet are dropped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._futures:
+            future.cancel()
+        self._processors.shutdown(wait=True)
+        self._handler.shutdown(wait=True)
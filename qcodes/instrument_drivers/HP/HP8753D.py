@@ -93,14 +93,11 @@ class HP8753DTrace(ArrayParameter):
         raw_resp = inst.visa_handle.read_raw()
         inst.visa_handle.read_termination = '\n'
 
-        first_points = b''
         # 4 bytes header, 4 bytes per point, value1's and value2's
         # are intertwined like: val1_001, val2_001, val1_002, val2_002...
-        for n in range((len(raw_resp)-4)//4):
-            first_points += raw_resp[4:][2*n*4:(2*n+1)*4]
-
-        dt = np.dtype('>f')
-        trace1 = np.fromstring(first_points, dtype=dt)
+        values = np.frombuffer(raw_resp, dtype=np.dtype('>f'),
+                               count=(len(raw_resp) - 4) // 4, offset=4)
+        trace1 = values[0::2].astype(np.float32)
 
         return trace1
 
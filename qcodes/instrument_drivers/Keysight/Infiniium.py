@@ -108,9 +108,10 @@ class RawTrace(ArrayParameter):
         instr.write(':WAVeform:STReaming OFF')
 
         # request the actual transfer
-        data = instr._parent.visa_handle.query_binary_values(
+        data = instr._parent.ask_binary_block(
             'WAV:DATA?', datatype='h', is_big_endian=False,
-            expect_termination=False)
+            expect_termination=False, data_format_cmd=None,
+            byte_order_cmd=None)
         # the Infiniium does not include an extra termination char on binary
         # messages so we set expect_termination to False
 
@@ -136,8 +137,7 @@ class RawTrace(ArrayParameter):
         # y data scaling
         yorigin = float(instr.ask(":WAVeform:YORigin?"))
         yinc = float(instr.ask(":WAVeform:YINCrement?"))
-        channel_data = np.array(data)
-        channel_data = np.multiply(channel_data, yinc) + yorigin
+        channel_data = data * yinc + yorigin
 
         # restore original state
         # ---------------------------------------------------------------------
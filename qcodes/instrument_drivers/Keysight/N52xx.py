@@ -76,10 +76,11 @@ class FormattedSweep(PNASweep):
             prev_mode = self._instrument.run_sweep()
         # Ask for data, setting the format to the requested form
         self._instrument.format(self.sweep_format)
-        data = root_instr.visa_handle.query_binary_values('CALC:DATA? FDATA',
-                                                          datatype='f',
-                                                          is_big_endian=True)
-        data = np.array(data)
+        # the data format and byte order are set once, in __init__
+        data = root_instr.ask_binary_block('CALC:DATA? FDATA', datatype='f',
+                                           is_big_endian=True,
+                                           data_format_cmd=None,
+                                           byte_order_cmd=None)
         # Restore previous state if it was changed
         if root_instr.auto_sweep():
             root_instr.sweep_mode(prev_mode)
@@ -90,19 +90,13 @@ class ArrayMeasurement(ArrayParameter):
 
         self._instrument.init_measurement()
         try:
-            rawvals = self._instrument.ask('FETCH?')
+            numvals = self._instrument._ask_readings('FETCH?')
         except VisaIOError:
-            rawvals = None
+            numvals = None
             log.error('Could not pull data from DMM. Perhaps no trigger?')
 
         self._instrument.visa_handle.timeout = old_timeout
 
-        # parse the acquired values
-        try:
-            numvals = np.array(list(map(float, rawvals.split(','))))
-        except AttributeError:
-            numvals = None
-
         self._instrument.display_clear()
 
         return numvals
@@ -587,6 +581,15 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
                 Setting the aperture time automatically enables the aperture 
                 mode."""))
 
+        ####################################
+        # Data format
+
+        # The readings are read as text by _get_voltage and as binary blocks
+        # of big endian 64 bit floats by _ask_readings. The data format the
+        # instrument is in is remembered, so it is only switched when needed.
+        # Like the readings as text always did, assume text to begin with
+        self._data_format = 'ASCii,9'
+
         ####################################
         # Connect message
 
@@ -612,6 +615,8 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
 
     def reset(self) -> None:
         self.write('*RST')
+        # the reset switches the readings back to text
+        self._data_format = 'ASCii,9'
 
     def display_clear(self) -> None:
         """
@@ -641,10 +646,36 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
         # or resistance) and not necessarily a single value. This function
         # should be aware of the configuration.
 
+        self._set_data_format('ASCii,9')
         response = self.ask('READ?')
 
         return float(response)
 
+    def _set_data_format(self, data_format: str) -> None:
+        """
+        Set the format of the readings returned by e.g. READ? and FETCH?,
+        unless the instrument is in that format already
+
+        Args:
+            data_format: 'ASCii,9' or 'REAL,64'
+        """
+        if data_format != self._data_format:
+            self.write('FORMat:DATA {}'.format(data_format))
+            if data_format == 'REAL,64':
+                self.write('FORMat:BORDer NORMal')
+            self._data_format = data_format
+
+    def _ask_readings(self, cmd: str) -> np.array:
+        """
+        Query readings, transferring them as a binary block of 64 bit floats
+        rather than as text
+        """
+        self._set_data_format('REAL,64')
+        # the byte order is set along with the data format
+        return self.ask_binary_block(cmd, datatype='d', is_big_endian=True,
+                                     data_format_cmd=None,
+                                     byte_order_cmd=None)
+
     def fetch(self) -> np.array:
         """
         Waits for measurements to complete and copies all available
@@ -658,8 +689,7 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
             a 1D numpy array of all measured values that are currently in the
             reading memory
         """
-        raw_vals: str = self.ask('FETCH?')
-        return _raw_vals_to_array(raw_vals)
+        return self._ask_readings('FETCH?')
 
     def read(self) -> np.array:
         """
@@ -672,8 +702,7 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
         Returns:
             a 1D numpy array of all measured values
         """
-        raw_vals: str = self.ask('READ?')
-        return _raw_vals_to_array(raw_vals)
+        return self._ask_readings('READ?')
 
     def _set_databuffer_setpoints(self, cmd, value):
         """
@@ -743,17 +772,3 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
         """Triggers the instrument if `trigger_source` is "BUS"."""
         self.write('*TRG')
 
-
-def _raw_vals_to_array(raw_vals: str) -> np.array:
-    """
-    Helper function that converts comma-delimited string of floating-point
-    values to a numpy 1D array of them. Most data retrieval command of these
-    instruments return data in this format.
-
-    Args:
-        raw_vals: comma-delimited string of floating-point values
-
-    Returns:
-        numpy 1D array of data
-    """
-    return np.array(list(map(float, raw_vals.split(','))))
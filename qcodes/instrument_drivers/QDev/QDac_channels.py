@@ -9,6 +9,7 @@ from datetime import datetime
 from functools import partial
 from operator import xor
 from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
 from qcodes.instrument.channel import MultiChannelInstrumentParameter
@@ -39,6 +40,7 @@ class QDacChannel(InstrumentChannel):
 
         # Validate the channel
         self._CHANNEL_VALIDATION.validate(channum)
+        self._channum = channum
 
         # Add the parameters
 
@@ -139,12 +141,40 @@ class QDacMultiChannelParameter(MultiChannelInstrumentParameter):
             qdac._get_status(readcurrents=False)
             output = tuple(chan.parameters[self._param_name].get_latest()
                            for chan in self._channels)
+        elif self._param_name == 'i':
+            qdac = self._channels[0]._parent
+            qdac._read_currents([chan._channum for chan in self._channels])
+            output = tuple(chan.parameters[self._param_name].get_latest()
+                           for chan in self._channels)
         else:
             output = tuple(chan.parameters[self._param_name].get()
                            for chan in self._channels)
 
         return output
 
+    def set_raw(self, value):
+        """
+        Set all parameters to this value
+
+        For voltages, all channels are set at once, and the channels with a
+        finite slope ramp simultaneously, see QDac._set_voltages.
+
+        Args:
+            value (Any): The value to set to. The type is given by the
+                underlying parameter.
+        """
+        if self._param_name != 'v':
+            super().set_raw(value)
+            return
+
+        for chan in self._channels:
+            chan.v.validate(value)
+        qdac = self._channels[0]._parent
+        qdac._set_voltages([chan._channum for chan in self._channels],
+                           [value]*len(self._channels))
+        for chan in self._channels:
+            chan.v._save_val(value)
+
 
 class QDac(VisaInstrument):
     """
@@ -293,15 +323,7 @@ class QDac(VisaInstrument):
         If a finite slope has been assigned, we assign a function generator to
         ramp the voltage.
         """
-        # validation
-        atten = self.channels[chan-1].vrange.get_latest()
-
-        attendict = {0: 10, 1: 1, 10: 10}
-        if abs(v_set) > attendict[atten]:
-            v_set = np.sign(v_set)*attendict[atten]
-            log.warning('Requested voltage outside reachable range.' +
-                        ' Setting voltage on channel ' +
-                        '{} to {} V'.format(chan, v_set))
+        v_set = self._clip_voltage(chan, v_set)
 
         slopechans = [sl[0] for sl in self._slopes]
         if chan in slopechans:
@@ -317,12 +339,172 @@ class QDac(VisaInstrument):
             # happen inside _rampvoltage
             self._rampvoltage(chan, fg, v_start, v_set, time)
         else:
-            # compensate for the 0.1 multiplier, if it's on
-            if self.channels[chan-1].vrange.get_latest() == 1:
-                v_set = v_set*10
-            # set the mode back to DC in case it had been changed
-            # and then set the voltage
-            self.write('wav {} 0 0 0;set {} {:.6f}'.format(chan, chan, v_set))
+            self.write(self._dc_voltage_command(chan, v_set))
+
+    def _clip_voltage(self, chan, v_set):
+        """
+        Clip a voltage to the range of a channel, given its attenuation.
+
+        Args:
+            chan (int): The 1-indexed channel number
+            v_set (float): The requested voltage
+
+        Returns:
+            float: The voltage to set
+        """
+        atten = self.channels[chan-1].vrange.get_latest()
+
+        attendict = {0: 10, 1: 1, 10: 10}
+        if abs(v_set) > attendict[atten]:
+            v_set = np.sign(v_set)*attendict[atten]
+            log.warning('Requested voltage outside reachable range.' +
+                        ' Setting voltage on channel ' +
+                        '{} to {} V'.format(chan, v_set))
+        return v_set
+
+    def _dc_voltage_command(self, chan, v_set):
+        """
+        The commands to set the voltage of a channel right away.
+
+        Args:
+            chan (int): The 1-indexed channel number
+            v_set (float): The voltage, within the range of the channel
+        """
+        # compensate for the 0.1 multiplier, if it's on
+        if self.channels[chan-1].vrange.get_latest() == 1:
+            v_set = v_set*10
+        # The channel is no longer driven by a function generator
+        self._assigned_fgs.pop(chan, None)
+        # set the mode back to DC in case it had been changed
+        # and then set the voltage
+        return 'wav {} 0 0 0;set {} {:.6f}'.format(chan, chan, v_set)
+
+    def _set_voltages(self, chans, v_sets):
+        """
+        Set the voltages of several channels at once, like setting their
+        chXX_v parameters, but in a single write.
+
+        The channels that have a finite slope are ramped simultaneously by a
+        single function generator. The ramp takes as long as the slowest
+        channel needs, so no channel exceeds its slope. The other channels
+        are set right away.
+
+        Args:
+            chans (List[int]): The 1-indexed channel numbers
+            v_sets (List[float]): The target voltages
+        """
+        v_sets = [self._clip_voltage(chan, v_set)
+                  for chan, v_set in zip(chans, v_sets)]
+        slopes = {sl[0]: sl[1] for sl in self._slopes}
+
+        commands = [self._dc_voltage_command(chan, v_set)
+                    for chan, v_set in zip(chans, v_sets)
+                    if chan not in slopes]
+
+        ramps = [(chan, v_set) for chan, v_set in zip(chans, v_sets)
+                 if chan in slopes]
+        if ramps:
+            # One status call rather than a .get per channel, in case a ramp
+            # was interrupted
+            self._get_status(readcurrents=False)
+            v_starts = [self.channels[chan-1].v.get_latest()
+                        for chan, _ in ramps]
+            ramptime = max(abs(v_set - v_start)/slopes[chan]
+                           for (chan, v_set), v_start in zip(ramps, v_starts))
+            log.info('Ramping {} channels, time: {}'.format(len(ramps),
+                                                            ramptime))
+            commands += self._ramp_commands([chan for chan, _ in ramps],
+                                            v_starts,
+                                            [v_set for _, v_set in ramps],
+                                            ramptime)
+
+        if commands:
+            self.write(';'.join(commands))
+
+    def ramp_voltages(self, channellist: Sequence[int],
+                      v_endlist: Sequence[float], ramptime: float,
+                      v_startlist: Optional[Sequence[float]] = None) -> float:
+        """
+        Ramp the voltages of several channels simultaneously, in a given
+        time and regardless of their slopes.
+
+        All channels are bound to a single function generator, each with its
+        own amplitude and offset, and the generator is started once all of
+        them (and their sync outputs) are set up, so the ramps start and end
+        together. This takes a single write, however many channels ramp.
+
+        Args:
+            channellist: The 1-indexed channel numbers
+            v_endlist: The voltages to ramp to
+            ramptime: The ramp time in seconds
+            v_startlist: The voltages to start the ramps from. If not given,
+                the ramps start at the current voltages, read in a single
+                status call.
+
+        Returns:
+            float: The ramp time in seconds. The call returns as soon as the
+                ramps have started.
+        """
+        chans = list(channellist)
+        if len(v_endlist) != len(chans) or (v_startlist is not None and
+                                            len(v_startlist) != len(chans)):
+            raise ValueError('Give exactly one start and end voltage for '
+                             'every channel')
+        for chan in chans:
+            self.channel_validator.validate(chan)
+        for chan, v_end in zip(chans, v_endlist):
+            self.channels[chan-1].v.validate(v_end)
+
+        if v_startlist is None:
+            self._get_status(readcurrents=False)
+            v_startlist = [self.channels[chan-1].v.get_latest()
+                           for chan in chans]
+        v_endlist = [self._clip_voltage(chan, v_end)
+                     for chan, v_end in zip(chans, v_endlist)]
+
+        self.write(';'.join(self._ramp_commands(chans, v_startlist,
+                                                v_endlist, ramptime)))
+        for chan, v_end in zip(chans, v_endlist):
+            self.channels[chan-1].v._save_val(v_end)
+        return ramptime
+
+    def _ramp_commands(self, chans, v_starts, v_ends, ramptime):
+        """
+        The commands to ramp several channels simultaneously by the means
+        of one function generator. Helper function used by _set_voltages
+        and ramp_voltages.
+
+        Args:
+            chans (List[int]): The 1-indexed channel numbers
+            v_starts (List[float]): The voltages to ramp from
+            v_ends (List[float]): The voltages to ramp to
+            ramptime (float): The ramp time in seconds.
+
+        Returns:
+            List[str]: The commands, to be joined by ';'. The last one starts
+                the function generator.
+        """
+        # Crazy stuff happens if the period is too small, e.g. the channel
+        # can jump to its max voltage, so set such voltages right away
+        if ramptime <= 0.002:
+            return [self._dc_voltage_command(chan, v_end)
+                    for chan, v_end in zip(chans, v_ends)]
+
+        # The function generators of other channels, that may still ramp
+        busy = {fg for chan, fg in self._assigned_fgs.items()
+                if chan not in chans}
+        free = self._fgs.difference(busy)
+        if not free:
+            raise RuntimeError('All function generators are in use. Assign '
+                               "slope 'Inf' to channels that no longer ramp.")
+        fg = min(free)
+
+        commands = []
+        for chan, v_start, v_end in zip(chans, v_starts, v_ends):
+            self._assigned_fgs[chan] = fg
+            commands += self._channel_ramp_commands(chan, fg, v_start, v_end)
+        commands.append(self._ramp_function_command(fg, ramptime))
+        return commands
 
     def _set_vrange(self, chan, switchint):
         """
@@ -394,6 +576,67 @@ class QDac(VisaInstrument):
 
         return value
 
+    def read_states(self, chans: Optional[Sequence[int]] = None,
+                    readcurrents: bool = True) -> Dict[int, Dict[str, Any]]:
+        """
+        Read the state of many channels at once: the voltages and ranges of
+        all channels in a single status call, and the currents in a single
+        write of all the current queries.
+
+        Args:
+            chans: The 1-indexed channel numbers. Default: all channels
+            readcurrents: Whether to read the currents too
+
+        Returns:
+            A dict of every channel number to a dict of its 'v', 'vrange'
+            and 'irange' (as returned by read_state) and 'i' if
+            readcurrents is True.
+        """
+        if chans is None:
+            chans = list(self.chan_range)
+        for chan in chans:
+            if chan not in self.chan_range:
+                raise ValueError('valid channels are {}'.format(
+                    self.chan_range))
+
+        self._get_status(readcurrents=False)
+        if readcurrents:
+            self._read_currents(chans)
+
+        returnmap: Dict[str, Dict[int, Any]] = {
+            'vrange': {1: 1, 10: 0},
+            'irange': {0: '1 muA', 1: '100 muA'}}
+        params: Tuple[str, ...] = ('v', 'vrange', 'irange')
+        if readcurrents:
+            params += ('i',)
+
+        states = {}
+        for chan in chans:
+            channel = self.channels[chan-1]
+            state = {param: getattr(channel, param).get_latest()
+                     for param in params}
+            for param, mapping in returnmap.items():
+                state[param] = mapping[state[param]]
+            states[chan] = state
+        return states
+
+    def _read_currents(self, chans: Sequence[int]) -> List[float]:
+        """
+        Read the currents of several channels by sending all queries in one
+        write, and update their chXX_i parameters.
+
+        Args:
+            chans: The 1-indexed channel numbers
+
+        Returns:
+            The currents in A
+        """
+        responses = self._ask_many(['get {}'.format(chan) for chan in chans])
+        currents = [self._current_parser(response) for response in responses]
+        for chan, current in zip(chans, currents):
+            self.channels[chan-1].i._save_val(current)
+        return currents
+
     def _get_status(self, readcurrents=False):
         r"""
         Function to query the instrument and get the status of all channels.
@@ -461,9 +704,7 @@ class QDac(VisaInstrument):
             chans_left.remove(chan)
 
         if readcurrents:
-            for chan in range(1, self.num_chans+1):
-                param = self.channels[chan-1].i
-                param._save_val(param.get())
+            self._read_currents(list(self.chan_range))
 
         self._status = chans
         self._status_ts = datetime.now()
@@ -602,24 +843,41 @@ class QDac(VisaInstrument):
             log.warning('Cancelled a ramp with a ramptime of '
                         '{} s'.format(ramptime) + '. Voltage not changed.')
 
+        for cmd in self._channel_ramp_commands(chan, fg, v_start, setvoltage):
+            self.write(cmd)
+        self.write(self._ramp_function_command(fg, ramptime))
+
+    def _channel_ramp_commands(self, chan, fg, v_start, setvoltage):
+        """
+        The commands to bind a channel (and its sync output, if any) to a
+        function generator that ramps from v_start to setvoltage.
+        """
         offset = v_start
         amplitude = setvoltage-v_start
         if self.channels[chan-1].vrange.get_latest() == 1:
             offset *= 10
             amplitude *= 10
 
-        chanmssg = 'wav {} {} {} {}'.format(chan, fg,
-                                            amplitude,
-                                            offset)
-
+        commands = []
         if chan in [syn[0] for syn in self._syncoutputs]:
             sync = [syn[1] for syn in self._syncoutputs if syn[0] == chan][0]
             sync_duration = 1000*self.channels[chan-1].sync_duration.get()
             sync_delay = 1000*self.channels[chan-1].sync_delay.get()
-            self.write('syn {} {} {} {}'.format(sync, fg,
-                                                sync_delay,
-                                                sync_duration))
+            commands.append('syn {} {} {} {}'.format(sync, fg,
+                                                     sync_delay,
+                                                     sync_duration))
+
+        commands.append('wav {} {} {} {}'.format(chan, fg,
+                                                 amplitude,
+                                                 offset))
+        return commands
 
+    @staticmethod
+    def _ramp_function_command(fg, ramptime):
+        """
+        The command that makes a function generator ramp once, which starts
+        the ramps of all channels bound to it.
+        """
         typedict = {'SINE': 1, 'SQUARE': 2, 'RAMP': 3}
 
         typeval = typedict['RAMP']
@@ -627,11 +885,9 @@ class QDac(VisaInstrument):
         # s -> ms
         periodval = ramptime*1e3
         repval = 1
-        funmssg = 'fun {} {} {} {} {}'.format(fg,
-                                              typeval, periodval,
-                                              dutyval, repval)
-        self.write(chanmssg)
-        self.write(funmssg)
+        return 'fun {} {} {} {} {}'.format(fg,
+                                           typeval, periodval,
+                                           dutyval, repval)
 
     def write(self, cmd):
         """
@@ -655,6 +911,18 @@ class QDac(VisaInstrument):
         for _ in range(cmd.count(';')+1):
             self._write_response = self.visa_handle.read()
 
+    def _ask_many(self, cmds: Sequence[str]) -> List[str]:
+        """
+        Send several queries concatenated by ';' in a single write, and read
+        the response of each of them.
+        """
+        cmd = ';'.join(cmds)
+        log.debug("Writing to instrument {}: {}".format(self.name, cmd))
+
+        nr_bytes_written, ret_code = self.visa_handle.write(cmd)
+        self.check_error(ret_code)
+        return [self.visa_handle.read() for _ in cmds]
+
     def read(self):
         return self.visa_handle.read()
 
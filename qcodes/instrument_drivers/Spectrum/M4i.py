@@ -14,10 +14,12 @@
 import os
 import sys
 import logging
+import math
+import mmap
 import numpy as np
 import ctypes as ct
 from functools import partial
-from typing import Union, Type
+from typing import Callable, Iterator, Optional
 
 from qcodes.utils.validators import Enum, Numbers, Anything, Ints
 from qcodes.instrument.base import Instrument
@@ -584,6 +586,9 @@ class M4i(Instrument):
         # memsize used for simple channel read-out
         self._channel_memsize = 2**12
 
+        # ring buffer for FIFO acquisitions, reused by every acquisition
+        self._fifo_buffer_memory: Optional[np.ndarray] = None
+
     # checks if requirements for the compensation get and set functions are met
     def _get_compensation(self, i):
         # if HF enabled
@@ -806,18 +811,16 @@ class M4i(Instrument):
             array: transfered data
 
         """
-        # setup software buffer
-        sample_ctype: Union[Type[ct.c_int16], Type[ct.c_int32]]
+        # setup software buffer, numpy does not initialize the memory
         if bytes_per_sample == 2:
-            sample_ctype = ct.c_int16
+            sample_dtype = np.int16
         elif bytes_per_sample == 4:
-            sample_ctype = ct.c_int32
+            sample_dtype = np.int32
         else:
             raise ValueError('bytes_per_sample should be 2 or 4')
 
-        ctype_buffer_type = sample_ctype * memsize * numch
-        data_buffer = (ctype_buffer_type)()
-        data_pointer = ct.cast(data_buffer, ct.c_void_p)
+        output = np.empty(memsize * numch, dtype=sample_dtype)
+        data_pointer = output.ctypes.data_as(ct.c_void_p)
 
         # data acquisition
         self._def_transfer64bit(
@@ -825,9 +828,6 @@ class M4i(Instrument):
         self.general_command(pyspcm.M2CMD_DATA_STARTDMA |
                              pyspcm.M2CMD_DATA_WAITDMA)
 
-        # convert buffer to numpy array
-        output = np.frombuffer(data_buffer, dtype=sample_ctype)
-
         return output
 
     def retrieve_data(self, trace):
@@ -1028,6 +1028,161 @@ class M4i(Instrument):
 
         return voltages
 
+    def _fifo_buffer(self, nbytes: int) -> np.ndarray:
+        """ Return a page aligned buffer of nbytes bytes for FIFO transfers
+
+        The memory is allocated once, and reused by later acquisitions unless
+        they need a larger buffer.
+        """
+        memory = self._fifo_buffer_memory
+        if memory is None or memory.nbytes < nbytes:
+            unaligned = np.empty(nbytes + mmap.PAGESIZE, dtype=np.uint8)
+            offset = -unaligned.ctypes.data % mmap.PAGESIZE
+            memory = unaligned[offset:offset + nbytes]
+            self._fifo_buffer_memory = memory
+        return memory[:nbytes]
+
+    def _wait_dma(self):
+        """ Wait until the card has transferred the next notify size of data
+
+        Raises:
+            TimeoutError: if no data arrived within the timeout of the card
+            RuntimeError: if the card overran the buffer
+        """
+        error = pyspcm.spcm_dwSetParam_i32(self.hCard, pyspcm.SPC_M2CMD,
+                                           pyspcm.M2CMD_DATA_WAITDMA)
+        if error == pyspcm.ERR_TIMEOUT:
+            raise TimeoutError('M4i: timeout waiting for FIFO data')
+        if self.card_status() & pyspcm.M2STAT_DATA_OVERRUN:
+            raise RuntimeError('M4i: FIFO overrun, the data was not read '
+                               'out fast enough')
+
+    def fifo_stream(self, segment_size: int, n_segments: int = 0,
+                    posttrigger_size: Optional[int] = None,
+                    segments_per_notify: Optional[int] = None,
+                    notifies_per_buffer: int = 16) -> Iterator[np.ndarray]:
+        """ Stream segments acquired in FIFO multi mode
+
+        The card transfers the samples continuously into a ring buffer in
+        host memory, which is page aligned, allocated once and registered
+        with the card once per acquisition. Every notify size worth of
+        segments is yielded as soon as the card has transferred it, as a
+        view of the ring buffer (so without copying it): an int16 array of
+        shape (segments, segment_size, channels) of ADC codes, see
+        `convert_to_voltage`. The memory of the view is handed back to the
+        card when the next segments are requested, so the view must not be
+        used after that.
+
+        The host memory needed is that of the ring buffer, regardless of
+        the number of segments acquired. Breaking out of the iteration (or
+        closing the generator) stops the acquisition.
+
+        Args:
+            segment_size (int): number of samples per channel per segment
+            n_segments (int): number of segments to acquire. 0 acquires
+                until the iteration is stopped.
+            posttrigger_size (None or int): number of samples per segment
+                after the trigger. Default the segment size minus 16.
+            segments_per_notify (None or int): number of segments yielded at
+                a time. Their size in bytes must be a multiple of the page
+                size (4 kB). Default the smallest such number.
+            notifies_per_buffer (int): size of the ring buffer, in notify
+                sizes
+        Yields:
+            segments (array)
+        """
+        numch = self._num_channels()
+        bytes_per_sample = 2
+        segment_bytes = bytes_per_sample * segment_size * numch
+        if segments_per_notify is None:
+            segments_per_notify = (mmap.PAGESIZE //
+                                   math.gcd(segment_bytes, mmap.PAGESIZE))
+        notify_bytes = segments_per_notify * segment_bytes
+        if notify_bytes % mmap.PAGESIZE:
+            raise ValueError('{} segments of {} bytes are not a multiple of '
+                             'the page size of {} bytes'.format(
+                                 segments_per_notify, segment_bytes,
+                                 mmap.PAGESIZE))
+        buffer = self._fifo_buffer(notify_bytes * notifies_per_buffer)
+        samples = buffer.view(np.int16)
+
+        if posttrigger_size is None:
+            posttrigger_size = segment_size - 16
+        self.card_mode(pyspcm.SPC_REC_FIFO_MULTI)
+        self.segment_size(segment_size)
+        self.posttrigger_memory_size(posttrigger_size)
+        self.total_segments(n_segments)
+
+        self._def_transfer64bit(
+            pyspcm.SPCM_BUF_DATA, pyspcm.SPCM_DIR_CARDTOPC, notify_bytes,
+            buffer.ctypes.data_as(ct.c_void_p), 0, buffer.nbytes)
+        self.general_command(pyspcm.M2CMD_CARD_START |
+                             pyspcm.M2CMD_CARD_ENABLETRIGGER |
+                             pyspcm.M2CMD_DATA_STARTDMA)
+        try:
+            segments_done = 0
+            position = 0
+            while n_segments == 0 or segments_done < n_segments:
+                if n_segments == 0:
+                    chunk_segments = segments_per_notify
+                else:
+                    chunk_segments = min(segments_per_notify,
+                                         n_segments - segments_done)
+                chunk_bytes = chunk_segments * segment_bytes
+                # the ring buffer is a whole number of notify sizes, so a
+                # chunk never wraps around its end
+                while self.user_available_length() < chunk_bytes:
+                    self._wait_dma()
+                start = position // bytes_per_sample
+                stop = start + chunk_bytes // bytes_per_sample
+                yield samples[start:stop].reshape(chunk_segments,
+                                                  segment_size, numch)
+                self.card_available_length(chunk_bytes)
+                position = (position + chunk_bytes) % buffer.nbytes
+                segments_done += chunk_segments
+        finally:
+            self._stop_acquisition()
+
+    def fifo_acquisition(self, mV_range, segment_size: int, n_segments: int,
+                         callback: Optional[Callable[[np.ndarray], None]] = None,
+                         datasaver=None, parameter=None,
+                         **kwargs) -> int:
+        """ Acquire segments in FIFO multi mode, handing them over as they
+        arrive
+
+        Unlike the other acquisition methods, the segments are never all
+        held in host memory at the same time, so long acquisitions are not
+        limited by the memory of the card or of the host. See `fifo_stream`.
+
+        Args:
+            mV_range (float): range in mV
+            segment_size (int): number of samples per channel per segment
+            n_segments (int): number of segments to acquire. 0 acquires
+                until interrupted.
+            callback (None or callable): called with every chunk of
+                segments, the raw int16 array yielded by `fifo_stream`,
+                which is only valid during the call
+            datasaver (None or DataSaver): if given, every chunk of
+                segments is added to it in volts, as the value of parameter
+            parameter: the parameter (or its name) of the measurement of
+                the datasaver to add the segments as
+            kwargs: passed on to `fifo_stream`
+        Returns:
+            n_segments (int): the number of segments acquired
+        """
+        if datasaver is not None and parameter is None:
+            raise ValueError('A parameter is needed to add the segments to '
+                             'the datasaver')
+        volts_per_code = mV_range / 1000 / self.ADC_to_voltage()
+        segments_done = 0
+        for segments in self.fifo_stream(segment_size, n_segments, **kwargs):
+            if callback is not None:
+                callback(segments)
+            if datasaver is not None:
+                datasaver.add_result((parameter, segments * volts_per_code))
+            segments_done += len(segments)
+        return segments_done
+
     def close(self):
         """Close handle to the card."""
         if self.hCard is not None:
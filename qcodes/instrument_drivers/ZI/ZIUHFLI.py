@@ -5,7 +5,8 @@ import numpy as np
 from functools import partial
 from math import sqrt
 
-from typing import Callable, List, Union, cast, Optional
+from typing import (Callable, Iterator, List, Union, cast, Optional,
+                    Tuple)
 
 from qcodes.utils.helpers import create_on_off_val_mapping
 
@@ -334,6 +335,11 @@ class Scope(MultiParameter):
           where N is he number of measured signals
         setpoint_names (tuple): Tuple of N identical strings with the name
           of the sweep x-axis.
+        reuse_buffers (bool): If True, the data is parsed into two
+          preallocated buffers used in turn, so the arrays returned by a get
+          are overwritten by the get after the next one. Saves allocating
+          the arrays of long segmented acquisitions every time. Default
+          False.
     """
     def __init__(self, name, instrument, **kwargs):
         # The __init__ requires that we supply names and shapes,
@@ -342,6 +348,9 @@ class Scope(MultiParameter):
         super().__init__(name, names=('',), shapes=((1,),), **kwargs)
         self._instrument = instrument
         self._scopeactions = []  # list of callables
+        self.reuse_buffers = False
+        self._buffers: List[Optional[np.ndarray]] = [None, None]
+        self._buffer_index = 0
 
     def add_post_trigger_action(self, action: Callable) -> None:
         """
@@ -505,28 +514,15 @@ class Scope(MultiParameter):
         self._instrument.daq.sync()
         self._instrument.scope_correctly_built = True
 
-    def get_raw(self):
+    def _settings(self) -> Tuple[int, int, Tuple[bool, bool], float]:
         """
-        Acquire data from the scope.
-
-        Returns:
-            tuple: Tuple of two n X m arrays where n is the number of segments
-                and m is the number of points in the scope trace.
-
-        Raises:
-            ValueError: If the scope has not been prepared by running the
-                prepare_scope function.
+        Get the settings of an acquisition: the number of points of a
+        segment, the number of segments, the channels to return and the
+        expected duration in seconds.
         """
-        t_start = time.monotonic()
-        log.info('Scope get method called')
-
-        if not self._instrument.scope_correctly_built:
-            raise ValueError('Scope not properly prepared. Please run '
-                             'prepare_scope before measuring.')
-
         # A convenient reference
-        params = self._instrument.parameters
-        #
+        instrument = cast('ZIUHFLI', self._instrument)
+        params = instrument.parameters
         chans = {1: (True, False), 2: (False, True), 3: (True, True)}
         channels = chans[params['scope_channels'].get()]
 
@@ -539,7 +535,7 @@ class Scope(MultiParameter):
         # The following steps SEEM to give the correct result
 
         # Make sure all settings have taken effect
-        self._instrument.daq.sync()
+        instrument.daq.sync()
 
         # Calculate the time needed for the measurement. We often have failed
         # measurements, so a timeout is needed.
@@ -551,89 +547,217 @@ class Scope(MultiParameter):
         # We add one second to account for latencies and random delays
         meas_time = segs*(params['scope_duration'].get()+deadtime)+1
         npts = params['scope_length'].get()
+        return npts, segs, channels, meas_time
+
+    def _arm(self) -> None:
+        """
+        Start an acquisition without waiting for it: arm the trigger, start
+        the scope module and perform the post trigger actions.
+        """
+        instrument = cast('ZIUHFLI', self._instrument)
+        # one shot per trigger. This needs to be set every time
+        # a the scope is enabled as below using scope_runstop
+        instrument.daq.setInt(
+            '/{}/scopes/0/single'.format(instrument.device), 1)
+
+        scope = instrument.scope
+        scope.set('scopeModule/clearhistory', 1)
+
+        # Start the scope triggering/acquiring
+        # set /dev/scopes/0/enable to 1
+        instrument.parameters['scope_runstop'].set('run')
+
+        instrument.daq.sync()
+
+        log.debug('Starting ZI scope acquisition.')
+        # Start something... hauling data from the scopeModule?
+        scope.execute()
 
-        zi_error = True
-        error_counter = 0
-        num_retries = 10
+        # Now perform actions that may produce data, e.g. running an AWG
+        for action in self._scopeactions:
+            action()
+
+    def _wait_and_read(self, meas_time: float) -> Optional[dict]:
+        """
+        Wait for an armed acquisition to complete and read its raw data.
+
+        Returns:
+            The return of scopeModule.read(), or None if the acquisition
+            timed out or failed.
+        """
+        instrument = cast('ZIUHFLI', self._instrument)
+        scope = instrument.scope
+        starttime = time.time()
         timedout = False
-        while (zi_error or timedout) and error_counter < num_retries:
-            # one shot per trigger. This needs to be set every time
-            # a the scope is enabled as below using scope_runstop
+
+        progress = scope.progress()
+        while progress < 1:
+            log.debug('Scope progress is {}'.format(progress))
+            progress = scope.progress()
+            time.sleep(0.1)  # This while+sleep is how ZI engineers do it
+            if (time.time()-starttime) > 20*meas_time+1:
+                timedout = True
+                break
+        metadata = scope.get("scopeModule/*")
+        zi_error = bool(metadata['error'][0])
+
+        # Stop the scope from running
+        instrument.parameters['scope_runstop'].set('stop')
+
+        rawdata = None
+        if not (timedout or zi_error):
+            rawdata = scope.read()
+            if 'error' in rawdata:
+                zi_error = bool(rawdata['error'][0])
+        if timedout or zi_error:
+            log.warning('[-] ZI scope acquisition failed, Timeout: {}, '
+                        'Error: {}'.format(timedout, zi_error))
+            return None
+        log.info('[+] ZI scope acquisition completed OK')
+        return rawdata
+
+    def _acquire(self, meas_time: float, armed: bool = False,
+                 num_retries: int = 10) -> dict:
+        """
+        Acquire the raw data of one acquisition, retrying failed ones.
+
+        Args:
+            meas_time: The expected duration of the acquisition in seconds
+            armed: Whether the acquisition has already been started by
+                ``_arm``
+            num_retries: The maximum number of attempts
+
+        Raises:
+            RuntimeError: If all attempts failed
+        """
+        instrument = cast('ZIUHFLI', self._instrument)
+        for attempt in range(num_retries):
             try:
                 # we wrap this in try finally to ensure that
                 # scope.finish is always called even if the
                 # measurement is interrupted
-                self._instrument.daq.setInt('/{}/scopes/0/single'.format(self._instrument.device), 1)
-
-
-                scope = self._instrument.scope
-                scope.set('scopeModule/clearhistory', 1)
-
-                # Start the scope triggering/acquiring
-                # set /dev/scopes/0/enable to 1
-                params['scope_runstop'].set('run')
-
-                self._instrument.daq.sync()
-
-                log.debug('Starting ZI scope acquisition.')
-                # Start something... hauling data from the scopeModule?
-                scope.execute()
-
-                # Now perform actions that may produce data, e.g. running an AWG
-                for action in self._scopeactions:
-                    action()
-
-                starttime = time.time()
-                timedout = False
-
-                progress = scope.progress()
-                while progress < 1:
-                    log.debug('Scope progress is {}'.format(progress))
-                    progress = scope.progress()
-                    time.sleep(0.1)  # This while+sleep is how ZI engineers do it
-                    if (time.time()-starttime) > 20*meas_time+1:
-                        timedout = True
-                        break
-                metadata = scope.get("scopeModule/*")
-                zi_error = bool(metadata['error'][0])
-
-                # Stop the scope from running
-                params['scope_runstop'].set('stop')
-
-                if not (timedout or zi_error):
-                    log.info('[+] ZI scope acquisition completed OK')
-                    rawdata = scope.read()
-                    if 'error' in rawdata:
-                        zi_error = bool(rawdata['error'][0])
-                    data = self._scopedataparser(rawdata, self._instrument.device,
-                                                 npts, segs, channels)
-                else:
-                    log.warning('[-] ZI scope acquisition attempt {} '
-                                'failed, Timeout: {}, Error: {}, '
-                                'retrying'.format(error_counter, timedout, zi_error))
-                    rawdata = None
-                    data = (None, None)
-                    error_counter += 1
-
-                if error_counter >= num_retries:
-                    log.error('[+] ZI scope acquisition failed, maximum number'
-                              'of retries performed. No data returned')
-                    raise RuntimeError('[+] ZI scope acquisition failed, maximum number'
-                              'of retries performed. No data returned')
+                if not armed:
+                    self._arm()
+                armed = False
+                rawdata = self._wait_and_read(meas_time)
             finally:
                 # cleanup and make ready for next scope acquisition
-                scope.finish()
+                instrument.scope.finish()
+            if rawdata is not None:
+                return rawdata
+            log.warning('[-] ZI scope acquisition attempt {} failed, '
+                        'retrying'.format(attempt))
+
+        log.error('[+] ZI scope acquisition failed, maximum number'
+                  'of retries performed. No data returned')
+        raise RuntimeError('[+] ZI scope acquisition failed, maximum number'
+                           'of retries performed. No data returned')
+
+    def _buffer(self, segments: int, channels: Tuple[bool, bool],
+                scopelength: int) -> np.ndarray:
+        """
+        Get a (segments, channels, scopelength) array to parse an
+        acquisition into: a new one, or the least recently used of the
+        reused buffers if ``reuse_buffers`` is True.
+        """
+        shape = (segments, sum(channels), scopelength)
+        if not self.reuse_buffers:
+            return np.empty(shape)
+        self._buffer_index = (self._buffer_index + 1) % len(self._buffers)
+        buffer = self._buffers[self._buffer_index]
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape)
+            self._buffers[self._buffer_index] = buffer
+        return buffer
+
+    def _parse(self, rawdata: dict, npts: int, segs: int,
+               channels: Tuple[bool, bool]) -> Tuple[Optional[np.ndarray],
+                                                     Optional[np.ndarray]]:
+        instrument = cast('ZIUHFLI', self._instrument)
+        return self._scopedataparser(rawdata, instrument.device, npts,
+                                     segs, channels,
+                                     out=self._buffer(segs, channels, npts))
+
+    def get_raw(self):
+        """
+        Acquire data from the scope.
+
+        Returns:
+            tuple: Tuple of two n X m arrays where n is the number of segments
+                and m is the number of points in the scope trace.
+
+        Raises:
+            ValueError: If the scope has not been prepared by running the
+                prepare_scope function.
+        """
+        t_start = time.monotonic()
+        log.info('Scope get method called')
+
+        if not self._instrument.scope_correctly_built:
+            raise ValueError('Scope not properly prepared. Please run '
+                             'prepare_scope before measuring.')
+
+        npts, segs, channels, meas_time = self._settings()
+        rawdata = self._acquire(meas_time)
+        data = self._parse(rawdata, npts, segs, channels)
 
         t_stop = time.monotonic()
         log.info('scope get method returning after {} s'.format(t_stop -
                                                                 t_start))
         return data
 
+    def acquisitions(self, count: int
+                     ) -> Iterator[Tuple[Optional[np.ndarray],
+                                         Optional[np.ndarray]]]:
+        """
+        Acquire data from the scope count times with the same settings,
+        e.g. to average many (segmented) traces. Every acquisition is
+        started as soon as the raw data of the previous one has been read,
+        so that the parsing of the previous one overlaps with it.
+
+        Args:
+            count: The number of acquisitions
+
+        Yields:
+            tuple: The data of an acquisition, as returned by get. Note that
+                if ``reuse_buffers`` is True the arrays are overwritten by
+                the acquisition after the next one, copy them to keep them.
+
+        Raises:
+            ValueError: If the scope has not been prepared by running the
+                prepare_scope function.
+        """
+        instrument = cast('ZIUHFLI', self._instrument)
+        if not instrument.scope_correctly_built:
+            raise ValueError('Scope not properly prepared. Please run '
+                             'prepare_scope before measuring.')
+
+        npts, segs, channels, meas_time = self._settings()
+        armed = False
+        try:
+            for index in range(count):
+                rawdata = self._acquire(meas_time, armed=armed)
+                armed = False
+                if index + 1 < count:
+                    self._arm()
+                    armed = True
+                yield self._parse(rawdata, npts, segs, channels)
+        finally:
+            if armed:
+                # the consumer stopped early, abort the last acquisition
+                instrument.parameters['scope_runstop'].set('stop')
+                instrument.scope.finish()
+
     @staticmethod
-    def _scopedataparser(rawdata, deviceID, scopelength, segments, channels):
+    def _scopedataparser(rawdata, deviceID, scopelength, segments, channels,
+                         out=None):
         """
         Cast the scope return value dict into a tuple.
 
+        The segments may come in a single shot or spread over several shots
+        (records); they are copied into one (segments, channels, scopelength)
+        array, without intermediate copies.
+
         Args:
             rawdata (dict): The return of scopeModule.read()
             deviceID (str): The device ID string of the instrument.
@@ -641,23 +765,45 @@ class Scope(MultiParameter):
             segments (int): The number of segments
             channels (tuple): Tuple of two bools controlling what data to return
                 (True, False) will return data for channel 1 etc.
+            out (np.array): The array to copy the data into, with dimensions
+                segments x number of returned channels x scopelength. A new
+                one is allocated if not given.
 
         Returns:
             tuple: A 2-tuple of either None or np.array with dimensions
-                segments x scopelength.
-        """
+                segments x scopelength, views of out.
 
-        data = rawdata['{}'.format(deviceID)]['scopes']['0']['wave'][0][0]
-        if channels[0]:
-            ch1data = data['wave'][0].reshape(segments, scopelength)
-        else:
-            ch1data = None
-        if channels[1]:
-            ch2data = data['wave'][1].reshape(segments, scopelength)
-        else:
-            ch2data = None
-
-        return (ch1data, ch2data)
+        Raises:
+            ValueError: If the data does not hold the given number of
+                segments of the given length.
+        """
+        enabled = [channel for channel in (0, 1) if channels[channel]]
+        if out is None:
+            out = np.empty((segments, len(enabled), scopelength))
+
+        records = rawdata['{}'.format(deviceID)]['scopes']['0']['wave']
+        segment = 0
+        for shot in (shot for record in records for shot in record):
+            wave = shot['wave']
+            length = wave.shape[-1]
+            end = segment*scopelength + length
+            if length % scopelength or end > segments*scopelength:
+                raise ValueError('Scope data of {} points does not fit {} '
+                                 'segments of {} points'
+                                 ''.format(end, segments, scopelength))
+            count = length // scopelength
+            for column, channel in enumerate(enabled):
+                out[segment:segment + count, column] = \
+                    wave[channel].reshape(count, scopelength)
+            segment += count
+        if segment != segments:
+            raise ValueError('Scope data of {} segments, expected {}'
+                             ''.format(segment, segments))
+
+        data = [None, None]
+        for column, channel in enumerate(enabled):
+            data[channel] = out[:, column]
+        return tuple(data)
 
 class ZIUHFLI(Instrument):
     """
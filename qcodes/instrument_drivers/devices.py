@@ -1,6 +1,7 @@
 from typing import Union, cast
 
-from qcodes import Parameter, Instrument
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.parameter import Parameter
 
 
 class VoltageDivider(Parameter):
@@ -98,23 +98,19 @@ class ScopeTrace(ArrayParameter):
                 M = instr.completed_acquisitions()
 
         log.info('Acquisition completed. Polling trace from instrument.')
-        vh = instr.visa_handle
-        vh.write('CHANnel{}:DATA?'.format(self.channum))
-        raw_vals = vh.read_raw()
-
-        num_length = int(raw_vals[1:2])
-        no_points = int(raw_vals[2:2+num_length])
-
-        # cut of the header and the trailing '\n'
-        raw_vals = raw_vals[2+num_length:-1]
-
         dataformat = instr.dataformat.get_latest()
-
-        if dataformat == 'INT,8':
-            int_vals = np.fromstring(raw_vals, dtype=np.int8, count=no_points)
-        else:
-            int_vals = np.fromstring(raw_vals, dtype=np.int16,
-                                     count=no_points//2)
+        datatypes = {'INT,8': 'b', 'INT,16': 'h', 'REAL,32': 'f'}
+        if dataformat not in datatypes:
+            raise ValueError('Can not read a trace in the {} data format, '
+                             'set the dataformat to one of {}'.format(
+                                 dataformat, ', '.join(datatypes)))
+        values = instr.ask_binary_block(
+            'CHANnel{}:DATA?'.format(self.channum),
+            datatype=datatypes[dataformat],
+            data_format_cmd=None, byte_order_cmd=None)
+        if dataformat == 'REAL,32':
+            # the values are in physical units already
+            return values
 
         # now the integer values must be converted to physical
         # values
@@ -125,7 +121,7 @@ class ScopeTrace(ArrayParameter):
         # we always export as 16 bit integers
         quant_levels = 253*256
         conv_factor = scale*no_divs/quant_levels
-        output = conv_factor*int_vals + self.channel.offset()
+        output = conv_factor*values + self.channel.offset()
 
         return output
 
@@ -348,10 +348,12 @@ class ZNBChannel(InstrumentChannel):
             # need to ensure averaged result is returned
             for avgcount in range(self.avg()):
                 self.write('INIT{}:IMM; *WAI'.format(self._instrument_channel))
-            data_str = self.ask(
+            # the data format and byte order are set by ZNB.reset
+            data = self._parent.ask_binary_block(
                 'CALC{}:DATA? {}'.format(self._instrument_channel,
-                                         data_format_command))
-            data = np.array(data_str.rstrip().split(',')).astype('float64')
+                                         data_format_command),
+                datatype='f', data_format_cmd=None,
+                byte_order_cmd=None).astype('float64')
             if self.format() in ['Polar', 'Complex',
                                  'Smith', 'Inverse Smith']:
                 data = data[0::2] + 1j * data[1::2]
@@ -417,7 +419,7 @@ class ZNB(VisaInstrument):
                            get_cmd='OUTP1?',
                            set_cmd='OUTP1 {}',
                            val_mapping={True: '1\n', False: '0\n'})
-        self.add_function('reset', call_cmd='*RST')
+        self.add_function('reset', call_cmd=self._reset)
         self.add_function('tooltip_on', call_cmd='SYST:ERR:DISP ON')
         self.add_function('tooltip_off', call_cmd='SYST:ERR:DISP OFF')
         self.add_function('cont_meas_on', call_cmd='INIT:CONT:ALL ON')
@@ -451,6 +453,15 @@ class ZNB(VisaInstrument):
         self.rf_off()
         self.connect_message()
 
+    def _reset(self) -> None:
+        """
+        Reset the instrument, and have it transfer traces as binary blocks
+        of little endian 32 bit floats rather than as text again.
+        """
+        self.write('*RST')
+        self.write('FORM:DATA REAL,32')
+        self.write('FORM:BORD SWAP')
+
     def display_grid(self, rows: int, cols: int):
         """
         Display a grid of channels rows by cols
@@ -1,20 +1,30 @@
 from functools import partial
+import time
 import numpy as np
 
 from qcodes import VisaInstrument
 from qcodes.instrument.parameter import ArrayParameter
 from qcodes.utils.validators import Numbers, Ints, Enum, Strings
 
-from typing import Tuple
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+
+def _decode_buffer(rawdata: bytes) -> np.ndarray:
+    """
+    Decode the points of a binary TRCL response. Every point is a 16 bit
+    mantissa followed by a 16 bit exponent, and its value is
+    mantissa * 2**(exponent - 124).
+    """
+    points = np.frombuffer(rawdata, dtype='<i2').reshape(-1, 2)
+    return np.ldexp(points[:, 0].astype(float), points[:, 1] - 124)
 
 
 class ChannelBuffer(ArrayParameter):
     """
     Parameter class for the two channel buffers
 
-    Currently always returns the entire buffer
-    TODO (WilliamHPNielsen): Make it possible to query parts of the buffer.
-    The instrument natively supports this in its TRCL call.
+    Always returns the entire buffer. Use SR830.read_buffer to read parts of
+    it, or SR830.stream_buffer to read it while it fills up.
     """
 
     def __init__(self, name: str, instrument: 'SR830', channel: int) -> None:
@@ -103,13 +113,7 @@ class ChannelBuffer(ArrayParameter):
             raise ValueError('No points stored in SR830 data buffer.'
                              ' Can not poll anything.')
 
-        # poll raw binary data
-        self._instrument.write('TRCL ? {}, 0, {}'.format(self.channel, N))
-        rawdata = self._instrument.visa_handle.read_raw()
-
-        # parse it
-        realdata = np.fromstring(rawdata, dtype='<i2')
-        numbers = realdata[::2]*2.0**(realdata[1::2]-124)
+        numbers = self._instrument.read_buffer(self.channel, 0, N)
         if self.shape[0] != N:
             raise RuntimeError("SR830 got {} points in buffer expected {}".format(N, self.shape[0]))
         return numbers
@@ -121,6 +125,9 @@ class SR830(VisaInstrument):
     Lock-in Amplifier
     """
 
+    # The number of points the data buffer of a channel holds
+    BUFFER_SIZE = 16383
+
     _VOLT_TO_N = {2e-9:    0, 5e-9:    1, 10e-9:  2,
                   20e-9:   3, 50e-9:   4, 100e-9: 5,
                   200e-9:  6, 500e-9:  7, 1e-6:   8,
@@ -548,6 +555,82 @@ class SR830(VisaInstrument):
 
         return tuple(float(val) for val in output.split(','))
 
+    def read_buffer(self, channel: int, start: int, npts: int) -> np.ndarray:
+        """
+        Read points from the data buffer of a channel, in binary form.
+
+        Args:
+            channel: The channel, 1 or 2
+            start: The number of the first point to read, counting from 0
+            npts: The number of points to read
+
+        Returns:
+            The values of the points
+        """
+        self.write('TRCL ? {}, {}, {}'.format(channel, start, npts))
+        return _decode_buffer(self.visa_handle.read_raw())
+
+    def stream_buffer(self, npts: Optional[int] = None,
+                      channels: Sequence[int] = (1, 2),
+                      poll_interval: float = 0.1
+                      ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Read the data buffers while they fill up, for logging long time
+        traces as they are acquired.
+
+        The buffers are reset and storage is started. Then the number of
+        stored points is polled, and the new points of every channel are
+        read by index with ``TRCL? ch, start, n``. Storage is paused once
+        npts points have been read, or when the iteration is stopped.
+
+        Every chunk can be added to a ``DataSaver`` as soon as it comes in:
+
+            >>> with meas.run() as datasaver:
+            ...     for chunk in lockin.stream_buffer(npts=10000):
+            ...         datasaver.add_result((time, chunk['index']*dt),
+            ...                              (signal, chunk['ch1']))
+
+        Args:
+            npts: The number of points to read, at most (and by default) the
+                size of the buffer. In the 'Trigger' sample rate, a point is
+                stored per trigger, so make sure triggers come in.
+            channels: The channels to read, 1 and/or 2
+            poll_interval: The time in seconds to wait before polling again
+                if no new points were stored
+
+        Yields:
+            A dict of the new points, with the arrays 'index', the numbers of
+            the points in the buffer (counting from 0), and 'ch1' and/or
+            'ch2', the values.
+        """
+        if npts is None:
+            npts = self.BUFFER_SIZE
+        if not 0 < npts <= self.BUFFER_SIZE:
+            raise ValueError('Can stream between 1 and {} points, not {}'
+                             ''.format(self.BUFFER_SIZE, npts))
+        for channel in channels:
+            if channel not in (1, 2):
+                raise ValueError('Invalid channel specifier. SR830 only has '
+                                 'channels 1 and 2.')
+
+        self.buffer_reset()
+        self.buffer_start()
+        n_read = 0
+        try:
+            while n_read < npts:
+                n_stored = min(self.buffer_npts(), npts)
+                if n_stored <= n_read:
+                    time.sleep(poll_interval)
+                    continue
+                chunk = {'index': np.arange(n_read, n_stored)}
+                for channel in channels:
+                    chunk['ch{}'.format(channel)] = self.read_buffer(
+                        channel, n_read, n_stored - n_read)
+                n_read = n_stored
+                yield chunk
+        finally:
+            self.buffer_pause()
+
     def increment_sensitivity(self):
         """
         Increment the sensitivity setting of the lock-in. This is equivalent
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
-from typing import Sequence, Dict, Callable, Tuple
+import time
+from typing import Sequence, Dict, Callable, Tuple, Iterator
 
 from qcodes import VisaInstrument
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
@@ -386,27 +387,36 @@ class SR86xBuffer(InstrumentChannel):
                              f"is larger than current capture length of the "
                              f"buffer ({current_capture_length}kB).")
 
-        values = np.array([])
-        data_size_to_read_in_kb = size_in_kb
-        n_readings = 0
+        return self._get_raw_capture_data_range(0, size_in_kb)
 
-        while data_size_to_read_in_kb > 0:
-            offset = n_readings * self.max_size_per_reading_in_kb
+    def _get_raw_capture_data_range(self, offset_in_kb: int,
+                                    size_in_kb: int) -> np.ndarray:
+        """
+        Read data from the buffer in as many blocks as needed to stay within
+        the instrument limit of 64 kilobytes per reading.
 
-            if data_size_to_read_in_kb > self.max_size_per_reading_in_kb:
-                size_of_this_reading = self.max_size_per_reading_in_kb
-            else:
-                size_of_this_reading = data_size_to_read_in_kb
+        Args:
+            offset_in_kb
+                Offset within the buffer of where to read the data
+            size_in_kb
+                Size of the data that needs to be read
 
-            data_from_this_reading = self._get_raw_capture_data_block(
+        Returns:
+            A one-dimensional numpy array of the requested data, for all the
+            variables that are mentioned in the capture config.
+        """
+        blocks = []
+        for offset in range(offset_in_kb, offset_in_kb + size_in_kb,
+                            self.max_size_per_reading_in_kb):
+            size_of_this_reading = min(self.max_size_per_reading_in_kb,
+                                       offset_in_kb + size_in_kb - offset)
+            blocks.append(self._get_raw_capture_data_block(
                 size_of_this_reading,
-                offset_in_kb=offset)
-            values = np.append(values, data_from_this_reading)
+                offset_in_kb=offset))
 
-            data_size_to_read_in_kb -= size_of_this_reading
-            n_readings += 1
-
-        return values
+        if not blocks:
+            return np.array([])
+        return np.concatenate(blocks)
 
     def _get_raw_capture_data_block(self,
                                     size_in_kb: int,
@@ -464,15 +474,82 @@ class SR86xBuffer(InstrumentChannel):
                              f"2kB chunks "
                              f"({size_of_currently_captured_data}kB)")
 
-        values = self._parent.visa_handle.query_binary_values(
+        values = self._parent.ask_binary_block(
             f"CAPTUREGET? {offset_in_kb}, {size_in_kb}",
             datatype='f',
             is_big_endian=False,
-            expect_termination=False)
+            expect_termination=False,
+            data_format_cmd=None,
+            byte_order_cmd=None)
         # the sr86x does not include an extra termination char on binary
         # messages so we set expect_termination to False
 
-        return np.array(values)
+        return values.astype(np.float64)
+
+    def stream_capture(self, sample_count: int,
+                       poll_interval: float = 0.1
+                       ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Capture a number of samples at the capture rate, starting
+        immediately, like ``capture_samples``, but read them while they are
+        being captured, for logging long time traces as they are acquired.
+
+        The number of captured bytes is polled, and the new samples are read
+        by their offset in the buffer. The capture is stopped once all
+        samples have been read, or when the iteration is stopped.
+
+        Every chunk can be added to a ``DataSaver`` as soon as it comes in:
+
+            >>> with meas.run() as datasaver:
+            ...     for chunk in lockin.buffer.stream_capture(10000):
+            ...         datasaver.add_result((time, chunk['index']*dt),
+            ...                              (signal, chunk['X']))
+
+        Args:
+            sample_count
+                Number of samples to capture
+            poll_interval
+                The time in seconds to wait before polling again if no new
+                samples were captured
+
+        Yields:
+            data
+                A dict of the new samples. The key 'index' holds the numbers
+                of the samples (counting from 0), the other keys correspond
+                to the captured variables, like for ``get_capture_data``.
+        """
+        self.set_capture_length_to_fit_samples(sample_count)
+        capture_variables = self._get_list_of_capture_variable_names()
+        sample_size = len(capture_variables) * self.bytes_per_sample
+
+        self.start_capture("ONE", "IMM")
+        n_read = 0
+        try:
+            while n_read < sample_count:
+                n_captured = min(self.count_capture_bytes() // sample_size,
+                                 sample_count)
+                if n_captured <= n_read:
+                    time.sleep(poll_interval)
+                    continue
+
+                # the buffer is read in whole kilobytes
+                start = n_read * sample_size
+                stop = n_captured * sample_size
+                offset_in_kb = start // 1024
+                size_in_kb = -(-stop // 1024) - offset_in_kb
+                values = self._get_raw_capture_data_range(offset_in_kb,
+                                                          size_in_kb)
+                first = (start - offset_in_kb * 1024) // self.bytes_per_sample
+                values = values[first:first + (stop - start) //
+                                self.bytes_per_sample]
+
+                data = {'index': np.arange(n_read, n_captured)}
+                data.update(zip(capture_variables,
+                                values.reshape(-1, len(capture_variables)).T))
+                n_read = n_captured
+                yield data
+        finally:
+            self.stop_capture()
 
     def capture_one_sample_per_trigger(self,
                                        trigger_count: int,
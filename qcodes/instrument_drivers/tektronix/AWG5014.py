@@ -5,17 +5,18 @@ import re
 from collections import namedtuple
 from collections import defaultdict
 
-from typing import Tuple
+from typing import Any, Dict, List, Sequence, Tuple, Union
 
 import numpy as np
 import array as arr
 
 from time import sleep, localtime
-from io import BytesIO
 from functools import wraps, WRAPPER_ASSIGNMENTS
 
 
 from qcodes import VisaInstrument, validators as vals
+from qcodes.instrument_drivers.tektronix.waveform_cache import (
+    WaveformCache, content_hash)
 from qcodes.utils.deprecate import deprecate
 from pyvisa.errors import VisaIOError
 
@@ -34,6 +35,84 @@ def parsestr(v):
     return v.strip().strip('"')
 
 
+_RECORD_SIZES = struct.Struct('<II')
+
+
+def _record_data(value: Any, dtype: str) -> Union[bytes, np.ndarray]:
+    """
+    The data of an awg file record, see ``Tektronix_AWG5014._pack_record``.
+    Arrays of unsigned shorts (waveform data) are returned as little endian
+    numpy arrays rather than packed, to be copied into the file at once.
+    """
+    if len(dtype) == 1:
+        return struct.pack('<' + dtype, value)
+    if dtype[-1] == 's':
+        return value.encode('ASCII')
+    if dtype[-1] == 'H' and isinstance(value, np.ndarray):
+        return np.ascontiguousarray(value, dtype='<u2')
+    return struct.pack('<' + dtype, *value)
+
+
+def _pack_records(records: Sequence[Tuple[str, Any, str]]) -> bytes:
+    """
+    Pack awg file records into a single buffer, which is allocated once for
+    the whole file.
+
+    Args:
+        records: the (name, value, dtype) of every record, see
+            ``Tektronix_AWG5014._pack_record``
+
+    Returns:
+        the packed records
+    """
+    names = [name.encode('ASCII') + b'\x00' for name, _, _ in records]
+    # the data of every record as bytes, without copying the arrays
+    datas: List[memoryview] = [
+        memoryview(_record_data(value, dtype)).cast('B')
+        for _, value, dtype in records]
+    size = sum(_RECORD_SIZES.size + len(name) + len(data)
+               for name, data in zip(names, datas))
+
+    packed = bytearray(size)
+    view = memoryview(packed)
+    position = 0
+    for name, data in zip(names, datas):
+        _RECORD_SIZES.pack_into(packed, position, len(name), len(data))
+        position += _RECORD_SIZES.size
+        view[position:position + len(name)] = name
+        position += len(name)
+        view[position:position + len(data)] = data
+        position += len(data)
+    return bytes(packed)
+
+
+def _pack_waveform_array(wf, m1, m2) -> np.ndarray:
+    """
+    Pack a waveform and two markers into 16 bit integers, with bit
+    operations on whole arrays. See ``Tektronix_AWG5014._pack_waveform``.
+    """
+    wf = np.asarray(wf)
+    m1 = np.asarray(m1)
+    m2 = np.asarray(m2)
+    if not len(wf) == len(m1) == len(m2):
+        raise Exception('error: sizes of the waveforms do not match')
+    if np.min(wf) < -1 or np.max(wf) > 1:
+        raise TypeError('Waveform values out of bonds.' +
+                        ' Allowed values: -1 to 1 (inclusive)')
+    if np.any((m1 != 0) & (m1 != 1)):
+        raise TypeError('Marker 1 contains invalid values.' +
+                        ' Only 0 and 1 are allowed')
+    if np.any((m2 != 0) & (m2 != 1)):
+        raise TypeError('Marker 2 contains invalid values.' +
+                        ' Only 0 and 1 are allowed')
+
+    # the 14 bit waveform, with the markers in the two highest bits
+    packed_wf = (np.rint(wf * 8191) + 8191).astype(np.uint16)
+    packed_wf |= m1.astype(np.uint16) << 14
+    packed_wf |= m2.astype(np.uint16) << 15
+    return packed_wf
+
+
 class Tektronix_AWG5014(VisaInstrument):
     """
     This is the QCoDeS driver for the Tektronix AWG5014
@@ -142,7 +221,8 @@ class Tektronix_AWG5014(VisaInstrument):
         'DC_OUTPUT_LEVEL_N': 'd',  # V
     }
 
-    def __init__(self, name, address, timeout=180, num_channels=4, **kwargs):
+    def __init__(self, name, address, timeout=180, num_channels=4,
+                 waveform_cache_bytes=0, **kwargs):
         """
         Initializes the AWG5014.
 
@@ -152,6 +232,9 @@ class Tektronix_AWG5014(VisaInstrument):
             timeout (float): visa timeout, in secs. long default (180)
                 to accommodate large waveforms
             num_channels (int): number of channels on the device
+            waveform_cache_bytes (int): how many bytes of packed waveforms
+                to keep, so that unchanged waveforms are not packed again
+                by make_awg_file. Default 0: nothing is kept.
 
         Returns:
             None
@@ -163,6 +246,9 @@ class Tektronix_AWG5014(VisaInstrument):
 
         self._values = {}
         self._values['files'] = {}
+        # what is in the user defined waveform list, see update_waveforms
+        self.waveform_cache = WaveformCache(
+            max_encoded_bytes=waveform_cache_bytes)
 
         self.add_function('reset', call_cmd='*RST')
 
@@ -852,22 +938,8 @@ class Tektronix_AWG5014(VisaInstrument):
             dtype (str): String specifying the data type of the record.
                 Allowed values: 'h', 'd', 's'.
         """
-        if len(dtype) == 1:
-            record_data = struct.pack('<' + dtype, value)
-        else:
-            if dtype[-1] == 's':
-                record_data = value.encode('ASCII')
-            else:
-                record_data = struct.pack('<' + dtype, *value)
-
         # the zero byte at the end the record name is the "(Include NULL.)"
-        record_name = name.encode('ASCII') + b'\x00'
-        record_name_size = len(record_name)
-        record_data_size = len(record_data)
-        size_struct = struct.pack('<II', record_name_size, record_data_size)
-        packed_record = size_struct + record_name + record_data
-
-        return packed_record
+        return _pack_records([(name, value, dtype)])
 
     def generate_sequence_cfg(self):
         """
@@ -1240,31 +1312,24 @@ class Tektronix_AWG5014(VisaInstrument):
         timetuple = tuple(np.array(localtime())[[0, 1, 8, 2, 3, 4, 5, 6, 7]])
 
         # general settings
-        head_str = BytesIO()
-        bytes_to_write = (self._pack_record('MAGIC', 5000, 'h') +
-                          self._pack_record('VERSION', 1, 'h'))
-        head_str.write(bytes_to_write)
-        # head_str.write(string(bytes_to_write))
+        records = [('MAGIC', 5000, 'h'), ('VERSION', 1, 'h')]
 
         if sequence_cfg is None:
             sequence_cfg = self.generate_sequence_cfg()
 
         for k in list(sequence_cfg.keys()):
             if k in self.AWG_FILE_FORMAT_HEAD:
-                head_str.write(self._pack_record(k, sequence_cfg[k],
-                                                 self.AWG_FILE_FORMAT_HEAD[k]))
+                records.append((k, sequence_cfg[k],
+                                self.AWG_FILE_FORMAT_HEAD[k]))
             else:
                 log.warning('AWG: ' + k +
                             ' not recognized as valid AWG setting')
         # channel settings
-        ch_record_str = BytesIO()
         for k in list(channel_cfg.keys()):
             ch_k = k[:-1] + 'N'
             if ch_k in self.AWG_FILE_FORMAT_CHANNEL:
-                pack = self._pack_record(k, channel_cfg[k],
-                                         self.AWG_FILE_FORMAT_CHANNEL[ch_k])
-                ch_record_str.write(pack)
-
+                records.append((k, channel_cfg[k],
+                                self.AWG_FILE_FORMAT_CHANNEL[ch_k]))
             else:
                 log.warning('AWG: ' + k +
                             ' not recognized as valid AWG channel setting')
@@ -1272,54 +1337,43 @@ class Tektronix_AWG5014(VisaInstrument):
         # waveforms
         ii = 21
 
-        wf_record_str = BytesIO()
         wlist = list(packed_waveforms.keys())
         wlist.sort()
         for wf in wlist:
             wfdat = packed_waveforms[wf]
             lenwfdat = len(wfdat)
 
-            wf_record_str.write(
-                self._pack_record('WAVEFORM_NAME_{}'.format(ii), wf + '\x00',
-                                  '{}s'.format(len(wf + '\x00'))) +
-                self._pack_record('WAVEFORM_TYPE_{}'.format(ii), 1, 'h') +
-                self._pack_record('WAVEFORM_LENGTH_{}'.format(ii),
-                                  lenwfdat, 'l') +
-                self._pack_record('WAVEFORM_TIMESTAMP_{}'.format(ii),
-                                  timetuple[:-1], '8H') +
-                self._pack_record('WAVEFORM_DATA_{}'.format(ii), wfdat,
-                                  '{}H'.format(lenwfdat)))
+            records += [
+                ('WAVEFORM_NAME_{}'.format(ii), wf + '\x00',
+                 '{}s'.format(len(wf + '\x00'))),
+                ('WAVEFORM_TYPE_{}'.format(ii), 1, 'h'),
+                ('WAVEFORM_LENGTH_{}'.format(ii), lenwfdat, 'l'),
+                ('WAVEFORM_TIMESTAMP_{}'.format(ii), timetuple[:-1], '8H'),
+                ('WAVEFORM_DATA_{}'.format(ii), np.asarray(wfdat),
+                 '{}H'.format(lenwfdat))]
             ii += 1
 
         # sequence
         kk = 1
-        seq_record_str = BytesIO()
 
         for segment in wfname_l.transpose():
 
-            seq_record_str.write(
-                self._pack_record('SEQUENCE_WAIT_{}'.format(kk),
-                                  trig_wait[kk - 1], 'h') +
-                self._pack_record('SEQUENCE_LOOP_{}'.format(kk),
-                                  int(nrep[kk - 1]), 'l') +
-                self._pack_record('SEQUENCE_JUMP_{}'.format(kk),
-                                  jump_to[kk - 1], 'h') +
-                self._pack_record('SEQUENCE_GOTO_{}'.format(kk),
-                                  goto_state[kk - 1], 'h'))
+            records += [
+                ('SEQUENCE_WAIT_{}'.format(kk), trig_wait[kk - 1], 'h'),
+                ('SEQUENCE_LOOP_{}'.format(kk), int(nrep[kk - 1]), 'l'),
+                ('SEQUENCE_JUMP_{}'.format(kk), jump_to[kk - 1], 'h'),
+                ('SEQUENCE_GOTO_{}'.format(kk), goto_state[kk - 1], 'h')]
             for wfname in segment:
                 if wfname is not None:
                     # TODO (WilliamHPNielsen): maybe infer ch automatically
                     # from the data size?
                     ch = wfname[-1]
-                    seq_record_str.write(
-                        self._pack_record('SEQUENCE_WAVEFORM_NAME_CH_' + ch
-                                          + '_{}'.format(kk), wfname + '\x00',
-                                          '{}s'.format(len(wfname + '\x00')))
-                    )
+                    records.append(
+                        ('SEQUENCE_WAVEFORM_NAME_CH_' + ch + '_{}'.format(kk),
+                         wfname + '\x00', '{}s'.format(len(wfname + '\x00'))))
             kk += 1
 
-        awg_file = (head_str.getvalue() + ch_record_str.getvalue() +
-                    wf_record_str.getvalue() + seq_record_str.getvalue())
+        awg_file = _pack_records(records)
         return awg_file
 
     @deprecate(alternative='make_awg_file, _generate_awg_file')
@@ -1364,6 +1418,7 @@ class Tektronix_AWG5014(VisaInstrument):
         s = 'AWGControl:SREStore "{}"'.format(filename)
         log.debug('Loading awg file using {}'.format(s))
         self.visa_handle.write_raw(s)
+        self.waveform_cache.clear()
         # we must update the appropriate parameter(s) for the sequence
         self.sequence_length.set(self.sequence_length.get())
 
@@ -1415,8 +1470,58 @@ class Tektronix_AWG5014(VisaInstrument):
                 file and will be reset to factory default when the file is
                 loaded. Default: True.
             """
-        packed_wfs = {}
+        awg_file, _ = self._make_awg_file(
+            waveforms, m1s, m2s, nreps, trig_waits, goto_states, jump_tos,
+            channels=channels,
+            preservechannelsettings=preservechannelsettings)
+        return awg_file
+
+    def _make_awg_file(self, waveforms, m1s, m2s, nreps, trig_waits,
+                       goto_states, jump_tos, channels=None,
+                       preservechannelsettings=True
+                       ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Make an .awg-file, see make_awg_file.
+
+        Returns:
+            The .awg-file and the content hash of every waveform in it
+        """
+        waveform_names, contents = self._hash_waveforms(waveforms, m1s, m2s,
+                                                        channels)
+        packed_wfs = {name: self._encode_waveform(key, *content)
+                      for name, (key, content) in contents.items()}
+
+        wavenamearray = np.array(waveform_names, dtype='str')
+
+        channel_cfg: Dict[str, Any] = {}
+
+        awg_file = self._generate_awg_file(
+            packed_wfs, wavenamearray, nreps, trig_waits, goto_states,
+            jump_tos, channel_cfg,
+            preservechannelsettings=preservechannelsettings)
+        return awg_file, {name: key for name, (key, _) in contents.items()}
+
+    @staticmethod
+    def _hash_waveforms(
+            waveforms, m1s, m2s, channels=None
+    ) -> Tuple[List[List[str]], Dict[str, Tuple[str, Tuple[Any, Any, Any]]]]:
+        """
+        Name the waveforms of a sequence like they are named in the waveform
+        list (wfm001ch1, wfm002ch1, ...), and hash their content.
+
+        Args:
+            waveforms (list): the waveforms, see make_awg_file
+            m1s (list): the markers 1, see make_awg_file
+            m2s (list): the markers 2, see make_awg_file
+            channels (list): the channels of the waveforms, see make_awg_file
+
+        Returns:
+            The names of the waveforms per channel, and a dict of the name of
+            each waveform to its content hash and its (waveform, marker 1,
+            marker 2)
+        """
         waveform_names = []
+        contents = {}
         if not isinstance(waveforms[0], list):
             waveforms = [waveforms]
             m1s = [m1s]
@@ -1430,21 +1535,18 @@ class Tektronix_AWG5014(VisaInstrument):
                     thisname = 'wfm{:03d}ch{}'.format(jj + 1, channels[ii])
                 namelist.append(thisname)
 
-                package = self._pack_waveform(waveforms[ii][jj],
-                                              m1s[ii][jj],
-                                              m2s[ii][jj])
-
-                packed_wfs[thisname] = package
+                content = (waveforms[ii][jj], m1s[ii][jj], m2s[ii][jj])
+                contents[thisname] = (content_hash(*content), content)
             waveform_names.append(namelist)
+        return waveform_names, contents
 
-        wavenamearray = np.array(waveform_names, dtype='str')
-
-        channel_cfg = {}
-
-        return self._generate_awg_file(
-            packed_wfs, wavenamearray, nreps, trig_waits, goto_states,
-            jump_tos, channel_cfg,
-            preservechannelsettings=preservechannelsettings)
+    def _encode_waveform(self, key: str, wf, m1, m2) -> np.ndarray:
+        """
+        Pack a waveform, unless a waveform with the same content hash has
+        been packed recently.
+        """
+        return self.waveform_cache.encode(
+            key, lambda: self._pack_waveform(wf, m1, m2))
 
     def make_send_and_load_awg_file(self, waveforms, m1s, m2s,
                                     nreps, trig_waits,
@@ -1504,7 +1606,7 @@ class Tektronix_AWG5014(VisaInstrument):
         """
 
         # waveform names and the dictionary of packed waveforms
-        awg_file = self.make_awg_file(
+        awg_file, keys = self._make_awg_file(
             waveforms, m1s, m2s, nreps, trig_waits,
             goto_states, jump_tos, channels=channels,
             preservechannelsettings=preservechannelsettings)
@@ -1519,6 +1621,70 @@ class Tektronix_AWG5014(VisaInstrument):
         currentdir = currentdir.replace('\n', '\\')
         loadfrom = '{}{}'.format(currentdir, filename)
         self.load_awg_file(loadfrom)
+        for name, key in keys.items():
+            self.waveform_cache.mark_uploaded(name, key)
+
+    def update_waveforms(self, waveforms, m1s, m2s,
+                         channels=None) -> List[str]:
+        """
+        Update the waveforms of a sequence uploaded with
+        make_send_and_load_awg_file, sending only the waveforms whose
+        content changed to the waveform list.
+
+        The changed waveforms are overwritten in place, so the sequence
+        elements playing them play the new content. This requires them to
+        keep their length: replacing a waveform by one of another length
+        would unload it from the sequence, so for that (or for a sequence
+        of other elements) use make_send_and_load_awg_file.
+
+        Which waveforms are in the waveform list is tracked by the
+        waveform_cache, only the waveforms of this update are queried.
+        Waveforms uploaded otherwise (e.g. by loading an .awg-file with
+        load_awg_file) are considered changed.
+
+        Args:
+            waveforms (list): A list of the waveforms to upload, like for
+                make_send_and_load_awg_file
+            m1s (list): A list of marker 1's, like for
+                make_send_and_load_awg_file
+            m2s (list): A list of marker 2's, like for
+                make_send_and_load_awg_file
+            channels (list): List of channels of the waveforms, like for
+                make_send_and_load_awg_file
+
+        Returns:
+            The names of the waveforms that were sent
+
+        Raises:
+            ValueError: If a changed waveform does not have the length of
+                the waveform of that name in the waveform list. Nothing is
+                sent then.
+        """
+        _, contents = self._hash_waveforms(waveforms, m1s, m2s, channels)
+        changed = [name for name in sorted(contents)
+                   if not self.waveform_cache.is_uploaded(
+                       name, contents[name][0])]
+
+        # check all lengths first, not to leave the sequence half updated
+        for name in changed:
+            length = int(self.ask('WLISt:WAVeform:LENGth? "{}"'.format(name)))
+            new_length = len(contents[name][1][0])
+            if length != new_length:
+                raise ValueError(
+                    'Waveform {} of {} points can not be replaced by one of '
+                    '{} points without unloading it from the sequence, use '
+                    'make_send_and_load_awg_file instead'.format(
+                        name, length, new_length))
+
+        for name in changed:
+            key, content = contents[name]
+            self.waveform_cache.forget(name)
+            self._send_packed_waveform_to_list(
+                self._encode_waveform(key, *content), name)
+            self.waveform_cache.mark_uploaded(name, key)
+        log.debug('Sent {} of {} waveforms to {}'.format(
+            len(changed), len(contents), self.name))
+        return changed
 
     def make_and_save_awg_file(self, waveforms, m1s, m2s,
                                nreps, trig_waits,
@@ -1617,28 +1783,7 @@ class Tektronix_AWG5014(VisaInstrument):
             TypeError: if the waveform contains values outside (-1, 1)
             TypeError: if the markers contain values that are not 0 or 1
         """
-
-        # Input validation
-        if (not((len(wf) == len(m1)) and ((len(m1) == len(m2))))):
-            raise Exception('error: sizes of the waveforms do not match')
-        if np.min(wf) < -1 or np.max(wf) > 1:
-            raise TypeError('Waveform values out of bonds.' +
-                            ' Allowed values: -1 to 1 (inclusive)')
-        if not np.all(np.in1d(m1, np.array([0, 1]))):
-            raise TypeError('Marker 1 contains invalid values.' +
-                            ' Only 0 and 1 are allowed')
-        if not np.all(np.in1d(m2, np.array([0, 1]))):
-            raise TypeError('Marker 2 contains invalid values.' +
-                            ' Only 0 and 1 are allowed')
-
-        wflen = len(wf)
-        packed_wf = np.zeros(wflen, dtype=np.uint16)
-        packed_wf += np.uint16(np.round(wf * 8191) + 8191 +
-                               np.round(16384 * m1) +
-                               np.round(32768 * m2))
-        if len(np.where(packed_wf == -1)[0]) > 0:
-            print(np.where(packed_wf == -1))
-        return packed_wf
+        return _pack_waveform_array(wf, m1, m2)
 
     @deprecate(reason='this function is for private use only.')
     @wraps(_pack_waveform, assigned=tuple(v for v in WRAPPER_ASSIGNMENTS
@@ -1688,6 +1833,16 @@ class Tektronix_AWG5014(VisaInstrument):
         channel is on, it will be switched off.
         """
         self.write('WLISt:WAVeform:DELete ALL')
+        self.waveform_cache.clear()
+
+    def get_waveform_list(self) -> List[str]:
+        """
+        Get the names of the waveforms in the waveform list, including the
+        predefined waveforms.
+        """
+        size = int(self.ask('WLISt:SIZE?'))
+        return [parsestr(self.ask('WLISt:NAME? {:d}'.format(n)))
+                for n in range(size)]
 
     def get_filenames(self):
         """Duplicate of self.get_folder_contents"""
@@ -1766,6 +1921,7 @@ class Tektronix_AWG5014(VisaInstrument):
                             ' Only 0 and 1 are allowed')
 
         self._values['files'][wfmname] = self._file_dict(w, m1, m2, None)
+        self.waveform_cache.forget(wfmname)
 
         # if we create a waveform with the same name but different size,
         # it will not get over written
@@ -1793,6 +1949,21 @@ class Tektronix_AWG5014(VisaInstrument):
         mes = s1 + s2 + s3
         self.visa_handle.write_raw(mes)
 
+    def _send_packed_waveform_to_list(self, packed: np.ndarray,
+                                      wfmname: str) -> None:
+        """
+        Overwrite the data of a waveform of the waveform list of the same
+        length with a waveform packed by _pack_waveform.
+
+        Args:
+            packed: the packed waveform and markers
+            wfmname: the name of the waveform
+        """
+        data = np.ascontiguousarray(packed, dtype='<u2').tobytes()
+        header = 'WLISt:WAVeform:DATA "{}",#{}{}'.format(
+            wfmname, len(str(len(data))), len(data))
+        self.visa_handle.write_raw(header.encode('ascii') + data)
+
     def clear_message_queue(self, verbose=False):
         """
         Function to clear up (flush) the VISA message queue of the AWG
@@ -1,11 +1,15 @@
 import datetime as dt
 import time
-import struct
 import io
+import os
 import zipfile as zf
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
-from typing import List, Sequence, Dict, Union, Optional
+from itertools import chain
+from typing import (Any, BinaryIO, Deque, Iterable, Iterator, List,
+                    Sequence, Dict, Tuple, Union, Optional)
 import time
 
 import xml.etree.ElementTree as ET
@@ -13,6 +17,8 @@ import numpy as np
 
 from qcodes import Instrument, VisaInstrument, validators as vals
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
+from qcodes.instrument_drivers.tektronix.waveform_cache import (
+    WaveformCache, content_hash)
 from qcodes.utils.validators import Validator
 from broadbean.sequence import fs_schema, InvalidForgedSequenceError
 
@@ -35,6 +41,129 @@ def _parse_string_response(input_str: str) -> str:
     return output
 
 
+def _make_timestamp() -> str:
+    """
+    The current time, formatted for the Timestamp element of the .wfmx and
+    .sml files
+    """
+    timezone = time.timezone
+    tz_m, _ = divmod(timezone, 60)  # returns (minutes, seconds)
+    tz_h, tz_m = divmod(tz_m, 60)
+    if np.sign(tz_h) == -1:
+        signstr = '-'
+        tz_h *= -1
+    else:
+        signstr = '+'
+    timestr = dt.datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]
+    timestr += signstr
+    timestr += '{:02.0f}:{:02.0f}'.format(tz_h, tz_m)
+    return timestr
+
+
+def _make_wfmx_files(waveforms: Iterable[Tuple[np.ndarray, float]],
+                     timestamp: str,
+                     processes: int = 1,
+                     waveform_cache: Optional[WaveformCache] = None
+                     ) -> Iterator[bytes]:
+    """
+    Make the .wfmx files of waveforms, one by one and in order.
+
+    With more than one process, the files are made in a pool of processes.
+    Only a few waveforms per process are handed to the pool at any time, so
+    that neither the waveforms waiting to be encoded nor the encoded files
+    waiting to be written pile up in memory.
+
+    Args:
+        waveforms: The (data, amplitude) of each waveform, see makeWFMXFile
+        timestamp: The timestamp of all the files
+        processes: The number of processes to make the files in
+        waveform_cache: If given, the files of waveforms encoded recently
+            are taken from this cache instead of being made again
+
+    Yields:
+        The .wfmx file of each waveform
+    """
+    def make(data: np.ndarray, amplitude: float) -> Any:
+        return partial(AWG70000A.makeWFMXFile, data, amplitude,
+                       timestamp=timestamp)
+
+    if processes == 1:
+        for data, amplitude in waveforms:
+            if waveform_cache is None:
+                yield make(data, amplitude)()
+            else:
+                yield waveform_cache.encode(
+                    content_hash(data, amplitude=amplitude),
+                    make(data, amplitude))
+        return
+
+    pending: Deque[Tuple[Optional[str], Any]] = deque()
+
+    def finish_first() -> bytes:
+        key, job = pending.popleft()
+        if key is None:
+            return job.result()
+        assert waveform_cache is not None
+        if isinstance(job, partial):
+            # in the cache when it was queued
+            return waveform_cache.encode(key, job)
+        wfmx = job.result()
+        return waveform_cache.encode(key, lambda: wfmx)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for data, amplitude in waveforms:
+            if waveform_cache is None:
+                pending.append((None, executor.submit(make(data, amplitude))))
+            else:
+                key = content_hash(data, amplitude=amplitude)
+                if key in waveform_cache:
+                    pending.append((key, make(data, amplitude)))
+                else:
+                    pending.append(
+                        (key, executor.submit(make(data, amplitude))))
+            while len(pending) > 2 * processes:
+                yield finish_first()
+        while pending:
+            yield finish_first()
+
+
+def _write_zip(file: BinaryIO,
+               entries: Iterable[Tuple[str, Union[str, bytes]]]) -> None:
+    """
+    Write a zip archive (e.g. a .seqx file) entry by entry, so that only one
+    entry at a time needs to be in memory. The entries are written like
+    ZipFile.writestr does, but all with the time at which writing started.
+
+    Args:
+        file: The (seekable) file to write to
+        entries: The name and content of each entry
+    """
+    date_time = time.localtime(time.time())[:6]
+    compression = zf.ZIP_STORED
+    with zf.ZipFile(file, mode='w', compression=compression) as archive:
+        for name, content in entries:
+            info = zf.ZipInfo(name, date_time=date_time)
+            info.compress_type = compression
+            info.external_attr = 0o600 << 16
+            archive.writestr(info, content)
+
+
+def _stack_forged_data(data: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Stack the waveform and markers of a channel of an element of a forged
+    broadbean sequence like makeWFMXFile takes them.
+    """
+    markerdata = []
+    for mkey in ['m1', 'm2', 'm3', 'm4']:
+        if mkey in data.keys():
+            markerdata.append(data.get(mkey))
+    return np.stack((data['wfm'], *markerdata))
+
+
+def _processes(processes: Optional[int]) -> int:
+    return (os.cpu_count() or 1) if processes is None else processes
+
+
 ##################################################
 #
 # MODEL DEPENDENT SETTINGS
@@ -362,13 +491,17 @@ class AWG70000A(VisaInstrument):
     """
 
     def __init__(self, name: str, address: str, num_channels: int,
-                 timeout: float=10, **kwargs) -> None:
+                 timeout: float=10, waveform_cache_bytes: int=0,
+                 **kwargs) -> None:
         """
         Args:
             name: The name used internally by QCoDeS in the DataSet
             address: The VISA resource name of the instrument
             timeout: The VISA timeout time (in seconds)
             num_channels: Number of channels on the AWG
+            waveform_cache_bytes: How many bytes of encoded waveforms and
+                sequences to keep, so that unchanged ones are not encoded
+                again on upload. Default 0: nothing is kept.
         """
 
         self.num_channels = num_channels
@@ -451,6 +584,13 @@ class AWG70000A(VisaInstrument):
         self.wfmxFileFolder = "\\Users\\OEM\\Documents"
         self.seqxFileFolder = "\\Users\\OEM\\Documents"
 
+        # what is in the waveform list and the sequence list, see
+        # upload_waveforms and upload_sequence
+        self.waveform_cache = WaveformCache(
+            max_encoded_bytes=waveform_cache_bytes)
+        self.sequence_cache = WaveformCache(
+            max_encoded_bytes=waveform_cache_bytes)
+
         self.current_directory(self.wfmxFileFolder)
 
         self.connect_message()
@@ -543,21 +683,147 @@ class AWG70000A(VisaInstrument):
                 list, not the file name) to delete
         """
         self.write(f'SLISt:SEQuence:DELete "{seqname}"')
+        self.sequence_cache.forget(seqname)
 
     def clearSequenceList(self):
         """
         Clear the sequence list
         """
         self.write('SLISt:SEQuence:DELete ALL')
+        self.sequence_cache.clear()
 
     def clearWaveformList(self):
         """
         Clear the waveform list
         """
         self.write('WLISt:WAVeform:DELete ALL')
+        self.waveform_cache.clear()
+
+    def upload_waveforms(self, wfms: Dict[str, np.ndarray], amplitude: float,
+                         path: Optional[str]=None) -> List[str]:
+        """
+        Send waveforms to the waveform list as .wfmx files, skipping the
+        ones that the waveform list already holds with the same content.
+
+        Which content the waveform list holds is tracked by the
+        waveform_cache, for the waveforms uploaded with this method. A
+        waveform that is missing from the waveform list of the instrument is
+        always sent, and a waveform that changed is deleted from the
+        waveform list before it is sent again.
+
+        Args:
+            wfms: The waveforms by their name in the waveform list, each a
+                numpy array like for makeWFMXFile
+            amplitude: The peak-to-peak amplitude (V) of the channel that
+                will play the waveforms, see makeWFMXFile
+            path: The path to the directory where the files are saved. If
+                omitted, wfmxFileFolder is used.
+
+        Returns:
+            The names of the waveforms that were sent
+        """
+        waveform_list = self.waveformList
+        stale = self.waveform_cache.sync(waveform_list)
+        if stale:
+            log.info(f'Waveforms {stale} are not in the waveform list of '
+                     f'{self.name} anymore')
+
+        sent = []
+        for name, data in wfms.items():
+            key = content_hash(data, amplitude=amplitude)
+            if self.waveform_cache.is_uploaded(name, key):
+                continue
+            wfmx = self.waveform_cache.encode(
+                key, partial(AWG70000A.makeWFMXFile, data, amplitude))
+            if name in waveform_list:
+                self.write(f'WLISt:WAVeform:DELete "{name}"')
+                self.waveform_cache.forget(name)
+            self.sendWFMXFile(wfmx, f'{name}.wfmx', path)
+            self.loadWFMXFile(f'{name}.wfmx', path)
+            self.waveform_cache.mark_uploaded(name, key)
+            sent.append(name)
+        log.debug(f'Sent {len(sent)} of {len(wfms)} waveforms to {self.name}')
+        return sent
+
+    def upload_sequence(self, trig_waits: Sequence[int],
+                        nreps: Sequence[int],
+                        event_jumps: Sequence[int],
+                        event_jump_to: Sequence[int],
+                        go_to: Sequence[int],
+                        wfms: Sequence[Sequence[np.ndarray]],
+                        amplitudes: Sequence[float],
+                        seqname: str,
+                        path: Optional[str]=None) -> bool:
+        """
+        Make a .seqx file, send it to the instrument and load it, unless the
+        sequence list already holds the exact same sequence.
+
+        A .seqx file always carries all the waveforms of its sequence, so a
+        sequence that changed is sent in full. The .wfmx files of the
+        waveforms that did not change are not encoded again though, see
+        makeSEQXFile.
+
+        Which sequences the sequence list holds is tracked by the
+        sequence_cache, for the sequences uploaded with this method. A
+        sequence missing from the sequence list of the instrument is always
+        sent, and a sequence that changed is deleted from the sequence list
+        before it is sent again.
+
+        Args:
+            trig_waits: See makeSEQXFile
+            nreps: See makeSEQXFile
+            event_jumps: See makeSEQXFile
+            event_jump_to: See makeSEQXFile
+            go_to: See makeSEQXFile
+            wfms: See makeSEQXFile
+            amplitudes: See makeSEQXFile
+            seqname: The name of the sequence, see makeSEQXFile. The file
+                is named after it.
+            path: The path to the directory where the file is saved. If
+                omitted, seqxFileFolder is used.
+
+        Returns:
+            Whether the sequence was sent
+        """
+        seqname = seqname.replace(' ', '_')
+        key = content_hash(
+            *(wfm for wfm_lst in wfms for wfm in wfm_lst),
+            trig_waits=[int(x) for x in trig_waits],
+            nreps=[int(x) for x in nreps],
+            event_jumps=[int(x) for x in event_jumps],
+            event_jump_to=[int(x) for x in event_jump_to],
+            go_to=[int(x) for x in go_to],
+            amplitudes=[float(x) for x in amplitudes],
+            channels=[len(wfm_lst) for wfm_lst in wfms])
+
+        sequence_list = self.sequenceList
+        stale = self.sequence_cache.sync(sequence_list)
+        if stale:
+            log.info(f'Sequences {stale} are not in the sequence list of '
+                     f'{self.name} anymore')
+        if self.sequence_cache.is_uploaded(seqname, key):
+            log.debug(f'Sequence {seqname} is up to date on {self.name}')
+            return False
+
+        seqx = self.makeSEQXFile(trig_waits, nreps, event_jumps,
+                                 event_jump_to, go_to, wfms, amplitudes,
+                                 seqname, waveform_cache=self.waveform_cache)
+        # without a file to write to, makeSEQXFile returns the bytes
+        assert seqx is not None
+        if seqname in sequence_list:
+            self.delete_sequence_from_list(seqname)
+        # loading the sequence (re)places its waveforms in the waveform list
+        for ch in range(1, len(wfms) + 1):
+            for el in range(1, len(wfms[0]) + 1):
+                self.waveform_cache.forget(f'wfmch{ch}pos{el}')
+        self.sendSEQXFile(seqx, f'{seqname}.seqx', path)
+        self.loadSEQXFile(f'{seqname}.seqx', path)
+        self.sequence_cache.mark_uploaded(seqname, key)
+        return True
 
     @staticmethod
-    def makeWFMXFile(data: np.ndarray, amplitude: float) -> bytes:
+    def makeWFMXFile(data: np.ndarray, amplitude: float,
+                     timestamp: Optional[str]=None) -> bytes:
         """
         Compose a WFMX file
 
@@ -568,6 +834,7 @@ class AWG70000A(VisaInstrument):
                 needed as the waveform must be rescaled to (-1, 1) where
                 -1 will correspond to the channel's min. voltage and 1 to the
                 channel's max. voltage.
+            timestamp: The timestamp written in the file. Default: now.
 
         Returns:
             The binary .wfmx file, ready to be sent to the instrument.
@@ -584,7 +851,8 @@ class AWG70000A(VisaInstrument):
             raise ValueError('Input data has too many dimensions!')
 
         wfmx_hdr_str = AWG70000A._makeWFMXFileHeader(num_samples=N,
-                                                     markers_included=markers_included)
+                                                     markers_included=markers_included,
+                                                     timestamp=timestamp)
         wfmx_hdr = bytes(wfmx_hdr_str, 'ascii')
         wfmx_data = AWG70000A._makeWFMXFileBinaryData(data, amplitude)
 
@@ -595,7 +863,7 @@ class AWG70000A(VisaInstrument):
         return wfmx
 
     def sendSEQXFile(self, seqx: bytes, filename: str,
-                     path: str=None) -> None:
+                     path: Optional[str]=None) -> None:
         """
         Send a binary seqx file to the AWG's memory
 
@@ -613,7 +881,7 @@ class AWG70000A(VisaInstrument):
         self._sendBinaryFile(seqx, filename, path)
 
     def sendWFMXFile(self, wfmx: bytes, filename: str,
-                     path: str=None) -> None:
+                     path: Optional[str]=None) -> None:
         """
         Send a binary wfmx file to the AWG's memory
 
@@ -667,7 +935,7 @@ class AWG70000A(VisaInstrument):
 
         self.visa_handle.write_raw(msg)
 
-    def loadWFMXFile(self, filename: str, path: str=None) -> None:
+    def loadWFMXFile(self, filename: str, path: Optional[str]=None) -> None:
         """
         Loads a wfmx from memory into the waveform list
         Only loading from the C: drive is supported
@@ -687,7 +955,7 @@ class AWG70000A(VisaInstrument):
         # the above command is overlapping, but we want a blocking command
         self.ask("*OPC?")
 
-    def loadSEQXFile(self, filename: str, path: str=None) -> None:
+    def loadSEQXFile(self, filename: str, path: Optional[str]=None) -> None:
         """
         Load a seqx file from instrument disk memory. All sequences in the file
         are loaded into the sequence list.
@@ -708,7 +976,8 @@ class AWG70000A(VisaInstrument):
 
     @staticmethod
     def _makeWFMXFileHeader(num_samples: int,
-                            markers_included: bool) -> str:
+                            markers_included: bool,
+                            timestamp: Optional[str]=None) -> str:
         """
         Compiles a valid XML header for a .wfmx file
         There might be behaviour we can't capture
@@ -723,18 +992,7 @@ class AWG70000A(VisaInstrument):
         if num_samples < 2400:
             raise ValueError('num_samples must be at least 2400.')
 
-        # form the timestamp string
-        timezone = time.timezone
-        tz_m, _ = divmod(timezone, 60)  # returns (minutes, seconds)
-        tz_h, tz_m = divmod(tz_m, 60)
-        if np.sign(tz_h) == -1:
-            signstr = '-'
-            tz_h *= -1
-        else:
-            signstr = '+'
-        timestr = dt.datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]
-        timestr += signstr
-        timestr += '{:02.0f}:{:02.0f}'.format(tz_h, tz_m)
+        timestr = timestamp or _make_timestamp()
 
         hdr = ET.Element('DataFile', attrib={'offset': '0'*offsetdigits,
                                              'version': '0.1'})
@@ -824,19 +1082,21 @@ class AWG70000A(VisaInstrument):
         shape = np.shape(data)
 
         if len(shape) == 1:
-            N = shape[0]
             binary_marker = b''
             wfm = data
         else:
-            N = shape[1]
             M = shape[0]
             wfm = data[0, :]
-            markers = data[1, :]
+            # a copy, not to add the other markers to the caller's marker 1
+            markers = np.array(data[1, :])
             for i in range(1, M-1):
                 markers += data[i+1, :] * (2**i)
             markers = markers.astype(int)
-            fmt = N*'B'  # endian-ness doesn't matter for one byte
-            binary_marker = struct.pack(fmt, *markers)
+            if markers.min() < 0 or markers.max() > 255:
+                raise ValueError('Invalid marker values, markers must be '
+                                 '0 or 1.')
+            # endian-ness doesn't matter for one byte
+            binary_marker = markers.astype(np.uint8).tobytes()
 
         if wfm.max() > channel_max or wfm.min() < channel_min:
             log.warning('Waveform exceeds specified channel range.'
@@ -851,9 +1111,7 @@ class AWG70000A(VisaInstrument):
         scale = 2/amplitude
         wfm = wfm*scale
 
-        # TODO: Is this a fast method?
-        fmt = '<' + N*'f'
-        binary_wfm = struct.pack(fmt, *wfm)
+        binary_wfm = np.asarray(wfm, dtype='<f4').tobytes()
         binary_out = binary_wfm + binary_marker
 
         return binary_out
@@ -864,7 +1122,9 @@ class AWG70000A(VisaInstrument):
             amplitudes: List[float],
             seqname: str,
             channel_mapping: Optional[Dict[Union[str, int],
-                                           int]]=None) -> bytes:
+                                           int]]=None,
+            processes: Optional[int]=1,
+            file: Optional[BinaryIO]=None) -> Optional[bytes]:
         """
         Make a .seqx from a forged broadbean sequence.
         Supports subsequences.
@@ -878,10 +1138,13 @@ class AWG70000A(VisaInstrument):
                 physical channel it should be assigned to.
             seqname: The name that the sequence will have in the AWG's
                 sequence list. Used for loading the sequence.
+            processes: The number of processes to make the .wfmx files in,
+                see makeSEQXFile
+            file: The file to write the .seqx file to, see makeSEQXFile
 
         Returns:
             The binary .seqx file contents. Can be sent directly to the
-                instrument or saved on disk.
+                instrument or saved on disk. None if it was written to file.
         """
 
         try:
@@ -915,26 +1178,16 @@ class AWG70000A(VisaInstrument):
 
         ##########
         # STEP 1:
-        # Make all .wfmx files
+        # Name all .wfmx files, they are made in STEP 4
 
-        wfmx_files: List[bytes] = []
+        wfmx_sources: List[Tuple[Dict[str, np.ndarray], float]] = []
         wfmx_filenames: List[str] = []
 
         for pos1 in seq.keys():
             for pos2 in seq[pos1]['content'].keys():
                 for ch, data in seq[pos1]['content'][pos2]['data'].items():
-                    wfm = data['wfm']
-
-                    markerdata = []
-                    for mkey in ['m1', 'm2', 'm3', 'm4']:
-                        if mkey in data.keys():
-                            markerdata.append(data.get(mkey))
-                    wfm_data = np.stack((wfm, *markerdata))
-
                     awgchan = channel_mapping[ch]
-                    wfmx = AWG70000A.makeWFMXFile(wfm_data,
-                                                  amplitudes[awgchan-1])
-                    wfmx_files.append(wfmx)
+                    wfmx_sources.append((data, amplitudes[awgchan-1]))
                     wfmx_filenames.append(f'wfm_{pos1}_{pos2}_{awgchan}')
 
         ##########
@@ -1027,30 +1280,25 @@ class AWG70000A(VisaInstrument):
 
         ##########
         # STEP 4:
-        # Build the .seqx file
+        # Build the .seqx file, making the .wfmx files on the way
 
         user_file = b''
         setup_file = AWG70000A._makeSetupFile(mainseqname)
 
-        buffer = io.BytesIO()
+        wfmx_files = _make_wfmx_files(
+            ((_stack_forged_data(data), amplitude)
+             for data, amplitude in wfmx_sources),
+            timestamp=_make_timestamp(), processes=_processes(processes))
 
-        zipfile = zf.ZipFile(buffer, mode='a')
-        for ssn, ssf in zip(subseqsml_filenames, subseqsml_files):
-            zipfile.writestr(f'Sequences/{ssn}.sml', ssf)
-        zipfile.writestr(f'Sequences/{mainseqname}.sml', mainseqsml)
+        entries: Iterable[Tuple[str, Union[str, bytes]]] = chain(
+            ((f'Sequences/{ssn}.sml', ssf)
+             for ssn, ssf in zip(subseqsml_filenames, subseqsml_files)),
+            [(f'Sequences/{mainseqname}.sml', mainseqsml)],
+            (('Waveforms/{}.wfmx'.format(name), wfile)
+             for (name, wfile) in zip(wfmx_filenames, wfmx_files)),
+            [('setup.xml', setup_file), ('userNotes.txt', user_file)])
 
-        for (name, wfile) in zip(wfmx_filenames, wfmx_files):
-            zipfile.writestr('Waveforms/{}.wfmx'.format(name), wfile)
-
-        zipfile.writestr('setup.xml', setup_file)
-        zipfile.writestr('userNotes.txt', user_file)
-        zipfile.close()
-
-        buffer.seek(0)
-        seqx = buffer.getvalue()
-        buffer.close()
-
-        return seqx
+        return AWG70000A._writeSEQXFile(entries, file)
 
     @staticmethod
     def makeSEQXFile(trig_waits: Sequence[int],
@@ -1060,7 +1308,10 @@ class AWG70000A(VisaInstrument):
                      go_to: Sequence[int],
                      wfms: Sequence[Sequence[np.ndarray]],
                      amplitudes: Sequence[float],
-                     seqname: str) -> bytes:
+                     seqname: str,
+                     waveform_cache: Optional[WaveformCache]=None,
+                     processes: Optional[int]=1,
+                     file: Optional[BinaryIO]=None) -> Optional[bytes]:
         """
         Make a full .seqx file (bundle)
         A .seqx file can presumably hold several sequences, but for now
@@ -1099,9 +1350,19 @@ class AWG70000A(VisaInstrument):
                 a list [ch1_amp, ch2_amp].
             seqname: The name of the sequence. This name will appear in the
                 sequence list. Note that all spaces are converted to '_'
+            waveform_cache: If given, the .wfmx files of waveforms encoded
+                recently with the same content and amplitude are taken from
+                this cache instead of being encoded again.
+            processes: The number of processes to make the .wfmx files in.
+                None for one per CPU. The file is the same for any number
+                of processes.
+            file: If given, the .seqx file is written to this (seekable)
+                file as it is made, instead of being returned. Then only a
+                few waveforms' .wfmx files are held in memory at any time.
 
         Returns:
-            The binary .seqx file, ready to be sent to the instrument.
+            The binary .seqx file, ready to be sent to the instrument, or
+            None if it was written to file.
         """
 
         # input sanitising to avoid spaces in filenames
@@ -1111,12 +1372,6 @@ class AWG70000A(VisaInstrument):
         wfm_names = [[f'wfmch{ch}pos{el}' for ch in range(1, chans+1)]
                      for el in range(1, elms+1)]
 
-        # generate wfmx files for the waveforms
-        flat_wfmxs = [] # type: List[bytes]
-        for amplitude, wfm_lst in zip(amplitudes, wfms):
-            flat_wfmxs += [AWG70000A.makeWFMXFile(wfm, amplitude)
-                           for wfm in wfm_lst]
-
         # This unfortunately assumes no subsequences
         flat_wfm_names = list(np.reshape(np.array(wfm_names).transpose(),
                                          (chans*elms,)))
@@ -1130,19 +1385,34 @@ class AWG70000A(VisaInstrument):
         user_file = b''
         setup_file = AWG70000A._makeSetupFile(seqname)
 
-        buffer = io.BytesIO()
+        # the wfmx files for the waveforms, made while the file is written
+        flat_wfmxs = _make_wfmx_files(
+            ((wfm, amplitude) for amplitude, wfm_lst in zip(amplitudes, wfms)
+             for wfm in wfm_lst),
+            timestamp=_make_timestamp(), processes=_processes(processes),
+            waveform_cache=waveform_cache)
 
-        zipfile = zf.ZipFile(buffer, mode='a')
-        zipfile.writestr('Sequences/{}.sml'.format(seqname), sml_file)
+        entries: Iterable[Tuple[str, Union[str, bytes]]] = chain(
+            [('Sequences/{}.sml'.format(seqname), sml_file)],
+            (('Waveforms/{}.wfmx'.format(name), wfile)
+             for (name, wfile) in zip(flat_wfm_names, flat_wfmxs)),
+            [('setup.xml', setup_file), ('userNotes.txt', user_file)])
 
-        for (name, wfile) in zip(flat_wfm_names, flat_wfmxs):
-            zipfile.writestr('Waveforms/{}.wfmx'.format(name), wfile)
+        return AWG70000A._writeSEQXFile(entries, file)
 
-        zipfile.writestr('setup.xml', setup_file)
-        zipfile.writestr('userNotes.txt', user_file)
-        zipfile.close()
+    @staticmethod
+    def _writeSEQXFile(entries: Iterable[Tuple[str, Union[str, bytes]]],
+                       file: Optional[BinaryIO]=None) -> Optional[bytes]:
+        """
+        Write the entries of a .seqx file to file, or return the .seqx file
+        if no file is given.
+        """
+        if file is not None:
+            _write_zip(file, entries)
+            return None
 
-        buffer.seek(0)
+        buffer = io.BytesIO()
+        _write_zip(buffer, entries)
         seqx = buffer.getvalue()
         buffer.close()
 
@@ -1239,18 +1509,7 @@ class AWG70000A(VisaInstrument):
 
         N = lstlens[0]
 
-        # form the timestamp string
-        timezone = time.timezone
-        tz_m, _ = divmod(timezone, 60)
-        tz_h, tz_m = divmod(tz_m, 60)
-        if np.sign(tz_h) == -1:
-            signstr = '-'
-            tz_h *= -1
-        else:
-            signstr = '+'
-        timestr = dt.datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]
-        timestr += signstr
-        timestr += '{:02.0f}:{:02.0f}'.format(tz_h, tz_m)
+        timestr = _make_timestamp()
 
         datafile = ET.Element('DataFile', attrib={'offset': '0'*offsetdigits,
                                                   'version': '0.1'})
@@ -258,7 +258,7 @@ AWG_FILE_FORMAT = {
     'DC_OUTPUT_LEVEL_4': 'd',  # V
     }
 
-# Note: this dictionary is dynamically updated by _parser1
+# Note: the WAVEFORM_DATA records are read as arrays by _parser1
 AWG_FILE_FORMAT_WAV = {
     'WAVEFORM_NAME': 's',
     'WAVEFORM_TYPE': 'h',
@@ -312,17 +312,12 @@ def _unpacker(binaryarray, dacbitdepth=14):
             scaled to have values from -1 to 1, marker 1, marker 2.
     """
 
-    wflength = len(binaryarray)
-    wf = np.zeros(wflength)
-    m1 = np.zeros(wflength)
-    m2 = np.zeros(wflength)
+    packed = np.asarray(binaryarray, dtype=np.uint16)
 
-    for ii, bitnum in enumerate(binaryarray):
-        bitstring = bin(bitnum)[2:].zfill(16)
-        m2[ii] = int(bitstring[0])
-        m1[ii] = int(bitstring[1])
-        wf[ii] = (int(bitstring[2:], base=2)-2**13)/2**13
-        # print(bitstring, int(bitstring[2:], base=2))
+    # the two highest bits are the markers, the rest is the waveform
+    m2 = (packed >> 15).astype(float)
+    m1 = ((packed >> 14) & 1).astype(float)
+    wf = ((packed & 0x3fff).astype(float) - 2**13) / 2**13
 
     return wf, m1, m2
 
@@ -398,56 +393,57 @@ def _parser1(awgfilepath):
     sequencelist = [[], []]
 
     with open(awgfilepath, 'rb') as fid:
+        content = fid.read()
 
-        while True:
-            chunk = fid.read(8)
-            if not chunk:
-                break
+    position = 0
+    while position < len(content):
 
-            (namelen, valuelen) = struct.unpack('<II', chunk)
+        (namelen, valuelen) = struct.unpack_from('<II', content, position)
+        position += 8
 
-            rawname = fid.read(namelen)
-            rawvalue = fid.read(valuelen)
+        rawname = content[position:position+namelen]
+        position += namelen
+        valuestart = position
+        position += valuelen
+        rawvalue = content[valuestart:position]
 
-            name = rawname[:-1].decode('ascii')  # remove NULL termination char
+        name = rawname[:-1].decode('ascii')  # remove NULL termination char
 
-            if name.startswith('WAVEFORM'):
+        if name.startswith('WAVEFORM'):
 
-                namestop = name[name.find('_')+1:].find('_')+name.find('_')
-                lookupname = name[:namestop+1]
-
-                if 'DATA' in name:
-                    fmtstr = '{}H'.format(wfmlen)
-                    AWG_FILE_FORMAT_WAV['WAVEFORM_DATA'] = fmtstr
+            namestop = name[name.find('_')+1:].find('_')+name.find('_')
+            lookupname = name[:namestop+1]
 
+            if 'DATA' in name:
+                # the packed waveform, read at once rather than value by value
+                value = np.frombuffer(content, dtype='<u2',
+                                      count=valuelen // 2, offset=valuestart)
+            else:
                 value = _unwrap(rawvalue, AWG_FILE_FORMAT_WAV[lookupname])
-                (number, barename) = _getendingnumber(name)
-                fieldname = barename + '{}'.format(number-20)
-                waveformlist[0].append(fieldname)
-                waveformlist[1].append(value)
-
-                if 'LENGTH' in name:
-                    wfmlen = value
+            (number, barename) = _getendingnumber(name)
+            fieldname = barename + '{}'.format(number-20)
+            waveformlist[0].append(fieldname)
+            waveformlist[1].append(value)
 
-                continue
+            continue
 
-            if name.startswith('SEQUENCE'):
+        if name.startswith('SEQUENCE'):
 
-                namestop = name[name.find('_')+1:].find('_')+name.find('_')
-                lookupname = name[:namestop+1]
-                value = _unwrap(rawvalue, AWG_FILE_FORMAT_SEQ[lookupname])
-                sequencelist[0].append(name)
-                sequencelist[1].append(value)
+            namestop = name[name.find('_')+1:].find('_')+name.find('_')
+            lookupname = name[:namestop+1]
+            value = _unwrap(rawvalue, AWG_FILE_FORMAT_SEQ[lookupname])
+            sequencelist[0].append(name)
+            sequencelist[1].append(value)
 
-                continue
+            continue
 
-            else:
-                value = _unwrap(rawvalue, AWG_FILE_FORMAT[name])
+        else:
+            value = _unwrap(rawvalue, AWG_FILE_FORMAT[name])
 
-            if name in AWG_TRANSLATER:
-                value = AWG_TRANSLATER[name][value]
+        if name in AWG_TRANSLATER:
+            value = AWG_TRANSLATER[name][value]
 
-            instdict.update({name: value})
+        instdict.update({name: value})
 
     return instdict, waveformlist, sequencelist
 
@@ -0,0 +1,131 @@
+"""
+A cache of the waveforms uploaded to an AWG, keyed by a hash of their
+content, so that re-uploading a sequence of which only a few elements changed
+only encodes and sends those elements.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+def content_hash(*arrays: Any, **settings: Any) -> str:
+    """
+    Hash the content of arrays (waveforms, markers) and any settings that
+    affect how they are encoded, e.g. the amplitude of the channel.
+
+    Args:
+        *arrays: the arrays to hash; anything numpy can convert into an array
+        **settings: further values to include in the hash, by their repr
+
+    Returns:
+        the hex digest of the hash
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update('{}{}'.format(array.dtype.str,
+                                    array.shape).encode('ascii'))
+        digest.update(array.view(np.uint8))
+    digest.update(repr(sorted(settings.items())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class WaveformCache:
+    """
+    Keeps track of which content is stored under which name on an AWG (in
+    its waveform list or sequence list), and of the encoded (packed) form of
+    recently uploaded content.
+
+    The cache is only a record of what has been uploaded through it; the
+    instrument is the authority. Before relying on the cache, a driver
+    should ``sync`` it with the names the instrument actually holds, and it
+    must ``forget`` (or ``clear``) names that are deleted or overwritten by
+    other means.
+
+    Args:
+        max_encoded_bytes: the maximum total size of the encoded content
+            kept around. The least recently used content is dropped first.
+            With 0, no encoded content is kept, only the names of what was
+            uploaded.
+    """
+    def __init__(self, max_encoded_bytes: int = 2**28) -> None:
+        self.max_encoded_bytes = max_encoded_bytes
+        self._uploaded: Dict[str, str] = {}
+        self._encoded: 'OrderedDict[str, Any]' = OrderedDict()
+        self._encoded_bytes = 0
+
+    @staticmethod
+    def _size(encoded: Any) -> int:
+        if isinstance(encoded, np.ndarray):
+            return encoded.nbytes
+        return len(encoded)
+
+    def encode(self, key: str, encoder: Callable[[], Any]) -> Any:
+        """
+        Get the encoded content with a given hash, encoding it only if it is
+        not in the cache yet.
+
+        Args:
+            key: the ``content_hash`` of the content
+            encoder: returns the encoded content, bytes or a numpy array
+
+        Returns:
+            the encoded content
+        """
+        if key in self._encoded:
+            self._encoded.move_to_end(key)
+            return self._encoded[key]
+        encoded = encoder()
+        if self.max_encoded_bytes <= 0:
+            return encoded
+        self._encoded[key] = encoded
+        self._encoded_bytes += self._size(encoded)
+        while (self._encoded_bytes > self.max_encoded_bytes
+               and len(self._encoded) > 1):
+            _, dropped = self._encoded.popitem(last=False)
+            self._encoded_bytes -= self._size(dropped)
+        return encoded
+
+    def __contains__(self, key: str) -> bool:
+        """Whether encoded content with the given hash is in the cache"""
+        return key in self._encoded
+
+    def is_uploaded(self, name: str, key: str) -> bool:
+        """Whether the content with the given hash is stored under name"""
+        return self._uploaded.get(name) == key
+
+    def mark_uploaded(self, name: str, key: str) -> None:
+        """Record that the content with the given hash is stored under name"""
+        self._uploaded[name] = key
+
+    def forget(self, name: str) -> None:
+        """Record that the content stored under name is unknown"""
+        self._uploaded.pop(name, None)
+
+    def clear(self) -> None:
+        """Forget the content of all names"""
+        self._uploaded.clear()
+
+    @property
+    def names(self) -> List[str]:
+        """The names whose content is known"""
+        return list(self._uploaded)
+
+    def sync(self, names: Optional[Iterable[str]]) -> List[str]:
+        """
+        Forget the names that the instrument does not hold (anymore), e.g.
+        because they were deleted from the front panel.
+
+        Args:
+            names: the names held by the instrument, e.g. its waveform list
+
+        Returns:
+            the names that were forgotten
+        """
+        held = set(names or ())
+        stale = [name for name in self._uploaded if name not in held]
+        for name in stale:
+            del self._uploaded[name]
+        return stale
@@ -1,7 +1,9 @@
 from .logger import (get_console_handler, get_file_handler, get_level_name,
                      get_level_code, start_logger,
                      start_command_history_logger, start_all_logging,
-                     handler_level, console_level, LogCapture)
+                     handler_level, console_level, LogCapture,
+                     get_record_handler, start_record_logger,
+                     stop_record_logger)
 from .instrument_logger import filter_instrument
 from .log_analysis import capture_dataframe
 
@@ -1,21 +1,25 @@
-import pandas
-from pandas.core.series import Series
 from contextlib import contextmanager
 import logging
 import io
 
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
 from .logger import (LOGGING_SEPARATOR,
                      FORMAT_STRING_DICT,
                      get_formatter,
                      LevelType,
-                     get_log_file_name)
+                     get_log_file_name,
+                     get_record_file_name)
+
+if TYPE_CHECKING:
+    # pandas is slow to import, it is only imported when it is used
+    import pandas
+    from pandas.core.series import Series
 
 
 def log_to_dataframe(log: List[str],
                      columns: Optional[List[str]]=None,
-                     separator: Optional[str]=None) -> pandas.DataFrame:
+                     separator: Optional[str]=None) -> 'pandas.DataFrame':
     """
     Return the provided or default log string as a pandas DataFrame.
 
@@ -36,6 +40,8 @@ def log_to_dataframe(log: List[str],
     Retruns:
         Pandas DataFrame containing the log content.
     """
+    import pandas
+
     separator = separator or LOGGING_SEPARATOR
     columns = columns or list(FORMAT_STRING_DICT.keys())
     # note: if we used commas as separators, pandas read_csv
@@ -50,7 +56,7 @@ def log_to_dataframe(log: List[str],
 
 def logfile_to_dataframe(logfile: Optional[str]=None,
                          columns: Optional[List[str]]=None,
-                         separator: Optional[str]=None) -> pandas.DataFrame:
+                         separator: Optional[str]=None) -> 'pandas.DataFrame':
     """
     Return the provided or default logfile as a pandas DataFrame.
 
@@ -78,9 +84,36 @@ def logfile_to_dataframe(logfile: Optional[str]=None,
     return log_to_dataframe(raw_cont, columns, separator)
 
 
-def time_difference(firsttimes: Series,
-                    secondtimes: Series,
-                    use_first_series_labels: bool=True) -> Series:
+def recordfile_to_dataframe(recordfile: Optional[str]=None
+                            ) -> 'pandas.DataFrame':
+    """
+    Return the provided or default record file, as written by
+    `start_record_logger`, as a pandas DataFrame.
+
+    The DataFrame has the same columns, of strings, as the one
+    `logfile_to_dataframe` returns for the text log, but is read several
+    times faster. Unlike in the text log, the messages include their
+    tracebacks.
+
+    Args:
+        recordfile: name of the record file; defaults to the current default
+            record file.
+
+    Returns:
+        Pandas DataFrame containing the record file content.
+    """
+    import pandas
+    from .records import read_records
+
+    recordfile = recordfile or get_record_file_name()
+    with open(recordfile, 'rb') as f:
+        columns = read_records(f.read())
+    return pandas.DataFrame(columns, columns=list(columns))
+
+
+def time_difference(firsttimes: 'Series',
+                    secondtimes: 'Series',
+                    use_first_series_labels: bool=True) -> 'Series':
     """
     Calculate the time differences between two series
     containing time stamp strings as their values.
@@ -96,6 +129,8 @@ def time_difference(firsttimes: Series,
         A Series with float values of the time difference (s)
     """
 
+    import pandas
+
     if ',' in firsttimes.iloc[0]:
         nfirsttimes = firsttimes.str.replace(',', '.')
     else:
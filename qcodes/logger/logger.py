@@ -1,9 +1,11 @@
+import atexit
 import io
 import logging
 # logging.handlers is not imported by logging. This extra import is neccessary
 import logging.handlers
 
 import os
+import queue
 from pathlib import Path
 from collections import OrderedDict
 from contextlib import contextmanager
@@ -21,6 +23,7 @@ LOGGING_DIR = "logs"
 LOGGING_SEPARATOR = ' ¦ '
 HISTORY_LOG_NAME = "command_history.log"
 PYTHON_LOG_NAME = 'qcodes.log'
+RECORD_LOG_NAME = 'qcodes.qclog'
 QCODES_USER_PATH_ENV = 'QCODES_USER_PATH'
 
 FORMAT_STRING_DICT = OrderedDict([
@@ -37,6 +40,10 @@ FORMAT_STRING_DICT = OrderedDict([
 # console hander.
 console_handler: Optional[logging.Handler] = None
 file_handler: Optional[logging.Handler] = None
+# The handler of the root logger that feeds the record file, and the listener
+# that writes to it, see `start_record_logger`
+record_handler: Optional[logging.Handler] = None
+record_listener: Optional['_RecordQueueListener'] = None
 
 
 def get_formatter() -> logging.Formatter:
@@ -68,6 +75,16 @@ def get_file_handler() -> Optional[logging.Handler]:
     return file_handler
 
 
+def get_record_handler() -> Optional[logging.Handler]:
+    """
+    Get the handler that queues messages from the root logger for the record
+    file. To setup call `start_record_logger`.
+    Returns `None` if `start_record_logger` had not been called
+    """
+    global record_handler
+    return record_handler
+
+
 def get_level_name(level: Union[str, int]) -> str:
     if isinstance(level, str):
         return level
@@ -117,6 +134,12 @@ def get_log_file_name() -> str:
                         PYTHON_LOG_NAME)
 
 
+def get_record_file_name() -> str:
+    return os.path.join(_get_qcodes_user_path(),
+                        LOGGING_DIR,
+                        RECORD_LOG_NAME)
+
+
 def start_logger() -> None:
     """
     Logging of messages passed through the python logging module
@@ -169,6 +192,110 @@ def start_logger() -> None:
     log.info("QCoDes logger setup completed")
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that does no more than necessary in the logging thread:
+    merge the message with its arguments and format the traceback, if any.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # a shallow copy is enough, and much faster than copy.copy
+        prepared = logging.LogRecord.__new__(logging.LogRecord)
+        prepared.__dict__.update(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                # cached on the record like logging.Formatter does
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+            prepared.exc_text = record.exc_text
+            prepared.exc_info = None
+        return prepared
+
+
+class _RecordQueueListener(logging.handlers.QueueListener):
+    """
+    Listener that writes its records in batches: its handlers are flushed
+    whenever the queue has been emptied.
+    """
+    def __init__(self, record_queue: queue.Queue,
+                 *handlers: logging.Handler) -> None:
+        super().__init__(record_queue, *handlers)
+        self.record_queue = record_queue
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.record_queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def start_record_logger(level: Optional[LevelType] = None,
+                        filename: Optional[str] = None) -> None:
+    """
+    Logging of messages passed through the python logging module to a
+    record file, a compact binary log that `recordfile_to_dataframe` reads
+    much faster than `logfile_to_dataframe` reads the text log. This can be
+    used next to, or instead of, `start_logger`.
+
+    The messages are only queued by the threads that log them. A background
+    thread formats the time stamps and writes the records to the file, in
+    batches. The messages themselves are still merged with their arguments
+    by the logging thread, so that later changes to the arguments can not
+    change the message.
+
+    Call `stop_record_logger` to stop, it is called at exit.
+
+    Args:
+        level: the level of the messages to write to the record file,
+            defaults to `logger.file_level` of the config
+        filename: the file to write to, defaults to
+            '~/.qcodes/logs/qcodes.qclog'
+    """
+    global record_handler
+    global record_listener
+    from .records import RecordFileHandler
+
+    stop_record_logger()
+
+    filename = filename or get_record_file_name()
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+
+    record_queue: queue.Queue = queue.Queue()
+    record_handler = _RecordQueueHandler(record_queue)
+    record_handler.setFormatter(get_formatter())
+    record_handler.setLevel(level or qc.config.logger.file_level)
+    record_listener = _RecordQueueListener(record_queue,
+                                           RecordFileHandler(filename))
+    record_listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(record_handler)
+    log.info("QCoDes record logger setup completed")
+
+
+def stop_record_logger() -> None:
+    """
+    Stop logging to the record file, after writing the messages still in
+    the queue.
+    """
+    global record_handler
+    global record_listener
+    if record_handler is not None:
+        logging.getLogger().removeHandler(record_handler)
+        record_handler.close()
+        record_handler = None
+    if record_listener is not None:
+        record_listener.stop()
+        for handler in record_listener.handlers:
+            handler.close()
+        record_listener = None
+
+
+atexit.register(stop_record_logger)
+
+
 def start_command_history_logger(log_dir: Optional[str]=None) -> None:
     """
     logging of the history of the interactive command shell
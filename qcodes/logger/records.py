@@ -0,0 +1,241 @@
+"""
+A compact binary file format for log records, written without formatting
+every record into a line of text and read back column by column.
+
+A record file starts with the ``MAGIC`` bytes, which are written again
+whenever a ``RecordFileHandler`` opens the file, followed by blocks, one per
+batch of records. Every ``RecordFileHandler`` writes a session of blocks,
+identified by a random session id. Several processes can append to the same
+file at the same time, so the blocks of their sessions may be interleaved.
+The columns of the records, the ones of ``FORMAT_STRING_DICT``, are stored
+in two ways:
+
+* the columns that are the same for every record logged from the same
+  place in the code (``name``, ``levelname``, ``module``, ``funcName`` and
+  ``lineno``) as a ``uint32`` code into a table of these places, the sites,
+  kept per session. Every block carries the sites that were added to the
+  table of its session since the previous block of that session.
+* the columns that are (almost) unique for every record (``asctime`` and
+  ``message``) as the strings themselves.
+
+So a block is, in order:
+
+* the ``BLOCK`` tag and a header of the 16 bytes of the session id and 4
+  ``uint32``: the number of records, the number of new sites, and the number
+  of bytes of the strings of the new sites and of the text of the records
+* the lengths (in characters) of the strings of the new sites, an array of
+  shape ``(n_sites, len(SITE_COLUMNS))``, and the strings concatenated, each
+  terminated by a NUL character, encoded as UTF-8
+* the codes of the sites of the records, an array of shape ``(n_records,)``
+* the lengths of the text of the records, an array of shape ``(n_records,
+  len(TEXT_COLUMNS))``, and the text concatenated like the strings of the
+  sites
+
+Since everything but the text is a fixed size array, and the text is split
+on the NUL's (falling back to the lengths for text containing NUL's),
+``read_records`` reads a block with a few calls that each handle all its
+records at once.
+"""
+import logging
+import struct
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b'QCLOG\x02'
+BLOCK = b'BLCK'
+_BLOCK_HEADER = struct.Struct('<16s4I')
+
+SITE_COLUMNS = ('name', 'levelname', 'module', 'funcName', 'lineno')
+TEXT_COLUMNS = ('asctime', 'message')
+COLUMNS = ('asctime', 'name', 'levelname', 'module', 'funcName', 'lineno',
+           'message')
+
+
+def _join(strings: List[str]) -> bytes:
+    """Concatenate strings, each terminated by a NUL, encoded as UTF-8"""
+    return ''.join(string + '\0' for string in strings).encode('utf-8')
+
+
+def _split(data: bytes, lengths: np.ndarray) -> List[str]:
+    """
+    Split the concatenation of strings back into the strings, of the given
+    lengths (not counting their terminating NUL's)
+    """
+    text = data.decode('utf-8')
+    strings = text.split('\0')
+    if len(strings) == len(lengths) + 1:
+        return strings[:-1]
+    # some of the strings contain NUL's themselves
+    ends = np.cumsum(lengths + 1).tolist()
+    starts = [0] + ends[:-1]
+    return [text[start:end - 1] for start, end in zip(starts, ends)]
+
+
+class RecordFileHandler(logging.Handler):
+    """
+    A handler that writes log records to a record file, see the module
+    docstring for the format.
+
+    The records are written in blocks. A block is written on ``flush``, and
+    whenever ``batch_size`` records have been buffered. The time stamps are
+    formatted like ``get_formatter`` does, and the message includes the
+    traceback of the record, if any.
+
+    This handler is meant to run behind a ``QueueListener`` (see
+    ``start_record_logger``), which flushes it whenever it has emptied its
+    queue, so that the threads emitting the records never do any file I/O.
+
+    Every block is written with a single unbuffered write to the file
+    opened for appending, so that blocks written by other processes to the
+    same file end up between blocks, not inside them.
+
+    Args:
+        filename: the file to append the records to
+        batch_size: the maximum number of records to buffer
+    """
+    def __init__(self, filename: str, batch_size: int = 4096) -> None:
+        super().__init__()
+        self.filename = filename
+        self.batch_size = batch_size
+        self._file = open(filename, 'ab', buffering=0)
+        self._file.write(MAGIC)
+        self._session = uuid.uuid4().bytes
+        self._sites: Dict[Tuple, int] = {}
+        self._new_sites: List[str] = []
+        self._codes: List[int] = []
+        self._texts: List[str] = []
+        # only used to format the time stamps and tracebacks
+        self._formatter = logging.Formatter()
+        self._converter: Callable[[Optional[float]], time.struct_time] = \
+            logging.Formatter.converter
+        # the time stamp without milliseconds is the same for all records
+        # logged within the same second
+        self._second: Optional[int] = None
+        self._second_text = ''
+
+    def _format_time(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._second:
+            self._second = second
+            self._second_text = time.strftime(
+                self._formatter.default_time_format,
+                self._converter(record.created))
+        return self._formatter.default_msec_format % (self._second_text,
+                                                      record.msecs)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = record.getMessage()
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self._formatter.formatException(
+                    record.exc_info)
+            if record.exc_text:
+                message = message + '\n' + record.exc_text
+            if record.stack_info:
+                message = message + '\n' + record.stack_info
+
+            site = (record.name, record.levelname, record.module,
+                    record.funcName, record.lineno)
+            code = self._sites.get(site)
+            if code is None:
+                code = self._sites[site] = len(self._sites)
+                self._new_sites += map(str, site)
+            self._codes.append(code)
+            self._texts += (self._format_time(record), message)
+            if len(self._codes) >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self._codes or self._file.closed:
+                return
+            sites = _join(self._new_sites)
+            text = _join(self._texts)
+            self._file.write(b''.join((
+                BLOCK,
+                _BLOCK_HEADER.pack(self._session, len(self._codes),
+                                   len(self._new_sites) // len(SITE_COLUMNS),
+                                   len(sites), len(text)),
+                np.array([len(s) for s in self._new_sites],
+                         dtype='<u4').tobytes(),
+                sites,
+                np.array(self._codes, dtype='<u4').tobytes(),
+                np.array([len(t) for t in self._texts],
+                         dtype='<u4').tobytes(),
+                text)))
+            self._new_sites = []
+            self._codes = []
+            self._texts = []
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.flush()
+            self._file.close()
+        finally:
+            self.release()
+        super().close()
+
+
+def read_records(data: bytes) -> Dict[str, np.ndarray]:
+    """
+    Read the records of a record file.
+
+    Args:
+        data: the content of a record file
+
+    Returns:
+        a dict of the name of every column of ``COLUMNS`` to an object array
+        of the strings of that column, one per record
+    """
+    if data and not data.startswith(MAGIC):
+        raise ValueError('Not a qcodes log record file')
+    blocks: Dict[str, List[np.ndarray]] = {name: [] for name in COLUMNS}
+    # the sites of every session
+    session_sites: Dict[bytes, List[str]] = {}
+    position = 0
+    while position < len(data):
+        if data.startswith(MAGIC, position):
+            position += len(MAGIC)
+            continue
+        if not data.startswith(BLOCK, position):
+            raise ValueError(f'Corrupt log record file at byte {position}')
+        position += len(BLOCK)
+        session, n_records, n_sites, sites_size, text_size = \
+            _BLOCK_HEADER.unpack_from(data, position)
+        position += _BLOCK_HEADER.size
+        sites = session_sites.setdefault(session, [])
+
+        lengths = np.frombuffer(data, '<u4', n_sites * len(SITE_COLUMNS),
+                                position)
+        position += lengths.nbytes
+        sites += _split(data[position:position + sites_size], lengths)
+        position += sites_size
+
+        codes = np.frombuffer(data, '<u4', n_records, position)
+        position += codes.nbytes
+        site_columns = np.array(sites, dtype=object).reshape(
+            -1, len(SITE_COLUMNS))[codes]
+        for index, name in enumerate(SITE_COLUMNS):
+            blocks[name].append(site_columns[:, index])
+
+        lengths = np.frombuffer(data, '<u4', n_records * len(TEXT_COLUMNS),
+                                position)
+        position += lengths.nbytes
+        texts = np.array(_split(data[position:position + text_size],
+                                lengths), dtype=object).reshape(n_records, -1)
+        position += text_size
+        for index, name in enumerate(TEXT_COLUMNS):
+            blocks[name].append(texts[:, index])
+
+    return {name: (np.concatenate(arrays) if arrays
+                   else np.array([], dtype=object))
+            for name, arrays in blocks.items()}
@@ -44,6 +44,25 @@ Supported commands to .set_measurement or .each are:
     - ActiveLoop (or Loop, will be activated with default measurement)
     - Task: any callable that does not generate data
     - Wait: a delay
+
+Buffered (hardware-timed) sweeps:
+
+Instruments that can execute a whole sweep from a list of setpoints can be
+used without setting and reading every point from Python. A (nested) loop is
+run as a single buffered sweep if its sweep parameter implements
+
+    - ``buffered_upload(setpoints, delay)``: load the list of setpoints and
+      the time to spend on each point into the instrument
+    - ``buffered_trigger()``: start the sweep and return when it is done
+
+and all its actions are parameters implementing
+
+    - ``buffered_arm(n_points)``: prepare to acquire ``n_points`` values
+    - ``buffered_fetch()``: return the acquired values as an array of length
+      ``n_points`` (or a sequence of such arrays for parameters with
+      ``names``)
+
+Otherwise the loop falls back to setting and measuring point by point.
 """
 
 from datetime import datetime
@@ -54,8 +73,10 @@ import numpy as np
 from qcodes.station import Station
 from qcodes.data.data_set import new_data
 from qcodes.data.data_array import DataArray
+from qcodes.instrument.sweep_values import SweepFixedValues
 from qcodes.utils.helpers import wait_secs, full_class, tprint
 from qcodes.utils.metadata import Metadatable
+from qcodes.utils.threading import SerializingThreadPool
 
 from .actions import (_actions_snapshot, Task, Wait, _Measure, _Nest,
                       BreakIf, _QcodesBreak)
@@ -604,18 +625,24 @@ class ActiveLoop(Metadatable):
 
         return sp
 
-    def set_common_attrs(self, data_set, use_threads):
+    def set_common_attrs(self, data_set, use_threads, buffered=True,
+                         thread_pool=None):
         """
         set a couple of common attributes that the main and nested loops
         all need to have:
         - the DataSet collecting all our measurements
         - a queue for communicating with the main process
+        - whether buffered (hardware-timed) sweeps may be used
+        - the pool of worker threads used to measure if use_threads is set
         """
         self.data_set = data_set
         self.use_threads = use_threads
+        self.buffered = buffered
+        self.thread_pool = thread_pool
         for action in self.actions:
             if hasattr(action, 'set_common_attrs'):
-                action.set_common_attrs(data_set, use_threads)
+                action.set_common_attrs(data_set, use_threads, buffered,
+                                        thread_pool)
 
     def get_data_set(self, *args, **kwargs):
         """
@@ -673,20 +700,30 @@ class ActiveLoop(Metadatable):
         return self.run(quiet=True, location=False, **kwargs)
 
     def run(self, use_threads=False, quiet=False, station=None,
-            progress_interval=False, set_active=True, *args, **kwargs):
+            progress_interval=False, set_active=True, *args,
+            buffered=True, **kwargs):
         """
         Execute this loop.
 
         Args:
             use_threads: (default False): whenever there are multiple `get` calls
-                back-to-back, execute them in separate threads so they run in
-                parallel (as long as they don't block each other)
+                back-to-back, execute them in a pool of worker threads so they
+                run in parallel (as long as they don't block each other).
+                Parameters of the same instrument are read one after the
+                other by the same worker. The pool lives as long as the loop
+                runs.
             quiet: (default False): set True to not print anything except errors
             station: a Station instance for snapshots (omit to use a previously
                 provided Station, or the default Station)
             progress_interval (int, float): show progress of the loop every x
                 seconds. If provided here, will override any interval provided
                 with the Loop definition. Defaults to None
+            set_active (bool): (default True) make this the active loop
+                while it is running
+            buffered (bool): (default True, keyword only) run (nested)
+                loops whose sweep parameter and measured parameters all
+                support buffered acquisition as a single hardware-timed
+                sweep. Set False to force point-by-point execution.
 
         kwargs are passed along to data_set.new_data. These can only be
         provided when the `DataSet` is first created; giving these during `run`
@@ -716,7 +753,9 @@ class ActiveLoop(Metadatable):
 
         data_set = self.get_data_set(*args, **kwargs)
 
-        self.set_common_attrs(data_set=data_set, use_threads=use_threads)
+        thread_pool = SerializingThreadPool() if use_threads else None
+        self.set_common_attrs(data_set=data_set, use_threads=use_threads,
+                              buffered=buffered, thread_pool=thread_pool)
 
         station = station or self.station or Station.default
         if station:
@@ -753,6 +792,8 @@ class ActiveLoop(Metadatable):
             self.data_set = None
             if set_active:
                 ActiveLoop.active_loop = None
+            if thread_pool is not None:
+                thread_pool.close()
 
         return ds
 
@@ -766,14 +807,14 @@ class ActiveLoop(Metadatable):
                 continue
             elif measurement_group:
                 callables.append(_Measure(measurement_group, self.data_set,
-                                          self.use_threads))
+                                          self.use_threads, self.thread_pool))
                 measurement_group[:] = []
 
             callables.append(self._compile_one(action, new_action_indices))
 
         if measurement_group:
             callables.append(_Measure(measurement_group, self.data_set,
-                                      self.use_threads))
+                                      self.use_threads, self.thread_pool))
             measurement_group[:] = []
 
         return callables
@@ -817,6 +858,34 @@ class ActiveLoop(Metadatable):
         # the loop parameter may be increased if an outer loop requested longer
         delay = max(self.delay, first_delay)
 
+        if self.buffered and self._buffered_sweep_supported():
+            self._run_buffered_sweep(delay, action_indices, loop_indices)
+        else:
+            self._run_sweep_points(delay, action_indices, loop_indices,
+                                   current_values)
+
+        # run the background task one last time to catch the last setpoint(s)
+        if self.bg_task is not None:
+            log.debug('Running the background task one last time.')
+            self.bg_task()
+
+        # the loop is finished - run the .then actions
+        #log.debug('Finishing loop, running the .then actions...')
+        for f in self._compile_actions(self.then_actions, ()):
+            #log.debug('...running .then action {}'.format(f))
+            f()
+
+        # run the bg_final_task from the bg_task:
+        if self.bg_final_task is not None:
+            log.debug('Running the bg_final_task')
+            self.bg_final_task()
+
+    def _run_sweep_points(self, delay, action_indices, loop_indices,
+                          current_values):
+        """
+        Software-timed execution of the loop: set each setpoint in turn,
+        wait and then execute all actions at that point.
+        """
         callables = self._compile_actions(self.actions, action_indices)
         n_callables = 0
         for item in callables:
@@ -907,21 +976,80 @@ class ActiveLoop(Metadatable):
 
                     last_task = t
 
-        # run the background task one last time to catch the last setpoint(s)
-        if self.bg_task is not None:
-            log.debug('Running the background task one last time.')
-            self.bg_task()
+    def _buffered_sweep_supported(self):
+        """
+        Check whether this loop can be executed as one hardware-timed sweep.
+
+        This is the case if the sweep values are fixed up front
+        (``SweepFixedValues``), the sweep parameter implements
+        ``buffered_upload`` and ``buffered_trigger``, and every action is a
+        parameter implementing ``buffered_arm`` and ``buffered_fetch``. Loops
+        with nested loops, tasks, waits, BreakIf, combined sweep parameters
+        or sweeps that choose the next value from the last measurement (like
+        ``AdaptiveSweep``) always run point by point.
+        """
+        if not self.actions or hasattr(self.sweep_values, 'parameters'):
+            return False
+        if not isinstance(self.sweep_values, SweepFixedValues):
+            return False
+        sweep_parameter = getattr(self.sweep_values, 'parameter', None)
+        if not (hasattr(sweep_parameter, 'buffered_upload') and
+                hasattr(sweep_parameter, 'buffered_trigger')):
+            return False
+        for action in self.actions:
+            if not (hasattr(action, 'get') and
+                    hasattr(action, 'buffered_arm') and
+                    hasattr(action, 'buffered_fetch')):
+                return False
+        return True
 
-        # the loop is finished - run the .then actions
-        #log.debug('Finishing loop, running the .then actions...')
-        for f in self._compile_actions(self.then_actions, ()):
-            #log.debug('...running .then action {}'.format(f))
-            f()
+    def _run_buffered_sweep(self, delay, action_indices, loop_indices):
+        """
+        Hardware-timed execution of the loop: upload all setpoints to the
+        sweep parameter, arm the measured parameters, trigger the sweep once
+        and store the fetched arrays in the DataSet in one go.
+        """
+        setpoints = list(self.sweep_values)
+        n_points = len(setpoints)
+        sweep_parameter = self.sweep_values.parameter
 
-        # run the bg_final_task from the bg_task:
-        if self.bg_final_task is not None:
-            log.debug('Running the bg_final_task')
-            self.bg_final_task()
+        log.debug('Running buffered sweep of {} with {} points'.format(
+            self.sweep_values.name, n_points))
+
+        sweep_parameter.buffered_upload(setpoints, self.delay)
+        for action in self.actions:
+            action.buffered_arm(n_points)
+
+        # the delay carried over from an outer loop (or this loop's own delay)
+        # is applied once, before the sweep starts
+        self._wait(delay)
+        sweep_parameter.buffered_trigger()
+
+        data_to_store = {
+            self.data_set.action_id_map[action_indices]: setpoints}
+        for i, action in enumerate(self.actions):
+            param_indices = action_indices + (i,)
+            fetched = action.buffered_fetch()
+            if hasattr(action, 'names'):
+                for j, values in enumerate(fetched):
+                    part_id = self.data_set.action_id_map[param_indices + (j,)]
+                    data_to_store[part_id] = self._check_buffered_length(
+                        action.names[j], values, n_points)
+            else:
+                param_id = self.data_set.action_id_map[param_indices]
+                data_to_store[param_id] = self._check_buffered_length(
+                    action.name, fetched, n_points)
+
+        self.data_set.store(loop_indices + (slice(0, n_points),),
+                            data_to_store)
+
+    @staticmethod
+    def _check_buffered_length(name, values, n_points):
+        values = np.asarray(values)
+        if len(values) != n_points:
+            raise ValueError('Buffered fetch of {} returned {} points, '
+                             'expected {}'.format(name, len(values), n_points))
+        return values
 
     def _wait(self, delay):
         if delay:
@@ -17,6 +17,12 @@ Add parameters to monitor in your measurement by creating a new monitor with a l
 of parameters to monitor:
 
 ``monitor = qcodes.Monitor(param1, param2, param3, ...)``
+
+The parameters push their updates to the monitor when they are set or
+gotten. Once per interval, the changed parameters are formatted and the
+state is sent to all clients: the full state to clients of
+``ws://localhost:5678``, and only the changed parameters to clients of
+``ws://localhost:5678/delta``.
 """
 import sys
 import logging
@@ -24,12 +30,12 @@ import os
 import time
 import json
 from contextlib import suppress
-from typing import Dict, Any, Optional
-from collections import defaultdict
+from typing import Dict, Any, Awaitable, Optional, Sequence, Set, List
+from collections import defaultdict, OrderedDict
 
 import asyncio
 from asyncio import CancelledError
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 
 import http.server
 import socketserver
@@ -60,6 +66,31 @@ SERVER_PORT = 3000
 log = logging.getLogger(__name__)
 
 
+def _get_parameter_meta(parameter: Parameter) -> Dict[str, Any]:
+    """
+    Return the metadata of a single parameter, as sent to the monitor.
+    """
+    # Get the latest value from the parameter, getting it again if it is
+    # older than its max_val_age
+    meta: Dict[str, Any] = {}
+    meta["value"] = str(parameter.get_latest())
+    if parameter.get_latest.get_timestamp() is not None:
+        meta["ts"] = parameter.get_latest.get_timestamp().timestamp()
+    else:
+        meta["ts"] = None
+    meta["name"] = parameter.label or parameter.name
+    meta["unit"] = parameter.unit
+    return meta
+
+
+def _instrument_name(parameter: Parameter) -> str:
+    # find the base instrument that this parameter belongs to
+    baseinst = parameter.root_instrument
+    if baseinst is None:
+        return "Unbound Parameter"
+    return str(baseinst)
+
+
 def _get_metadata(*parameters) -> Dict[str, Any]:
     """
     Return a dict that contains the parameter metadata grouped by the
@@ -69,22 +100,8 @@ def _get_metadata(*parameters) -> Dict[str, Any]:
     # group metadata by instrument
     metas = defaultdict(list) # type: dict
     for parameter in parameters:
-        # Get the latest value from the parameter, respecting the max_val_age parameter
-        meta: Dict[str, Optional[str]] = {}
-        meta["value"] = str(parameter.get_latest())
-        if parameter.get_latest.get_timestamp() is not None:
-            meta["ts"] = parameter.get_latest.get_timestamp().timestamp()
-        else:
-            meta["ts"] = None
-        meta["name"] = parameter.label or parameter.name
-        meta["unit"] = parameter.unit
-
-        # find the base instrument that this parameter belongs to
-        baseinst = parameter.root_instrument
-        if baseinst is None:
-            metas["Unbound Parameter"].append(meta)
-        else:
-            metas[str(baseinst)].append(meta)
+        metas[_instrument_name(parameter)].append(
+            _get_parameter_meta(parameter))
 
     # Create list of parameters, grouped by instrument
     parameters_out = []
@@ -96,33 +113,136 @@ def _get_metadata(*parameters) -> Dict[str, Any]:
     return state
 
 
-def _handler(parameters, interval: int):
+class _StateProducer:
     """
-    Return the websockets server handler
+    Keeps the state of the monitored parameters, and sends it to all
+    connected websocket clients once per ``interval``.
+
+    Parameters push their updates (see ``parameter_updated``), so only the
+    parameters that changed since the last tick are formatted again, and
+    every message is serialized once for all clients. Clients connected to
+    ``/`` get the full state every tick, in the format of ``_get_metadata``.
+    Clients connected to ``/delta`` get the full state once, and after that
+    only the parameters that changed, in the same format, and only on ticks
+    where anything changed. Parameters with a ``max_val_age`` are gotten
+    again every tick where their value is older than that.
     """
-    async def server_func(websocket, _):
+    def __init__(self, parameters: Sequence[Parameter],
+                 interval: float) -> None:
+        self.interval = interval
+        self._parameters = list(parameters)
+        self._metas = [_get_parameter_meta(parameter)
+                       for parameter in self._parameters]
+        self._instruments = [_instrument_name(parameter)
+                             for parameter in self._parameters]
+        # the parameters that only push their updates when gotten again
+        self._aging = [parameter for parameter in
+                       OrderedDict.fromkeys(self._parameters)
+                       if parameter.get_latest.max_val_age is not None]
+        # the positions of each parameter, by id
+        self._indices: Dict[int, List[int]] = defaultdict(list)
+        groups: Dict[str, List[Dict[str, Any]]] = OrderedDict()
+        for index, parameter in enumerate(self._parameters):
+            self._indices[id(parameter)].append(index)
+            groups.setdefault(self._instruments[index],
+                              []).append(self._metas[index])
+        # the full state, sharing the meta dicts that get updated
+        self._groups = [{"instrument": instrument, "parameters": metas}
+                        for instrument, metas in groups.items()]
+        self._groups_json = json.dumps(self._groups)
+
+        self._changed: Set[int] = set()
+        self._changed_lock = Lock()
+        self.clients: Set[Any] = set()
+        self.delta_clients: Set[Any] = set()
+
+    def parameter_updated(self, parameter: Parameter) -> None:
+        """
+        Mark a parameter as changed. Called by the parameter from whatever
+        thread sets or gets it.
+        """
+        with self._changed_lock:
+            self._changed.add(id(parameter))
+
+    def full_state(self) -> str:
+        """The full state as JSON, with the current timestamp"""
+        return f'{{"ts": {json.dumps(time.time())}, ' \
+               f'"parameters": {self._groups_json}}}'
+
+    def refresh(self) -> None:
         """
-        Create a websockets handler that sends parameter values to a listener
-        every "interval" seconds
+        Get the values that are older than their max_val_age again, which
+        marks those parameters as changed. This talks to the instruments, so
+        ``run`` calls it in an executor.
         """
+        for parameter in self._aging:
+            parameter.get_latest()
+
+    def update(self) -> Optional[str]:
+        """
+        Format the parameters that changed since the last update.
+
+        Returns:
+            the changes as JSON, or None if nothing changed
+        """
+        with self._changed_lock:
+            changed, self._changed = self._changed, set()
+        if not changed:
+            return None
+        indices = sorted(index for parameter_id in changed
+                         for index in self._indices[parameter_id])
+        groups: Dict[str, List[Dict[str, Any]]] = OrderedDict()
+        for index in indices:
+            meta = self._metas[index]
+            meta.update(_get_parameter_meta(self._parameters[index]))
+            groups.setdefault(self._instruments[index], []).append(meta)
+        self._groups_json = json.dumps(self._groups)
+        return json.dumps({"ts": time.time(), "parameters": [
+            {"instrument": instrument, "parameters": metas}
+            for instrument, metas in groups.items()]})
+
+    async def handler(self, websocket, path: str) -> None:
+        """
+        The websockets server handler, registering the websocket as a client
+        until it is closed
+        """
+        delta = path.rstrip('/').endswith('delta')
+        try:
+            await websocket.send(self.full_state())
+            (self.delta_clients if delta else self.clients).add(websocket)
+            await websocket.wait_closed()
+        except (CancelledError, websockets.exceptions.ConnectionClosed):
+            log.debug("Got CancelledError or ConnectionClosed",
+                      exc_info=True)
+        finally:
+            self.clients.discard(websocket)
+            self.delta_clients.discard(websocket)
+        log.debug("Closing websockets connection")
+
+    async def run(self) -> None:
+        """Send the state to all clients every interval"""
         while True:
+            await asyncio.sleep(self.interval)
             try:
-                # Update the parameter values
-                try:
-                    meta = _get_metadata(*parameters)
-                except ValueError:
-                    log.exception("Error getting parameters")
-                    break
-                log.debug("sending.. to %r", websocket)
-                await websocket.send(json.dumps(meta))
-                # Wait for interval seconds and then send again
-                await asyncio.sleep(interval)
-            except (CancelledError, websockets.exceptions.ConnectionClosed):
-                log.debug("Got CancelledError or ConnectionClosed", exc_info=True)
-                break
-        log.debug("Closing websockets connection")
+                if self._aging:
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, self.refresh)
+                delta = self.update()
+            except ValueError:
+                log.exception("Error getting parameters")
+                continue
+            sends: List[Awaitable[Any]] = []
+            if self.clients:
+                full_state = self.full_state()
+                sends += [client.send(full_state)
+                          for client in self.clients]
+            if delta is not None:
+                sends += [client.send(delta)
+                          for client in self.delta_clients]
+            if sends:
+                log.debug("sending.. to %d clients", len(sends))
+                await asyncio.gather(*sends, return_exceptions=True)
 
-    return server_func
 
 class Monitor(Thread):
     """
@@ -150,7 +270,11 @@ class Monitor(Thread):
         self._parameters = parameters
         self.loop_is_closed = Event()
         self.server_is_started = Event()
-        self.handler = _handler(parameters, interval=interval)
+        self.producer = _StateProducer(parameters, interval=interval)
+        self._producer_task = None
+        self.handler = self.producer.handler
+        for parameter in parameters:
+            parameter._update_listeners.add(self.producer)
 
         log.debug("Start monitoring thread")
         if Monitor.running:
@@ -176,6 +300,7 @@ class Monitor(Thread):
             server_start = websockets.serve(self.handler, '127.0.0.1',
                                             WEBSOCKET_PORT, close_timeout=1)
             self.server = self.loop.run_until_complete(server_start)
+            self._producer_task = self.loop.create_task(self.producer.run())
             self.server_is_started.set()
             self.loop.run_forever()
         except OSError:
@@ -205,9 +330,15 @@ class Monitor(Thread):
         Setting active Monitor to None
         """
         self.join()
+        for parameter in self._parameters:
+            parameter._update_listeners.discard(self.producer)
         Monitor.running = None
 
     async def __stop_server(self):
+        log.debug("stopping the producer")
+        self._producer_task.cancel()
+        with suppress(CancelledError):
+            await self._producer_task
         log.debug("asking server %r to close", self.server)
         self.server.close()
         log.debug("waiting for server to close")
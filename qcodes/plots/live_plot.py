@@ -0,0 +1,367 @@
+"""
+Live plotting in a separate process, fed through shared memory.
+
+``QtPlot`` and ``MatPlot`` redraw from the measurement process, which
+competes with the measurement for the CPU and the GIL. A ``LivePlot``
+instead renders with a ``QtPlot`` in a process of its own. The measurement
+process only appends new points to a ``SharedRingBuffer`` per trace; the
+plot process polls those buffers and redraws at most once per ``interval``,
+however many points arrived in between. The pipe between the processes
+only carries small control messages, never data.
+
+With a ``Measurement``, the traces are given by the names of (or the)
+parameters of the measurement:
+
+>>> plot = LivePlot(window_title='sweep')
+>>> plot.add(x=dac.ch1, y=dmm.v1)
+>>> meas.add_live_plot(plot)
+>>> with meas.run() as datasaver:
+...     ...
+
+With a ``Loop``, the traces are given by ``DataArray``'s, with the setpoint
+axes implied as for ``QtPlot``:
+
+>>> data = loop.get_data_set()
+>>> plot = LivePlot()
+>>> plot.add(data.dmm_v1)
+>>> loop.run()
+"""
+import logging
+import multiprocessing
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    Union)
+
+import numpy as np
+
+from qcodes.data.data_array import DataArray
+from qcodes.plots.base import BasePlot
+from qcodes.utils.ring_buffer import SharedRingBuffer
+
+log = logging.getLogger(__name__)
+
+Column = Union[str, Any]
+
+
+def _column_name(column: Column) -> str:
+    if isinstance(column, DataArray):
+        return column.array_id
+    return str(column)
+
+
+def _rows(values: Sequence[Any]) -> np.ndarray:
+    """
+    Broadcast the values of the columns of a trace against each other, and
+    stack them into rows.
+    """
+    columns = np.broadcast_arrays(*(np.asarray(value, dtype=float)
+                                    for value in values))
+    return np.column_stack([column.ravel() for column in columns])
+
+
+class _Trace:
+    """A trace as seen by the measurement process"""
+    def __init__(self, columns: Sequence[Column], capacity: int) -> None:
+        self.columns = list(columns)
+        self.names = [_column_name(column) for column in columns]
+        self.buffer = SharedRingBuffer(len(columns), capacity)
+
+    def labels(self) -> Dict[str, str]:
+        labels = {}
+        for letter, column, name in zip('xyz', self.columns, self.names):
+            label, unit = BasePlot.get_label(column)
+            labels[letter + 'label'] = label or name
+            labels[letter + 'unit'] = unit
+        return labels
+
+
+class LivePlot:
+    """
+    A live plot rendered by a ``QtPlot`` in a separate process.
+
+    Args:
+        window_title: the title of the plot window
+        figsize: (width, height) of the window in pixels
+        interval: the period in seconds at which the plot process checks
+            for new data and redraws
+        theme: the (foreground, background) colors, see ``QtPlot``
+        capacity: the number of points per trace that can be buffered
+            before the plot process has read them. If the plot falls further
+            behind, the oldest points are dropped from the plot (but not from
+            the data).
+        start: whether to start the plot process right away. If False, call
+            ``start`` before adding any data.
+    """
+    def __init__(self, window_title: str = '',
+                 figsize: Tuple[int, int] = (1000, 600),
+                 interval: float = 0.1,
+                 theme: Tuple[Any, Any] = ((60, 60, 60), 'w'),
+                 capacity: int = 2**16,
+                 start: bool = True) -> None:
+        self.interval = interval
+        self.capacity = capacity
+        self.traces: List[_Trace] = []
+        self._connection, self._server_connection = multiprocessing.Pipe()
+        self._plot_kwargs = {'window_title': window_title,
+                             'figsize': figsize, 'theme': theme}
+        self.process: Optional[multiprocessing.Process] = None
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        """Start the plot process"""
+        self.process = multiprocessing.Process(
+            target=_serve, name='LivePlot',
+            args=(self._server_connection, self.interval),
+            kwargs=self._plot_kwargs, daemon=True)
+        self.process.start()
+
+    def add(self, *args: DataArray, x: Optional[Column] = None,
+            y: Optional[Column] = None, z: Optional[Column] = None,
+            subplot: int = 1, **kwargs: Any) -> int:
+        """
+        Add a trace: a line of y against x, or an image of z against x and
+        y.
+
+        Each of x, y and z is either the name of a parameter of a
+        ``Measurement``, the parameter itself, or a ``DataArray`` of a
+        legacy ``DataSet``. ``DataArray``'s can also be given as positional
+        arguments, and the x (and y) axis can be left out and is then taken
+        from their setpoints, like for ``QtPlot``.
+
+        Args:
+            *args: ``DataArray``'s of the trace, see ``BasePlot.add``
+            x: the data of the x axis
+            y: the data of the y axis
+            z: the data of the image, if any
+            subplot: the number of the subplot to draw the trace in
+            **kwargs: passed on to ``QtPlot.add``, e.g. a ``name``, a pen
+                ``color`` or a ``cmap``. The axis labels default to the
+                labels and units of the parameters or ``DataArray``'s.
+
+        Returns:
+            the index of the new trace, to use with ``push``
+        """
+        config = {letter: column for letter, column in zip('xyz', (x, y, z))
+                  if column is not None}
+        if not all(isinstance(arg, DataArray) for arg in args):
+            raise TypeError('Only DataArrays can be given as positional '
+                            'arguments of LivePlot.add')
+        if args or isinstance(config.get('z', config.get('y')), DataArray):
+            BasePlot.expand_trace(args, config)
+        letters = 'xyz' if 'z' in config else 'xy'
+        if any(config.get(letter) is None for letter in letters):
+            raise ValueError(f'LivePlot needs data for {", ".join(letters)} '
+                             f'unless the data is a DataArray')
+
+        trace = _Trace([config[letter] for letter in letters], self.capacity)
+        for column in trace.columns:
+            data_set = getattr(column, 'data_set', None)
+            if data_set is not None and self not in data_set.live_plots:
+                data_set.live_plots.append(self)
+
+        self.traces.append(trace)
+        self._send('add', trace.buffer.name,
+                   dict(trace.labels(), subplot=subplot, **kwargs))
+        return len(self.traces) - 1
+
+    def push(self, trace: int, *columns: Any) -> None:
+        """
+        Add points to a trace.
+
+        Args:
+            trace: the index of the trace, as returned by ``add``
+            *columns: the values of the x and y (and z) axes, numbers or
+                arrays that broadcast against each other
+        """
+        self.traces[trace].buffer.write(_rows(columns))
+
+    def add_results(self, results: Sequence[Dict[str, Any]]) -> None:
+        """
+        Add the points of the traces found in results, as added to a
+        ``DataSaver``.
+
+        Args:
+            results: dicts of parameter names to values, one per point
+        """
+        for trace in self.traces:
+            rows = [_rows([result[name] for name in trace.names])
+                    for result in results
+                    if all(name in result for name in trace.names)]
+            if rows:
+                trace.buffer.write(np.concatenate(rows))
+
+    def store(self, data_set, loop_indices: Tuple,
+              ids_values: Dict[str, Any]) -> None:
+        """
+        Add the points of the traces just stored in a legacy ``DataSet``,
+        see ``DataSet.store``.
+
+        A trace gets new points when its last array (y or z) is stored. The
+        values of its setpoint arrays at the same loop indices are read from
+        the ``DataSet``, where they have already been stored.
+        """
+        for trace in self.traces:
+            arrays = [column for column in trace.columns
+                      if isinstance(column, DataArray)]
+            if len(arrays) != len(trace.columns):
+                continue
+            main = arrays[-1]
+            if (main.data_set is not data_set
+                    or main.array_id not in ids_values):
+                continue
+            trace.buffer.write(_rows(
+                [array.ndarray[tuple(loop_indices)[:array.ndim]]
+                 for array in arrays]))
+
+    def clear(self) -> None:
+        """Remove all traces"""
+        self._send('clear')
+        self._close_buffers()
+
+    def close(self) -> None:
+        """Close the plot window and stop the plot process"""
+        if self.process is not None and self.process.is_alive():
+            self._send('close')
+            self.process.join(timeout=5)
+        self._close_buffers()
+        self._connection.close()
+
+    def _close_buffers(self) -> None:
+        for trace in self.traces:
+            trace.buffer.close()
+        self.traces = []
+
+    def _send(self, command: str, *args: Any) -> None:
+        self._connection.send((command,) + args)
+
+
+class _ServerTrace:
+    """A trace as seen by the plot process"""
+    def __init__(self, buffer_name: str, kwargs: Dict[str, Any]) -> None:
+        self.buffer = SharedRingBuffer.attach(buffer_name)
+        self.kwargs = kwargs
+        self.is_image = self.buffer.n_columns == 3
+        self._points = np.empty((0, self.buffer.n_columns))
+        self.n_points = 0
+        # the config of the trace in the QtPlot, once it is drawn
+        self.config: Optional[Dict[str, Any]] = None
+
+    def read(self) -> bool:
+        """Read new points from the buffer. Returns whether there were any"""
+        rows = self.buffer.read()
+        if len(rows) == 0:
+            return False
+        n = self.n_points + len(rows)
+        if n > len(self._points):
+            grown = np.empty((max(n, 2 * len(self._points)),
+                              self.buffer.n_columns))
+            grown[:self.n_points] = self._points[:self.n_points]
+            self._points = grown
+        self._points[self.n_points:n] = rows
+        self.n_points = n
+        return True
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points[:self.n_points]
+
+    def plot_data(self) -> Dict[str, np.ndarray]:
+        """The x, y (and z) data of the trace as QtPlot takes it"""
+        points = self.points
+        if not self.is_image:
+            return {'x': points[:, 0], 'y': points[:, 1]}
+        # only imported here, the measurement process never needs it
+        from qcodes.dataset.data_export import detect_grid
+        grid = detect_grid(points[:, 1], points[:, 0])
+        z = np.full(grid.shape, np.nan)
+        z[grid.indices] = points[:, 2]
+        return {'x': grid.axes[1], 'y': grid.axes[0], 'z': z}
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+class _LivePlotServer:
+    """
+    The plot process side of a ``LivePlot``: executes the commands of the
+    ``LivePlot`` and draws the points in its buffers.
+
+    Args:
+        connection: the plot process end of the pipe to the ``LivePlot``
+        plot_factory: creates the plot to draw in, a ``QtPlot``
+    """
+    def __init__(self, connection, plot_factory: Callable[[], Any]) -> None:
+        self.connection = connection
+        self.plot_factory = plot_factory
+        self.plot: Optional[Any] = None
+        self.traces: List[_ServerTrace] = []
+        self.closed = False
+
+    def poll(self) -> None:
+        """Execute pending commands, then draw any new points"""
+        while not self.closed and self.connection.poll():
+            try:
+                command, *args = self.connection.recv()
+            except EOFError:
+                # the measurement process is gone
+                command, args = 'close', []
+            getattr(self, '_' + command)(*args)
+        plot = self.plot
+        if self.closed or plot is None:
+            # there are no traces before the plot is created
+            return
+
+        redraw = False
+        for trace in self.traces:
+            if not trace.read():
+                continue
+            data = trace.plot_data()
+            if trace.config is None:
+                plot.add(**data, **trace.kwargs)
+                trace.config = plot.traces[-1]['config']
+            else:
+                trace.config.update(data)
+                redraw = True
+        if redraw:
+            plot.update_plot()
+
+    def _add(self, buffer_name: str, kwargs: Dict[str, Any]) -> None:
+        if self.plot is None:
+            self.plot = self.plot_factory()
+        self.traces.append(_ServerTrace(buffer_name, kwargs))
+
+    def _clear(self) -> None:
+        for trace in self.traces:
+            trace.close()
+        self.traces = []
+        if self.plot is not None:
+            self.plot.clear()
+
+    def _close(self) -> None:
+        for trace in self.traces:
+            trace.close()
+        self.traces = []
+        self.closed = True
+
+
+def _serve(connection, interval: float, **plot_kwargs: Any) -> None:
+    """The main function of the plot process"""
+    import pyqtgraph as pg
+    from qcodes.plots.pyqtgraph import QtPlot
+
+    app = pg.mkQApp()
+    server = _LivePlotServer(
+        connection, lambda: QtPlot(remote=False, **plot_kwargs))
+
+    def poll() -> None:
+        try:
+            server.poll()
+        except Exception:
+            log.exception('LivePlot failed to update')
+        if server.closed:
+            app.quit()
+
+    timer = pg.QtCore.QTimer()
+    timer.timeout.connect(poll)
+    timer.start(int(interval * 1000))
+    app.exec_()
@@ -5,7 +5,6 @@ using the nbagg backend and matplotlib
 from collections.abc import Mapping
 from collections.abc import Sequence
 from functools import partial
-from copy import deepcopy
 
 import matplotlib.pyplot as plt
 from matplotlib import ticker
@@ -42,6 +41,13 @@ class MatPlot(BasePlot):
             specifies the index of the matplotlib figure window to use. If None
             then open a new window
 
+        incremental: if True, updates of live plots only push what changed
+            since the previous update: heatmaps keep their pcolormesh and only
+            the rows of data that were modified are copied into it, and the
+            traces are redrawn with blitting as long as the axes limits and
+            color scales do not change. Default False, which redraws all
+            traces and the whole figure on every update.
+
         **kwargs: passed along to MatPlot.add() to add the first data trace
     """
 
@@ -50,9 +56,13 @@ class MatPlot(BasePlot):
     max_subplot_columns = 3
 
     def __init__(self, *args, figsize=None, interval=1, subplots=None, num=None,
-                 **kwargs):
+                 incremental=False, **kwargs):
         super().__init__(interval)
 
+        self.incremental = incremental
+        # per subplot the background without the traces, for blitting
+        self._backgrounds = None
+
         if subplots is None:
             # Subplots is equal to number of args, or 1 if no args provided
             subplots = max(len(args), 1)
@@ -126,6 +136,7 @@ class MatPlot(BasePlot):
         so that the window can be reused.
         """
         self.traces = []
+        self._backgrounds = None
         self.fig.clf()
         self._init_plot(subplots, figsize, num=self.fig.number)
 
@@ -172,6 +183,9 @@ class MatPlot(BasePlot):
             'config': kwargs,
             'plot_object': plot_object
         })
+        if 'z' in kwargs:
+            self.traces[-1]['plotted_index'] = \
+                self._last_modified_index(kwargs['z'])
 
         if prev_default_title == self.title.get_text():
             # in case the user has updated title, don't change it anymore
@@ -236,25 +250,20 @@ class MatPlot(BasePlot):
         # matplotlib doesn't know how to autoscale to a pcolormesh after the
         # first draw (relim ignores it...) so we have to do this ourselves
         bboxes = dict(zip(self.subplots, [[] for p in self.subplots]))
+        full_draw = False
 
         for trace in self.traces:
             config = trace['config']
             plot_object = trace['plot_object']
             if 'z' in config:
-                # pcolormesh doesn't seem to allow editing x and y data, only z
-                # so instead, we'll remove and re-add the data.
-                if plot_object:
-                    plot_object.remove()
-
-                ax = self[config.get('subplot', 1) - 1]
-                kwargs = deepcopy(config)
-                # figsize may be passed in as part of config.
-                # pcolormesh will raise an error if this is passed to it
-                # so strip it here.
-                if 'figsize' in kwargs:
-                    kwargs.pop('figsize')
-                plot_object = self._draw_pcolormesh(ax, **kwargs)
-                trace['plot_object'] = plot_object
+                if self.incremental:
+                    clim_changed = self._update_pcolormesh(trace)
+                    if clim_changed is not None:
+                        full_draw = full_draw or clim_changed
+                        continue
+                full_draw = True
+                self._redraw_pcolormesh(trace)
+                plot_object = trace['plot_object']
 
                 if plot_object:
                     bboxes[plot_object.axes].append(
@@ -280,7 +289,182 @@ class MatPlot(BasePlot):
                         ax.dataLim = bbox
                 ax.autoscale()
 
-        self.fig.canvas.draw()
+        if not self.incremental:
+            self.fig.canvas.draw()
+        elif full_draw or not self._blit_traces():
+            self._draw_and_cache_backgrounds()
+
+    def _redraw_pcolormesh(self, trace):
+        """
+        Remove the pcolormesh of a heatmap trace, if any, and draw it anew
+        """
+        # pcolormesh doesn't seem to allow editing x and y data, only z
+        # so instead, we'll remove and re-add the data.
+        if trace['plot_object']:
+            trace['plot_object'].remove()
+
+        config = trace['config']
+        ax = self[config.get('subplot', 1) - 1]
+        # figsize may be passed in as part of config.
+        # pcolormesh will raise an error if this is passed to it
+        # so strip it here. A shallow copy is enough for that, and avoids
+        # copying the data.
+        kwargs = dict(config)
+        kwargs.pop('figsize', None)
+        trace['plot_object'] = self._draw_pcolormesh(ax, **kwargs)
+        trace['plotted_index'] = self._last_modified_index(config['z'])
+
+    @staticmethod
+    def _last_modified_index(data):
+        """
+        The flat index of the last point of a DataArray that has data,
+        (see ``DataArray.get_changes``), or of the last point of any other
+        array
+        """
+        if not isinstance(data, DataArray):
+            return np.size(data) - 1
+        latest_index = data.last_saved_index
+        if latest_index is None:
+            latest_index = -1
+        if data.modified_range:
+            latest_index = max(latest_index, data.modified_range[1])
+        return latest_index
+
+    def _update_pcolormesh(self, trace):
+        """
+        Update the existing pcolormesh of a heatmap trace in place, copying
+        only the rows of z that changed since the last update.
+
+        Returns:
+            None if the pcolormesh has to be redrawn instead, because there
+            is none yet or its cell edges changed, otherwise whether the
+            color scale changed
+        """
+        pc = trace['plot_object']
+        config = trace['config']
+        if not pc or 'x' not in config or 'y' not in config:
+            return None
+
+        x = np.asarray(config['x'])
+        y = np.asarray(config['y'])
+        z = config['z']
+        z_data = np.asarray(getattr(z, 'ndarray', z))
+        if z_data.ndim != 2:
+            return None
+
+        # the edges only depend on the first row/column of x/y
+        rows_masked = [masked_invalid(x[0] if x.ndim > 1 else x),
+                       masked_invalid(y[:, 0] if y.ndim > 1 else y)]
+        if np.any([np.all(getmask(arr)) for arr in rows_masked]):
+            return None
+        edges = self._make_args_for_pcolormesh(rows_masked + [None],
+                                               x, y)[:-1]
+        if not all(len(new) == len(old) and np.allclose(new, old)
+                   for new, old in zip(edges, pc.qcodes_edges)):
+            return None
+
+        plotted_index = trace.get('plotted_index', -1)
+        last_index = self._last_modified_index(z)
+        if isinstance(z, DataArray):
+            start = plotted_index + 1
+            if z.modified_range:
+                start = min(start, z.modified_range[0])
+        else:
+            start = 0
+        if start > last_index:
+            return False
+        rewritten = start <= plotted_index
+
+        # copy the modified rows into the data of the pcolormesh
+        ncols = z_data.shape[1]
+        start = (start // ncols) * ncols
+        stop = min((last_index // ncols + 1) * ncols, z_data.size)
+        new_values = masked_invalid(z_data.reshape(-1)[start:stop])
+        buffer = getattr(pc, 'qcodes_buffer', None)
+        if buffer is None:
+            # first incremental update: keep a copy of the plotted data
+            plotted = pc.get_array()
+            buffer = pc.qcodes_buffer = np.ma.array(
+                plotted, copy=True,
+                mask=np.ma.getmaskarray(plotted)).reshape(-1)
+        buffer[start:stop] = new_values
+        pc.set_array(buffer.reshape(pc.get_array().shape))
+        trace['plotted_index'] = last_index
+
+        # Scale colors if z has elements
+        if rewritten and buffer.count():
+            clim = (buffer.min(), buffer.max())
+        elif new_values.count():
+            cmin, cmax = pc.get_clim()
+            clim = (min(cmin, new_values.min()), max(cmax, new_values.max()))
+        else:
+            return False
+        if clim == pc.get_clim():
+            return False
+        pc.axes.qcodes_colorbar.set_clim(*clim)
+        pc.axes.qcodes_colorbar.update_bruteforce(pc)
+        return True
+
+    def _trace_artists(self, ax=None):
+        """The artists of all traces that have been drawn, optionally only
+        those in one subplot"""
+        return [trace['plot_object'] for trace in self.traces
+                if trace['plot_object']
+                and (ax is None or trace['plot_object'].axes is ax)]
+
+    def _draw_and_cache_backgrounds(self):
+        """
+        Draw the whole figure. If the canvas supports blitting, store the
+        background of every subplot without the traces, so that subsequent
+        updates can blit the traces onto it.
+        """
+        canvas = self.fig.canvas
+        artists = self._trace_artists()
+        if not artists or not getattr(canvas, 'supports_blit', False):
+            self._backgrounds = None
+            canvas.draw_idle()
+            return
+
+        for artist in artists:
+            artist.set_animated(True)
+        try:
+            canvas.draw()
+        finally:
+            for artist in artists:
+                artist.set_animated(False)
+
+        self._backgrounds = {
+            ax: (canvas.copy_from_bbox(ax.bbox), ax.bbox.bounds,
+                 ax.viewLim.bounds)
+            for ax in self.subplots}
+        for artist in artists:
+            artist.axes.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+
+    def _blit_traces(self):
+        """
+        Redraw only the traces onto the stored backgrounds.
+
+        Returns:
+            False if that is not possible since the subplots have changed
+            size or limits since the backgrounds were stored, True otherwise
+        """
+        if not self._backgrounds:
+            return False
+        for ax, (_, bbox, view) in self._backgrounds.items():
+            if ax.bbox.bounds != bbox or ax.viewLim.bounds != view:
+                return False
+
+        canvas = self.fig.canvas
+        for ax, (background, _, _) in self._backgrounds.items():
+            artists = self._trace_artists(ax)
+            if not artists:
+                continue
+            canvas.restore_region(background)
+            for artist in artists:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+        return True
 
     def _draw_plot(self, ax, y, x=None, fmt=None, subplot=1,
                    xlabel=None,
@@ -384,6 +568,8 @@ class MatPlot(BasePlot):
         args = self._make_args_for_pcolormesh(args_masked, x, y)
 
         pc = ax.pcolormesh(*args, **kwargs)
+        # keep the edges of the mesh for incremental updates
+        pc.qcodes_edges = args[:-1]
 
         # Set x and y limits if arrays are provided
         if x is not None and y is not None:
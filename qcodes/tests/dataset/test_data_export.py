@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset import data_export
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.sqlite_base import get_data
+from qcodes.instrument.parameter import Parameter
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+from qcodes.dataset.data_export import (detect_grid,
+                                        datatype_from_setpoints_2d,
+                                        reshape_2D_data, decimate_1D_data,
+                                        downsample_2D_data, _strings_as_ints)
+
+
+def _sweep(nx, ny, npoints=None):
+    x, y = np.meshgrid(np.linspace(-1, 1, nx), np.logspace(0, 1, ny))
+    return x.ravel()[:npoints], y.ravel()[:npoints]
+
+
+def test_detect_grid_regular():
+    x, y = _sweep(4, 3)
+    grid = detect_grid(x, y)
+    assert grid.is_grid
+    assert grid.shape == (4, 3)
+    assert np.array_equal(grid.axes[0], np.linspace(-1, 1, 4))
+    assert np.array_equal(grid.axes[1], np.logspace(0, 1, 3))
+    for axis, index, points in zip(grid.axes, grid.indices, (x, y)):
+        assert np.array_equal(axis[index], points)
+
+
+@pytest.mark.parametrize('npoints', [1, 4, 5, 9, 11])
+def test_detect_grid_interrupted(npoints):
+    x, y = _sweep(4, 3, npoints)
+    grid = detect_grid(x, y)
+    assert grid.is_grid
+    z = np.full(grid.shape, np.nan)
+    z[grid.indices] = np.arange(npoints)
+    assert np.sum(np.isfinite(z)) == npoints
+
+
+def test_detect_grid_not_a_grid():
+    x, y = _sweep(4, 3)
+    # a point measured twice
+    assert not detect_grid(np.append(x, x[0]), np.append(y, y[0])).is_grid
+    # scatter data
+    assert not detect_grid(np.random.rand(20), np.random.rand(20)).is_grid
+
+
+def test_detect_grid_3d():
+    x, y, z = np.meshgrid(range(2), range(3), range(4), indexing='ij')
+    grid = detect_grid(z.ravel(), y.ravel(), x.ravel())
+    assert grid.is_grid
+    assert grid.shape == (4, 3, 2)
+    grid = detect_grid(z.ravel()[:-3], y.ravel()[:-3], x.ravel()[:-3])
+    assert grid.is_grid
+    assert grid.shape == (4, 3, 2)
+
+
+def test_detect_grid_raises():
+    with pytest.raises(ValueError):
+        detect_grid()
+    with pytest.raises(ValueError):
+        detect_grid(np.arange(3), np.arange(4))
+
+
+def test_datatype_from_setpoints_2d():
+    x, y = _sweep(5, 4)
+    assert datatype_from_setpoints_2d(x, y) == '2D_grid'
+    assert datatype_from_setpoints_2d(x[:-2], y[:-2]) == '2D_grid'
+    assert datatype_from_setpoints_2d(np.zeros(5), np.arange(5)) == '2D_point'
+
+    x, y = np.meshgrid(np.arange(5), np.arange(4))
+    x, y = np.append(x.ravel(), 2), np.append(y.ravel(), 1)
+    assert datatype_from_setpoints_2d(x, y) == '2D_equidistant'
+
+    x, y = np.array([0, 1, 3**0.5, 0]), np.array([0, 0, 2**0.5, 1])
+    assert datatype_from_setpoints_2d(x, y) == '2D_unknown'
+
+
+def test_reshape_2D_data_interrupted():
+    x, y = _sweep(3, 2, 4)
+    z = np.arange(4.)
+    xrow, yrow, z_to_plot = reshape_2D_data(x, y, z)
+    assert np.array_equal(xrow, np.linspace(-1, 1, 3))
+    assert np.array_equal(yrow, np.logspace(0, 1, 2))
+    assert np.array_equal(z_to_plot[0], [0, 1, 2])
+    assert z_to_plot[1, 0] == 3
+    assert np.all(np.isnan(z_to_plot[1, 1:]))
+
+
+def test_strings_as_ints():
+    ints = _strings_as_ints(np.array(['b', 'c', 'a', 'b', 'c']))
+    assert np.array_equal(ints, [1, 2, 0, 1, 2])
+
+
+def test_decimate_1D_data():
+    x = np.linspace(0, 1, 10001)
+    y = np.sin(30 * x)
+    y[5000] = 10
+    y[7000] = np.nan
+
+    xd, yd = decimate_1D_data(x, y, 100)
+    assert len(xd) <= 400
+    assert xd[0] == 0 and xd[-1] == 1
+    assert np.all(np.diff(xd) > 0)
+    assert np.nanmax(yd) == 10
+    assert np.nanmin(yd) == np.nanmin(y)
+    # only actual points are kept
+    np.testing.assert_array_equal(yd, y[np.searchsorted(x, xd)])
+
+    xd, yd = decimate_1D_data(x, y, 5000)
+    assert xd is x and yd is y
+
+
+def test_downsample_2D_data():
+    xrow = np.arange(5.)
+    yrow = np.arange(3.)
+    z = np.arange(15.).reshape(3, 5)
+    z[0, 0] = np.nan
+
+    xd, yd, zd = downsample_2D_data(xrow, yrow, z, (2, 2))
+    assert np.array_equal(xd, [1, 3.5])
+    assert np.array_equal(yd, [0.5, 2])
+    assert np.array_equal(zd, [[(1 + 2 + 5 + 6 + 7) / 5, (3 + 4 + 8 + 9) / 4],
+                               [11, 13.5]])
+
+    assert downsample_2D_data(xrow, yrow, z, (5, 3))[2] is z
+
+
+def test_get_data_by_id_single_scan(experiment, monkeypatch):
+    x = Parameter('x', set_cmd=None, get_cmd=None, unit='V')
+    y = Parameter('y', set_cmd=None, get_cmd=None)
+    a = Parameter('a', set_cmd=None, get_cmd=None, label='A')
+    b = Parameter('b', set_cmd=None, get_cmd=None)
+    text = Parameter('text', set_cmd=None, get_cmd=None)
+    freq = Parameter('freq', set_cmd=None, get_cmd=None)
+    array = Parameter('array', set_cmd=None, get_cmd=None)
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y)
+    meas.register_parameter(a, setpoints=(x,))
+    meas.register_parameter(b, setpoints=(y, x))
+    meas.register_parameter(text, setpoints=(x,), paramtype='text')
+    meas.register_parameter(freq, paramtype='array')
+    meas.register_parameter(array, setpoints=(x, freq), paramtype='array')
+
+    with meas.run() as datasaver:
+        for i in range(3):
+            datasaver.add_result((x, i), (a, 2 * i), (text, f's{i}'))
+            for j in range(2):
+                datasaver.add_result((x, i), (y, j / 2), (b, i + j))
+            datasaver.add_result((x, i), (freq, np.arange(4)),
+                                 (array, np.arange(4) * i))
+
+    scans = []
+
+    def counting_get_data(conn, table_name, columns, *args, **kwargs):
+        scans.append(columns)
+        return get_data(conn, table_name, columns, *args, **kwargs)
+
+    monkeypatch.setattr(data_export, 'get_data', counting_get_data)
+    output = data_export.get_data_by_id(datasaver.run_id)
+    assert scans == [['x', 'a', 'y', 'b', 'text', 'freq', 'array']]
+
+    assert [[axis['name'] for axis in axes] for axes in output] == \
+        [['x', 'a'], ['y', 'x', 'b'], ['x', 'text'], ['x', 'freq', 'array']]
+    x_axis, a_axis = output[0]
+    assert x_axis['unit'] == 'V' and a_axis['label'] == 'A'
+    assert np.array_equal(a_axis['data'], [0, 2, 4])
+    assert np.array_equal(output[1][0]['data'], [0, 0.5] * 3)
+    assert np.array_equal(output[1][1]['data'], [0, 0, 1, 1, 2, 2])
+    assert np.array_equal(output[2][1]['data'], ['s0', 's1', 's2'])
+    assert np.array_equal(output[3][0]['data'], np.repeat([0, 1, 2], 4))
+    assert np.array_equal(output[3][1]['data'], np.tile(np.arange(4), 3))
+    assert np.array_equal(output[3][2]['data'],
+                          np.outer([0, 1, 2], np.arange(4)).ravel())
@@ -0,0 +1,106 @@
+import json
+
+import numpy as np
+import pytest
+
+from qcodes.actions import BreakIf
+from qcodes.dataset.data_set import load_by_id
+from qcodes.dataset.database_format import DatabaseFormat
+from qcodes.instrument.parameter import Parameter
+from qcodes.loops import Loop
+from qcodes.tests.instrument_mocks import DummyInstrument
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+
+
+@pytest.fixture
+def dac():
+    dac = DummyInstrument('dummy_dac', gates=['ch1', 'ch2'])
+    yield dac
+    dac.close()
+
+
+@pytest.fixture
+def dmm(dac):
+    dmm = DummyInstrument('dummy_dmm', gates=['v1', 'v2'])
+    dmm.v1.get = lambda: dac.ch1() + 10 * dac.ch2()
+    yield dmm
+    dmm.close()
+
+
+@pytest.mark.usefixtures("experiment")
+def test_loop_1d(dac, dmm):
+    loop = Loop(dac.ch1.sweep(0, 4, num=5)).each(dmm.v1)
+    data = loop.run(formatter=DatabaseFormat(name='loop_1d'), quiet=True)
+
+    run = load_by_id(data.run_id)
+    assert run.name == 'loop_1d'
+    assert run.completed
+    assert run.parameters == 'dummy_dac_ch1_set,dummy_dmm_v1'
+    specs = run.paramspecs
+    assert specs['dummy_dmm_v1'].depends_on == 'dummy_dac_ch1_set'
+    assert specs['dummy_dac_ch1_set'].label == 'Gate ch1'
+    assert specs['dummy_dac_ch1_set'].unit == 'V'
+    assert run.get_values('dummy_dac_ch1_set') == [[0.], [1.], [2.], [3.],
+                                                   [4.]]
+    assert run.get_values('dummy_dmm_v1') == [[0.], [1.], [2.], [3.], [4.]]
+
+    snapshot = json.loads(run.get_metadata('snapshot'))
+    assert 'loop' in snapshot
+    assert 'ts_end' in snapshot['loop']
+
+
+@pytest.mark.usefixtures("experiment")
+def test_loop_2d_with_outer_measurement(dac, dmm):
+    loop = Loop(dac.ch2.sweep(0, 2, num=3)).each(
+        dmm.v2,
+        Loop(dac.ch1.sweep(0, 3, num=4)).each(dmm.v1))
+    data = loop.run(formatter=DatabaseFormat(), quiet=True)
+
+    run = load_by_id(data.run_id)
+    assert run.number_of_results == 3 + 12
+    specs = run.paramspecs
+    assert specs['dummy_dmm_v1'].depends_on == ('dummy_dac_ch2_set, '
+                                                'dummy_dac_ch1_set')
+    assert specs['dummy_dmm_v2'].depends_on == 'dummy_dac_ch2_set'
+
+    setpoints = run.get_setpoints('dummy_dmm_v1')
+    outer = np.array(setpoints['dummy_dac_ch2_set']).ravel()
+    inner = np.array(setpoints['dummy_dac_ch1_set']).ravel()
+    values = np.array(run.get_values('dummy_dmm_v1')).ravel()
+    assert outer.tolist() == [0.] * 4 + [1.] * 4 + [2.] * 4
+    assert inner.tolist() == [0., 1., 2., 3.] * 3
+    assert values.tolist() == (inner + 10 * outer).tolist()
+    assert len(run.get_values('dummy_dmm_v2')) == 3
+
+
+@pytest.mark.usefixtures("experiment")
+def test_periodic_writes_append(dac, dmm):
+    loop = Loop(dac.ch1.sweep(0, 9, num=10)).each(dmm.v1)
+    data = loop.get_data_set(formatter=DatabaseFormat(), write_period=0)
+    loop.run(quiet=True)
+
+    run = load_by_id(data.run_id)
+    assert run.number_of_results == 10
+    assert np.array(run.get_values('dummy_dmm_v1')).ravel().tolist() == \
+        list(range(10))
+
+
+@pytest.mark.usefixtures("experiment")
+def test_interrupted_loop(dac, dmm):
+    loop = Loop(dac.ch1.sweep(0, 9, num=10)).each(
+        dmm.v1, BreakIf(lambda: dac.ch1() >= 3))
+    data = loop.run(formatter=DatabaseFormat(), quiet=True)
+
+    run = load_by_id(data.run_id)
+    assert run.completed
+    assert run.number_of_results == 4
+
+
+@pytest.mark.usefixtures("experiment")
+def test_read_not_supported(dac, dmm):
+    data = Loop(dac.ch1.sweep(0, 1, num=2)).each(dmm.v1).run(
+        formatter=DatabaseFormat(), quiet=True)
+    with pytest.raises(NotImplementedError):
+        data.read()
@@ -0,0 +1,81 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from qcodes.data.data_set import load_data
+from qcodes.dataset.data_set import load_by_id
+from qcodes.dataset.legacy_import import (import_dat_file, import_dat_files,
+                                          find_dat_files, dataset_to_columns)
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', '2018-01-17')
+LOCATION_1D = os.path.join(FIXTURES, '#001_testsweep_15-42-57')
+LOCATION_2D = os.path.join(FIXTURES, '#002_2D_test_15-43-14')
+
+
+@pytest.fixture
+def legacy_tree(tmp_path):
+    root = tmp_path / 'legacy'
+    shutil.copytree(LOCATION_1D, str(root / 'day1' / 'run1'))
+    shutil.copytree(LOCATION_2D, str(root / 'day1' / 'run2'))
+    shutil.copytree(LOCATION_2D, str(root / 'day2' / 'run3'))
+    broken = root / 'day2' / 'broken'
+    broken.mkdir()
+    (broken / 'x_set.dat').write_text('not a gnuplot file')
+    yield str(root)
+
+
+def test_dataset_to_columns_2d():
+    legacy = load_data(LOCATION_2D)
+    column_groups = dataset_to_columns(legacy)
+    assert len(column_groups) == 1
+    columns = column_groups[0]
+    assert list(columns.keys()) == ['dac_ch1_set', 'dac_ch2_set',
+                                    'dmm_voltage']
+    outer = legacy.arrays['dac_ch1_set'].ndarray
+    inner = legacy.arrays['dac_ch2_set'].ndarray
+    data = legacy.arrays['dmm_voltage'].ndarray
+    assert np.array_equal(columns['dac_ch1_set'],
+                          np.repeat(outer, inner.shape[1]))
+    assert np.array_equal(columns['dac_ch2_set'], inner.ravel())
+    assert np.array_equal(columns['dmm_voltage'], data.ravel())
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize('chunk_size', [1, 7, 10000])
+def test_import_in_chunks(chunk_size):
+    legacy = load_data(LOCATION_2D)
+    run_id, = import_dat_file(LOCATION_2D, chunk_size=chunk_size)
+    data = load_by_id(run_id)
+    assert data.completed
+    assert data.number_of_results == 36
+    values = np.array(data.get_values('dmm_voltage')).ravel()
+    assert np.array_equal(values, legacy.arrays['dmm_voltage'].ndarray.ravel())
+
+
+def test_find_dat_files(legacy_tree):
+    found = [os.path.relpath(loc, legacy_tree)
+             for loc in find_dat_files(legacy_tree)]
+    assert found == [os.path.join('day1', 'run1'),
+                     os.path.join('day1', 'run2'),
+                     os.path.join('day2', 'broken'),
+                     os.path.join('day2', 'run3')]
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize('processes', [1, 2])
+def test_import_tree(legacy_tree, processes):
+    run_ids = import_dat_files(legacy_tree, processes=processes,
+                               progress=False)
+    run_ids = {os.path.relpath(loc, legacy_tree): run_id
+               for loc, run_id in run_ids.items()}
+    assert run_ids == {os.path.join('day1', 'run1'): 1,
+                       os.path.join('day1', 'run2'): 2,
+                       os.path.join('day2', 'run3'): 3}
+    assert load_by_id(1).number_of_results == 201
+    assert load_by_id(2).parameters == 'dac_ch1_set,dac_ch2_set,dmm_voltage'
+    assert load_by_id(3).number_of_results == 36
@@ -9,6 +9,7 @@ from qcodes.dataset.plotting import _make_rescaled_ticks_and_units, \
 
 from qcodes.dataset.plotting import plot_by_id, _appropriate_kwargs
 from qcodes.dataset.measurements import Measurement
+from qcodes.instrument.parameter import Parameter
 from qcodes.tests.instrument_mocks import DummyInstrument
 from qcodes.tests.dataset.temporary_databases import empty_temp_db, experiment
 
@@ -147,3 +148,47 @@ def test_appropriate_kwargs():
     with _appropriate_kwargs('2D_point', False, **{}) as ap_kwargs:
         assert len(ap_kwargs) == 1
         assert ap_kwargs['cmap'] == qc.config.plotting.default_color_map
+
+
+def test_plot_by_id_decimated(experiment):
+    """
+    Test that lines and heatmaps are plotted with no more detail than the
+    axes can show, and that zooming in shows the full resolution
+    """
+    x = Parameter('x', set_cmd=None, get_cmd=None)
+    y = Parameter('y', set_cmd=None, get_cmd=None)
+    line = Parameter('line', set_cmd=None, get_cmd=None)
+    heat = Parameter('heat', set_cmd=None, get_cmd=None)
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y)
+    meas.register_parameter(line, setpoints=(x,))
+    meas.register_parameter(heat, setpoints=(x, y))
+
+    with meas.run() as datasaver:
+        line_xs = np.linspace(0, 1, 1000)
+        datasaver.add_result((x, line_xs), (line, np.sin(20 * line_xs)))
+        for yval in range(60):
+            xs = np.arange(80)
+            datasaver.add_result((x, xs), (y, np.full_like(xs, yval)),
+                                 (heat, xs * yval))
+
+    axes, colorbars = plot_by_id(datasaver.run_id, decimate=True,
+                                 figsize=(1, 1), dpi=50)
+    line_ax, heat_ax = axes
+    # the axes are less than 50 pixels wide and high
+    plotted_line, = line_ax.get_lines()
+    assert len(plotted_line.get_xdata()) <= 4 * 50
+    assert max(plotted_line.get_ydata()) == max(np.sin(20 * line_xs))
+    assert colorbars[1].mappable.get_array().shape[0] <= 50 * 50
+
+    line_ax.set_xlim(0.5, 0.51)
+    assert 10 <= len(plotted_line.get_xdata()) <= 14
+
+    heat_ax.set_xlim(10, 20)
+    heat_ax.set_ylim(10, 20)
+    mesh, = heat_ax.collections
+    assert mesh is colorbars[1].mappable
+    assert mesh.get_array().shape == (13 * 13,)
+    assert mesh.get_array()[0] == 9 * 9
@@ -152,6 +152,31 @@ def test_get_dependents(experiment):
     assert deps == expected_deps
 
 
+def test_get_dependent_layouts(experiment):
+    x = ParamSpec('x', 'numeric', label='X', unit='V')
+    t = ParamSpec('t', 'numeric', unit='s')
+    x_raw = ParamSpec('x_raw', 'numeric')
+    y = ParamSpec('y', 'numeric', label='Y', depends_on=['t', 'x'])
+    z = ParamSpec('z', 'numeric', depends_on=['x'], inferred_from=['x_raw'])
+
+    (_, run_id, _) = mut.create_run(experiment.conn,
+                                    experiment.exp_id,
+                                    name='testrun',
+                                    guid=generate_guid(),
+                                    parameters=[x, t, x_raw, y, z])
+
+    layouts = mut.get_dependent_layouts(experiment.conn, run_id)
+
+    assert layouts == [[{'name': 't', 'label': '', 'unit': 's'},
+                        {'name': 'x', 'label': 'X', 'unit': 'V'},
+                        {'name': 'y', 'label': 'Y', 'unit': ''}],
+                       [{'name': 'x', 'label': 'X', 'unit': 'V'},
+                        {'name': 'z', 'label': '', 'unit': ''}]]
+    for layout_id, axes in zip(mut.get_dependents(experiment.conn, run_id),
+                               layouts):
+        assert axes[-1] == mut.get_layout(experiment.conn, layout_id)
+
+
 def test_column_in_table(dataset):
     assert mut.is_column_in_table(dataset.conn, "runs", "run_id")
     assert not mut.is_column_in_table(dataset.conn, "runs",
@@ -0,0 +1,129 @@
+"""
+A simulated Alazar API and board, to test the acquisition logic of
+:class:`.AlazarTech_ATS` without a board or the Alazar DLL.
+"""
+import collections
+import ctypes
+from typing import Callable, Deque, Optional
+
+import numpy as np
+
+from qcodes.instrument_drivers.AlazarTech.ATS import AlazarTech_ATS
+from qcodes.utils import validators
+
+
+class SimulatedATSAPI:
+    """
+    Stands in for :class:`.AlazarATSAPI`, implementing the calls made by
+    ``AlazarTech_ATS.acquire``.
+
+    When a buffer is waited for, it is filled by ``fill``, which gets the
+    number of the buffer in the acquisition and the buffer as a numpy array.
+    Buffers must be waited for in the order they were posted, as on a real
+    board.
+    """
+    def __init__(self, dll_path: Optional[str] = None,
+                 bits_per_sample: int = 12) -> None:
+        self.bits_per_sample = bits_per_sample
+        self.fill: Callable[[int, np.ndarray], None] = \
+            lambda number, buffer: buffer.fill(number)
+        self.posted: Deque = collections.deque()
+        self.buffers_filled = 0
+        self.capturing = False
+
+    def get_board_by_system_id(self, system_id: int, board_id: int) -> int:
+        return 1
+
+    def get_channel_info_(self, handle: int):
+        return 2**22, self.bits_per_sample
+
+    def set_record_size(self, handle, pre_trigger_samples,
+                        post_trigger_samples) -> None:
+        pass
+
+    def before_async_read(self, handle, channel_select, transfer_offset,
+                          samples_per_record, records_per_buffer,
+                          records_per_acquisition, flags) -> None:
+        self.posted.clear()
+        self.buffers_filled = 0
+
+    def post_async_buffer(self, handle, address, size_bytes) -> None:
+        self.posted.append((address.value, size_bytes))
+
+    def start_capture(self, handle) -> None:
+        self.capturing = True
+
+    def wait_async_buffer_complete(self, handle, address,
+                                   timeout_ms) -> None:
+        if not self.capturing:
+            raise RuntimeError('Capture has not been started')
+        if not self.posted or self.posted[0][0] != address.value:
+            raise RuntimeError('Waiting for a buffer that is not the next '
+                               'posted buffer')
+        address, size_bytes = self.posted.popleft()
+        dtype = np.uint16 if self.bits_per_sample > 8 else np.uint8
+        buffer = np.ctypeslib.as_array(
+            (ctypes.c_uint8 * size_bytes).from_address(address)).view(dtype)
+        self.fill(self.buffers_filled, buffer)
+        self.buffers_filled += 1
+
+    def abort_async_read(self, handle) -> None:
+        self.capturing = False
+
+
+class SimulatedBuffer:
+    """
+    Stands in for :class:`.Buffer`, allocating the memory with ctypes
+    rather than ``VirtualAlloc``, so that it works on any OS.
+    """
+    def __init__(self, c_sample_type, size_bytes: int) -> None:
+        self.size_bytes = size_bytes
+        n_samples = size_bytes // ctypes.sizeof(c_sample_type)
+        self.ctypes_buffer = (c_sample_type * n_samples)()
+        self.addr = ctypes.addressof(self.ctypes_buffer)
+        self.buffer = np.ctypeslib.as_array(self.ctypes_buffer)
+
+    def free_mem(self) -> None:
+        pass
+
+
+class SimulatedATS(AlazarTech_ATS):
+    """
+    A board with just the parameters needed by ``acquire`` and the
+    acquisition controllers, to be used with ``AlazarATSAPI`` replaced by
+    ``SimulatedATSAPI`` and ``Buffer`` by ``SimulatedBuffer``.
+    """
+    def __init__(self, name: str, **kwargs) -> None:
+        super().__init__(name, **kwargs)
+        disabled = {'DISABLED': 0x0}
+        self.add_parameter('mode', set_cmd=None, initial_value='NPT',
+                           val_mapping={'NPT': 0x200, 'TS': 0x400})
+        self.add_parameter('samples_per_record', set_cmd=None,
+                           initial_value=128, vals=validators.Ints(1))
+        self.add_parameter('records_per_buffer', set_cmd=None,
+                           initial_value=1, vals=validators.Ints(1))
+        self.add_parameter('buffers_per_acquisition', set_cmd=None,
+                           initial_value=1, vals=validators.Ints(1))
+        self.add_parameter('channel_selection', set_cmd=None,
+                           initial_value='AB',
+                           val_mapping={'A': 1, 'B': 2, 'AB': 3})
+        self.add_parameter('transfer_offset', set_cmd=None, initial_value=0)
+        for name in ('external_startcapture', 'enable_record_headers',
+                     'alloc_buffers', 'fifo_only_streaming',
+                     'interleave_samples', 'get_processed_data'):
+            self.add_parameter(name, set_cmd=None, initial_value='DISABLED',
+                               val_mapping=disabled)
+        self.add_parameter('allocated_buffers', set_cmd=None,
+                           initial_value=4, vals=validators.Ints(1))
+        self.add_parameter('buffer_timeout', set_cmd=None,
+                           initial_value=1000, vals=validators.Ints(0))
+        self.add_parameter('clock_source', set_cmd=None,
+                           initial_value='INTERNAL_CLOCK')
+        self.add_parameter('sample_rate', set_cmd=None,
+                           initial_value=100_000_000)
+        self.add_parameter('decimation', set_cmd=None, initial_value=0,
+                           vals=validators.Ints(0))
+        for channel in range(1, self.channels + 1):
+            self.add_parameter(f'channel_range{channel}', set_cmd=None,
+                               initial_value=0.4)
+        self._parameters_synced = True
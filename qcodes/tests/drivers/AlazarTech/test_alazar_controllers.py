@@ -0,0 +1,150 @@
+"""
+Tests of the vectorized acquisition controllers of
+``ATS_acquisition_controllers`` against straightforward implementations,
+with a simulated API filling the buffers with random samples.
+"""
+import numpy as np
+import pytest
+
+import qcodes.instrument_drivers.AlazarTech.ATS as ATS
+from qcodes.instrument_drivers.AlazarTech.ATS_acquisition_controllers import (
+    BufferAveraging_AcquisitionController,
+    IQDemodulation_AcquisitionController,
+    RecordAveraging_AcquisitionController)
+
+from .simulated_alazar import SimulatedATS, SimulatedATSAPI, SimulatedBuffer
+
+SAMPLES_PER_RECORD = 256
+RECORDS_PER_BUFFER = 8
+BUFFERS_PER_ACQUISITION = 5
+SAMPLE_RATE = 100_000_000
+RANGES = (0.4, 0.8)
+
+
+@pytest.fixture
+def alazar(monkeypatch):
+    monkeypatch.setattr(ATS, 'AlazarATSAPI', SimulatedATSAPI)
+    monkeypatch.setattr(ATS, 'Buffer', SimulatedBuffer)
+    alazar = SimulatedATS('alazar_sim')
+    alazar.samples_per_record(SAMPLES_PER_RECORD)
+    alazar.records_per_buffer(RECORDS_PER_BUFFER)
+    alazar.buffers_per_acquisition(BUFFERS_PER_ACQUISITION)
+    alazar.sample_rate(SAMPLE_RATE)
+    alazar.channel_range1(RANGES[0])
+    alazar.channel_range2(RANGES[1])
+
+    # random 12 bit samples, left justified in the 16 bit sample words
+    rng = np.random.RandomState(0)
+    codes = rng.randint(0, 2**12, size=(BUFFERS_PER_ACQUISITION, 2,
+                                        RECORDS_PER_BUFFER,
+                                        SAMPLES_PER_RECORD))
+    alazar.codes = codes
+
+    def fill(number, buffer):
+        buffer[:] = codes[number].ravel() << 4
+    alazar.api.fill = fill
+    yield alazar
+    alazar.close()
+
+
+def _volts(codes):
+    """The samples in volts, with the channels last"""
+    volts = (codes - 2047.5) / 2047.5
+    return np.moveaxis(volts, 1, -1) * np.array(RANGES)
+
+
+@pytest.fixture(params=[0, 2], ids=['synchronous', 'pipelined'])
+def acquisitionkwargs(request):
+    return {'processing_workers': request.param}
+
+
+def test_record_averaging(alazar, acquisitionkwargs):
+    controller = RecordAveraging_AcquisitionController('controller',
+                                                       'alazar_sim')
+    try:
+        controller.update_acquisitionkwargs(**acquisitionkwargs)
+        result = controller.acquisition()
+    finally:
+        controller.close()
+    # (buffers, records, samples, channels)
+    expected = _volts(alazar.codes).mean(axis=(0, 1))
+    assert result.shape == (SAMPLES_PER_RECORD, 2)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_buffer_averaging(alazar, acquisitionkwargs):
+    controller = BufferAveraging_AcquisitionController('controller',
+                                                       'alazar_sim')
+    try:
+        controller.update_acquisitionkwargs(**acquisitionkwargs)
+        result = controller.acquisition()
+    finally:
+        controller.close()
+    expected = _volts(alazar.codes).mean(axis=0)
+    assert result.shape == (RECORDS_PER_BUFFER, SAMPLES_PER_RECORD, 2)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def _demodulate(volts, frequency, weights):
+    times = np.arange(SAMPLES_PER_RECORD) / SAMPLE_RATE
+    reference = weights * np.exp(-2j * np.pi * frequency * times)
+    # samples are the second to last axis of the volts
+    return 2 * np.einsum('...sc,s->...c', volts, reference) / weights.sum()
+
+
+@pytest.mark.parametrize('average_records', [True, False])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_iq_demodulation(alazar, acquisitionkwargs, average_records,
+                         weighted):
+    frequency = 12.5e6
+    weights = (np.hanning(SAMPLES_PER_RECORD) if weighted
+               else np.ones(SAMPLES_PER_RECORD))
+    controller = IQDemodulation_AcquisitionController(
+        'controller', 'alazar_sim', demodulation_frequency=frequency,
+        integration_weights=weights if weighted else None,
+        average_records=average_records)
+    try:
+        controller.update_acquisitionkwargs(**acquisitionkwargs)
+        result = controller.acquisition()
+    finally:
+        controller.close()
+
+    expected = _demodulate(_volts(alazar.codes), frequency, weights)
+    if average_records:
+        expected = expected.mean(axis=(0, 1))
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_iq_demodulation_of_a_sine(alazar):
+    """A whole number of periods of a sine gives its amplitude and phase"""
+    frequency = 12.5e6
+    amplitude = 0.1
+    phase = 0.3
+    times = np.arange(SAMPLES_PER_RECORD) / SAMPLE_RATE
+    volts = amplitude * np.cos(2 * np.pi * frequency * times + phase)
+    codes = np.round(volts / RANGES[0] * 2047.5 + 2047.5).astype(np.uint16)
+    alazar.channel_selection('A')
+    alazar.api.fill = lambda number, buffer: buffer.__setitem__(
+        slice(None), np.tile(codes << 4, RECORDS_PER_BUFFER))
+
+    controller = IQDemodulation_AcquisitionController(
+        'controller', 'alazar_sim', demodulation_frequency=frequency)
+    try:
+        result = controller.acquisition()
+    finally:
+        controller.close()
+    assert result.shape == (1,)
+    assert abs(result[0]) == pytest.approx(amplitude, rel=1e-3)
+    assert np.angle(result[0]) == pytest.approx(phase, abs=1e-3)
+
+
+def test_wrong_number_of_weights(alazar):
+    controller = IQDemodulation_AcquisitionController(
+        'controller', 'alazar_sim', demodulation_frequency=1e6,
+        integration_weights=np.ones(SAMPLES_PER_RECORD - 1))
+    try:
+        with pytest.raises(ValueError, match='integration weights'):
+            controller.acquisition()
+    finally:
+        controller.close()
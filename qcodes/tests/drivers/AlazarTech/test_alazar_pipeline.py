@@ -0,0 +1,164 @@
+"""
+Tests of pipelined acquisitions (``processing_workers``) of
+``AlazarTech_ATS.acquire`` against a simulated API.
+"""
+import logging
+import random
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import qcodes.instrument_drivers.AlazarTech.ATS as ATS
+from qcodes.instrument_drivers.AlazarTech.ATS import AcquisitionController
+
+from .simulated_alazar import SimulatedATS, SimulatedATSAPI, SimulatedBuffer
+
+SAMPLES_PER_RECORD = 64
+RECORDS_PER_BUFFER = 4
+
+
+class AveragingController(AcquisitionController):
+    """
+    Averages the records of every buffer in process_buffer, and collects
+    the averages in handle_buffer.
+    """
+    def __init__(self, name, alazar_name, delay=0., fail_at=None,
+                 **kwargs):
+        super().__init__(name, alazar_name, **kwargs)
+        self.delay = delay
+        self.fail_at = fail_at
+        self.handled = []
+        self.threads = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def pre_start_capture(self):
+        self.handled = []
+
+    def pre_acquire(self):
+        pass
+
+    def process_buffer(self, buffer, buffer_number=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.threads.add(threading.get_ident())
+        if buffer_number == self.fail_at:
+            raise ValueError(f'Failed to process buffer {buffer_number}')
+        # random delays, so that buffers finish processing out of order
+        time.sleep(random.uniform(0, self.delay))
+        records = buffer.reshape(-1, RECORDS_PER_BUFFER, SAMPLES_PER_RECORD)
+        return records.mean(axis=1)
+
+    def handle_buffer(self, buffer, buffer_number=None):
+        self.handled.append((buffer_number, np.array(buffer, dtype=float)))
+        with self._lock:
+            self.in_flight -= 1
+
+    def post_acquire(self):
+        return self.handled
+
+
+@pytest.fixture
+def alazar(monkeypatch):
+    monkeypatch.setattr(ATS, 'AlazarATSAPI', SimulatedATSAPI)
+    monkeypatch.setattr(ATS, 'Buffer', SimulatedBuffer)
+    alazar = SimulatedATS('alazar_sim')
+    alazar.samples_per_record(SAMPLES_PER_RECORD)
+    alazar.records_per_buffer(RECORDS_PER_BUFFER)
+    yield alazar
+    alazar.close()
+
+
+def _make_controller(**kwargs):
+    controller = AveragingController('controller', 'alazar_sim', **kwargs)
+    return controller
+
+
+@pytest.fixture
+def controller():
+    controller = _make_controller(delay=0.002)
+    yield controller
+    controller.close()
+
+
+def _expected(n_buffers):
+    # the simulated api fills every buffer with its number
+    return [np.full((2, SAMPLES_PER_RECORD), float(n))
+            for n in range(n_buffers)]
+
+
+@pytest.mark.parametrize('buffers_per_acquisition', (3, 20))
+def test_pipelined_acquisition(alazar, controller, buffers_per_acquisition):
+    alazar.allocated_buffers(3)
+    handled = alazar.acquire(buffers_per_acquisition=buffers_per_acquisition,
+                             acquisition_controller=controller,
+                             processing_workers=4)
+
+    numbers = [number for number, _ in handled]
+    assert numbers == list(range(buffers_per_acquisition))
+    for (_, data), expected in zip(handled, _expected(
+            buffers_per_acquisition)):
+        np.testing.assert_array_equal(data, expected)
+    assert len(controller.threads) > 1
+    assert controller.in_flight == 0
+
+
+def test_pipelined_matches_synchronous(alazar):
+    def fill(number, buffer):
+        buffer[:] = np.random.RandomState(number).randint(
+            0, 4096, buffer.shape)
+
+    results = []
+    for workers in (0, 3):
+        alazar.api.fill = fill
+        controller = _make_controller()
+        try:
+            results.append(alazar.acquire(buffers_per_acquisition=12,
+                                          acquisition_controller=controller,
+                                          processing_workers=workers))
+        finally:
+            controller.close()
+
+    synchronous, pipelined = results
+    assert len(synchronous) == len(pipelined) == 12
+    for (n1, data1), (n2, data2) in zip(synchronous, pipelined):
+        assert n1 == n2
+        np.testing.assert_array_equal(data1, data2)
+
+
+def test_buffers_in_flight_are_bounded(alazar, controller):
+    alazar.acquire(buffers_per_acquisition=30,
+                   acquisition_controller=controller,
+                   processing_workers=4, max_buffers_in_flight=2)
+    assert controller.max_in_flight <= 2
+
+
+def test_processing_error_aborts_acquisition(alazar):
+    controller = _make_controller(fail_at=5)
+    try:
+        with pytest.raises(ValueError, match='Failed to process buffer 5'):
+            alazar.acquire(buffers_per_acquisition=50,
+                           acquisition_controller=controller,
+                           processing_workers=2)
+    finally:
+        controller.close()
+    assert not alazar.api.capturing
+    # the acquisition stopped soon after the failing buffer
+    assert alazar.api.buffers_filled < 50
+    assert not [thread for thread in threading.enumerate()
+                if thread.name.startswith('alazar_')]
+
+
+def test_stage_timings_are_logged(alazar, controller, caplog):
+    with caplog.at_level(logging.DEBUG):
+        alazar.acquire(buffers_per_acquisition=10,
+                       acquisition_controller=controller,
+                       processing_workers=2)
+    messages = [record.getMessage() for record in caplog.records]
+    for stage in ('waiting for buffers', 'copying buffers',
+                  'processing buffers', 'handling buffers'):
+        assert any(stage in message for message in messages)
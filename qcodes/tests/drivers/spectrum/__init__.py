@@ -0,0 +1 @@
+"""Tests of the Spectrum M4i driver"""
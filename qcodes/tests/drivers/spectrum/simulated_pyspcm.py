@@ -0,0 +1,146 @@
+"""
+A simulated ``pyspcm``, the python wrapper of the Spectrum driver library,
+to test the FIFO acquisitions of :class:`.M4i` without a card or the
+library. It provides the functions and constants of ``pyspcm`` used by the
+driver, backed by the ``SimulatedCard`` in ``card``.
+"""
+import ctypes
+from ctypes import byref, c_int32 as int32, c_int64 as int64, \
+    c_uint32 as uint32
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from qcodes.instrument_drivers.Spectrum.py_header.regs import *
+from qcodes.instrument_drivers.Spectrum.py_header.spcerr import *
+
+SPCM_DIR_PCTOCARD = 0
+SPCM_DIR_CARDTOPC = 1
+SPCM_BUF_DATA = 1000
+ERRORTEXTLEN = 200
+
+
+class SimulatedCard:
+    """
+    A card recording in FIFO multi mode. On every ``M2CMD_DATA_WAITDMA`` it
+    transfers a notify size of segments (or the segments that are left) into
+    the ring buffer defined by ``spcm_dwDefTransfer_i64``, every sample of a
+    segment being the number of the segment in the acquisition. Without
+    segments left, waiting times out.
+    """
+    def __init__(self) -> None:
+        self.registers: Dict[int, int] = {SPC_CHENABLE: CHANNEL0 | CHANNEL1,
+                                          SPC_MIINST_MAXADCVALUE: 32767}
+        self.commands: List[int] = []
+        # the ring buffer: its address, size and notify size in bytes
+        self.transfers: List[Dict[str, int]] = []
+        self.invalidated = 0
+        self.available = 0
+        self.position = 0
+        self.segments_done = 0
+        self.overrun = False
+
+    def get(self, register: int) -> int:
+        if register == SPC_DATA_AVAIL_USER_LEN:
+            return self.available
+        if register == SPC_M2STATUS:
+            return M2STAT_DATA_OVERRUN if self.overrun else 0
+        return self.registers.get(register, 0)
+
+    def set(self, register: int, value: int) -> int:
+        if register == SPC_DATA_AVAIL_CARD_LEN:
+            self.available -= value
+        elif register == SPC_M2CMD:
+            self.commands.append(value)
+            if value & M2CMD_DATA_WAITDMA:
+                return self.transfer()
+        else:
+            self.registers[register] = value
+        return ERR_OK
+
+    def define_transfer(self, address: int, notify: int,
+                        length: int) -> None:
+        self.transfers.append({'address': address, 'notify': notify,
+                               'length': length})
+        self.available = 0
+        self.position = 0
+        self.segments_done = 0
+
+    def transfer(self) -> int:
+        channels = bin(self.registers[SPC_CHENABLE]).count('1')
+        segment_bytes = 2 * self.registers[SPC_SEGMENTSIZE] * channels
+        ring = self.transfers[-1]
+        n_segments = ring['notify'] // segment_bytes
+        if self.registers[SPC_LOOPS]:
+            n_segments = min(n_segments, self.registers[SPC_LOOPS] -
+                             self.segments_done)
+        if n_segments == 0:
+            return ERR_TIMEOUT
+        if self.available + n_segments * segment_bytes > ring['length']:
+            self.overrun = True
+            return ERR_OK
+        samples = np.ctypeslib.as_array(
+            (ctypes.c_int16 * (ring['length'] // 2)).from_address(
+                ring['address']))
+        for _ in range(n_segments):
+            start = self.position // 2
+            samples[start:start + segment_bytes // 2] = self.segments_done
+            self.segments_done += 1
+            self.position = (self.position + segment_bytes) % ring['length']
+        self.available += n_segments * segment_bytes
+        return ERR_OK
+
+    def stopped(self) -> bool:
+        """Whether the last commands stopped the transfer and the card"""
+        return (M2CMD_DATA_STOPDMA in self.commands[-2:] and
+                self.commands[-1] == M2CMD_CARD_STOP)
+
+
+card = SimulatedCard()
+
+
+def reset() -> SimulatedCard:
+    """Replace the card by a new one, and return it"""
+    global card
+    card = SimulatedCard()
+    return card
+
+
+def spcm_hOpen(cardid: str) -> int:
+    return 1
+
+
+def spcm_vClose(handle: int) -> None:
+    pass
+
+
+def spcm_dwGetErrorInfo_i32(handle: int, register: Any, value: Any,
+                            text: Optional[Any]) -> int:
+    return ERR_OK
+
+
+def spcm_dwGetParam_i32(handle: int, register: int, value: Any) -> int:
+    value._obj.value = card.get(register)
+    return ERR_OK
+
+
+spcm_dwGetParam_i64 = spcm_dwGetParam_i32
+
+
+def spcm_dwSetParam_i32(handle: int, register: int, value: int) -> int:
+    return card.set(register, value)
+
+
+spcm_dwSetParam_i64 = spcm_dwSetParam_i32
+
+
+def spcm_dwDefTransfer_i64(handle: int, buffer_type: int, direction: int,
+                           notify: int, address: Any, offset: int,
+                           length: int) -> int:
+    card.define_transfer(address.value, notify, length)
+    return ERR_OK
+
+
+def spcm_dwInvalidateBuf(handle: int, buffer_type: int) -> int:
+    card.invalidated += 1
+    return ERR_OK
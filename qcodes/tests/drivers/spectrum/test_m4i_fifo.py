@@ -0,0 +1,146 @@
+"""
+Tests of the FIFO acquisitions (``fifo_stream`` and ``fifo_acquisition``)
+of the M4i against a simulated card.
+"""
+import mmap
+import sys
+
+import numpy as np
+import pytest
+
+from . import simulated_pyspcm
+
+if 'pyspcm' not in sys.modules:
+    sys.modules['pyspcm'] = simulated_pyspcm
+
+import qcodes.instrument_drivers.Spectrum.M4i as M4i_module
+from qcodes.instrument_drivers.Spectrum.M4i import M4i
+
+# 2 channels of 512 samples, so 2 kB per segment and 2 segments per page
+SEGMENT_SIZE = 512
+
+
+@pytest.fixture
+def card(monkeypatch):
+    monkeypatch.setattr(M4i_module, 'pyspcm', simulated_pyspcm)
+    yield simulated_pyspcm.reset()
+
+
+@pytest.fixture
+def m4i(card):
+    instrument = M4i('m4i')
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_chunks(m4i, card):
+    chunks = []
+
+    def callback(segments):
+        chunks.append((segments.shape, segments[0, 0, 0],
+                       segments[-1, -1, -1]))
+
+    n_segments = m4i.fifo_acquisition(1000, SEGMENT_SIZE, 9,
+                                      callback=callback,
+                                      segments_per_notify=4)
+
+    assert n_segments == 9
+    assert chunks == [((4, SEGMENT_SIZE, 2), 0, 3),
+                      ((4, SEGMENT_SIZE, 2), 4, 7),
+                      ((1, SEGMENT_SIZE, 2), 8, 8)]
+    transfer, = card.transfers
+    assert transfer['notify'] == 4 * 2 * 2 * SEGMENT_SIZE
+    assert transfer['length'] == 16 * transfer['notify']
+    assert card.stopped()
+
+
+def test_default_notify_size_is_a_page(m4i):
+    shapes = [segments.shape
+              for segments in m4i.fifo_stream(SEGMENT_SIZE, 4)]
+    assert shapes == [(mmap.PAGESIZE // 2048, SEGMENT_SIZE, 2)] * (
+        4 * 2048 // mmap.PAGESIZE)
+
+
+def test_notify_size_must_be_pages(m4i):
+    with pytest.raises(ValueError):
+        next(m4i.fifo_stream(SEGMENT_SIZE, 10, segments_per_notify=3))
+
+
+def test_ring_buffer_is_reused(m4i, card):
+    buffers = []
+    for _ in range(2):
+        for segments in m4i.fifo_stream(SEGMENT_SIZE, 40,
+                                        segments_per_notify=2,
+                                        notifies_per_buffer=4):
+            assert np.shares_memory(segments, m4i._fifo_buffer_memory)
+        buffers.append(m4i._fifo_buffer_memory)
+
+    # the ring buffer wrapped around and is the same for both acquisitions
+    assert buffers[0] is buffers[1]
+    assert buffers[0].ctypes.data % mmap.PAGESIZE == 0
+    assert [transfer['address'] for transfer in card.transfers] == \
+        [buffers[0].ctypes.data] * 2
+
+    # a larger buffer is only allocated when needed
+    next(m4i.fifo_stream(SEGMENT_SIZE, 40, segments_per_notify=2,
+                         notifies_per_buffer=8))
+    assert m4i._fifo_buffer_memory.nbytes == 8 * 2 * 2048
+
+
+def test_stop_when_leaving_the_stream(m4i, card):
+    stream = m4i.fifo_stream(SEGMENT_SIZE, 0, segments_per_notify=2)
+    for index, segments in enumerate(stream):
+        if index == 20:
+            break
+    assert not card.stopped()
+    stream.close()
+    assert card.stopped()
+    assert card.invalidated == 1
+
+
+def test_stop_on_callback_error(m4i, card):
+    def callback(segments):
+        raise ValueError('processing failed')
+
+    with pytest.raises(ValueError):
+        m4i.fifo_acquisition(1000, SEGMENT_SIZE, 10, callback=callback)
+    assert card.stopped()
+
+
+def test_timeout_and_overrun(m4i, card):
+    stream = m4i.fifo_stream(SEGMENT_SIZE, 4, segments_per_notify=2)
+    next(stream)
+    # the card acquires no more segments than asked for
+    card.registers[simulated_pyspcm.SPC_LOOPS] = 2
+    with pytest.raises(TimeoutError):
+        next(stream)
+    assert card.stopped()
+
+    stream = m4i.fifo_stream(SEGMENT_SIZE, 0, segments_per_notify=2)
+    next(stream)
+    card.overrun = True
+    with pytest.raises(RuntimeError):
+        next(stream)
+    assert card.stopped()
+
+
+def test_datasaver(m4i):
+    class DataSaver:
+        def __init__(self):
+            self.results = []
+
+        def add_result(self, *results):
+            self.results.append(results)
+
+    datasaver = DataSaver()
+    with pytest.raises(ValueError):
+        m4i.fifo_acquisition(1000, SEGMENT_SIZE, 4, datasaver=datasaver)
+
+    m4i.fifo_acquisition(1000, SEGMENT_SIZE, 4, datasaver=datasaver,
+                         parameter='signal', segments_per_notify=2)
+    assert len(datasaver.results) == 2
+    (name, volts), = datasaver.results[-1]
+    assert name == 'signal'
+    np.testing.assert_allclose(volts[:, 0, 0], np.array([2, 3]) / 32767)
@@ -0,0 +1,227 @@
+"""
+Test the drivers that read traces as binary blocks against a loopback visa
+handle, which encodes the traces like the instruments do. pyvisa-sim can not
+be used for this, as it sends all responses as text.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from qcodes.instrument.visa import VisaInstrument
+from qcodes.instrument_drivers.HP.HP8753D import HP8753D
+from qcodes.instrument_drivers.Keysight.Keysight_34465A_submodules import \
+    Keysight_34465A
+from qcodes.instrument_drivers.rohde_schwarz.RTO1000 import RTO1000
+from qcodes.instrument_drivers.rohde_schwarz.ZNB import ZNB
+
+
+def binary_block(values, dtype):
+    data = np.asarray(values, dtype=dtype).tobytes()
+    length = str(len(data))
+    return '#{}{}'.format(len(length), length).encode() + data + b'\n'
+
+
+class LoopbackHandle:
+    """
+    A visa handle answering the queries in ``responses``, a dict of the
+    query to its response or to a function of the settings returning it.
+    Every other query is answered with '0'. Writes of the form
+    'setting value' are remembered in ``settings``.
+    """
+    def __init__(self, responses):
+        self.responses = responses
+        self.settings = {}
+        self.written = []
+        self.output = b''
+        self.timeout = 5000
+        self.read_termination = '\n'
+
+    def write(self, cmd):
+        self.written.append(cmd)
+        if cmd.endswith('?') or cmd in self.responses:
+            response = self.responses.get(cmd, '0')
+            if callable(response):
+                response = response(self.settings)
+            if isinstance(response, str):
+                response = (response + '\n').encode()
+            self.output += response
+        else:
+            setting, _, value = cmd.partition(' ')
+            self.settings[setting] = value
+        return len(cmd), 0
+
+    def query(self, cmd):
+        self.write(cmd)
+        return self.read()
+
+    def read(self):
+        line, _, self.output = self.output.partition(b'\n')
+        return line.decode()
+
+    def read_raw(self):
+        data, self.output = self.output, b''
+        return data
+
+    def read_bytes(self, count):
+        data, self.output = self.output[:count], self.output[count:]
+        return data
+
+    def clear(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def loopback(instrument_class, responses, **kwargs):
+    def set_address(self, address):
+        self.visa_handle = LoopbackHandle(responses)
+        self._address = address
+
+    with patch.object(VisaInstrument, 'set_address', set_address):
+        instrument = instrument_class('loopback', 'loopback', **kwargs)
+    instrument.visa_handle.written.clear()
+    return instrument
+
+
+READINGS = np.linspace(-1, 1, 11)
+
+
+def readings(settings):
+    if settings['FORMat:DATA'] == 'REAL,64':
+        assert settings['FORMat:BORDer'] == 'NORMal'
+        return binary_block(READINGS, '>f8')
+    return ','.join(map(str, READINGS))
+
+
+@pytest.fixture
+def dmm():
+    instrument = loopback(Keysight_34465A,
+                          {'*IDN?': 'Keysight,34465A,1000,0.1',
+                           'SYST:LIC:CAT?': '"DIG"',
+                           'SYSTem:LFRequency?': '50',
+                           'FETCH?': readings,
+                           'READ?': readings},
+                          silent=True)
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_keysight_344xxA_fetch_and_read(dmm):
+    handle = dmm.visa_handle
+
+    np.testing.assert_array_equal(dmm.fetch(), READINGS)
+    np.testing.assert_array_equal(dmm.read(), READINGS)
+    np.testing.assert_array_equal(dmm.fetch(), READINGS)
+    # the data format is only switched once
+    assert handle.written == ['FORMat:DATA REAL,64', 'FORMat:BORDer NORMal',
+                              'FETCH?', 'READ?', 'FETCH?']
+
+    # single readings are read as text
+    handle.written.clear()
+    handle.responses['READ?'] = lambda settings: (
+        '0.5' if settings['FORMat:DATA'] == 'ASCii,9' else 'not text')
+    assert dmm.volt() == 0.5
+    assert handle.written == ['FORMat:DATA ASCii,9', 'READ?']
+
+    # a reset switches the instrument back to text
+    handle.responses['READ?'] = readings
+    dmm.reset()
+    handle.written.clear()
+    np.testing.assert_array_equal(dmm.read(), READINGS)
+    assert handle.written == ['FORMat:DATA REAL,64', 'FORMat:BORDer NORMal',
+                              'READ?']
+
+
+def test_znb_trace():
+    trace = np.linspace(-10, 0, 5)
+
+    def sweep_data(settings):
+        assert settings['FORM:DATA'] == 'REAL,32'
+        assert settings['FORM:BORD'] == 'SWAP'
+        return binary_block(trace, '<f4')
+
+    znb = loopback(ZNB, {'*IDN?': 'Rohde-Schwarz,ZNB8-4Port,1000,0.1',
+                         'INST:PORT:COUN?': '2',
+                         "CALC1:PAR:MEAS? 'Trc1'": "'S21'",
+                         'SENS1:SWE:POIN?': '5',
+                         'SENS1:AVER:COUN?': '1',
+                         'CALC1:DATA? FDAT': sweep_data},
+                   init_s_params=False)
+    try:
+        znb.add_channel('S21')
+        # the driver expects these responses with their termination
+        znb.rf_power.get = lambda: True
+        znb.S21.format.get = lambda: 'dB'
+        znb.visa_handle.written.clear()
+
+        data = znb.S21.trace.get()
+        np.testing.assert_array_equal(data, trace)
+        assert data.dtype == np.float64
+        # the data format is set by the reset in __init__ only
+        assert not [cmd for cmd in znb.visa_handle.written
+                    if cmd.startswith('FORM')]
+    finally:
+        znb.close()
+
+
+@pytest.fixture
+def rto():
+    trace = np.arange(-100, 100, dtype=float)
+
+    def channel_data(settings):
+        assert settings['FORMat:BORder'] == 'LSBFirst'
+        dtype = {'INT,8': '<i1', 'INT,16': '<i2',
+                 'REAL,32': '<f4'}[settings['FORMat:DATA']]
+        return binary_block(trace, dtype)
+
+    instrument = loopback(RTO1000,
+                          {'*IDN?': 'Rohde&Schwarz,RTO,1000,0.1',
+                           'CHANnel1:DATA:HEADER?': '0,1e-6,200,1',
+                           'CHANnel1:SCALe?': '0.5',
+                           'CHANnel1:OFFSet?': '0.25',
+                           'ACQuire:COUNt?': '1',
+                           'CHANnel1:DATA?': channel_data},
+                          model='RTO1044')
+    instrument.trace = trace
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_rto_1000_trace(rto):
+    rto.ch1.trace.prepare_trace()
+    data = rto.ch1.trace.get()
+    np.testing.assert_allclose(data, 0.5 * 10 / (253 * 256) * rto.trace
+                               + 0.25)
+
+    rto.dataformat('REAL,32')
+    np.testing.assert_array_equal(rto.ch1.trace.get(), rto.trace)
+
+    rto.dataformat('ASC,0')
+    with pytest.raises(ValueError, match='ASC,0'):
+        rto.ch1.trace.get()
+
+
+def test_hp8753d_trace():
+    trace = np.linspace(-40, -20, 7)
+    # the values of the two traces are interleaved, after a 4 byte header
+    interleaved = np.stack([trace, trace + 100], axis=1)
+    data = interleaved.astype('>f4').tobytes()
+    response = b'#A' + len(data).to_bytes(2, 'big') + data
+
+    hp = loopback(HP8753D, {'*IDN?': 'HP,8753D,1000,0.1',
+                            'OUTPFORM': response,
+                            'STAR?': '1e6', 'STOP?': '2e6', 'POIN?': '7',
+                            'S21?': '1', 'LOGM?': '1'})
+    try:
+        hp.trace.prepare_trace()
+        result = hp.trace.get()
+        np.testing.assert_array_equal(result, trace.astype(np.float32))
+        assert hp.visa_handle.written[-2:] == ['FORM2', 'OUTPFORM']
+    finally:
+        hp.close()
@@ -0,0 +1,161 @@
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+
+from qcodes.instrument.visa import VisaInstrument
+from qcodes.instrument_drivers.QDev.QDac_channels import QDac
+
+
+class SimulatedHandle:
+    """
+    A visa handle simulating a QDac, that answers every command of a write
+    with one line, like the instrument does. The currents are 0.5 uA times
+    the channel number, channel 3 is in the 1 V range.
+    """
+    def __init__(self):
+        self.commands = []
+        self.voltages = {chan: 0.0 for chan in range(1, 49)}
+        self.ranges = {chan: 'X 1' for chan in range(1, 49)}
+        self.ranges[3] = 'X 0.1'
+        self._output = deque()
+
+    def respond(self, cmd):
+        words = cmd.split()
+        if words[0] == 'status':
+            # the channels come in a somewhat peculiar order
+            return (['Software Version: 1.07',
+                     'Channel\tOut V\t\tVoltage range\tCurrent range', ''] +
+                    ['{}\t{:f}\t\t{}\t\thi cur'.format(chan,
+                                                       self.voltages[chan],
+                                                       self.ranges[chan])
+                     for chan in sorted(self.voltages, reverse=True)])
+        if words[0] == 'get':
+            return ['{}'.format(0.5 * int(words[1]))]
+        if words[0] == 'set':
+            self.voltages[int(words[1])] = float(words[2])
+        return ['']
+
+    def write(self, cmd):
+        self.commands.append(cmd)
+        for command in cmd.split(';'):
+            self._output.extend(self.respond(command))
+        return len(cmd), 0
+
+    def query(self, cmd):
+        self.write(cmd)
+        return self.read()
+
+    def read(self):
+        return self._output.popleft()
+
+    def clear(self):
+        self._output.clear()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def qdac():
+    def set_address(self, address):
+        self.visa_handle = SimulatedHandle()
+        self._address = address
+
+    with patch.object(VisaInstrument, 'set_address', set_address):
+        instrument = QDac('qdac', 'simulated', update_currents=False)
+    instrument.visa_handle.commands.clear()
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_set_voltages(qdac):
+    for chan in (1, 2, 3):
+        qdac.channels[chan - 1].slope.set(1)
+    qdac.ch02.sync.set(1)
+    qdac.visa_handle.voltages[2] = 0.25
+
+    qdac._set_voltages([4, 1, 2, 3], [0.5, 0.5, 0.75, 0.05])
+
+    # the ramps take as long as the longest one at 1 V/s: 0.5 s
+    assert qdac.visa_handle.commands == [
+        'status',
+        'wav 4 0 0 0;set 4 0.500000;'
+        'wav 1 1 0.5 0.0;'
+        'syn 1 1 0 10.0;wav 2 1 0.5 0.25;'
+        'wav 3 1 0.5 0.0;'
+        'fun 1 3 500.0 100 1']
+    assert qdac._assigned_fgs == {1: 1, 2: 1, 3: 1}
+
+    # setting a voltage right away frees the channel
+    qdac.ch03.slope.set('Inf')
+    qdac.visa_handle.commands.clear()
+    qdac._set_voltages([5, 3], [0.1, 0.05])
+    assert qdac.visa_handle.commands == ['wav 5 0 0 0;set 5 0.100000;'
+                                         'wav 3 0 0 0;set 3 0.500000']
+    assert qdac._assigned_fgs == {1: 1, 2: 1}
+
+
+def test_ramp_voltages(qdac):
+    ramptime = qdac.ramp_voltages([5, 6], [1, -1], 2.0)
+    assert ramptime == 2.0
+    assert qdac.visa_handle.commands == [
+        'status', 'wav 5 1 1.0 0.0;wav 6 1 -1.0 0.0;fun 1 3 2000.0 100 1']
+    assert qdac.ch05.v.get_latest() == 1
+    assert qdac.ch06.v.get_latest() == -1
+
+    # function generator 1 is still ramping channels 5 and 6
+    qdac.visa_handle.commands.clear()
+    qdac.ramp_voltages([3, 6], [0.1, 0], 1.0, v_startlist=[0.05, -1])
+    assert qdac.visa_handle.commands == [
+        'wav 3 2 0.5 0.5;wav 6 2 1 -1;fun 2 3 1000.0 100 1']
+    assert qdac._assigned_fgs == {5: 1, 3: 2, 6: 2}
+
+    with pytest.raises(ValueError):
+        qdac.ramp_voltages([1, 2], [1], 1.0)
+    with pytest.raises(ValueError):
+        qdac.ramp_voltages([1], [1], 1.0, v_startlist=[0, 0])
+
+
+def test_ramp_commands(qdac):
+    assert qdac._ramp_commands([1, 2], [0, 0.5], [1, 0], 0.5) == [
+        'wav 1 1 1 0', 'wav 2 1 -0.5 0.5', 'fun 1 3 500.0 100 1']
+
+    # all function generators but the 8th are in use by other channels
+    qdac._assigned_fgs = {chan: chan - 10 for chan in range(11, 18)}
+    assert qdac._ramp_commands([1], [0], [1], 0.5)[-1] == \
+        'fun 8 3 500.0 100 1'
+    qdac._assigned_fgs[18] = 8
+    with pytest.raises(RuntimeError):
+        qdac._ramp_commands([1], [0], [1], 0.5)
+
+    # too short ramps are not ramps
+    assert qdac._ramp_commands([1, 2], [0, 0], [1, 0.5], 0.001) == [
+        'wav 1 0 0 0;set 1 1.000000', 'wav 2 0 0 0;set 2 0.500000']
+
+
+def test_read_states(qdac):
+    qdac.visa_handle.voltages[2] = 0.25
+    qdac.visa_handle.voltages[3] = 0.5
+
+    states = qdac.read_states([2, 3], readcurrents=True)
+    assert qdac.visa_handle.commands == ['status', 'get 2;get 3']
+    assert states == {
+        2: {'v': 0.25, 'vrange': 0, 'irange': '100 muA', 'i': 1e-6},
+        3: {'v': 0.05, 'vrange': 1, 'irange': '100 muA', 'i': 1.5e-6}}
+
+    qdac.visa_handle.commands.clear()
+    states = qdac.read_states(readcurrents=False)
+    assert qdac.visa_handle.commands == ['status']
+    assert sorted(states) == list(range(1, 49))
+    assert 'i' not in states[1]
+
+    with pytest.raises(ValueError):
+        qdac.read_states([49])
+
+
+def test_ask_many(qdac):
+    assert qdac._ask_many(['get 3', 'get 10']) == ['1.5', '5.0']
+    assert qdac.visa_handle.commands == ['get 3;get 10']
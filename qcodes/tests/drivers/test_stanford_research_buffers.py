@@ -0,0 +1,203 @@
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from qcodes.instrument.visa import VisaInstrument
+from qcodes.instrument_drivers.stanford_research.SR830 import SR830
+from qcodes.instrument_drivers.stanford_research.SR860 import SR860
+
+
+class SimulatedHandle:
+    """
+    A visa handle simulating the data buffer of a lock-in, that acquires
+    ``step`` more points every time it is polled for the number of acquired
+    points.
+    """
+    def __init__(self, step):
+        self.step = step
+        self.n_stored = 0
+        self.running = False
+        self.commands = []
+        self._output = bytearray()
+        self.capture_length_in_kb = 2
+
+    def respond(self, cmd):
+        if cmd == '*IDN?':
+            return 'Stanford_Research_Systems,SR8x,s/n0,ver1.0'
+        if cmd in ('ISRC?', 'SRAT ?'):
+            return '0'
+        if cmd == 'CAPTURERATEMAX?':
+            return '1.25e6'
+        if cmd == 'CAPTURECFG?':
+            return '1'  # X,Y
+        if cmd == 'CAPTURELEN?':
+            return str(self.capture_length_in_kb)
+        if cmd in ('SPTS ?', 'CAPTUREBYTES?'):
+            if self.running:
+                self.n_stored += self.step
+            if cmd == 'CAPTUREBYTES?':
+                # a single capture stops when the buffer is full
+                self.n_stored = min(self.n_stored,
+                                    1024 * self.capture_length_in_kb)
+            return str(self.n_stored)
+        if cmd in ('REST', 'CAPTURESTART ONE, IMM'):
+            self.n_stored = 0
+        if cmd in ('STRT', 'CAPTURESTART ONE, IMM'):
+            self.running = True
+        if cmd in ('PAUS', 'CAPTURESTOP'):
+            self.running = False
+        if cmd.startswith('CAPTURELEN '):
+            self.capture_length_in_kb = int(cmd.split()[1])
+
+        match = re.match(r'TRCL \? (\d), (\d+), (\d+)', cmd)
+        if match:
+            channel, start, npts = map(int, match.groups())
+            assert start + npts <= self.n_stored
+            return trcl_points(channel, start, npts).tobytes()
+        match = re.match(r'CAPTUREGET\? (\d+), (\d+)', cmd)
+        if match:
+            offset, size = (1024 * int(group) for group in match.groups())
+            captured = np.zeros(self.capture_length_in_kb * 256, '<f4')
+            captured[:self.n_stored // 4] = np.arange(1, self.n_stored // 4
+                                                      + 1)
+            data = captured.tobytes()[offset:offset + size]
+            return b'#%d%d%s' % (len(str(len(data))), len(data), data)
+        return None
+
+    def write(self, cmd):
+        self.commands.append(cmd)
+        response = self.respond(cmd)
+        if isinstance(response, str):
+            response = (response + '\n').encode()
+        if response is not None:
+            self._output += response
+        return len(cmd), 0
+
+    def query(self, cmd):
+        self.write(cmd)
+        return self.read()
+
+    def read(self):
+        end = self._output.index(b'\n')
+        line = bytes(self._output[:end])
+        del self._output[:end + 1]
+        return line.decode()
+
+    def read_raw(self):
+        data = bytes(self._output)
+        self._output.clear()
+        return data
+
+    def read_bytes(self, count):
+        data = bytes(self._output[:count])
+        del self._output[:count]
+        return data
+
+    def clear(self):
+        self._output.clear()
+
+    def close(self):
+        pass
+
+
+def trcl_points(channel, start, npts):
+    """The TRCL response of the simulated SR830: (mantissa, exponent)'s"""
+    index = np.arange(start, start + npts)
+    mantissa = (index + 1) * (3 if channel == 1 else -5)
+    exponent = 124 + index % 3
+    return np.stack([mantissa, exponent], axis=1).astype('<i2')
+
+
+def simulate(instrument_class, step, **kwargs):
+    def set_address(self, address):
+        self.visa_handle = SimulatedHandle(step)
+        self._address = address
+
+    with patch.object(VisaInstrument, 'set_address', set_address):
+        return instrument_class('lockin', 'simulated', **kwargs)
+
+
+@pytest.fixture
+def sr830():
+    instrument = simulate(SR830, step=7)
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+@pytest.fixture
+def sr860():
+    instrument = simulate(SR860, step=4 * 2 * 100)
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_sr830_read_buffer(sr830):
+    sr830.visa_handle.n_stored = 10
+    points = trcl_points(2, 3, 5)
+    np.testing.assert_array_equal(sr830.read_buffer(2, 3, 5),
+                                  points[:, 0] * 2.0**(points[:, 1] - 124))
+
+
+def test_sr830_stream_buffer(sr830):
+    handle = sr830.visa_handle
+    handle.commands.clear()
+    chunks = list(sr830.stream_buffer(npts=30, poll_interval=0))
+
+    assert [len(chunk['index']) for chunk in chunks] == [7, 7, 7, 7, 2]
+    index = np.concatenate([chunk['index'] for chunk in chunks])
+    np.testing.assert_array_equal(index, np.arange(30))
+    for channel in (1, 2):
+        data = np.concatenate([chunk['ch{}'.format(channel)]
+                               for chunk in chunks])
+        np.testing.assert_array_equal(data, sr830.read_buffer(channel, 0,
+                                                              30))
+    assert handle.commands[:2] == ['REST', 'STRT']
+    assert 'PAUS' in handle.commands
+    assert not handle.running
+
+
+def test_sr830_stream_buffer_stopped_early(sr830):
+    chunks = sr830.stream_buffer(channels=(1,), poll_interval=0)
+    chunk = next(chunks)
+    assert set(chunk) == {'index', 'ch1'}
+    assert sr830.visa_handle.running
+    chunks.close()
+    assert not sr830.visa_handle.running
+
+
+def test_sr830_stream_buffer_too_long(sr830):
+    with pytest.raises(ValueError):
+        next(sr830.stream_buffer(npts=SR830.BUFFER_SIZE + 1))
+
+
+def test_sr86x_stream_capture(sr860):
+    handle = sr860.visa_handle
+    n_samples = 1000
+    chunks = list(sr860.buffer.stream_capture(n_samples, poll_interval=0))
+
+    assert len(chunks) > 1
+    index = np.concatenate([chunk['index'] for chunk in chunks])
+    np.testing.assert_array_equal(index, np.arange(n_samples))
+    values = np.arange(1, 2 * n_samples + 1).reshape(-1, 2)
+    for name, column in zip(('X', 'Y'), values.T):
+        data = np.concatenate([chunk[name] for chunk in chunks])
+        np.testing.assert_array_equal(data, column)
+    assert 'CAPTURESTART ONE, IMM' in handle.commands
+    assert handle.commands[-1] == 'CAPTURESTOP'
+
+
+def test_sr86x_get_capture_data(sr860):
+    handle = sr860.visa_handle
+    handle.capture_length_in_kb = 128
+    handle.n_stored = 128 * 1024
+    data = sr860.buffer.get_capture_data(10000)
+
+    values = np.arange(1, 20001).reshape(-1, 2)
+    np.testing.assert_array_equal(data['Y'], values[:, 1])
+    assert data['Y'].dtype == np.float64
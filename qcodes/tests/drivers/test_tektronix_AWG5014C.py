@@ -1,7 +1,13 @@
+import re
+
 import pytest
 import numpy as np
 
-from qcodes.instrument_drivers.tektronix.AWG5014 import Tektronix_AWG5014
+from qcodes.instrument_drivers.tektronix.AWG5014 import (
+    Tektronix_AWG5014, _pack_waveform_array)
+from qcodes.instrument_drivers.tektronix.waveform_cache import WaveformCache
+from qcodes.instrument_drivers.tektronix.AWGFileParser import (
+    _unpacker, parse_awg_file)
 import qcodes.instrument.sims as sims
 visalib = sims.__file__.replace('__init__.py', 'Tektronix_AWG5014C.yaml@sim')
 
@@ -60,3 +66,120 @@ def test_make_awg_file(awg):
                                 preservechannelsettings=False)
 
     assert len(awgfile) > 0
+
+
+def test_pack_unpack_waveform():
+
+    N = 1000
+
+    waveform = np.random.uniform(-1, 1, N)
+    waveform[:2] = [-1, 1]
+    m1 = np.random.randint(0, 2, N)
+    m2 = np.random.randint(0, 2, N)
+
+    package = _pack_waveform_array(waveform, m1, m2)
+    assert package.dtype == np.uint16
+    assert package[0] & 0x3fff == 0
+    assert package[1] & 0x3fff == 2 * 8191
+
+    wf, um1, um2 = _unpacker(package)
+    # packing and unpacking scale the waveform slightly differently
+    assert np.allclose(wf, waveform, atol=3/8192)
+    assert np.array_equal(um1, m1)
+    assert np.array_equal(um2, m2)
+
+    with pytest.raises(TypeError):
+        _pack_waveform_array(waveform, m1 + 1, m2)
+    with pytest.raises(TypeError):
+        _pack_waveform_array(2 * waveform, m1, m2)
+
+
+def test_awg_file_round_trip(awg, tmp_path):
+
+    N = 50
+    n_elements = 3
+
+    waveforms = [[np.random.uniform(-1, 1, N) for _ in range(n_elements)]
+                 for _ in range(2)]
+    m1s = [[np.random.randint(0, 2, N) for _ in range(n_elements)]
+           for _ in range(2)]
+    m2s = [[np.random.randint(0, 2, N) for _ in range(n_elements)]
+           for _ in range(2)]
+    nreps = [1, 3, 2]
+    trig_waits = [0, 1, 0]
+    goto_states = [2, 3, 1]
+    jump_tos = [0, 0, 1]
+
+    awgfile = awg.make_awg_file(waveforms, m1s, m2s, nreps, trig_waits,
+                                goto_states, jump_tos, channels=[1, 3],
+                                preservechannelsettings=False)
+    path = tmp_path / 'sequence.awg'
+    path.write_bytes(awgfile)
+
+    (wfms, pm1s, pm2s, pnreps, ptrig_waits, pgoto_states, pjump_tos,
+     channels), _ = parse_awg_file(str(path))
+
+    assert channels == [1, 3]
+    assert np.allclose(wfms, waveforms, atol=3/8192)
+    assert np.array_equal(pm1s, m1s)
+    assert np.array_equal(pm2s, m2s)
+    assert pnreps == nreps
+    assert ptrig_waits == trig_waits
+    assert pgoto_states == goto_states
+    assert pjump_tos == jump_tos
+
+
+class FakeWaveformList:
+    """
+    The waveform list of an AWG5014, answering the queries of
+    update_waveforms and recording the waveforms written to it.
+    """
+    def __init__(self, lengths):
+        self.lengths = lengths
+        self.queried = []
+        self.written = []
+
+    def ask(self, cmd):
+        name = re.match(r'WLISt:WAVeform:LENGth\? "(\w+)"', cmd).group(1)
+        self.queried.append(name)
+        return str(self.lengths[name])
+
+    def write_raw(self, message):
+        self.written.append(
+            re.match(rb'WLISt:WAVeform:DATA "(\w+)"', message).group(1)
+            .decode())
+
+
+def test_update_waveforms():
+    N = 20
+    waveforms = [[np.linspace(-1, 1, N), np.zeros(N)]]
+    markers = [[np.zeros(N), np.zeros(N)]]
+
+    # an instrument without a connection, the waveform list is all it needs
+    awg = Tektronix_AWG5014.__new__(Tektronix_AWG5014)
+    awg.name = 'awg'
+    awg.waveform_cache = WaveformCache()
+    awg.visa_handle = wlist = FakeWaveformList({'wfm001ch1': N,
+                                                'wfm002ch1': N})
+    awg.ask = wlist.ask
+
+    assert awg.update_waveforms(waveforms, markers, markers) == [
+        'wfm001ch1', 'wfm002ch1']
+    assert wlist.written == ['wfm001ch1', 'wfm002ch1']
+
+    # only the changed waveform is queried and sent
+    wlist.queried.clear()
+    wlist.written.clear()
+    waveforms[0][1] = np.ones(N)
+    assert awg.update_waveforms(waveforms, markers, markers) == [
+        'wfm002ch1']
+    assert wlist.queried == wlist.written == ['wfm002ch1']
+
+    # a waveform of another length would be unloaded from the sequence
+    wlist.written.clear()
+    waveforms[0][0] = np.zeros(N + 1)
+    waveforms[0][1] = np.zeros(N)
+    markers = [[np.zeros(N + 1), np.zeros(N)]]
+    with pytest.raises(ValueError, match='make_send_and_load_awg_file'):
+        awg.update_waveforms(waveforms, markers, markers)
+    assert wlist.written == []
@@ -9,6 +9,7 @@ from lxml import etree
 
 from qcodes.instrument_drivers.tektronix.AWG70002A import AWG70002A
 from qcodes.instrument_drivers.tektronix.AWG70000A import AWG70000A
+import qcodes.instrument_drivers.tektronix.AWG70000A as awg70000a_module
 import qcodes.instrument.sims as sims
 import qcodes.tests.drivers.auxiliary_files as auxfiles
 
@@ -235,3 +236,69 @@ def test_makeSEQXFile(awg2, random_wfm_m1_m2_package):
     seqxfile = awg2.makeSEQXFile(trig_waits, nreps, event_jumps,
                                  event_jump_to, go_to, wfms,
                                  amplitudes, seqname)
+
+
+def _seqx_entries(seqx):
+    with zipfile.ZipFile(BytesIO(seqx)) as archive:
+        return [(info.filename, archive.read(info))
+                for info in archive.infolist()]
+
+
+def test_makeSEQXFile_in_processes(monkeypatch, random_wfm_m1_m2_package):
+    """
+    Test that the .seqx file is the same, whether it is made in a process
+    pool or not and whether it is returned or written to a file
+    """
+    monkeypatch.setattr(awg70000a_module, '_make_timestamp',
+                        lambda: '2019-01-01T12:00:00.000+00:00')
+
+    seqlen = 5
+    chans = 2
+    wfms = [[random_wfm_m1_m2_package() for i in range(seqlen)]
+            for j in range(chans)]
+    args = ([0]*seqlen, [1]*seqlen, [0]*seqlen, [0]*seqlen, [0]*seqlen,
+            wfms, [0.5]*chans, 'testseq')
+
+    seqx = AWG70000A.makeSEQXFile(*args)
+    entries = _seqx_entries(seqx)
+    assert [name for name, _ in entries][:3] == ['Sequences/testseq.sml',
+                                                 'Waveforms/wfmch1pos1.wfmx',
+                                                 'Waveforms/wfmch1pos2.wfmx']
+    assert entries[1][1] == AWG70000A.makeWFMXFile(wfms[0][0], 0.5)
+
+    assert _seqx_entries(AWG70000A.makeSEQXFile(*args,
+                                                processes=2)) == entries
+    with BytesIO() as file:
+        assert AWG70000A.makeSEQXFile(*args, processes=2, file=file) is None
+        assert _seqx_entries(file.getvalue()) == entries
+
+
+def test_seqxfile_from_fs_in_processes(monkeypatch, forged_sequence):
+    monkeypatch.setattr(awg70000a_module, '_make_timestamp',
+                        lambda: '2019-01-01T12:00:00.000+00:00')
+    make_seqx = AWG70000A.make_SEQX_from_forged_sequence
+
+    entries = _seqx_entries(make_seqx(forged_sequence, [10, 10, 10],
+                                      'myseq'))
+    assert _seqx_entries(make_seqx(forged_sequence, [10, 10, 10], 'myseq',
+                                   processes=2)) == entries
+
+
+def test_WFMXFileBinaryData():
+    wfm = np.linspace(-0.25, 0.25, 2400)
+    m1 = np.random.randint(0, 2, 2400)
+    m2 = np.random.randint(0, 2, 2400)
+    data = np.array([wfm, m1, m2])
+
+    binary = AWG70000A._makeWFMXFileBinaryData(data, amplitude=0.5)
+
+    assert np.array_equal(np.frombuffer(binary[:4*2400], dtype='<f4'),
+                          (4 * wfm).astype(np.float32))
+    assert np.array_equal(np.frombuffer(binary[4*2400:], dtype=np.uint8),
+                          m1 + 2 * m2)
+    # the markers of the caller are left alone
+    assert np.array_equal(data[1], m1)
+
+    data[1, 0] = -3
+    with pytest.raises(ValueError):
+        AWG70000A._makeWFMXFileBinaryData(data, 0.5)
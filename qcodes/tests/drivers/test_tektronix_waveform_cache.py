@@ -0,0 +1,127 @@
+from io import BytesIO
+import zipfile
+
+import numpy as np
+import pytest
+
+from qcodes.instrument_drivers.tektronix.AWG70000A import AWG70000A
+from qcodes.instrument_drivers.tektronix.waveform_cache import (
+    WaveformCache, content_hash)
+
+
+def test_content_hash():
+    wfm = np.linspace(-1, 1, 100)
+
+    assert content_hash(wfm) == content_hash(wfm.copy())
+    assert content_hash(wfm) != content_hash(wfm[::-1])
+    # the hash accounts for the type, the shape and the settings
+    assert content_hash(wfm) != content_hash(wfm.astype(np.float32))
+    assert content_hash(wfm) != content_hash(wfm.reshape(10, 10))
+    assert content_hash(wfm, amplitude=1) != content_hash(wfm, amplitude=2)
+    assert (content_hash(wfm, amplitude=1, offset=0) ==
+            content_hash(wfm, offset=0, amplitude=1))
+    # a view hashes like its content
+    assert content_hash(wfm[::2]) == content_hash(wfm[::2].copy())
+
+
+def test_encode_only_once():
+    cache = WaveformCache()
+    calls = []
+
+    def encoder():
+        calls.append(1)
+        return b'encoded'
+
+    assert cache.encode('key', encoder) == b'encoded'
+    assert cache.encode('key', encoder) == b'encoded'
+    assert len(calls) == 1
+
+
+def test_encode_drops_least_recently_used():
+    cache = WaveformCache(max_encoded_bytes=250)
+
+    for key in 'abc':
+        cache.encode(key, lambda: np.zeros(10, dtype=np.uint64))
+    # a is used again, so b is the least recently used
+    cache.encode('a', lambda: pytest.fail('a was dropped'))
+    cache.encode('d', lambda: np.zeros(10, dtype=np.uint64))
+
+    encoded = []
+    cache.encode('b', lambda: encoded.append('b') or b'')
+    assert encoded == ['b']
+
+
+def test_encode_without_keeping():
+    cache = WaveformCache(max_encoded_bytes=0)
+    calls = []
+
+    def encoder():
+        calls.append(1)
+        return b'encoded'
+
+    assert cache.encode('key', encoder) == b'encoded'
+    assert cache.encode('key', encoder) == b'encoded'
+    assert len(calls) == 2
+    assert 'key' not in cache
+
+
+def test_uploaded_and_sync():
+    cache = WaveformCache()
+    cache.mark_uploaded('wfm1', 'key1')
+    cache.mark_uploaded('wfm2', 'key2')
+
+    assert cache.is_uploaded('wfm1', 'key1')
+    assert not cache.is_uploaded('wfm1', 'key2')
+    assert not cache.is_uploaded('wfm3', 'key1')
+
+    # the instrument lost wfm2
+    assert cache.sync(['wfm1', 'sine']) == ['wfm2']
+    assert cache.names == ['wfm1']
+    assert not cache.is_uploaded('wfm2', 'key2')
+
+    cache.forget('wfm1')
+    assert cache.names == []
+    cache.mark_uploaded('wfm1', 'key1')
+    cache.clear()
+    assert not cache.is_uploaded('wfm1', 'key1')
+
+
+def test_makeSEQXFile_with_cache(monkeypatch):
+    seqlen = 4
+    wfms = [[np.array([0.2 * np.random.rand(2400) - 0.1,
+                       np.random.randint(0, 2, 2400),
+                       np.random.randint(0, 2, 2400)])
+             for _ in range(seqlen)] for _ in range(2)]
+    args = ([0] * seqlen, [1] * seqlen, [0] * seqlen, [0] * seqlen,
+            [0] * seqlen, wfms, [0.5, 1.0], 'testseq')
+
+    make_wfmx = AWG70000A.makeWFMXFile
+    encoded = []
+
+    def counting_make_wfmx(data, amplitude, **kwargs):
+        encoded.append(amplitude)
+        return make_wfmx(data, amplitude, **kwargs)
+
+    monkeypatch.setattr(AWG70000A, 'makeWFMXFile', counting_make_wfmx)
+
+    def contents(seqx):
+        with zipfile.ZipFile(BytesIO(seqx)) as bundle:
+            return {name: bundle.read(name) for name in bundle.namelist()}
+
+    cache = WaveformCache()
+    first = contents(AWG70000A.makeSEQXFile(*args, waveform_cache=cache))
+    assert len(encoded) == 2 * seqlen
+
+    # only the changed waveform is encoded again
+    wfms[1][2] = wfms[1][2].copy()
+    wfms[1][2][0] *= -1
+    second = contents(AWG70000A.makeSEQXFile(*args, waveform_cache=cache))
+    assert encoded[2 * seqlen:] == [1.0]
+    assert first.keys() == second.keys()
+    changed = [name for name in first if name.startswith('Waveforms')
+               and first[name] != second[name]]
+    assert changed == ['Waveforms/wfmch2pos3.wfmx']
+
+    # without a cache, everything is encoded
+    AWG70000A.makeSEQXFile(*args)
+    assert len(encoded) == 4 * seqlen + 1
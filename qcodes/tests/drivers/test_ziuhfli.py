@@ -0,0 +1,157 @@
+import sys
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+if 'zhinst' not in sys.modules:
+    sys.modules['zhinst.utils'] = MagicMock(name='zhinst.utils')
+    sys.modules['zhinst'] = MagicMock(name='zhinst')
+
+import qcodes.instrument_drivers.ZI.ZIUHFLI as ziuhfli_module
+from qcodes.instrument_drivers.ZI.ZIUHFLI import ZIUHFLI, Scope
+
+DEVICE = 'dev2235'
+
+
+class FakeScopeModule:
+    """
+    A stand-in for the scopeModule of the data server, that acquires the
+    segments of every acquisition in shots of shot_segments segments.
+    """
+    def __init__(self, segments, length, shot_segments):
+        self.segments = segments
+        self.length = length
+        self.shot_segments = shot_segments
+        self.executed = 0
+        self.finished = 0
+
+    def wave(self, acquisition):
+        points = np.arange(self.segments * self.length, dtype=float)
+        return np.stack([points + 1e6 * acquisition,
+                         -points - 1e6 * acquisition])
+
+    def execute(self):
+        self.executed += 1
+
+    def progress(self):
+        return np.array([1.])
+
+    def get(self, path):
+        return {'error': [0]}
+
+    def read(self):
+        wave = self.wave(self.executed)
+        shot_length = self.shot_segments * self.length
+        records = [[{'wave': wave[:, start:start + shot_length]}]
+                   for start in range(0, wave.shape[1], shot_length)]
+        return {DEVICE: {'scopes': {'0': {'wave': records}}}}
+
+    def finish(self):
+        self.finished += 1
+
+    def set(self, *args):
+        pass
+
+    def subscribe(self, path):
+        pass
+
+    def unsubscribe(self, path):
+        pass
+
+    def clear(self):
+        pass
+
+
+@pytest.fixture
+def uhfli():
+    with patch.object(ziuhfli_module.zhinst.utils, 'create_api_session',
+                      return_value=(MagicMock(), DEVICE, MagicMock())):
+        instrument = ZIUHFLI('uhfli', DEVICE)
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def prepare(uhfli, segments, length, shot_segments, channels=3):
+    settings = {'scope_channels': channels, 'scope_segments': 'ON',
+                'scope_segments_count': segments, 'scope_length': length,
+                'scope_duration': 1e-3, 'scope_trig_holdoffmode': 's',
+                'scope_trig_holdoffseconds': 0}
+    for name, value in settings.items():
+        parameter = uhfli.parameters[name]
+        parameter._save_val(value)
+        parameter.get = lambda value=value: value
+    uhfli.scope = FakeScopeModule(segments, length, shot_segments)
+    uhfli.scope_correctly_built = True
+    return uhfli.scope
+
+
+@pytest.mark.parametrize('shot_segments', [1, 3, 12])
+def test_scopedataparser(shot_segments):
+    scope = FakeScopeModule(12, 100, shot_segments)
+    wave = scope.wave(0).reshape(2, 12, 100)
+
+    ch1, ch2 = Scope._scopedataparser(scope.read(), DEVICE, 100, 12,
+                                      (True, True))
+    np.testing.assert_array_equal(ch1, wave[0])
+    np.testing.assert_array_equal(ch2, wave[1])
+
+    out = np.empty((12, 1, 100))
+    ch1, ch2 = Scope._scopedataparser(scope.read(), DEVICE, 100, 12,
+                                      (False, True), out=out)
+    assert ch1 is None
+    assert np.shares_memory(ch2, out)
+    np.testing.assert_array_equal(ch2, wave[1])
+
+
+def test_scopedataparser_wrong_length():
+    scope = FakeScopeModule(12, 100, 3)
+    # the last shot of 3 segments starts at segment 9 of 10
+    with pytest.raises(ValueError, match='1200 points does not fit 10'):
+        Scope._scopedataparser(scope.read(), DEVICE, 100, 10, (True, True))
+    with pytest.raises(ValueError):
+        Scope._scopedataparser(scope.read(), DEVICE, 100, 13, (True, True))
+    with pytest.raises(ValueError):
+        Scope._scopedataparser(scope.read(), DEVICE, 120, 10, (True, True))
+
+
+def test_get_reuses_buffers(uhfli):
+    scope = prepare(uhfli, segments=8, length=50, shot_segments=2)
+
+    first = uhfli.Scope.get()
+    second = uhfli.Scope.get()
+    assert not np.shares_memory(first[0], second[0])
+
+    uhfli.Scope.reuse_buffers = True
+    data = [uhfli.Scope.get() for _ in range(3)]
+    assert np.shares_memory(data[0][0], data[2][0])
+    assert not np.shares_memory(data[1][0], data[2][0])
+    np.testing.assert_array_equal(data[1][1],
+                                  scope.wave(4)[1].reshape(8, 50))
+    np.testing.assert_array_equal(data[2][0],
+                                  scope.wave(5)[0].reshape(8, 50))
+    assert scope.executed == scope.finished == 5
+
+
+def test_acquisitions_overlap(uhfli):
+    scope = prepare(uhfli, segments=8, length=50, shot_segments=8,
+                    channels=1)
+
+    for index, (ch1, ch2) in enumerate(uhfli.Scope.acquisitions(3)):
+        # the next acquisition has been started before this one is parsed
+        assert scope.executed == min(index + 2, 3)
+        assert ch2 is None
+        np.testing.assert_array_equal(ch1, scope.wave(index + 1)[0]
+                                      .reshape(8, 50))
+    assert scope.executed == scope.finished == 3
+
+
+def test_acquisitions_stopped_early(uhfli):
+    scope = prepare(uhfli, segments=8, length=50, shot_segments=8)
+
+    acquisitions = uhfli.Scope.acquisitions(5)
+    next(acquisitions)
+    acquisitions.close()
+    assert scope.executed == scope.finished == 2
@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset.measurements import Measurement
+from qcodes.instrument.parameter import Parameter
+from qcodes.instrument.sweep_values import AdaptiveSweep
+from qcodes.loops import Loop
+from qcodes.utils.adaptive import Learner1D, Learner2D, run_adaptive
+from qcodes.utils.validators import Numbers
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+
+
+def step(x):
+    return np.tanh((x - 0.3) / 0.01)
+
+
+def ridge(x, y):
+    return np.exp(-((x - y) / 0.02) ** 2)
+
+
+def test_learner1d_starts_with_bounds():
+    learner = Learner1D((2, -1))
+    assert learner.ask() == 2
+    learner.tell(2, 0)
+    assert learner.ask() == -1
+    learner.tell(-1, 0)
+    assert learner.ask() == 0.5
+
+
+def test_learner1d_refines_step():
+    learner = Learner1D((0, 1))
+    for _ in range(60):
+        x = learner.ask()
+        learner.tell(x, step(x))
+    xs = np.array(sorted(learner.data))
+    assert len(xs) == 60
+    near_step = np.sum(np.abs(xs - 0.3) < 0.05)
+    # a uniform grid would only have 6 points there
+    assert near_step > 30
+    assert np.max(np.diff(xs)) <= 0.125
+
+
+def test_learner1d_min_step():
+    learner = Learner1D((0, 1), min_step=0.1)
+    with pytest.raises(RuntimeError):
+        for _ in range(100):
+            x = learner.ask()
+            learner.tell(x, step(x))
+    assert np.min(np.diff(sorted(learner.data))) >= 0.1
+
+
+def test_ask_before_tell_raises():
+    learner = Learner1D((0, 1))
+    x = learner.ask()
+    with pytest.raises(RuntimeError):
+        learner.ask()
+    with pytest.raises(ValueError):
+        learner.tell(x + 0.5, 1)
+
+
+def test_learner2d_refines_ridge():
+    learner = Learner2D(((0, 1), (0, 1)))
+    for _ in range(401):
+        point = learner.ask()
+        learner.tell(point, ridge(*point))
+    points = np.array(list(learner.data))
+    assert len(points) == 401
+    assert np.all((points >= 0) & (points <= 1))
+    near_ridge = np.sum(np.abs(points[:, 0] - points[:, 1]) < 0.1)
+    # a uniform grid would have less than 20% of the points there
+    assert near_ridge > 0.4 * len(points)
+    # the triangulation covers the whole rectangle
+    triangles = learner.triangles
+    ab = triangles[:, 1] - triangles[:, 0]
+    ac = triangles[:, 2] - triangles[:, 0]
+    area = 0.5 * np.abs(np.cross(ab, ac))
+    assert np.isclose(area.sum(), 1)
+
+
+def test_learner2d_only_takes_asked_points():
+    learner = Learner2D(((0, 1), (0, 2)))
+    for _ in range(4):
+        point = learner.ask()
+        learner.tell(point, 0)
+    with pytest.raises(ValueError):
+        learner.tell((0.25, 0.25), 1)
+
+
+def test_adaptive_sweep_in_loop():
+    gate = Parameter('gate', set_cmd=None, get_cmd=None,
+                     vals=Numbers(-1, 2))
+    signal = Parameter('signal', get_cmd=lambda: step(gate.get_latest()))
+
+    with pytest.raises(ValueError):
+        AdaptiveSweep(gate, signal, start=0, stop=3, num=10)
+
+    sweep = AdaptiveSweep(gate, signal, start=0, stop=1, num=40)
+    assert len(sweep) == 40
+    assert sweep.snapshot()['values'][0]['type'] == 'adaptive'
+
+    data = Loop(sweep).each(signal).run_temp()
+    xs = data.gate_set.ndarray
+    assert len(np.unique(xs)) == 40
+    assert xs[0] == 0 and xs[1] == 1
+    assert np.allclose(data.signal.ndarray, step(xs))
+    assert np.sum(np.abs(xs - 0.3) < 0.05) > 15
+
+    # a second run starts over
+    data = Loop(sweep).each(signal).run_temp()
+    assert np.array_equal(data.gate_set.ndarray, xs)
+
+
+def test_adaptive_sweep_feedback():
+    gate = Parameter('gate', set_cmd=None, get_cmd=None)
+    signal = Parameter('signal', get_cmd=None, set_cmd=None)
+    sweep = AdaptiveSweep(gate, signal, start=0, stop=1, num=20)
+    xs = []
+    for x in sweep:
+        xs.append(x)
+        sweep.feedback((len(xs) - 1,), step(x))
+    assert np.sum(np.abs(np.array(xs) - 0.3) < 0.05) > 5
+
+
+@pytest.mark.usefixtures("experiment")
+def test_run_adaptive_2d():
+    x = Parameter('x', set_cmd=None, get_cmd=None)
+    y = Parameter('y', set_cmd=None, get_cmd=None)
+    z = Parameter('z', get_cmd=lambda: ridge(x.get_latest(),
+                                             y.get_latest()))
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y)
+    meas.register_parameter(z, setpoints=(x, y))
+
+    with meas.run() as datasaver:
+        run_adaptive(datasaver, Learner2D(((0, 1), (0, 1))), (x, y), z,
+                     npoints=50)
+    data = datasaver.dataset
+    assert data.number_of_results == 50
+    xs = np.array(data.get_values('x')).ravel()
+    ys = np.array(data.get_values('y')).ravel()
+    zs = np.array(data.get_values('z')).ravel()
+    assert np.allclose(zs, ridge(xs, ys))
+
+    with meas.run() as datasaver:
+        with pytest.raises(ValueError):
+            run_adaptive(datasaver, Learner1D((0, 1)), (x, y), z, npoints=5)
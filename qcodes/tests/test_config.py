@@ -360,3 +360,56 @@ def test_add_and_describe():
                          f"Type: {value_type}. Default: {default}.")
 
         assert desc == expected_desc
+
+
+def test_lookup_snapshot_follows_changes():
+    """
+    Test that lookups by dotted keys see every change of the config
+    """
+    with default_config():
+        cfg = Config()
+        location = cfg['core.db_location']
+        assert cfg.snapshot['core.db_location'] == location
+        assert cfg['core'] is cfg.current_config.core
+
+        cfg['core']['db_location'] = 'changed.db'
+        assert cfg['core.db_location'] == 'changed.db'
+        cfg.core.db_location = 'again.db'
+        assert cfg['core.db_location'] == 'again.db'
+
+        cfg.add('snapshot_key', 1)
+        assert cfg['user.snapshot_key'] == 1
+
+        # nested dicts, however they are added, count their changes too
+        cfg.add('nested', {'inner': {'value': 1}})
+        cfg.current_config.user.update({'updated': {'value': 1}})
+        assert cfg['user.nested.inner.value'] == 1
+        cfg['user']['nested']['inner']['value'] = 2
+        cfg['user']['updated']['value'] = 2
+        assert cfg['user.nested.inner.value'] == 2
+        assert cfg['user.updated.value'] == 2
+
+        cfg.current_config = copy.deepcopy(cfg.current_config)
+        cfg.current_config['core']['db_location'] = location
+        assert cfg['core.db_location'] == location
+
+        cfg.update_config()
+        assert 'user.snapshot_key' not in cfg.snapshot
+        with pytest.raises(TypeError):
+            cfg.snapshot['core.db_location'] = 'read-only'
+        with pytest.raises(KeyError):
+            cfg['core.not_a_key']
+
+
+def test_validator_is_compiled_once():
+    with default_config():
+        cfg = Config()
+        validator = jsonschema.validators.validator_for(cfg.current_schema)
+        with patch.object(validator, 'check_schema') as check_schema:
+            cfg = Config()
+            cfg.validate()
+        check_schema.assert_not_called()
+
+        cfg.current_config['core']['db_debug'] = 'not a boolean'
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            cfg.validate()
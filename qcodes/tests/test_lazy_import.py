@@ -0,0 +1,69 @@
+"""
+Tests of the lazily loaded qcodes namespace. Every test imports qcodes in a
+fresh interpreter, since the test session has imported most of it already.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+import qcodes
+
+# modules that must not be imported just to use the dataset
+GUI_MODULES = ('matplotlib', 'pyqtgraph', 'PyQt5', 'websockets',
+               'qcodes.plots', 'qcodes.monitor', 'qcodes.utils.magic',
+               'IPython', 'h5py', 'zmq', 'qcodes.instrument_drivers')
+
+
+def _imported_modules(code):
+    """The modules imported after running code in a fresh interpreter"""
+    script = code + '\nimport sys, json\nprint(json.dumps(list(sys.modules)))'
+    output = subprocess.check_output([sys.executable, '-c', script],
+                                     stderr=subprocess.DEVNULL)
+    return set(json.loads(output.decode().splitlines()[-1]))
+
+
+def _heavy(modules):
+    return sorted(module for module in modules
+                  if module.split('.')[0] in GUI_MODULES
+                  or any(module.startswith(gui + '.') or module == gui
+                         for gui in GUI_MODULES))
+
+
+@pytest.mark.parametrize('code', ['import qcodes',
+                                  'import qcodes.dataset',
+                                  'import qcodes.dataset.measurements',
+                                  'import qcodes.dataset.data_set'])
+def test_dataset_does_not_import_gui(code):
+    assert _heavy(_imported_modules(code)) == []
+
+
+def test_names_are_imported_on_access():
+    modules = _imported_modules('import qcodes\nqcodes.Instrument')
+    assert 'qcodes.instrument.base' in modules
+    assert 'qcodes.loops' not in modules
+
+
+def test_all_names_resolve():
+    for name in qcodes._lazy_attributes:
+        if name in ('QtPlot', 'MatPlot'):
+            # the plotting libraries are optional
+            continue
+        assert getattr(qcodes, name) is not None, name
+    assert qcodes.validators is qcodes.utils.validators
+    assert qcodes.Parameter is qcodes.instrument.parameter.Parameter
+    assert set(qcodes._lazy_attributes) <= set(dir(qcodes))
+    assert set(qcodes._lazy_attributes) <= set(qcodes.__all__)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        qcodes.not_a_qcodes_name
+
+
+def test_submodules_are_imported_on_access():
+    modules = _imported_modules('import qcodes\nqcodes.loops\n'
+                                'qcodes.instrument_drivers')
+    assert {'qcodes.loops', 'qcodes.instrument_drivers'} <= modules
+    assert {'loops', 'dataset', 'instrument_drivers'} <= set(dir(qcodes))
@@ -0,0 +1,158 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from qcodes import Loop
+from qcodes.dataset.measurements import Measurement
+from qcodes.instrument.parameter import Parameter
+from qcodes.plots.live_plot import LivePlot, _LivePlotServer
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+
+
+class FakePlot:
+    """Records what a LivePlot server draws, in place of a QtPlot"""
+    def __init__(self):
+        self.traces = []
+        self.updates = 0
+
+    def add(self, **kwargs):
+        self.traces.append({'config': kwargs, 'plot_object': None})
+
+    def update_plot(self):
+        self.updates += 1
+
+    def clear(self):
+        self.traces = []
+
+
+@pytest.fixture
+def live_plot():
+    plot = LivePlot(start=False)
+    server = _LivePlotServer(plot._server_connection, FakePlot)
+    try:
+        yield plot, server
+    finally:
+        plot.close()
+
+
+def test_push_line(live_plot):
+    plot, server = live_plot
+    trace = plot.add(x='x', y='y', name='sweep')
+    server.poll()
+    assert server.plot.traces == []
+
+    plot.push(trace, [0, 1], [2, 3])
+    plot.push(trace, 2, 4)
+    server.poll()
+    config, = [t['config'] for t in server.plot.traces]
+    np.testing.assert_array_equal(config['x'], [0, 1, 2])
+    np.testing.assert_array_equal(config['y'], [2, 3, 4])
+    assert config['name'] == 'sweep'
+    assert config['xlabel'] == 'x'
+
+    # many points between two polls give a single redraw
+    for i in range(3, 100):
+        plot.push(trace, i, i + 2)
+    server.poll()
+    server.poll()
+    assert server.plot.updates == 1
+    np.testing.assert_array_equal(config['x'], np.arange(100))
+
+
+def test_push_image(live_plot):
+    plot, server = live_plot
+    trace = plot.add(x='x', y='y', z='z')
+    y, x = np.meshgrid([10, 20, 30], [1, 2], indexing='ij')
+    z = 10 * y + x
+    # an interrupted sweep
+    plot.push(trace, x.ravel()[:5], y.ravel()[:5], z.ravel()[:5])
+    server.poll()
+    config = server.plot.traces[0]['config']
+    np.testing.assert_array_equal(config['x'], [1, 2])
+    np.testing.assert_array_equal(config['y'], [10, 20, 30])
+    expected = z.astype(float)
+    expected[-1, -1] = np.nan
+    np.testing.assert_array_equal(config['z'], expected)
+
+
+def test_clear_and_close(live_plot):
+    plot, server = live_plot
+    trace = plot.add(x='x', y='y')
+    plot.push(trace, 0, 1)
+    server.poll()
+    plot.clear()
+    assert plot.traces == []
+    server.poll()
+    assert server.traces == []
+    assert server.plot.traces == []
+    plot._send('close')
+    server.poll()
+    assert server.closed
+
+
+def test_measurement(experiment, live_plot):
+    plot, server = live_plot
+    x = Parameter('x', label='Gate', unit='V', set_cmd=None, get_cmd=None)
+    y = Parameter('y', label='Current', unit='A', set_cmd=None,
+                  get_cmd=None)
+    plot.add(x=x, y=y)
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y, setpoints=(x,))
+    meas.add_live_plot(plot)
+    # nothing gets written to the database during the run
+    meas.write_period = 1000
+
+    with meas.run() as datasaver:
+        for value in range(5):
+            datasaver.add_result((x, value), (y, 2 * value))
+        server.poll()
+        config = server.plot.traces[0]['config']
+        np.testing.assert_array_equal(config['x'], range(5))
+        np.testing.assert_array_equal(config['y'], range(0, 10, 2))
+        assert (config['xlabel'], config['xunit']) == ('Gate', 'V')
+        assert (config['ylabel'], config['yunit']) == ('Current', 'A')
+
+        # arrays are unrolled into points
+        datasaver.add_result((x, np.arange(5, 8)), (y, np.zeros(3)))
+        server.poll()
+        np.testing.assert_array_equal(config['x'], range(8))
+
+
+def test_loop(live_plot):
+    plot, server = live_plot
+    x = Parameter('x', set_cmd=None, get_cmd=None)
+    y = Parameter('y', set_cmd=None, get_cmd=lambda: x() ** 2)
+    z = Parameter('z', set_cmd=None, get_cmd=lambda: x() + y())
+    loop = Loop(x.sweep(0, 3, num=4)).loop(y.sweep(0, 1, num=3)).each(z)
+    data = loop.get_data_set(location=False)
+    plot.add(data.z)
+    assert data.live_plots == [plot]
+
+    loop.run(quiet=True)
+    server.poll()
+    config = server.plot.traces[0]['config']
+    np.testing.assert_array_equal(config['x'], [0, 0.5, 1])
+    np.testing.assert_array_equal(config['y'], [0, 1, 2, 3])
+    np.testing.assert_array_equal(config['z'], data.z.ndarray)
+
+
+def test_plot_process_stops_on_close():
+    plot = LivePlot(start=False)
+    plot.process = multiprocessing.Process(
+        target=_run_fake_server, args=(plot._server_connection,),
+        daemon=True)
+    plot.process.start()
+    plot.add(x='x', y='y')
+    plot.close()
+    assert not plot.process.is_alive()
+
+
+def _run_fake_server(connection):
+    server = _LivePlotServer(connection, FakePlot)
+    while not server.closed:
+        server.poll()
@@ -2,10 +2,13 @@
 Tests for `qcodes.utils.logger`.
 """
 import pytest
+import io
 import os
 import logging
+import logging.handlers
 from copy import copy
 import qcodes.logger as logger
+from qcodes.logger.records import RecordFileHandler
 import qcodes as qc
 
 TEST_LOG_MESSAGE = 'test log message'
@@ -231,3 +234,90 @@ def test_channels_nomessages(model372):
     logs = [l for l in logs.value.splitlines()
             if '[lakeshore' in l]
     assert len(logs) == 0
+
+
+@pytest.mark.usefixtures("remove_root_handlers")
+def test_record_logger(tmp_path):
+    filename = str(tmp_path / 'qcodes.qclog')
+    root_logger = logging.getLogger()
+    logger.start_record_logger(level=logging.DEBUG, filename=filename)
+    try:
+        handler = logger.get_record_handler()
+        assert isinstance(handler, logging.handlers.QueueHandler)
+        assert handler in root_logger.handlers
+
+        root_logger.debug(TEST_LOG_MESSAGE)
+        logging.getLogger('qcodes.test').info('value: %s', 'ünïcödé\0')
+        try:
+            raise ValueError('not a value')
+        except ValueError:
+            root_logger.exception('failed')
+    finally:
+        logger.stop_record_logger()
+    assert logger.get_record_handler() is None
+    assert handler not in root_logger.handlers
+
+    df = logger.log_analysis.recordfile_to_dataframe(filename)
+    assert list(df.columns) == list(logger.logger.FORMAT_STRING_DICT)
+    # the first record is the one of the setup of the logger itself
+    assert df.message[1] == TEST_LOG_MESSAGE
+    assert df.levelname[1] == 'DEBUG'
+    assert df.funcName[1] == 'test_record_logger'
+    assert df.name[2] == 'qcodes.test'
+    assert df.message[2] == 'value: ünïcödé\0'
+    assert df.message[3].startswith('failed\nTraceback')
+    assert df.message[3].endswith('ValueError: not a value')
+    assert df.lineno[1].isdigit()
+
+
+def test_record_file_matches_text_log(tmp_path):
+    filename = str(tmp_path / 'qcodes.qclog')
+    stream = io.StringIO()
+    text_handler = logging.StreamHandler(stream)
+    text_handler.setFormatter(logger.logger.get_formatter())
+    # a small batch size, to write several blocks
+    record_handler = RecordFileHandler(filename, batch_size=3)
+    test_logger = logging.getLogger('qcodes.test.records')
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(text_handler)
+    test_logger.addHandler(record_handler)
+    try:
+        for i in range(10):
+            test_logger.log(logging.DEBUG if i % 2 else logging.WARNING,
+                            'message %d', i)
+    finally:
+        test_logger.removeHandler(text_handler)
+        test_logger.removeHandler(record_handler)
+        record_handler.close()
+    # a second session appended to the same file
+    record_handler = RecordFileHandler(filename)
+    record_handler.handle(logging.LogRecord('other', logging.INFO, __file__,
+                                            1, 'last', None, None))
+    record_handler.close()
+
+    records = logger.log_analysis.recordfile_to_dataframe(filename)
+    text = logger.log_analysis.log_to_dataframe(stream.getvalue().splitlines())
+    assert len(records) == 11
+    assert records.iloc[:10].equals(text)
+    assert records.iloc[10].tolist()[1:] == ['other', 'INFO', 'test_logger',
+                                             'None', '1', 'last']
+
+
+def test_record_file_interleaved_sessions(tmp_path):
+    # two processes appending to the same file, flushing in turns
+    filename = str(tmp_path / 'qcodes.qclog')
+    handlers = [RecordFileHandler(filename, batch_size=1) for _ in range(2)]
+    for i in range(6):
+        handler = handlers[i % 2]
+        # every handler logs from a site of its own first, so that the same
+        # site code means a different site in each session
+        name = f'session{i % 2}' if i < 2 else 'shared'
+        handler.handle(logging.LogRecord(name, logging.INFO, __file__, i,
+                                         f'message {i}', None, None))
+    for handler in handlers:
+        handler.close()
+
+    records = logger.log_analysis.recordfile_to_dataframe(filename)
+    assert records.message.tolist() == [f'message {i}' for i in range(6)]
+    assert records.name.tolist() == ['session0', 'session1'] + ['shared'] * 4
+    assert records.lineno.tolist() == [str(i) for i in range(6)]
@@ -10,6 +10,7 @@ from qcodes.actions import Task, Wait, BreakIf, _QcodesBreak
 from qcodes.station import Station
 from qcodes.data.data_array import DataArray
 from qcodes.instrument.parameter import Parameter, MultiParameter
+from qcodes.instrument.sweep_values import AdaptiveSweep
 from qcodes.utils.validators import Numbers
 from qcodes.logger.logger import LogCapture
 
@@ -543,3 +544,117 @@ class TestMetaData(TestCase):
         expected['actions'] = [p1.snapshot(), breaker.snapshot()]
 
         self.assertEqual(loop.snapshot(), expected)
+
+
+class BufferedSweepParameter(Parameter):
+    """
+    A manual parameter that can also execute a whole sweep from a list of
+    setpoints, recording what it was asked to do.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.uploaded = []
+        self.n_triggers = 0
+
+    def buffered_upload(self, setpoints, delay):
+        self.uploaded.append((list(setpoints), delay))
+
+    def buffered_trigger(self):
+        self.n_triggers += 1
+        self.set(self.uploaded[-1][0][-1])
+
+
+class BufferedGetter(Parameter):
+    """
+    A parameter returning ``factor`` times the value of ``source``, both point
+    by point and as a buffered acquisition of the last uploaded sweep.
+    """
+    def __init__(self, *args, source, factor=1, n_fetched=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.source = source
+        self.factor = factor
+        self.n_fetched = n_fetched
+        self.n_gets = 0
+        self.armed = []
+
+    def get_raw(self):
+        self.n_gets += 1
+        return self.factor * self.source.get_latest()
+
+    def buffered_arm(self, n_points):
+        self.armed.append(n_points)
+
+    def buffered_fetch(self):
+        setpoints = self.source.uploaded[-1][0]
+        if self.n_fetched is not None:
+            setpoints = setpoints[:self.n_fetched]
+        return self.factor * np.array(setpoints)
+
+
+class TestBufferedLoop(TestCase):
+    def setUp(self):
+        self.sweep = BufferedSweepParameter('sweep', set_cmd=None,
+                                            vals=Numbers(-10, 10))
+        self.meas = BufferedGetter('meas', source=self.sweep, factor=2)
+        self.outer = Parameter('outer', get_cmd=None, set_cmd=None)
+
+    def test_buffered_sweep(self):
+        data = Loop(self.sweep[1:5:1], 0.01).each(self.meas).run_temp()
+
+        self.assertEqual(self.sweep.uploaded, [([1, 2, 3, 4], 0.01)])
+        self.assertEqual(self.sweep.n_triggers, 1)
+        self.assertEqual(self.meas.armed, [4])
+        self.assertEqual(self.meas.n_gets, 0)
+        self.assertEqual(data.sweep_set.tolist(), [1, 2, 3, 4])
+        self.assertEqual(data.meas.tolist(), [2, 4, 6, 8])
+        self.assertEqual(self.sweep.get_latest(), 4)
+
+    def test_nested_buffered_sweep(self):
+        data = Loop(self.outer[0:3:1]).loop(self.sweep[1:3:1]).each(
+            self.meas).run_temp()
+
+        self.assertEqual(self.sweep.n_triggers, 3)
+        self.assertEqual(self.meas.n_gets, 0)
+        self.assertEqual(data.sweep_set.tolist(), [[1, 2]] * 3)
+        self.assertEqual(data.meas.tolist(), [[2, 4]] * 3)
+
+    def test_fallback_to_point_by_point(self):
+        plain = Parameter('plain', get_cmd=lambda: 7)
+        data = Loop(self.sweep[1:4:1]).each(self.meas, plain).run_temp()
+
+        self.assertEqual(self.sweep.n_triggers, 0)
+        self.assertEqual(self.meas.n_gets, 3)
+        self.assertEqual(data.meas.tolist(), [2, 4, 6])
+        self.assertEqual(data.plain.tolist(), [7, 7, 7])
+
+    def test_adaptive_sweep_point_by_point(self):
+        sweep = AdaptiveSweep(self.sweep, self.meas, start=1, stop=3, num=5)
+        data = Loop(sweep).each(self.meas).run_temp()
+
+        self.assertEqual(self.sweep.uploaded, [])
+        self.assertEqual(self.meas.n_gets, 5)
+        self.assertEqual(data.sweep_set.tolist()[:3], [1, 3, 2])
+        self.assertEqual(data.meas.tolist(),
+                         [2 * v for v in data.sweep_set.tolist()])
+
+    def test_buffered_disabled(self):
+        data = Loop(self.sweep[1:4:1]).each(self.meas).run_temp(
+            buffered=False)
+
+        self.assertEqual(self.sweep.n_triggers, 0)
+        self.assertEqual(self.meas.n_gets, 3)
+        self.assertEqual(data.meas.tolist(), [2, 4, 6])
+
+    def test_positional_location_is_not_buffered(self):
+        # the argument after set_active is passed on to get_data_set
+        data = Loop(self.sweep[1:4:1]).each(self.meas).run(
+            False, True, None, False, True, False)
+
+        self.assertIs(data.location, False)
+        self.assertEqual(self.sweep.n_triggers, 1)
+
+    def test_wrong_number_of_points(self):
+        meas = BufferedGetter('meas', source=self.sweep, n_fetched=2)
+        loop = Loop(self.sweep[1:4:1]).each(meas)
+        with self.assertRaises(ValueError):
+            loop.run_temp()
@@ -1,11 +1,13 @@
 """
 Test suite for monitor
 """
+from datetime import timedelta
 from unittest import TestCase
 
 import asyncio
 import json
 import random
+import threading
 import websockets
 
 from qcodes.monitor import monitor
@@ -72,6 +74,95 @@ class TestMonitor(TestCase):
 
         m.stop()
 
+
+class TestStateProducer(TestCase):
+    """
+    Test the producer of the monitor state without a server
+    """
+    def setUp(self):
+        self.a = Parameter("a", unit="V", get_cmd=None, set_cmd=None)
+        self.b = Parameter("b", unit="A", get_cmd=None, set_cmd=None)
+        self.a(1)
+        self.b(2)
+        self.producer = monitor._StateProducer((self.a, self.b), interval=1)
+        for parameter in (self.a, self.b):
+            parameter._update_listeners.add(self.producer)
+
+    def test_full_state(self):
+        state = json.loads(self.producer.full_state())
+        expected = monitor._get_metadata(self.a, self.b)
+        self.assertEqual(state["parameters"], expected["parameters"])
+
+    def test_only_changed_parameters_are_sent(self):
+        self.assertIsNone(self.producer.update())
+
+        self.b(3)
+        self.b(4)
+        delta = json.loads(self.producer.update())
+        group, = delta["parameters"]
+        self.assertEqual(group["instrument"], "Unbound Parameter")
+        self.assertEqual([meta["value"] for meta in group["parameters"]],
+                         ["4"])
+        self.assertIsNone(self.producer.update())
+
+        # the full state is updated as well
+        state = json.loads(self.producer.full_state())
+        values = [meta["value"]
+                  for meta in state["parameters"][0]["parameters"]]
+        self.assertEqual(values, ["1", "4"])
+
+    def test_get_pushes_update(self):
+        self.a.get()
+        delta = json.loads(self.producer.update())
+        self.assertEqual(delta["parameters"][0]["parameters"][0]["name"],
+                         "a")
+
+    def test_outdated_parameters_are_gotten(self):
+        values = iter(range(10))
+        c = Parameter("c", get_cmd=lambda: next(values), max_val_age=1)
+        c.get()
+        producer = monitor._StateProducer((self.a, c), interval=1)
+        c._update_listeners.add(producer)
+        producer.refresh()
+        self.assertIsNone(producer.update())
+
+        c._latest['ts'] -= timedelta(seconds=2)
+        # updating alone does not get the values
+        self.assertIsNone(producer.update())
+        producer.refresh()
+        delta = json.loads(producer.update())
+        meta, = delta["parameters"][0]["parameters"]
+        self.assertEqual((meta["name"], meta["value"]), ("c", "1"))
+        producer.refresh()
+        self.assertIsNone(producer.update())
+
+    def test_outdated_parameters_are_gotten_off_the_loop(self):
+        threads = []
+
+        def get_value():
+            threads.append(threading.current_thread())
+            return 1
+
+        c = Parameter("c", get_cmd=get_value, max_val_age=0)
+        producer = monitor._StateProducer((c,), interval=0.01)
+        threads.clear()
+
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                loop.run_until_complete(
+                    asyncio.wait_for(producer.run(), 0.1, loop=loop))
+        finally:
+            loop.close()
+        self.assertTrue(threads)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_unregistered_producer_is_not_updated(self):
+        self.a._update_listeners.discard(self.producer)
+        self.a(5)
+        self.assertIsNone(self.producer.update())
+
+
 class TestMonitorWithInstr(TestCase):
     """
     Test monitor values from instruments
@@ -144,3 +235,30 @@ class TestMonitorWithInstr(TestCase):
             self.assertEqual(self.param.label, metadata[0]["name"])
 
         loop.run_until_complete(async_test_monitor())
+
+    def test_delta(self):
+        """
+        Test that clients of /delta only get the changed parameters
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        @asyncio.coroutine
+        def async_test_delta():
+            websocket = yield from websockets.connect(
+                f"ws://localhost:{monitor.WEBSOCKET_PORT}/delta")
+
+            # the first message is the full state
+            data = json.loads((yield from websocket.recv()))
+            self.assertEqual(len(data["parameters"]), 2)
+
+            self.param(2)
+            data = json.loads((yield from websocket.recv()))
+            group, = data["parameters"]
+            self.assertEqual(group["instrument"], "Unbound Parameter")
+            meta, = group["parameters"]
+            self.assertEqual(meta["name"], self.param.label)
+            self.assertEqual(meta["value"], "2")
+            yield from websocket.close()
+
+        loop.run_until_complete(async_test_delta())
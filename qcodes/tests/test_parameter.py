@@ -6,7 +6,7 @@ from collections.abc import Iterable
 from unittest import TestCase
 from typing import Tuple
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import numpy as np
 from hypothesis import given, event, settings
@@ -216,6 +216,22 @@ class TestParameter(TestCase):
         self.assertEqual(local_parameter.get_latest(), 2)
         self.assertGreaterEqual(local_parameter.get_latest.get_timestamp(), after_set)
 
+    def test_get_latest_max_val_age(self):
+        counts = iter(range(10))
+        local_parameter = Parameter('test_param', set_cmd=None,
+                                    get_cmd=lambda: next(counts),
+                                    max_val_age=1)
+        self.assertEqual(local_parameter.get_latest.max_val_age, 1)
+
+        # a fresh value is returned without getting it again
+        self.assertEqual(local_parameter.get(), 0)
+        self.assertEqual(local_parameter.get_latest(), 0)
+
+        # an outdated value is gotten again
+        local_parameter._latest['ts'] -= timedelta(seconds=2)
+        self.assertEqual(local_parameter.get_latest(), 1)
+        self.assertEqual(local_parameter.get_latest(), 1)
+
     def test_has_set_get(self):
         # Create parameter that has no set_cmd, and get_cmd returns last value
         gettable_parameter = Parameter('one', set_cmd=False, get_cmd=None)
@@ -9,6 +9,8 @@ from unittest import TestCase, skipIf
 import numpy as np
 import os
 
+from qcodes.data.data_array import DataArray
+
 try:
     from qcodes.plots.pyqtgraph import QtPlot
     if os.environ.get("TRAVISCI"):
@@ -89,3 +91,72 @@ class TestMatPlot(TestCase):
         self.assertIs(returned_handle, line_handle)
         plotM.clear()
         plt.close(plotM.fig)
+
+    @staticmethod
+    def _live_2d_data(ny, nx):
+        y = DataArray(name='y', array_id='y', is_setpoint=True,
+                      preset_data=np.full(ny, np.nan))
+        x = DataArray(name='x', array_id='x', is_setpoint=True,
+                      preset_data=np.full((ny, nx), np.nan), set_arrays=(y,))
+        x.set_arrays = (y, x)
+        z = DataArray(name='z', array_id='z', set_arrays=(y, x),
+                      preset_data=np.full((ny, nx), np.nan))
+        line = DataArray(name='line', array_id='line', set_arrays=(x,),
+                         preset_data=np.full(nx, np.nan))
+        return x, y, z, line
+
+    def _run_live_plot(self, incremental):
+        ny, nx = 6, 5
+        x, y, z, line = self._live_2d_data(ny, nx)
+        plot = MatPlot(interval=0, subplots=2, incremental=incremental)
+        plot[0].add(z)
+        plot[1].add(x=x[0], y=line)
+        meshes = []
+        for i in range(ny):
+            y[i] = i
+            x[i] = np.arange(nx) / 2
+            z[i] = np.arange(nx) * (i - 2)
+            line[:] = np.cos(np.arange(nx) + i)
+            plot.update_plot()
+            meshes.append(plot.traces[0]['plot_object'])
+        plot.fig.canvas.draw()
+        image = np.array(plot.fig.canvas.buffer_rgba())
+        plt.close(plot.fig)
+        return z, meshes, image
+
+    def test_incremental_update(self):
+        z, meshes, image = self._run_live_plot(incremental=True)
+        mesh = meshes[-1]
+        # the mesh is only recreated while the y edges are not known yet
+        self.assertIs(meshes[2], mesh)
+        np.testing.assert_array_equal(mesh.get_array().reshape(z.shape),
+                                      z.ndarray)
+        self.assertEqual(mesh.get_clim(), (-8, 12))
+
+        _, meshes, full_image = self._run_live_plot(incremental=False)
+        self.assertIsNot(meshes[2], meshes[-1])
+        # only incrementally updated meshes keep a copy of their data
+        self.assertFalse(hasattr(meshes[-1], 'qcodes_buffer'))
+        np.testing.assert_array_equal(image, full_image)
+
+    def test_incremental_update_only_copies_modified_rows(self):
+        ny, nx = 4, 3
+        x, y, z, _ = self._live_2d_data(ny, nx)
+        y[:] = np.arange(ny)
+        x[:] = np.arange(nx)
+        z[:] = 1
+        plot = MatPlot(interval=0, incremental=True)
+        mesh = plot.add(z)
+        # pretend the data has been saved, as a formatter would
+        z.mark_saved(z.ndarray.size - 1)
+
+        # data changed without marking it modified is not pushed
+        z.ndarray[0, 0] = 5
+        z[3, 1] = 7
+        plot.update_plot()
+        self.assertIs(plot.traces[0]['plot_object'], mesh)
+        data = mesh.get_array().reshape(z.shape)
+        self.assertEqual(data[0, 0], 1)
+        np.testing.assert_array_equal(data[3], [1, 7, 1])
+        self.assertEqual(mesh.get_clim(), (1, 7))
+        plt.close(plot.fig)
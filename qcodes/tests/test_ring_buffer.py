@@ -0,0 +1,76 @@
+import multiprocessing
+import os
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from qcodes.utils.ring_buffer import SharedRingBuffer
+
+
+def _read_in_child(buffer, queue):
+    queue.put(buffer.read())
+    buffer.close()
+
+
+class TestSharedRingBuffer(TestCase):
+
+    def setUp(self):
+        self.buffer = SharedRingBuffer(n_columns=2, capacity=5)
+        self.reader = SharedRingBuffer.attach(self.buffer.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.buffer.close()
+
+    def test_read_returns_new_rows(self):
+        self.buffer.write([[0, 1], [1, 2]])
+        self.buffer.write([2, 3])
+        np.testing.assert_array_equal(self.reader.read(),
+                                      [[0, 1], [1, 2], [2, 3]])
+        self.assertEqual(self.reader.read().shape, (0, 2))
+        self.assertEqual(self.buffer.written, 3)
+
+    def test_wraps_around(self):
+        for start in range(0, 12, 3):
+            rows = np.arange(start, start + 3)[:, None] * [1, -1]
+            self.buffer.write(rows)
+            np.testing.assert_array_equal(self.reader.read(), rows)
+        self.assertEqual(self.reader.dropped, 0)
+
+    def test_overrun_drops_oldest_rows(self):
+        self.buffer.write(np.arange(14).reshape(7, 2))
+        np.testing.assert_array_equal(self.reader.read(),
+                                      np.arange(4, 14).reshape(5, 2))
+        self.assertEqual(self.reader.dropped, 2)
+
+        # more rows than the capacity in a single write
+        self.buffer.write(np.arange(24).reshape(12, 2))
+        np.testing.assert_array_equal(self.reader.read(),
+                                      np.arange(14, 24).reshape(5, 2))
+        self.assertEqual(self.reader.dropped, 9)
+        self.assertEqual(self.buffer.written, 19)
+
+    def test_wrong_number_of_columns(self):
+        with self.assertRaises(ValueError):
+            self.buffer.write([1, 2, 3])
+
+    def test_read_in_other_process(self):
+        # pickling a buffer only sends its name, the child maps the memory
+        self.assertLess(len(pickle.dumps(self.buffer)), 200)
+        self.buffer.write(np.arange(6).reshape(3, 2))
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_read_in_child,
+                                          args=(self.buffer, queue))
+        process.start()
+        rows = queue.get(timeout=10)
+        process.join(timeout=10)
+        np.testing.assert_array_equal(rows, np.arange(6).reshape(3, 2))
+
+    def test_close_removes_buffer(self):
+        buffer = SharedRingBuffer(n_columns=1)
+        name = buffer.name
+        self.assertTrue(os.path.exists(name))
+        buffer.close()
+        buffer.close()
+        self.assertFalse(os.path.exists(name))
@@ -1,13 +1,77 @@
 import gc
+import threading
+import time
 
 from unittest import TestCase
 
 from qcodes import Loop
-from qcodes.actions import UnsafeThreadingException
+from qcodes.instrument.parameter import Parameter
 from qcodes.tests.instrument_mocks import DummyInstrument
+from qcodes.utils.threading import SerializingThreadPool
 
 
-class TestUnsafeThreading(TestCase):
+class OverlapCounter:
+    """
+    Callable factory recording the maximal number of its callables that
+    were executing at the same time.
+    """
+    def __init__(self, duration=0.02):
+        self.duration = duration
+        self.running = 0
+        self.max_running = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def make(self, value):
+        def f():
+            with self._lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                self.threads.add(threading.get_ident())
+            time.sleep(self.duration)
+            with self._lock:
+                self.running -= 1
+            return value
+        return f
+
+
+class TestSerializingThreadPool(TestCase):
+
+    def test_map_preserves_order(self):
+        counter = OverlapCounter()
+        callables = [counter.make(i) for i in range(4)]
+        with SerializingThreadPool() as pool:
+            self.assertEqual(pool.map(callables), [0, 1, 2, 3])
+        self.assertEqual(counter.max_running, 4)
+
+    def test_groups_are_serialized(self):
+        counter = OverlapCounter()
+        callables = [counter.make(i) for i in range(4)]
+        with SerializingThreadPool() as pool:
+            out = pool.map(callables, groups=['a', 'a', 'a', 'a'])
+        self.assertEqual(out, [0, 1, 2, 3])
+        self.assertEqual(counter.max_running, 1)
+
+    def test_workers_are_reused(self):
+        counter = OverlapCounter(duration=0)
+        callables = [counter.make(i) for i in range(3)]
+        with SerializingThreadPool(max_workers=3) as pool:
+            for _ in range(50):
+                pool.map(callables)
+        self.assertLessEqual(len(counter.threads), 3)
+
+    def test_exception_is_propagated(self):
+        def fail():
+            raise ValueError('bad get')
+
+        counter = OverlapCounter()
+        with SerializingThreadPool() as pool:
+            with self.assertRaises(ValueError):
+                pool.map([counter.make(1), fail])
+        self.assertEqual(counter.running, 0)
+
+
+class TestThreadedLoop(TestCase):
 
     def setUp(self):
         self.inst1 = DummyInstrument(name='inst1',
@@ -24,9 +88,23 @@ class TestUnsafeThreading(TestCase):
 
         gc.collect()
 
-    def test_unsafe_exception(self):
+    def test_same_instrument_is_serialized(self):
         to_meas = (self.inst1.v1, self.inst1.v2)
         loop = Loop(self.inst2.v1.sweep(0, 1, num=10)).each(*to_meas)
 
-        with self.assertRaises(UnsafeThreadingException):
-            loop.run(use_threads=True)
+        data = loop.run(use_threads=True, quiet=True, location=False)
+        self.assertEqual(data.inst1_v1.tolist(), [0] * 10)
+        self.assertEqual(data.inst1_v2.tolist(), [0] * 10)
+
+    def test_parallel_instruments(self):
+        counter = OverlapCounter(duration=0.005)
+        p1 = Parameter('p1', get_cmd=counter.make(1))
+        p2 = Parameter('p2', get_cmd=counter.make(2))
+        loop = Loop(self.inst2.v1.sweep(0, 1, num=50)).each(p1, p2)
+
+        data = loop.run(use_threads=True, quiet=True, location=False)
+        self.assertEqual(data.p1.tolist(), [1] * 50)
+        self.assertEqual(data.p2.tolist(), [2] * 50)
+        self.assertEqual(counter.max_running, 2)
+        # threads are reused instead of being created for every point
+        self.assertLess(len(counter.threads), 50)
@@ -1,5 +1,7 @@
 from unittest import TestCase
 from unittest.mock import patch
+import numpy as np
+import pytest
 import visa
 from qcodes.instrument.visa import VisaInstrument
 from qcodes.utils.validators import Numbers
@@ -159,3 +161,127 @@ class TestVisaInstrument(TestCase):
         self.assertEqual(rm_mock.call_count, 4)
         self.assertEqual(rm_mock.call_args, (('@py',),))
         self.assertEqual(address_opened[0], 'ASRL4')
+
+
+class LoopbackVisaHandle:
+    """
+    A visa handle answering the data query 'TRACE?' with an IEEE 488.2 block
+    of the numbers in ``trace``, in the data format ('ASC,0', 'REAL,32' or
+    'REAL,64') and byte order ('NORM' or 'SWAP') set with 'FORM:DATA' and
+    'FORM:BORD'
+    """
+    def __init__(self):
+        self.trace = np.linspace(-1, 1, 1001)
+        self.settings = {'FORM:DATA': 'ASC,0', 'FORM:BORD': 'NORM'}
+        self.written = []
+        self.output = b''
+        self.timeout = 5000
+
+    def clear(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, cmd):
+        self.written.append(cmd)
+        if cmd == 'TRACE?':
+            data_format = self.settings['FORM:DATA']
+            if data_format.startswith('ASC'):
+                data = ','.join(map(str, self.trace)).encode()
+                self.output = data + b'\n'
+                return len(cmd), 0
+            byte_order = '>' if self.settings['FORM:BORD'] == 'NORM' else '<'
+            dtype = byte_order + ('f4' if data_format == 'REAL,32' else 'f8')
+            data = self.trace.astype(dtype).tobytes()
+            length = str(len(data)).encode()
+            self.output = (b'#' + str(len(length)).encode() + length + data +
+                           b'\n')
+        else:
+            setting, value = cmd.split(' ')
+            self.settings[setting] = value
+        return len(cmd), 0
+
+    def query(self, cmd):
+        return self.settings[cmd.rstrip('?')]
+
+    def read_bytes(self, count):
+        data, self.output = self.output[:count], self.output[count:]
+        return data
+
+    def read_raw(self):
+        data, _, self.output = self.output.partition(b'\n')
+        return data + b'\n'
+
+
+class LoopbackVisa(VisaInstrument):
+    def set_address(self, address):
+        self.visa_handle = LoopbackVisaHandle()
+
+
+@pytest.fixture
+def loopback():
+    instrument = LoopbackVisa('loopback')
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+@pytest.mark.parametrize('datatype', ['f', 'd'])
+@pytest.mark.parametrize('is_big_endian', [True, False])
+def test_ask_binary_block(loopback, datatype, is_big_endian):
+    handle = loopback.visa_handle
+    data = loopback.ask_binary_block('TRACE?', datatype=datatype,
+                                     is_big_endian=is_big_endian)
+    assert data.dtype == np.dtype(datatype)
+    np.testing.assert_array_equal(data, handle.trace.astype(datatype))
+    # the whole response has been read, and the format restored
+    assert handle.output == b''
+    assert handle.settings == {'FORM:DATA': 'ASC,0', 'FORM:BORD': 'NORM'}
+
+
+def test_ask_binary_block_only_changes_what_differs(loopback):
+    handle = loopback.visa_handle
+    handle.settings = {'FORM:DATA': 'REAL,+32', 'FORM:BORD': 'NORM'}
+    loopback.ask_binary_block('TRACE?', datatype='f', is_big_endian=True)
+    assert handle.written == ['TRACE?']
+
+    handle.written = []
+    loopback.ask_binary_block('TRACE?', datatype='f', is_big_endian=False)
+    assert handle.written == ['FORM:BORD SWAP', 'TRACE?', 'FORM:BORD NORM']
+
+
+def test_ask_binary_block_without_format_commands(loopback):
+    handle = loopback.visa_handle
+    handle.settings = {'FORM:DATA': 'REAL,64', 'FORM:BORD': 'SWAP'}
+    data = loopback.ask_binary_block('TRACE?', datatype='d',
+                                     data_format_cmd=None,
+                                     byte_order_cmd=None)
+    np.testing.assert_array_equal(data, handle.trace)
+    assert handle.written == ['TRACE?']
+
+
+def test_ask_binary_block_not_a_block(loopback):
+    # the instrument is left in ASCII format
+    with pytest.raises(ValueError, match='binary block'):
+        loopback.ask_binary_block('TRACE?', data_format_cmd=None,
+                                  byte_order_cmd=None)
+
+
+def test_ask_binary_block_restores_format_on_error(loopback):
+    handle = loopback.visa_handle
+
+    def read_bytes(count):
+        raise visa.VisaIOError(visa.constants.VI_ERROR_TMO)
+    handle.read_bytes = read_bytes
+
+    with pytest.raises(visa.VisaIOError):
+        loopback.ask_binary_block('TRACE?', datatype='d')
+    assert handle.settings == {'FORM:DATA': 'ASC,0', 'FORM:BORD': 'NORM'}
+
+
+def test_ask_binary_block_only_real_formats(loopback):
+    with pytest.raises(ValueError, match='REAL'):
+        loopback.ask_binary_block('TRACE?', datatype='h')
+    assert loopback.visa_handle.written == []
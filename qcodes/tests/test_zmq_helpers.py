@@ -0,0 +1,174 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+import zmq
+
+import qcodes.utils.zmq_helpers as zmq_helpers
+from qcodes.utils.zmq_helpers import BatchingPublisher, decode_batch
+
+
+@pytest.fixture
+def subscriber():
+    context = zmq.Context()
+    socket = context.socket(zmq.SUB)
+    socket.bind('inproc://telemetry')
+    socket.setsockopt(zmq.SUBSCRIBE, b'')
+    socket.setsockopt(zmq.RCVTIMEO, 2000)
+    yield context, socket
+    socket.close(linger=0)
+    context.term()
+
+
+def _connect(publisher, socket):
+    # pub/sub subscriptions are asynchronous, wait until messages get through
+    max_delay = publisher.max_delay
+    publisher.max_delay = 0
+    for _ in range(100):
+        publisher.send('ping')
+        if socket.poll(20):
+            break
+    else:
+        raise RuntimeError('Subscriber never got connected')
+    # let the pings drain
+    while socket.poll(50):
+        socket.recv_multipart()
+    publisher.max_delay = max_delay
+
+
+def test_batches_by_size(subscriber):
+    context, socket = subscriber
+    with BatchingPublisher('telemetry', 'inproc://telemetry',
+                           context=context, max_batch=5,
+                           max_delay=10) as publisher:
+        _connect(publisher, socket)
+        for i in range(10):
+            publisher.send({'point': i})
+        batches = [socket.recv_multipart() for _ in range(2)]
+
+    assert all(batch[0] == b'telemetry' for batch in batches)
+    messages = decode_batch(batches[0]) + decode_batch(batches[1])
+    assert messages == [{'point': i} for i in range(10)]
+
+
+def test_batches_by_time(subscriber):
+    context, socket = subscriber
+    with BatchingPublisher('telemetry', 'inproc://telemetry',
+                           context=context, max_batch=1000,
+                           max_delay=0.05) as publisher:
+        _connect(publisher, socket)
+        t0 = time.perf_counter()
+        publisher.send([1, 2, 3])
+        frames = socket.recv_multipart()
+        elapsed = time.perf_counter() - t0
+
+    assert decode_batch(frames) == [[1, 2, 3]]
+    assert elapsed < 1
+
+
+def test_arrays_are_sent_as_buffers(subscriber):
+    context, socket = subscriber
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    with BatchingPublisher('telemetry', 'inproc://telemetry',
+                           context=context, max_batch=3,
+                           max_delay=10) as publisher:
+        _connect(publisher, socket)
+        publisher.send(array)
+        publisher.send({'label': 'v1'})
+        publisher.send(np.array([], dtype=np.int64))
+        frames = socket.recv_multipart()
+
+    # topic, header and one frame per array
+    assert len(frames) == 4
+    assert bytes(frames[2]) == array.tobytes()
+    received, label, empty = decode_batch(frames)
+    assert received.dtype == np.float32
+    np.testing.assert_array_equal(received, array)
+    assert label == {'label': 'v1'}
+    assert empty.dtype == np.int64 and empty.shape == (0,)
+
+
+def test_arrays_are_copied_unless_told_not_to(subscriber):
+    context, socket = subscriber
+    array = np.zeros(4)
+    kept = np.zeros(4)
+    with BatchingPublisher('telemetry', 'inproc://telemetry',
+                           context=context, max_batch=3,
+                           max_delay=10) as publisher:
+        _connect(publisher, socket)
+        publisher.send(array)
+        publisher.send(kept, copy=False)
+        # changed before the batch is encoded
+        array[:] = 1
+        kept[:] = 1
+        publisher.send('flush')
+        frames = socket.recv_multipart()
+
+    sent, sent_kept, _ = decode_batch(frames)
+    np.testing.assert_array_equal(sent, np.zeros(4))
+    np.testing.assert_array_equal(sent_kept, np.ones(4))
+
+
+def test_unencodable_messages_are_dropped(subscriber):
+    context, socket = subscriber
+    with BatchingPublisher('telemetry', 'inproc://telemetry',
+                           context=context, max_batch=3,
+                           max_delay=10) as publisher:
+        _connect(publisher, socket)
+        publisher.send('before')
+        publisher.send(object())
+        publisher.send(np.arange(3))
+        frames = socket.recv_multipart()
+        assert publisher.dropped == 1
+
+    before, array = decode_batch(frames)
+    assert before == 'before'
+    np.testing.assert_array_equal(array, np.arange(3))
+
+
+def test_close_flushes_queue(subscriber):
+    context, socket = subscriber
+    publisher = BatchingPublisher('telemetry', 'inproc://telemetry',
+                                  context=context, max_batch=1000,
+                                  max_delay=10)
+    _connect(publisher, socket)
+    for i in range(3):
+        publisher.send(i)
+    publisher.close()
+    assert decode_batch(socket.recv_multipart()) == [0, 1, 2]
+
+    with pytest.raises(RuntimeError):
+        publisher.send(3)
+
+
+def test_full_queue_drops_messages(subscriber, monkeypatch):
+    context, socket = subscriber
+    publisher = BatchingPublisher('telemetry', 'inproc://telemetry',
+                                  context=context, hwm=2, max_delay=0)
+    _connect(publisher, socket)
+
+    # hold the thread up while it encodes the first batch, so that the
+    # queue fills up behind it
+    encoding = threading.Event()
+    release = threading.Event()
+    encode_batch = zmq_helpers._encode_batch
+
+    def slow_encode_batch(messages):
+        encoding.set()
+        release.wait(5)
+        return encode_batch(messages)
+
+    monkeypatch.setattr(zmq_helpers, '_encode_batch', slow_encode_batch)
+    publisher.send(0)
+    assert encoding.wait(5)
+    for i in range(1, 5):
+        publisher.send(i)
+    assert publisher.dropped == 2
+    release.set()
+    publisher.close()
+
+    received = []
+    while socket.poll(100):
+        received += decode_batch(socket.recv_multipart())
+    assert received == [0, 1, 2]
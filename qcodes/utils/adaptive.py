@@ -0,0 +1,290 @@
+"""
+Adaptive sampling of a scalar signal in one or two dimensions.
+
+The learners in this module decide where to measure next, based on all the
+points measured so far, so that points are concentrated where the measured
+signal changes fastest and flat regions are only sampled coarsely. They
+follow an ask/tell protocol:
+
+>>> learner = Learner1D(bounds=(0, 1))
+>>> for _ in range(100):
+...     x = learner.ask()
+...     learner.tell(x, measure(x))
+
+``Learner1D`` refines the interval between neighbouring points that is
+longest in the (normalized) plane of setpoint and measured value, by
+bisection. ``Learner2D`` keeps a triangulation of the measured points and
+refines the triangle with the largest (normalized) surface area by
+bisecting its longest edge.
+
+To use them in a ``Loop``, see ``qcodes.instrument.sweep_values.AdaptiveSweep``,
+with a ``Measurement``, see ``run_adaptive``.
+"""
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class _Learner:
+    """
+    Base class of the learners, keeping track of the measured points and of
+    the point that has been asked for but not told yet.
+    """
+    def __init__(self) -> None:
+        self.data: Dict[Any, float] = {}
+        self._pending: Optional[Any] = None
+
+    def ask(self) -> Any:
+        """
+        Get the next point to measure. Every point must be told (see
+        ``tell``) before the next one can be asked for.
+        """
+        if self._pending is not None:
+            raise RuntimeError(f'Point {self._pending} has not been told yet')
+        self._pending = self._next_point()
+        return self._pending
+
+    def tell(self, point: Any, value: float) -> None:
+        """
+        Add the value measured at a point. If a point has been asked for,
+        this must be that point.
+        """
+        point = self._normalize_point(point)
+        if self._pending is not None:
+            if point != self._pending:
+                raise ValueError(f'Expected the value at {self._pending}, '
+                                 f'got a value at {point}')
+            self._pending = None
+        self.data[point] = value
+        self._add_point(point, value)
+
+    def _scale(self) -> float:
+        """The range of the finite measured values, used for normalization"""
+        values = np.array(list(self.data.values()), dtype=float)
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return 1.0
+        scale = values.max() - values.min()
+        return scale if scale > 0 else 1.0
+
+    def _normalize_point(self, point: Any) -> Any:
+        raise NotImplementedError
+
+    def _next_point(self) -> Any:
+        raise NotImplementedError
+
+    def _add_point(self, point: Any, value: float) -> None:
+        raise NotImplementedError
+
+
+class Learner1D(_Learner):
+    """
+    Adaptive sampling of a function of one variable by bisection.
+
+    The first two points are the bounds. After that, the interval between
+    neighbouring points with the largest length in the plane of setpoint
+    and measured value, both normalized to their full range, is bisected.
+
+    Args:
+        bounds: the lowest and highest setpoint to measure
+        min_step: intervals shorter than this are never bisected. Default
+            ``1e-6`` of the full range.
+    """
+    def __init__(self, bounds: Tuple[float, float],
+                 min_step: Optional[float] = None) -> None:
+        super().__init__()
+        self.bounds = (float(bounds[0]), float(bounds[1]))
+        width = abs(self.bounds[1] - self.bounds[0])
+        if width == 0:
+            raise ValueError('The bounds must not be equal')
+        self._width = width
+        self.min_step = width * 1e-6 if min_step is None else min_step
+        self._xs: List[float] = []
+        self._ys: List[float] = []
+
+    def _normalize_point(self, point: float) -> float:
+        return float(point)
+
+    def _add_point(self, point: float, value: float) -> None:
+        index = int(np.searchsorted(self._xs, point))
+        if index < len(self._xs) and self._xs[index] == point:
+            self._ys[index] = value
+        else:
+            self._xs.insert(index, point)
+            self._ys.insert(index, value)
+
+    def losses(self) -> np.ndarray:
+        """
+        The loss of each interval between neighbouring measured points, in
+        the order of the setpoints. Intervals that can not be bisected any
+        further have zero loss.
+        """
+        xs = np.array(self._xs)
+        ys = np.array(self._ys, dtype=float)
+        dx = np.diff(xs)
+        dy = np.nan_to_num(np.diff(ys)) / self._scale()
+        losses = np.hypot(dx / self._width, dy)
+        losses[dx < 2 * self.min_step] = 0
+        return losses
+
+    def _next_point(self) -> float:
+        for bound in self.bounds:
+            if bound not in self.data:
+                return bound
+        losses = self.losses()
+        index = int(np.argmax(losses))
+        if losses[index] == 0:
+            raise RuntimeError('All intervals are smaller than min_step')
+        return (self._xs[index] + self._xs[index + 1]) / 2
+
+
+class Learner2D(_Learner):
+    """
+    Adaptive sampling of a function of two variables by triangle refinement.
+
+    The first four points are the corners of the rectangle given by the
+    bounds, which is split into two triangles. After that, the triangle with
+    the largest surface area in the space of both setpoints and the measured
+    value, all normalized to their full range, is refined: its longest edge
+    is bisected, splitting it and the triangle sharing that edge in two.
+
+    Args:
+        bounds: the lowest and highest setpoint of each of the two axes,
+            ``((x_min, x_max), (y_min, y_max))``
+    """
+    def __init__(self, bounds: Sequence[Tuple[float, float]]) -> None:
+        super().__init__()
+        if len(bounds) != 2:
+            raise ValueError('Learner2D needs bounds for two axes')
+        self.bounds = tuple((float(low), float(high)) for low, high in bounds)
+        self._widths = np.array([abs(high - low)
+                                 for low, high in self.bounds])
+        if not np.all(self._widths > 0):
+            raise ValueError('The bounds must not be equal')
+        (x0, x1), (y0, y1) = self.bounds
+        self._corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+        self._vertices: List[Tuple[float, float]] = list(self._corners)
+        self._vertex_index = {v: i for i, v in enumerate(self._vertices)}
+        self._triangles: List[Tuple[int, int, int]] = [(0, 1, 2), (0, 2, 3)]
+        self._edges: Dict[FrozenSet[int], List[int]] = {}
+        for t, triangle in enumerate(self._triangles):
+            self._register_triangle(t, triangle)
+        # the edge whose midpoint is being measured
+        self._pending_edge: Optional[FrozenSet[int]] = None
+
+    @property
+    def triangles(self) -> np.ndarray:
+        """The current triangulation, as an array of vertex coordinates"""
+        vertices = np.array(self._vertices)
+        return vertices[np.array(self._triangles)]
+
+    def _normalize_point(self, point: Sequence[float]
+                         ) -> Tuple[float, float]:
+        x, y = point
+        return float(x), float(y)
+
+    def _register_triangle(self, t: int, triangle: Tuple[int, int, int]
+                           ) -> None:
+        a, b, c = triangle
+        for edge in (frozenset((a, b)), frozenset((b, c)),
+                     frozenset((a, c))):
+            self._edges.setdefault(edge, []).append(t)
+
+    def _unregister_triangle(self, t: int) -> None:
+        a, b, c = self._triangles[t]
+        for edge in (frozenset((a, b)), frozenset((b, c)),
+                     frozenset((a, c))):
+            self._edges[edge].remove(t)
+            if not self._edges[edge]:
+                del self._edges[edge]
+
+    def losses(self) -> np.ndarray:
+        """
+        The loss of each triangle: its surface area in the space of the two
+        setpoints and the measured value, all normalized to their range.
+        """
+        vertices = np.array(self._vertices) / self._widths
+        values = np.array([self.data.get(v, np.nan) for v in self._vertices],
+                          dtype=float)
+        values = np.nan_to_num(values) / self._scale()
+        points = np.column_stack([vertices, values])
+        triangles = points[np.array(self._triangles)]
+        ab = triangles[:, 1] - triangles[:, 0]
+        ac = triangles[:, 2] - triangles[:, 0]
+        return 0.5 * np.linalg.norm(np.cross(ab, ac), axis=1)
+
+    def _longest_edge(self, t: int) -> FrozenSet[int]:
+        a, b, c = self._triangles[t]
+        vertices = np.array(self._vertices) / self._widths
+        edges = [frozenset((a, b)), frozenset((b, c)), frozenset((a, c))]
+        lengths = [np.linalg.norm(vertices[i] - vertices[j])
+                   for i, j in ((a, b), (b, c), (a, c))]
+        return edges[int(np.argmax(lengths))]
+
+    def _next_point(self) -> Tuple[float, float]:
+        for corner in self._corners:
+            if corner not in self.data:
+                return corner
+        worst = int(np.argmax(self.losses()))
+        edge = self._longest_edge(worst)
+        i, j = tuple(edge)
+        vi, vj = self._vertices[i], self._vertices[j]
+        self._pending_edge = edge
+        return ((vi[0] + vj[0]) / 2, (vi[1] + vj[1]) / 2)
+
+    def _add_point(self, point: Tuple[float, float], value: float) -> None:
+        if point in self._vertex_index:
+            return
+        edge = self._pending_edge
+        if edge is None:
+            raise ValueError(f'Learner2D can only be told points it has '
+                             f'asked for, not {point}')
+        self._pending_edge = None
+
+        new = len(self._vertices)
+        self._vertices.append(point)
+        self._vertex_index[point] = new
+        i, j = tuple(edge)
+        for t in list(self._edges[edge]):
+            opposite, = set(self._triangles[t]) - edge
+            self._unregister_triangle(t)
+            self._triangles[t] = (i, new, opposite)
+            self._register_triangle(t, self._triangles[t])
+            self._triangles.append((new, j, opposite))
+            self._register_triangle(len(self._triangles) - 1,
+                                    self._triangles[-1])
+
+
+def run_adaptive(datasaver, learner: _Learner,
+                 setpoint_parameters: Sequence[Any],
+                 measured_parameter: Any,
+                 npoints: int) -> None:
+    """
+    Measure ``npoints`` points chosen by a learner, and add them to a
+    ``DataSaver``, one ``add_result`` per point.
+
+    The setpoint and measured parameters must have been registered with the
+    ``Measurement`` of the ``DataSaver``. Since the points are irregular,
+    the data is best plotted as scatter data.
+
+    Args:
+        datasaver: the DataSaver of a running measurement
+        learner: a ``Learner1D`` or ``Learner2D``
+        setpoint_parameters: the parameters to set, one per dimension of the
+            learner
+        measured_parameter: the parameter whose value drives the learner
+        npoints: the number of points to measure
+    """
+    for _ in range(npoints):
+        point = learner.ask()
+        setpoints: Tuple[float, ...] = (point if isinstance(point, tuple)
+                                        else (point,))
+        if len(setpoints) != len(setpoint_parameters):
+            raise ValueError(f'Got {len(setpoint_parameters)} setpoint '
+                             f'parameters for a {len(setpoints)}D learner')
+        for parameter, setpoint in zip(setpoint_parameters, setpoints):
+            parameter.set(setpoint)
+        value = measured_parameter.get()
+        learner.tell(point, value)
+        datasaver.add_result(*zip(setpoint_parameters, setpoints),
+                             (measured_parameter, value))
@@ -0,0 +1,188 @@
+"""
+A ring buffer of rows of floats in shared memory, to stream data from one
+process to another without pickling or copying it through a pipe.
+
+The buffer lives in a memory mapped file (in ``/dev/shm`` where available,
+so it never touches a disk) that is identified by its ``name``. The process
+creating the buffer owns the file and removes it when the buffer is closed;
+any other process can ``attach`` to it by name:
+
+>>> buffer = SharedRingBuffer(n_columns=2)
+>>> buffer.write([[0, 1], [1, 2]])
+>>> # in another process
+>>> reader = SharedRingBuffer.attach(buffer.name)
+>>> reader.read()
+array([[0., 1.],
+       [1., 2.]])
+
+There must be a single writer and a single reader per buffer. The writer is
+never blocked: if it gets more than ``capacity`` rows ahead of the reader,
+the oldest rows are overwritten, and the reader skips them and counts them
+in ``dropped``.
+"""
+import logging
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Optional
+
+import numpy as np
+
+# the header is four int64's: the number of rows written, the number of rows
+# claimed by the writer (written plus the ones being written), the number of
+# columns and the capacity
+_HEADER = 4
+_WRITTEN, _CLAIMED, _COLUMNS, _CAPACITY = range(_HEADER)
+
+log = logging.getLogger(__name__)
+
+
+def _shared_memory_dir() -> str:
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError as e:
+        log.warning(f'Could not remove shared ring buffer {path}: {e}')
+
+
+class SharedRingBuffer:
+    """
+    A ring buffer of ``capacity`` rows of ``n_columns`` float64's, shared
+    between processes.
+
+    Args:
+        n_columns: the number of values in a row
+        capacity: the number of rows the buffer holds before the oldest ones
+            are overwritten
+    """
+    def __init__(self, n_columns: int, capacity: int = 2**16) -> None:
+        if n_columns < 1 or capacity < 1:
+            raise ValueError('A SharedRingBuffer needs at least one column '
+                             'and a capacity of at least one row')
+        handle, path = tempfile.mkstemp(prefix='qcodes_ring_',
+                                        dir=_shared_memory_dir())
+        header = np.zeros(_HEADER, dtype=np.int64)
+        header[_COLUMNS] = n_columns
+        header[_CAPACITY] = capacity
+        try:
+            os.write(handle, header.tobytes())
+            os.ftruncate(handle, 8 * (_HEADER + n_columns * capacity))
+        finally:
+            os.close(handle)
+        self._map(path)
+        self._finalizer: Optional[weakref.finalize] = weakref.finalize(
+            self, _remove, path)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedRingBuffer':
+        """
+        Open a buffer created by another process. Reading starts at the
+        oldest row still in the buffer.
+        """
+        buffer = cls.__new__(cls)
+        buffer._map(name)
+        buffer._finalizer = None
+        return buffer
+
+    def _map(self, path: str) -> None:
+        self.name = path
+        with open(path, 'r+b') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0)
+        self._header = np.frombuffer(self._mmap, dtype=np.int64,
+                                     count=_HEADER)
+        self.n_columns = int(self._header[_COLUMNS])
+        self.capacity = int(self._header[_CAPACITY])
+        self._data = np.frombuffer(
+            self._mmap, dtype=np.float64, offset=8 * _HEADER
+        ).reshape(-1, self.n_columns)
+        self._read = 0
+        self.dropped = 0
+
+    def __reduce__(self):
+        # only the name crosses the process boundary, never the data
+        return type(self).attach, (self.name,)
+
+    @property
+    def written(self) -> int:
+        """The total number of rows written to the buffer"""
+        return int(self._header[_WRITTEN])
+
+    def write(self, rows) -> None:
+        """
+        Append rows to the buffer, overwriting the oldest rows if it is
+        full.
+
+        Args:
+            rows: anything that can be converted into an array of floats of
+                shape ``(n, n_columns)``; a single row may be 1D
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.n_columns)
+        n = len(rows)
+        if n == 0:
+            return
+        claimed = int(self._header[_WRITTEN]) + n
+        # announce the rows before writing them, so that a reader copying
+        # concurrently can tell which of its rows may be torn
+        self._header[_CLAIMED] = claimed
+        if n > self.capacity:
+            # only the last rows survive, but they are all counted
+            rows = rows[-self.capacity:]
+            n = self.capacity
+        written = claimed - n
+        start = written % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = rows[:first]
+        self._data[:n - first] = rows[first:]
+        self._header[_WRITTEN] = claimed
+
+    def read(self) -> np.ndarray:
+        """
+        Get all rows written since the last read, as a new array of shape
+        ``(n, n_columns)``. Rows that have been overwritten before they could
+        be read are skipped and added to ``dropped``.
+        """
+        written = int(self._header[_WRITTEN])
+        if written - self._read > self.capacity:
+            self.dropped += written - self.capacity - self._read
+            self._read = written - self.capacity
+        n = written - self._read
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        rows = np.concatenate([self._data[start:start + first],
+                               self._data[:n - first]])
+        self._read = written
+
+        # rows the writer started overwriting while we were copying them
+        # are not reliable
+        oldest_intact = int(self._header[_CLAIMED]) - self.capacity
+        torn = min(oldest_intact - (written - n), n)
+        if torn > 0:
+            self.dropped += torn
+            rows = rows[torn:]
+        return rows
+
+    def close(self) -> None:
+        """
+        Unmap the buffer. If this process created it, the buffer is removed
+        and can not be attached to anymore.
+        """
+        if self._mmap.closed:
+            return
+        # the arrays must be released before the map can be closed
+        del self._header
+        del self._data
+        self._mmap.close()
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self) -> 'SharedRingBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
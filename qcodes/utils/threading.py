@@ -3,6 +3,8 @@
 # several parameters in parallel), we can parallelize them with threads.
 # That way the things we call need not be rewritten explicitly async.
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 import threading
 
 
@@ -72,3 +74,74 @@ def thread_map(callables, args=None, kwargs=None):
         t.start()
 
     return [t.output() for t in threads]
+
+
+class SerializingThreadPool:
+    """
+    A persistent pool of worker threads for repeatedly evaluating a set of
+    callables in parallel, e.g. the ``get`` methods of the parameters
+    measured at every point of a loop.
+
+    Callables that share a group key are executed sequentially, in the order
+    given, by a single worker, while different groups run concurrently. Using
+    the instrument of each parameter as group key therefore never talks to
+    one instrument from two threads at the same time.
+
+    The worker threads are created once and reused for every call to
+    ``map``, so there is no per-call thread creation overhead. Call ``close``
+    (or use the pool as a context manager) to shut the workers down.
+
+    Args:
+        max_workers (Optional[int]): maximal number of worker threads. If
+            there are more groups than workers, the remaining groups wait for
+            a free worker.
+    """
+    def __init__(self, max_workers=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='qcodes_pool')
+
+    def map(self, callables, groups=None):
+        """
+        Evaluate a sequence of callables in the pool, returning a list of
+        their return values in the order of ``callables``.
+
+        Args:
+            callables: a sequence of callables taking no arguments
+            groups (Optional): a sequence of hashable group keys, one per
+                callable. Callables with the same key are evaluated
+                sequentially. By default every callable is its own group.
+
+        Raises:
+            the first exception raised by any of the callables, after all
+            of them have finished.
+        """
+        if groups is None:
+            groups = range(len(callables))
+
+        jobs = OrderedDict()
+        for index, (c, group) in enumerate(zip(callables, groups)):
+            jobs.setdefault(group, []).append((index, c))
+
+        futures = [self._executor.submit(_call_in_order, group_jobs)
+                   for group_jobs in jobs.values()]
+        wait(futures)
+
+        out = [None] * len(callables)
+        for future in futures:
+            for index, value in future.result():
+                out[index] = value
+        return out
+
+    def close(self):
+        """Shut down the worker threads, waiting for pending calls."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _call_in_order(jobs):
+    return [(index, c()) for index, c in jobs]
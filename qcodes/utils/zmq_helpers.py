@@ -1,9 +1,18 @@
-import time
 import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
 import zmq
 
+log = logging.getLogger(__name__)
+
 _LINGER = 1000  # milliseconds
 _ZMQ_HWM = int(5e8 / 120) # 500MB max memory for the logger
+_STOP = object()  # tells the thread of a BatchingPublisher to stop
 
 class UnboundedPublisher:
     """
@@ -16,7 +25,7 @@ class UnboundedPublisher:
     def __init__(self,
                  topic: str,
                  interface_or_socket: str="tcp://localhost:5559",
-                 context: zmq.Context = None) -> None:
+                 context: Optional[zmq.Context] = None) -> None:
         """
 
         Args:
@@ -50,7 +59,8 @@ class Publisher(UnboundedPublisher):
     def __init__(self, topic: str,
                  interface_or_socket: str="tcp://localhost:5559",
                  timeout: int = _LINGER*10,
-                 hwm: int = _ZMQ_HWM*5,  context: zmq.Context = None) -> None:
+                 hwm: int = _ZMQ_HWM*5,
+                 context: Optional[zmq.Context] = None) -> None:
         """
 
         Args:
@@ -72,3 +82,194 @@ class Publisher(UnboundedPublisher):
         # if it happens, then we may as well stop using python!
         time.sleep(1e-09)
         self.socket.send_multipart([self.topic, json.dumps(msg).encode()])
+
+
+def _encode_batch(messages: Sequence[object]) -> List[Any]:
+    """
+    Encode messages into the frames of a single ZMQ message (after the
+    topic), see ``decode_batch``.
+    """
+    header = []
+    buffers: List[Any] = []
+    for msg in messages:
+        if isinstance(msg, np.ndarray):
+            array = np.ascontiguousarray(msg)
+            header.append({'dtype': array.dtype.str, 'shape': array.shape,
+                           'frame': len(buffers)})
+            buffers.append(array.data if array.size else b'')
+        else:
+            header.append({'json': msg})
+    return [json.dumps(header).encode()] + buffers
+
+
+def decode_batch(frames: Sequence[Any]) -> List[object]:
+    """
+    Decode a message sent by a ``BatchingPublisher`` into the list of
+    messages it contains, NumPy arrays included.
+
+    Args:
+        frames: the frames of the ZMQ message, as returned by
+            ``recv_multipart``, topic included
+
+    Returns:
+        the messages of the batch, in the order they were sent
+    """
+    header = json.loads(bytes(frames[1]).decode())
+    buffers = frames[2:]
+    messages: List[object] = []
+    for entry in header:
+        if 'json' in entry:
+            messages.append(entry['json'])
+        else:
+            array = np.frombuffer(buffers[entry['frame']],
+                                  dtype=np.dtype(entry['dtype']))
+            messages.append(array.reshape(entry['shape']))
+    return messages
+
+
+class BatchingPublisher(Publisher):
+    """
+    Publisher that never blocks the caller to serialize or send messages.
+
+    ``send`` only puts the message in a queue. A background thread takes
+    the messages from the queue, encodes them and sends them in batches: a
+    batch is sent as soon as it holds ``max_batch`` messages, or
+    ``max_delay`` seconds after its first message was queued, whichever
+    comes first. Every batch is a single ZMQ message of the frames
+    ``[topic, header, *buffers]``, where the header is a JSON list of
+    the messages of the batch. NumPy arrays are not JSON encoded but sent
+    as raw buffers, described by their dtype and shape in the header. Use
+    ``decode_batch`` to get the messages back on the receiving end.
+
+    Since messages are encoded later, by the thread, ``send`` copies arrays
+    unless told not to. Other messages must not be changed after they are
+    sent.
+
+    Like for ``Publisher``, at most ``hwm`` messages are kept: messages
+    sent while the queue is full are dropped, and counted in ``dropped``.
+    So are messages that can not be encoded.
+
+    NOTE that this offers no guarantees on message delivery.
+    If there is no reciever the message is LOST.
+    """
+
+    def __init__(self, topic: str,
+                 interface_or_socket: str="tcp://localhost:5559",
+                 timeout: int = _LINGER*10,
+                 hwm: int = _ZMQ_HWM*5,
+                 context: Optional[zmq.Context] = None,
+                 max_batch: int = 1000, max_delay: float = 0.01) -> None:
+        """
+
+        Args:
+            interface_or_socket:  Interface or socket to connect to
+            topic: Topic of this publisher
+            timeout: time in millisecond to wait before destroying this
+                    published and the messages it caches
+            hwm: number of messages to keep in the queue, and number of
+                    batches to keep in the cache of the socket
+            context: Context to reuse if desired
+            max_batch: maximum number of messages in a batch
+            max_delay: maximum time in seconds a message waits for its batch
+                    to fill up before it is sent
+        """
+        super().__init__(topic, interface_or_socket, timeout, hwm, context)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.dropped = 0
+        # None once the publisher is closed
+        self._queue: Optional['queue.Queue'] = queue.Queue(maxsize=hwm)
+        # the socket is only used by the thread from now on, zmq sockets
+        # are not thread safe
+        self._thread = threading.Thread(target=self._run,
+                                        args=(self._queue,),
+                                        name='BatchingPublisher',
+                                        daemon=True)
+        self._thread.start()
+
+    def send(self, msg: object, copy: bool = True):
+        """
+        Queue a message to be sent: anything that can be JSON encoded, or a
+        NumPy array.
+
+        Args:
+            msg: the message
+            copy: whether to copy a NumPy array. Only pass False for an
+                array that is not changed anymore, which is then sent
+                without any copy.
+        """
+        if self._queue is None:
+            raise RuntimeError('Can not send with a closed publisher')
+        if copy and isinstance(msg, np.ndarray):
+            msg = msg.copy()
+        try:
+            self._queue.put_nowait(msg)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self, messages: 'queue.Queue') -> None:
+        stopping = False
+        while not stopping:
+            msg = messages.get()
+            if msg is _STOP:
+                break
+            batch = [msg]
+            deadline = time.perf_counter() + self.max_delay
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        msg = messages.get(timeout=remaining)
+                    else:
+                        msg = messages.get_nowait()
+                except queue.Empty:
+                    break
+                if msg is _STOP:
+                    stopping = True
+                    break
+                batch.append(msg)
+            try:
+                frames = _encode_batch(batch)
+            except (TypeError, ValueError):
+                frames = self._encode_valid(batch)
+            try:
+                self.socket.send_multipart([self.topic] + frames, copy=False)
+            except Exception:
+                log.exception('BatchingPublisher failed to send a batch')
+
+    def _encode_valid(self, batch: List[object]) -> List[Any]:
+        """
+        Encode the messages of a batch that can be encoded, dropping the
+        others.
+        """
+        valid = []
+        for msg in batch:
+            try:
+                _encode_batch([msg])
+            except (TypeError, ValueError):
+                log.exception('BatchingPublisher dropped a message that '
+                              'can not be encoded')
+                self.dropped += 1
+            else:
+                valid.append(msg)
+        return _encode_batch(valid)
+
+    def close(self) -> None:
+        """
+        Send the messages still in the queue, stop the thread and close the
+        socket, waiting at most ``timeout`` for the messages to go out.
+        """
+        messages = self._queue
+        if messages is None:
+            return
+        self._queue = None
+        # waits for room in the queue if it is full
+        messages.put(_STOP)
+        self._thread.join()
+        self.socket.close()
+
+    def __enter__(self) -> 'BatchingPublisher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()